@@ -15,6 +15,7 @@ from .auth import (
     build_idcs_http_auth,
     profile_declares_security_token,
 )
+from .mapping import construct_model, is_sdk_model, sdk_to_dict, validate_fields
 
 __all__ = [
     "AuthContext",
@@ -25,6 +26,10 @@ __all__ = [
     "IDCSHttpAuthOptions",
     "build_auth_context",
     "build_idcs_http_auth",
+    "construct_model",
+    "is_sdk_model",
     "profile_declares_security_token",
+    "sdk_to_dict",
+    "validate_fields",
 ]
 __version__ = "0.1.0"
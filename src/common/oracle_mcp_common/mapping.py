@@ -0,0 +1,224 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from __future__ import annotations
+
+import threading
+import types
+import typing
+from datetime import date, datetime
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+from pydantic import BaseModel
+
+Converter = Callable[[Any], Any]
+
+# How a pydantic field is filled: copied as is, copied after converting SDK models to plain
+# data, or constructed as a nested model (or list of them).
+_FIELD_KIND_PLAIN = 0
+_FIELD_KIND_SCALAR = 1
+_FIELD_KIND_MODEL = 2
+_FIELD_KIND_MODEL_LIST = 3
+
+_object_setattr = object.__setattr__
+_attribute_plans: dict[type, tuple[str, ...]] = {}
+_model_plans: dict[type, "_ModelPlan"] = {}
+_plans_lock = threading.Lock()
+
+
+def _sdk_attributes(obj: Any) -> tuple[str, ...] | None:
+    """Attribute names of an OCI SDK model, read once per model class from ``swagger_types``."""
+    cls = type(obj)
+    attributes = _attribute_plans.get(cls)
+    if attributes is None:
+        swagger_types = getattr(obj, "swagger_types", None)
+        if not isinstance(swagger_types, Mapping) or not isinstance(
+            getattr(obj, "attribute_map", None), Mapping
+        ):
+            return None
+        attributes = tuple(swagger_types)
+        with _plans_lock:
+            _attribute_plans[cls] = attributes
+    return attributes
+
+
+def is_sdk_model(obj: Any) -> bool:
+    """Return True for OCI SDK model instances (objects carrying ``swagger_types`` and ``attribute_map``)."""
+    return _sdk_attributes(obj) is not None
+
+
+def _plain(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    attributes = _sdk_attributes(value)
+    if attributes is not None:
+        return {name: _plain(getattr(value, name, None)) for name in attributes}
+    return value
+
+
+def sdk_to_dict(obj: Any, fields: Iterable[str] | None = None) -> Any:
+    """
+    Convert an OCI SDK model (or a list or dict of them) to plain Python data.
+
+    Keys are the SDK's snake_case attribute names and datetimes become ISO-8601 strings, as with
+    ``oci.util.to_dict``. Attribute names come from the model's ``swagger_types`` and are looked
+    up once per model class. ``fields`` limits the top-level keys of a model to those names.
+    """
+    if fields is None:
+        return _plain(obj)
+    if isinstance(obj, (list, tuple)):
+        return [sdk_to_dict(item, fields) for item in obj]
+    attributes = _sdk_attributes(obj)
+    if attributes is None:
+        return _plain(obj)
+    wanted = set(fields)
+    return {name: _plain(getattr(obj, name, None)) for name in attributes if name in wanted}
+
+
+def _field_kind(annotation: Any) -> tuple[int, type | None]:
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union or origin is types.UnionType:
+        candidates = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _field_kind(candidates[0]) if len(candidates) == 1 else (_FIELD_KIND_PLAIN, None)
+    if origin is typing.Literal:
+        return _FIELD_KIND_SCALAR, None
+    if origin in (list, Sequence):
+        args = typing.get_args(annotation)
+        if args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+            return _FIELD_KIND_MODEL_LIST, args[0]
+        return _FIELD_KIND_PLAIN, None
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _FIELD_KIND_MODEL, annotation
+        if issubclass(annotation, (str, int, float, bool, date)):
+            return _FIELD_KIND_SCALAR, None
+    return _FIELD_KIND_PLAIN, None
+
+
+class _ModelPlan:
+    """How to fill each field of one pydantic model, worked out once per model class."""
+
+    def __init__(self, model_cls: type[BaseModel]):
+        self.kinds = {name: _field_kind(info.annotation) for name, info in model_cls.model_fields.items()}
+        self.defaults = {
+            name: info.get_default(call_default_factory=True) for name, info in model_cls.model_fields.items()
+        }
+        # Setting __dict__ directly is what model_construct does for a plain model, minus its
+        # per-call alias and default handling; models with extras or private state keep using it.
+        self.direct = not model_cls.__private_attributes__ and model_cls.model_config.get("extra") != "allow"
+        self._selections: dict[tuple[str, ...] | None, tuple[tuple, tuple, frozenset]] = {}
+
+    def selection(self, fields: tuple[str, ...] | None) -> tuple[tuple, tuple, frozenset]:
+        """(scalar fields, other fields, field names) to read; entries carry the SDK ``_<name>`` slot."""
+        selection = self._selections.get(fields)
+        if selection is None:
+            names = self.kinds if fields is None else fields
+            scalars = tuple((name, "_" + name) for name in names if self.kinds[name][0] == _FIELD_KIND_SCALAR)
+            others = tuple(
+                (name, "_" + name, *self.kinds[name])
+                for name in names
+                if self.kinds[name][0] != _FIELD_KIND_SCALAR
+            )
+            selection = self._selections[fields] = (scalars, others, frozenset(names))
+        return selection
+
+
+def _model_plan(model_cls: type[BaseModel]) -> _ModelPlan:
+    plan = _model_plans.get(model_cls)
+    if plan is None:
+        plan = _ModelPlan(model_cls)
+        with _plans_lock:
+            _model_plans[model_cls] = plan
+    return plan
+
+
+def model_field_names(model_cls: type[BaseModel]) -> list[str]:
+    """Field names a ``fields`` projection may select for ``model_cls``."""
+    return list(model_cls.model_fields)
+
+
+def validate_fields(model_cls: type[BaseModel], fields: Iterable[str] | None) -> list[str] | None:
+    """Normalize a ``fields`` projection, raising ValueError for names ``model_cls`` does not have."""
+    if fields is None:
+        return None
+    requested = list(dict.fromkeys(field.strip() for field in fields if field and field.strip()))
+    if not requested:
+        raise ValueError("fields must contain at least one field name")
+    unknown = [field for field in requested if field not in model_cls.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown fields {unknown}; available fields: {model_field_names(model_cls)}")
+    return requested
+
+
+def construct_model(
+    model_cls: type[BaseModel],
+    obj: Any,
+    fields: Iterable[str] | None = None,
+    converters: Mapping[str, Converter] | None = None,
+) -> BaseModel | None:
+    """
+    Build ``model_cls`` from an OCI SDK object without pydantic validation.
+
+    SDK responses are already typed by the SDK, so each field is read by name from ``obj`` and
+    the model is constructed the way ``model_construct`` does it. Fields typed as pydantic models
+    (or lists of them) are constructed the same way, SDK models in other fields are converted
+    with :func:`sdk_to_dict`, and ``converters`` override the mapping of individual fields whose
+    shape differs from the SDK's. With ``fields``, only those fields are read; the rest keep their
+    defaults. Call :func:`validate_fields` first when ``fields`` comes from a caller.
+    """
+    if obj is None:
+        return None
+    plan = _model_plan(model_cls)
+    scalars, others, names = plan.selection(None if fields is None else tuple(fields))
+    # Start from the defaults so __dict__ keeps the model's field order, as validation would.
+    values = dict(plan.defaults)
+    if isinstance(obj, dict):
+        values.update({name: obj.get(name) for name, _ in scalars})
+        read = obj.get
+    elif _sdk_attributes(obj) is not None:
+        # SDK models keep each swagger attribute in a ``_<name>`` slot behind a property.
+        state = obj.__dict__
+        values.update({name: state.get(slot) for name, slot in scalars})
+        read = None
+    else:
+        values.update({name: getattr(obj, name, None) for name, _ in scalars})
+        read = lambda name: getattr(obj, name, None)  # noqa: E731
+    for name, slot, kind, nested in others:
+        value = state.get(slot) if read is None else read(name)
+        if converters is not None and name in converters:
+            value = converters[name](value)
+        elif value is None:
+            pass
+        elif kind == _FIELD_KIND_MODEL:
+            value = construct_model(nested, value)
+        elif kind == _FIELD_KIND_MODEL_LIST:
+            value = [construct_model(nested, item) for item in value]
+        elif not isinstance(value, (str, int, float, bool, datetime, date)):
+            value = _plain(value)
+        values[name] = value
+    if not plan.direct:
+        return model_cls.model_construct(_fields_set=set(names), **values)
+    instance = model_cls.__new__(model_cls)
+    _object_setattr(instance, "__dict__", values)
+    _object_setattr(instance, "__pydantic_fields_set__", set(names))
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(instance, "__pydantic_private__", None)
+    return instance
+
+
+__all__ = [
+    "construct_model",
+    "is_sdk_model",
+    "model_field_names",
+    "sdk_to_dict",
+    "validate_fields",
+]
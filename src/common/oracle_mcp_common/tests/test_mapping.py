@@ -0,0 +1,118 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Literal, Optional
+
+import oci
+import pytest
+from pydantic import BaseModel
+
+from oracle_mcp_common import construct_model, is_sdk_model, sdk_to_dict, validate_fields
+
+CREATED = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class ShapeConfig(BaseModel):
+    ocpus: Optional[float] = None
+    memory_in_gbs: Optional[float] = None
+
+
+class Plugin(BaseModel):
+    name: Optional[str] = None
+    desired_state: Optional[str] = None
+
+
+class Instance(BaseModel):
+    id: Optional[str] = None
+    display_name: Optional[str] = None
+    lifecycle_state: Optional[Literal["RUNNING", "STOPPED", "UNKNOWN_ENUM_VALUE"]] = None
+    time_created: Optional[datetime] = None
+    freeform_tags: Optional[dict[str, str]] = None
+    shape_config: Optional[ShapeConfig] = None
+    source_details: Optional[dict[str, Any]] = None
+    plugins: Optional[list[Plugin]] = None
+
+
+def _sdk_instance():
+    return oci.core.models.Instance(
+        id="ocid1.instance.oc1..example",
+        display_name="web-01",
+        lifecycle_state="RUNNING",
+        time_created=CREATED,
+        freeform_tags={"env": "prod"},
+        shape_config=oci.core.models.InstanceShapeConfig(ocpus=2.0, memory_in_gbs=16.0),
+        source_details=oci.core.models.InstanceSourceViaImageDetails(image_id="ocid1.image.oc1..example"),
+    )
+
+
+class TestSdkToDict:
+    def test_matches_oci_to_dict(self):
+        instance = _sdk_instance()
+
+        assert is_sdk_model(instance)
+        assert not is_sdk_model({"id": "x"})
+        assert sdk_to_dict(instance) == oci.util.to_dict(instance)
+        assert sdk_to_dict([instance, None]) == [oci.util.to_dict(instance), None]
+
+    def test_fields_limit_top_level_keys(self):
+        assert sdk_to_dict([_sdk_instance()], fields=["id", "time_created"]) == [
+            {"id": "ocid1.instance.oc1..example", "time_created": CREATED.isoformat()}
+        ]
+
+
+class TestConstructModel:
+    def test_builds_nested_models_without_validation(self):
+        result = construct_model(Instance, _sdk_instance())
+
+        expected = Instance(
+            id="ocid1.instance.oc1..example",
+            display_name="web-01",
+            lifecycle_state="RUNNING",
+            time_created=CREATED,
+            freeform_tags={"env": "prod"},
+            shape_config=ShapeConfig(ocpus=2.0, memory_in_gbs=16.0),
+            source_details=oci.util.to_dict(_sdk_instance().source_details),
+        )
+        assert result == expected
+        assert result.model_dump_json() == expected.model_dump_json()
+        assert result.model_fields_set == set(Instance.model_fields)
+
+    def test_fields_projection_reads_only_requested_fields(self):
+        result = construct_model(Instance, _sdk_instance(), fields=["display_name", "shape_config"])
+
+        assert result.model_dump() == {
+            **{name: None for name in Instance.model_fields},
+            "display_name": "web-01",
+            "shape_config": {"ocpus": 2.0, "memory_in_gbs": 16.0},
+        }
+        assert result.model_fields_set == {"display_name", "shape_config"}
+
+    def test_converters_dicts_and_lists(self):
+        source = {
+            "id": "abc",
+            "plugins": [{"name": "monitoring", "desired_state": "ENABLED"}],
+            "freeform_tags": {"team": "web"},
+        }
+
+        result = construct_model(
+            Instance, source, converters={"freeform_tags": lambda tags: {"count": str(len(tags))}}
+        )
+
+        assert result.id == "abc"
+        assert result.plugins == [Plugin(name="monitoring", desired_state="ENABLED")]
+        assert result.freeform_tags == {"count": "1"}
+        assert construct_model(Instance, None) is None
+
+    def test_validate_fields(self):
+        assert validate_fields(Instance, None) is None
+        assert validate_fields(Instance, [" id ", "id", "display_name"]) == ["id", "display_name"]
+        with pytest.raises(ValueError, match="at least one"):
+            validate_fields(Instance, [" "])
+        with pytest.raises(ValueError, match=r"Unknown fields \['nope'\]"):
+            validate_fields(Instance, ["id", "nope"])
@@ -0,0 +1,211 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from logging import Logger
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = Logger(__name__, level="INFO")
+
+_CATALOG_FORMAT_VERSION = 1
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+# Operation names carry most of the signal, so their tokens count more than summary words.
+_OPERATION_TOKEN_WEIGHT = 3
+_CLIENT_TOKEN_WEIGHT = 2
+
+
+def catalog_dir() -> str:
+    value = os.getenv("OCI_CLOUD_OPERATION_CATALOG_DIR")
+    if value:
+        return os.path.expanduser(value)
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "oci-cloud-mcp-server")
+
+
+def catalog_file(sdk_version: str) -> str:
+    safe_version = re.sub(r"[^A-Za-z0-9.]+", "_", sdk_version)
+    return os.path.join(catalog_dir(), f"operation-catalog-{safe_version}.json")
+
+
+def _stem(token: str) -> str:
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str, stopwords: Iterable[str] = ()) -> List[str]:
+    """Lowercase word tokens of ``text``, splitting snake_case, dotted names and CamelCase."""
+    spaced = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", text or "")
+    stop = set(stopwords)
+    return [_stem(token) for token in re.split(r"[^a-z0-9]+", spaced.lower()) if token and token not in stop]
+
+
+def _client_text(client_fqn: str) -> str:
+    module_name, _, class_name = client_fqn.rpartition(".")
+    return f"{module_name.removeprefix('oci.')} {class_name.removesuffix('Client')}"
+
+
+class OperationIndex:
+    """BM25 index over SDK operations.
+
+    Each operation is one document made of its operation name, client name and doc summary,
+    with name tokens weighted above summary tokens. Scoring only touches the postings of the
+    query tokens, so a search costs a few dictionary lookups rather than a pass over every method.
+    """
+
+    def __init__(self, operations: List[Dict[str, Any]]):
+        self.operations = operations
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._lengths: List[int] = []
+        for doc_id, entry in enumerate(operations):
+            counts: Counter = Counter()
+            for token in tokenize(entry["operation"]):
+                counts[token] += _OPERATION_TOKEN_WEIGHT
+            for token in tokenize(_client_text(entry["client_fqn"])):
+                counts[token] += _CLIENT_TOKEN_WEIGHT
+            counts.update(tokenize(entry.get("summary", "")))
+            for token, count in counts.items():
+                self._postings[token].append((doc_id, count))
+            self._lengths.append(sum(counts.values()))
+        self._average_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+
+    def search(self, query_tokens: List[str], *, min_matched: int = 1) -> List[Tuple[float, int]]:
+        """Return (score, doc_id) for documents containing at least ``min_matched`` query tokens."""
+        scores: Dict[int, float] = defaultdict(float)
+        matched: Counter = Counter()
+        total = len(self._lengths)
+        for token in dict.fromkeys(query_tokens):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings:
+                norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * self._lengths[doc_id] / self._average_length)
+                scores[doc_id] += idf * tf * (_BM25_K1 + 1) / (tf + norm)
+                matched[doc_id] += 1
+        return [(score, doc_id) for doc_id, score in scores.items() if matched[doc_id] >= min_matched]
+
+
+class OperationCatalog:
+    """SDK operation catalog for the installed ``oci`` version, persisted as JSON.
+
+    ``builder`` walks the SDK (importing every client module) and returns
+    ``{"clients": [...], "operations": [...]}``. It runs once per SDK version; afterwards the
+    catalog and its index are loaded from disk without importing any SDK service module.
+    """
+
+    def __init__(
+        self, builder: Callable[[], Dict[str, Any]], sdk_version: str, *, path: Optional[str] = None
+    ):
+        self._builder = builder
+        self._sdk_version = sdk_version
+        self._path = path
+        self._data: Optional[Dict[str, Any]] = None
+        self._index: Optional[OperationIndex] = None
+        self._by_client: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self._path or catalog_file(self._sdk_version)
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, "r") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable operation catalog {self.path}: {e}")
+            return None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format") != _CATALOG_FORMAT_VERSION
+            or payload.get("sdk_version") != self._sdk_version
+            or not isinstance(payload.get("operations"), list)
+            or not isinstance(payload.get("clients"), list)
+        ):
+            return None
+        return payload
+
+    def _write(self, payload: Dict[str, Any]) -> None:
+        path = self.path
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist operation catalog {path}: {e}")
+            return
+        # Catalogs for other SDK versions are never read again.
+        directory, name = os.path.split(path)
+        for other in os.listdir(directory):
+            if other != name and other.startswith("operation-catalog-") and other.endswith(".json"):
+                try:
+                    os.remove(os.path.join(directory, other))
+                except OSError:
+                    pass
+
+    def _install(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        self._data = payload
+        self._index = OperationIndex(payload["operations"])
+        self._by_client = defaultdict(list)
+        for doc_id, entry in enumerate(payload["operations"]):
+            self._by_client[entry["client_fqn"]].append(doc_id)
+        return payload
+
+    def load(self, *, build: bool = True) -> Optional[Dict[str, Any]]:
+        """Return the catalog from memory or disk, building it unless ``build`` is False."""
+        with self._lock:
+            if self._data is not None:
+                return self._data
+            payload = self._read()
+            if payload is None:
+                if not build:
+                    return None
+                logger.info(f"Building OCI SDK operation catalog for oci {self._sdk_version}")
+                built = self._builder()
+                payload = {
+                    "format": _CATALOG_FORMAT_VERSION,
+                    "sdk_version": self._sdk_version,
+                    "clients": built["clients"],
+                    "operations": built["operations"],
+                }
+                self._write(payload)
+            return self._install(payload)
+
+    def clients(self) -> List[Dict[str, Any]]:
+        return list(self.load()["clients"])
+
+    def has_client(self, client_fqn: str) -> bool:
+        return self.load(build=False) is not None and client_fqn in self._by_client
+
+    def search(
+        self, query_tokens: List[str], *, client_fqn: Optional[str] = None, min_matched: int = 1
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """Return (bm25 score, operation entry) pairs, optionally restricted to one client."""
+        self.load()
+        results = self._index.search(query_tokens, min_matched=min_matched)
+        if client_fqn is not None:
+            allowed = set(self._by_client.get(client_fqn, ()))
+            results = [(score, doc_id) for score, doc_id in results if doc_id in allowed]
+        return [(score, self._index.operations[doc_id]) for score, doc_id in results]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data = None
+            self._index = None
+            self._by_client = {}
@@ -4,12 +4,18 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import contextvars
 import difflib
+import hashlib
 import inspect
 import json
 import os
 import pkgutil
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from functools import lru_cache
 from importlib import import_module
 from itertools import islice
@@ -23,6 +29,7 @@ from fastmcp.server.dependencies import get_access_token
 from fastmcp.utilities.auth import parse_scopes
 
 from . import __project__, __version__
+from .operation_catalog import OperationCatalog, OperationIndex, tokenize
 from .utils import initAuditLogger
 
 logger = Logger(__name__, level="INFO")
@@ -54,6 +61,12 @@ _http_auth: IDCSHttpAuth | None = None
 known_paginated: set = {"get_rr_set"}
 _MODEL_SUFFIXES = ("_details", "_config", "_configuration", "_source_details")
 _DEFAULT_SUMMARY_ITEMS = 5
+_MAX_BATCH_CALLS = 50
+_MAX_BATCH_WORKERS = 16
+_BATCH_CONNECT_TIMEOUT_SECONDS = 10.0
+_DEFAULT_CLIENT_CACHE_SIZE = 64
+_MAX_IDLE_CLIENTS_PER_KEY = 16
+_BATCH_CALL_KEYS = {"client_fqn", "operation", "params", "fields", "max_results", "result_mode"}
 _DEFAULT_MODEL_FIELDS = 20
 _SEARCH_QUERY_STOPWORDS = {
     "a",
@@ -319,7 +332,7 @@ def _resolve_polymorphic_model_class(model_class: Any, mapping: Dict[str, Any],
     return subtype_class if inspect.isclass(subtype_class) else model_class
 
 
-def _extract_expected_kwargs_from_source(method: Callable[..., Any]) -> Optional[set]:
+def _scan_expected_kwargs(method: Callable[..., Any]) -> Optional[frozenset]:
     try:
         src = inspect.getsource(method)
     except Exception:
@@ -327,13 +340,29 @@ def _extract_expected_kwargs_from_source(method: Callable[..., Any]) -> Optional
     try:
         match = re.search(r"expected_kwargs\s*=\s*\[\s*(.*?)\s*\]", src, re.DOTALL)
         if not match:
-            return set()
+            return frozenset()
         body = match.group(1)
-        return set(re.findall(r"['\"]([a-zA-Z0-9_]+)['\"]", body))
+        return frozenset(re.findall(r"['\"]([a-zA-Z0-9_]+)['\"]", body))
     except Exception:
         return None
 
 
+@lru_cache(maxsize=4096)
+def _expected_kwargs_for_function(function: Callable[..., Any]) -> Optional[frozenset]:
+    return _scan_expected_kwargs(function)
+
+
+def _extract_expected_kwargs_from_source(method: Callable[..., Any]) -> Optional[set]:
+    # SDK clients share one function object per (client class, operation); key the
+    # source scan on it so repeated invocations skip reading and parsing the SDK source.
+    function = getattr(method, "__func__", method)
+    try:
+        expected_kwargs = _expected_kwargs_for_function(function)
+    except TypeError:
+        expected_kwargs = _scan_expected_kwargs(method)
+    return set(expected_kwargs) if expected_kwargs is not None else None
+
+
 def _supports_pagination(method: Callable[..., Any], operation_name: str) -> bool:
     try:
         if operation_name.startswith("list_"):
@@ -467,6 +496,83 @@ def _discover_client_classes() -> List[Tuple[str, Any]]:
     return sorted(discovered, key=lambda item: item[0])
 
 
+def _code_string_constants(function: Callable[..., Any]) -> set:
+    code = getattr(getattr(function, "__func__", function), "__code__", None)
+    names: set = set()
+    for const in getattr(code, "co_consts", ()):
+        if isinstance(const, str):
+            names.add(const)
+        elif isinstance(const, tuple):
+            names.update(item for item in const if isinstance(item, str))
+    return names
+
+
+def _catalog_supports_pagination(method: Callable[..., Any], operation_name: str) -> bool:
+    # Same answer as _supports_pagination, but reads the expected_kwargs names from the compiled
+    # constants instead of parsing each method's source, which dominates a full-SDK catalog build.
+    if operation_name.startswith("list_") or operation_name.startswith("summarize_"):
+        return True
+    names = _code_string_constants(method)
+    if "page" in names or "limit" in names:
+        return True
+    try:
+        param_names = set(inspect.signature(method).parameters.keys())
+        if "page" in param_names or "limit" in param_names:
+            return True
+    except Exception:
+        pass
+    return operation_name in known_paginated
+
+
+def _catalog_operation_entries(client_fqn: str, cls: Any) -> List[Dict[str, Any]]:
+    entries: List[Dict[str, Any]] = []
+    for name, member in _get_public_client_methods(cls):
+        signature, doc = _inspect_method(member)
+        entries.append(
+            {
+                "client_fqn": client_fqn,
+                "operation": name,
+                "summary": doc.strip().partition("\n")[0] if doc else "",
+                "params": _signature_to_display(name, signature),
+                "paginated": _catalog_supports_pagination(member, name),
+            }
+        )
+    return entries
+
+
+def _build_operation_catalog() -> Dict[str, Any]:
+    clients: List[Dict[str, Any]] = []
+    operations: List[Dict[str, Any]] = []
+    for client_fqn, cls in _discover_client_classes():
+        clients.append(
+            {
+                "client_fqn": client_fqn,
+                "module": client_fqn.rsplit(".", 1)[0],
+                "class": getattr(cls, "__name__", client_fqn.rsplit(".", 1)[-1]),
+            }
+        )
+        operations.extend(_catalog_operation_entries(client_fqn, cls))
+    return {"clients": clients, "operations": operations}
+
+
+_OPERATION_CATALOG = OperationCatalog(lambda: _build_operation_catalog(), oci.__version__)
+
+
+def load_operation_catalog() -> Dict[str, Any]:
+    """Load the persisted SDK operation catalog, building it first for a new SDK version."""
+    return _OPERATION_CATALOG.load()
+
+
+def _rank_catalog_match(
+    score: float, entry: Dict[str, Any], query_tokens: List[str], normalized_query: str
+) -> float:
+    if normalized_query and normalized_query == " ".join(_normalized_query_tokens(entry["operation"])):
+        score *= 2
+    if any(entry["client_fqn"] in _FALLBACK_CLIENT_PREFERENCES.get(token, ()) for token in query_tokens):
+        score *= 1.2
+    return score
+
+
 def _get_http_config_and_signer() -> Tuple[Dict[str, Any], Any]:
     """Build caller-specific OCI SDK authentication for an HTTP request."""
     if _http_auth is None:
@@ -487,19 +593,165 @@ def _get_config_and_signer() -> Tuple[Dict[str, Any], Any]:
     return config, auth_context.signer
 
 
-def _import_client(client_fqn: str):
-    cls = _get_client_class(client_fqn)
-    config, signer = _get_config_and_signer()
-    client_kwargs = _get_oci_client_kwargs(signer)
+@lru_cache(maxsize=None)
+def _client_init_kwarg_names(cls: Any) -> Optional[frozenset]:
+    """Keyword names a client constructor accepts, or None when it takes **kwargs or cannot be inspected."""
     try:
         init_signature = inspect.signature(cls.__init__)
-        if any(param.kind == inspect.Parameter.VAR_KEYWORD for param in init_signature.parameters.values()):
-            return cls(config, **client_kwargs)
     except (TypeError, ValueError):
+        return None
+    if any(param.kind == inspect.Parameter.VAR_KEYWORD for param in init_signature.parameters.values()):
+        return None
+    return frozenset(init_signature.parameters)
+
+
+def _new_client(cls: Any, config: Dict[str, Any], signer: Any) -> Any:
+    client_kwargs = _get_oci_client_kwargs(signer)
+    accepted = _client_init_kwarg_names(cls)
+    if accepted is None:
         return cls(config, **client_kwargs)
+    return cls(config, **{key: value for key, value in client_kwargs.items() if key in accepted})
+
+
+def _import_client(client_fqn: str):
+    cls = _get_client_class(client_fqn)
+    config, signer = _get_config_and_signer()
+    return _new_client(cls, config, signer)
+
+
+# Settings that select the stdio principal; a change to any of them selects a different cache entry.
+_AUTH_ENV_PREFIXES = ("OCI_", "ORACLE_MCP_AUTH_METHOD")
+# Credential files named by the environment rather than by the OCI config file.
+_AUTH_ENV_FILES = (
+    "OCI_MCP_UPST_JWT_FILE",
+    "OCI_MCP_IDENTITY_DOMAIN_CLIENT_SECRET_FILE",
+    "OCI_MCP_DELEGATION_TOKEN_FILE",
+    "OCI_MCP_OKE_SERVICE_ACCOUNT_TOKEN_PATH",
+)
+
 
-    filtered_kwargs = {key: value for key, value in client_kwargs.items() if key in init_signature.parameters}
-    return cls(config, **filtered_kwargs)
+def _client_cache_size() -> int:
+    value = os.getenv("OCI_CLOUD_CLIENT_CACHE_SIZE")
+    try:
+        return max(0, int(value)) if value else _DEFAULT_CLIENT_CACHE_SIZE
+    except ValueError:
+        return _DEFAULT_CLIENT_CACHE_SIZE
+
+
+def _file_stamps(paths: List[Optional[str]]) -> Tuple[Tuple[str, Optional[Tuple[int, int]]], ...]:
+    stamps = []
+    for path in dict.fromkeys(os.path.expanduser(path) for path in paths if path):
+        try:
+            stat = os.stat(path)
+            stamps.append((path, (stat.st_mtime_ns, stat.st_size)))
+        except OSError:
+            stamps.append((path, None))
+    return tuple(stamps)
+
+
+class _ClientLease:
+    def __init__(
+        self,
+        cache: "_ClientCache",
+        key: Optional[tuple],
+        client: Any,
+        entry: Optional[Dict[str, Any]] = None,
+    ):
+        self._cache = cache
+        self._key = key
+        self._entry = entry
+        self.client = client
+
+    def release(self) -> None:
+        if self._key is not None:
+            self._cache._release(self._key, self._entry, self.client)
+            self._key = None
+            self._entry = None
+
+
+class _ClientCache:
+    """Constructed SDK clients reused across calls, so repeated calls keep their signer and connection pool.
+
+    stdio entries are keyed by client class and the auth settings in the environment, and are
+    dropped when the OCI config file or a credential file it names changes (for example after
+    `oci session refresh`). HTTP entries are keyed by client class and a hash of the caller's
+    access token, so a client built for one caller never signs another caller's request, and
+    expire with the token. A client is checked out by one call at a time; calls that run
+    concurrently get their own instances.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _identity(self) -> Optional[Tuple[tuple, Optional[float]]]:
+        if os.getenv("ORACLE_MCP_HOST") and os.getenv("ORACLE_MCP_PORT"):
+            access_token = get_access_token()
+            if access_token is None or not access_token.token:
+                return None
+            token_hash = hashlib.sha256(access_token.token.encode("utf-8")).hexdigest()
+            return ("http", token_hash, os.getenv("OCI_REGION")), getattr(access_token, "expires_at", None)
+        settings = tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith(_AUTH_ENV_PREFIXES)))
+        return ("stdio", settings), None
+
+    @staticmethod
+    def _credential_paths(config: Dict[str, Any]) -> List[Optional[str]]:
+        return [
+            os.getenv("OCI_CONFIG_FILE") or oci.config.DEFAULT_LOCATION,
+            config.get("key_file"),
+            config.get("security_token_file"),
+            *(os.getenv(name) for name in _AUTH_ENV_FILES),
+        ]
+
+    def checkout(self, client_fqn: str) -> _ClientLease:
+        cls = _get_client_class(client_fqn)
+        identity = self._identity() if _client_cache_size() else None
+        if identity is None:
+            return _ClientLease(self, None, _import_client(client_fqn))
+        key = (cls, identity[0])
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                (entry["expires_at"] is not None and entry["expires_at"] <= now)
+                or _file_stamps([path for path, _ in entry["stamps"]]) != entry["stamps"]
+            ):
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry["idle"]:
+                    return _ClientLease(self, key, entry["idle"].pop(), entry)
+
+        config, signer = _get_config_and_signer()
+        client = _new_client(cls, config, signer)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = {
+                    "stamps": _file_stamps(self._credential_paths(config)),
+                    "expires_at": identity[1],
+                    "idle": [],
+                }
+                self._entries[key] = entry
+            while len(self._entries) > _client_cache_size():
+                self._entries.popitem(last=False)
+        return _ClientLease(self, key, client, entry)
+
+    def _release(self, key: tuple, entry: Optional[Dict[str, Any]], client: Any) -> None:
+        # A client only goes back to the entry it was checked out against: if that entry was
+        # dropped (credentials changed, token expired, evicted) the client is discarded rather
+        # than pooled under the entry that replaced it.
+        with self._lock:
+            if self._entries.get(key) is entry and len(entry["idle"]) < _MAX_IDLE_CLIENTS_PER_KEY:
+                entry["idle"].append(client)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_CLIENT_CACHE = _ClientCache()
 
 
 def _annotation_to_type_name(annotation: Any) -> Optional[str]:
@@ -1074,6 +1326,102 @@ def _call_with_pagination_if_applicable(
     return data, opc_request_id, False
 
 
+def _accepts_kwarg(method: Callable[..., Any], name: str) -> bool:
+    if name in (_extract_expected_kwargs_from_source(method) or ()):
+        return True
+    try:
+        return name in inspect.signature(method).parameters
+    except Exception:
+        return False
+
+
+def _stream_paginated_summary(
+    method: Callable[..., Any],
+    params: Dict[str, Any],
+    operation_name: str,
+    sample_size: int,
+    exact_count: bool = False,
+) -> Tuple[List[Any], Dict[str, Any], Optional[str]]:
+    """
+    Page through a paginated operation for a summary. Only the first sample_size items are
+    serialized, page by page, and paging stops once the sample is full unless exact_count asks
+    for every page to be counted.
+
+    Returns (serialized sample items, counts, opc-request-id). counts holds item_count,
+    item_count_exact, has_more and pages_fetched, plus prefixes for Object Storage listings.
+    """
+    logger.info(f"Streaming summary for operation {operation_name}")
+    call_params = dict(params)
+    requested_limit = call_params.get("limit")
+    if not exact_count and _accepts_kwarg(method, "limit"):
+        # A summary only needs the sample, so ask for no more than that on each page.
+        if isinstance(requested_limit, int) and requested_limit > 0:
+            call_params["limit"] = min(requested_limit, sample_size)
+        else:
+            call_params["limit"] = sample_size
+
+    sample: List[Any] = []
+    prefixes: set = set()
+    is_list_objects_response = False
+    item_count = 0
+    total_items: Optional[int] = None
+    pages_fetched = 0
+    has_more = False
+    call_result = None
+
+    while True:
+        call_result = oci.retry.DEFAULT_RETRY_STRATEGY.make_retrying_call(method, **call_params)
+        pages_fetched += 1
+        response_data = call_result.data if hasattr(call_result, "data") else call_result
+        current_items, collection_kind, _ = _extract_paginated_items(response_data)
+        if collection_kind == "object_storage":
+            is_list_objects_response = True
+            prefixes.update(response_data.prefixes or [])
+        if total_items is None:
+            try:
+                total_items = int(call_result.headers.get("opc-total-items"))
+            except Exception:
+                total_items = None
+
+        page_count = 0
+        for item in current_items:
+            page_count += 1
+            if len(sample) < sample_size:
+                sample.append(_serialize_oci_data(item))
+        item_count += page_count
+
+        if is_list_objects_response:
+            next_start = getattr(response_data, "next_start_with", None)
+            more_pages = next_start is not None
+        else:
+            next_start = getattr(call_result, "next_page", None)
+            more_pages = bool(getattr(call_result, "has_next_page", False))
+
+        if not more_pages:
+            break
+        if not exact_count and len(sample) >= sample_size:
+            has_more = True
+            break
+        call_params["start" if is_list_objects_response else "page"] = next_start
+
+    exact = not has_more
+    if has_more and total_items is not None:
+        item_count, exact = max(total_items, item_count), True
+    counts: Dict[str, Any] = {
+        "item_count": item_count,
+        "item_count_exact": exact,
+        "has_more": has_more,
+        "pages_fetched": pages_fetched,
+    }
+    if is_list_objects_response:
+        counts["prefixes"] = sorted(prefixes)
+    try:
+        opc_request_id = call_result.headers.get("opc-request-id")
+    except Exception:
+        opc_request_id = None
+    return sample, counts, opc_request_id
+
+
 def _build_param_error_hints(
     method: Callable[..., Any], operation_name: str, params: Dict[str, Any], error_text: str
 ) -> Dict[str, Any]:
@@ -1142,37 +1490,34 @@ def find_oci_api(
         raise ValueError("query must be non-empty")
     query_tokens = _normalized_query_tokens(query)
     normalized_query = " ".join(query_tokens)
+    search_tokens = tokenize(normalized_query)
+    min_matched = min(2, len(set(search_tokens)))
 
     if client_fqn:
         _validate_client_fqn(client_fqn, require_client_class=True)
-        client_entries = [(client_fqn, _get_client_class(client_fqn))]
+        if _OPERATION_CATALOG.has_client(client_fqn):
+            scored = _OPERATION_CATALOG.search(search_tokens, client_fqn=client_fqn, min_matched=min_matched)
+        else:
+            # No catalog on disk yet, or a client it does not know: index just this one class.
+            entries = _catalog_operation_entries(client_fqn, _get_client_class(client_fqn))
+            scored = [
+                (score, entries[doc_id])
+                for score, doc_id in OperationIndex(entries).search(search_tokens, min_matched=min_matched)
+            ]
     else:
-        client_entries = _discover_client_classes()
-
-    matches: List[Tuple[int, Dict[str, Any]]] = []
-    for current_client_fqn, cls in client_entries:
-        for name, member in _get_public_client_methods(cls):
-            signature, doc = _inspect_method(member)
-            summary = doc.strip().partition("\n")[0] if doc else ""
-            score = _score_discovery_match(
-                query,
-                current_client_fqn,
-                name,
-                summary,
-                query_tokens=query_tokens,
-                normalized_query=normalized_query,
-            )
-            if score <= 0:
-                continue
-
-            entry: Dict[str, Any] = {
-                "client_fqn": current_client_fqn,
-                "operation": name,
-                "summary": summary,
-            }
-            if include_params:
-                entry["params"] = _signature_to_display(name, signature)
-            matches.append((score, entry))
+        scored = _OPERATION_CATALOG.search(search_tokens, min_matched=min_matched)
+
+    matches: List[Tuple[float, Dict[str, Any]]] = []
+    for score, catalog_entry in scored:
+        entry: Dict[str, Any] = {
+            "client_fqn": catalog_entry["client_fqn"],
+            "operation": catalog_entry["operation"],
+            "summary": catalog_entry["summary"],
+        }
+        if include_params:
+            entry["params"] = catalog_entry["params"]
+            entry["supports_pagination"] = catalog_entry["paginated"]
+        matches.append((_rank_catalog_match(score, catalog_entry, query_tokens, normalized_query), entry))
 
     matches.sort(key=lambda item: (-item[0], item[1]["client_fqn"], item[1]["operation"]))
     limited_matches = [entry for _, entry in matches[:limit]]
@@ -1204,37 +1549,18 @@ def describe_oci_operation(
     return _describe_operation(client_fqn, operation, max_model_fields=max_model_fields)
 
 
-@mcp.tool(
-    description=(
-        "Invoke an OCI Python SDK client method by fully-qualified client class and operation name. "
-        "This is a thin wrapper over the OCI Python SDK call. Equivalent Python "
-        "`oci.core.ComputeClient.list_instances(compartment_id='...')` maps to "
-        "`client_fqn='oci.core.ComputeClient', operation='list_instances', "
-        "params={'compartment_id': '...'}`. The default result_mode='auto' keeps list, summarize, and paginated results compact."
-    )
-)
-def invoke_oci_api(
-    client_fqn: Annotated[str, "Fully-qualified client class, e.g. 'oci.core.ComputeClient'"],
-    operation: Annotated[str, "Client method/operation name, e.g. 'list_instances' or 'get_instance'"],
-    params: Annotated[
-        Optional[Dict[str, Any]],
-        "Keyword arguments for the SDK method (JSON object). These are the snake_case kwargs you would pass in Python.",
-    ] = None,
-    fields: Annotated[
-        Optional[List[str]],
-        "Optional top-level response fields to project after serialization, e.g. "
-        "['id', 'display_name', 'lifecycle_state']. This shapes the returned payload only; "
-        "it does not change the SDK call contract.",
-    ] = None,
-    max_results: Annotated[
-        Optional[int],
-        "Optionally limit returned records for paginated operations, or trim top-level lists after serialization.",
-    ] = None,
-    result_mode: Annotated[
-        Literal["auto", "full", "summary"],
-        "Use 'auto' for compact defaults, 'summary' for a compact structural summary, or 'full' for the full payload.",
-    ] = "auto",
+def _invoke_operation(
+    client_fqn: str,
+    operation: str,
+    params: Optional[Dict[str, Any]] = None,
+    fields: Optional[List[str]] = None,
+    max_results: Optional[int] = None,
+    result_mode: str = "auto",
+    exact_count: bool = False,
+    acquire_client: Optional[Callable[[str], Any]] = None,
 ) -> dict:
+    """Run one invoke_oci_api call. Failures are returned as an error payload with repair hints."""
+    lease: Optional[_ClientLease] = None
     try:
         if max_results is not None and max_results < 1:
             raise ValueError("max_results must be >= 1")
@@ -1247,7 +1573,11 @@ def invoke_oci_api(
         else:
             normalized_fields = None
         _validate_client_fqn(client_fqn, require_client_class=True)
-        client = _import_client(client_fqn)
+        if acquire_client is not None:
+            client = acquire_client(client_fqn)
+        else:
+            lease = _CLIENT_CACHE.checkout(client_fqn)
+            client = lease.client
         method = _resolve_public_client_method(client, client_fqn, operation)
 
         input_params = params or {}
@@ -1260,18 +1590,6 @@ def invoke_oci_api(
         )
         logger.debug(f"invoke_oci_api final_params keys: {list(final_params.keys())}")
         logger.debug(f"op: {operation}")
-        data, opc_request_id, has_more_results = _call_with_pagination_if_applicable(
-            method,
-            final_params,
-            operation,
-            max_results,
-            uses_pagination=uses_pagination,
-        )
-
-        serialized_data = _serialize_oci_data(data)
-        projected_data, matched_fields, unmatched_fields, available_fields = _project_top_level_fields(
-            serialized_data, normalized_fields
-        )
 
         effective_result_mode = result_mode
         if result_mode == "auto":
@@ -1281,6 +1599,29 @@ def invoke_oci_api(
                 else "full"
             )
 
+        summary_counts: Optional[Dict[str, Any]] = None
+        if effective_result_mode == "summary" and uses_pagination:
+            projected_data, summary_counts, opc_request_id = _stream_paginated_summary(
+                method,
+                final_params,
+                operation,
+                max_results or _DEFAULT_SUMMARY_ITEMS,
+                exact_count=exact_count,
+            )
+            has_more_results = summary_counts["has_more"]
+        else:
+            data, opc_request_id, has_more_results = _call_with_pagination_if_applicable(
+                method,
+                final_params,
+                operation,
+                max_results,
+                uses_pagination=uses_pagination,
+            )
+            projected_data = _serialize_oci_data(data)
+        projected_data, matched_fields, unmatched_fields, available_fields = _project_top_level_fields(
+            projected_data, normalized_fields
+        )
+
         result_meta: Dict[str, Any] = {"result_mode": effective_result_mode, "pagination_used": uses_pagination}
         if max_results is not None:
             result_meta["max_results"] = max_results
@@ -1290,7 +1631,18 @@ def invoke_oci_api(
                 result_meta["unmatched_fields"] = unmatched_fields
                 result_meta["available_fields"] = available_fields
 
-        if effective_result_mode == "summary":
+        if summary_counts is not None:
+            rendered_data = _summarize_serialized_data(projected_data, max_results or _DEFAULT_SUMMARY_ITEMS)
+            rendered_data["item_count"] = summary_counts["item_count"]
+            rendered_data["item_count_exact"] = summary_counts["item_count_exact"]
+            rendered_data["has_more"] = has_more_results
+            rendered_data["sample_truncated"] = has_more_results or summary_counts["item_count"] > len(
+                projected_data
+            )
+            if "prefixes" in summary_counts:
+                rendered_data["prefixes"] = summary_counts["prefixes"]
+            result_meta["pages_fetched"] = summary_counts["pages_fetched"]
+        elif effective_result_mode == "summary":
             rendered_data = _summarize_serialized_data(projected_data, max_results or _DEFAULT_SUMMARY_ITEMS)
         else:
             trim_limit = None if uses_pagination else max_results
@@ -1350,6 +1702,181 @@ def invoke_oci_api(
         except Exception:
             pass
         return error_result
+    finally:
+        if lease is not None:
+            lease.release()
+
+
+@mcp.tool(
+    description=(
+        "Invoke an OCI Python SDK client method by fully-qualified client class and operation name. "
+        "This is a thin wrapper over the OCI Python SDK call. Equivalent Python "
+        "`oci.core.ComputeClient.list_instances(compartment_id='...')` maps to "
+        "`client_fqn='oci.core.ComputeClient', operation='list_instances', "
+        "params={'compartment_id': '...'}`. The default result_mode='auto' keeps list, summarize, and paginated results compact."
+    )
+)
+def invoke_oci_api(
+    client_fqn: Annotated[str, "Fully-qualified client class, e.g. 'oci.core.ComputeClient'"],
+    operation: Annotated[str, "Client method/operation name, e.g. 'list_instances' or 'get_instance'"],
+    params: Annotated[
+        Optional[Dict[str, Any]],
+        "Keyword arguments for the SDK method (JSON object). These are the snake_case kwargs you would pass in Python.",
+    ] = None,
+    fields: Annotated[
+        Optional[List[str]],
+        "Optional top-level response fields to project after serialization, e.g. "
+        "['id', 'display_name', 'lifecycle_state']. This shapes the returned payload only; "
+        "it does not change the SDK call contract.",
+    ] = None,
+    max_results: Annotated[
+        Optional[int],
+        "Optionally limit returned records for paginated operations, or trim top-level lists after serialization.",
+    ] = None,
+    result_mode: Annotated[
+        Literal["auto", "full", "summary"],
+        "Use 'auto' for compact defaults, 'summary' for a compact structural summary, or 'full' for the full payload.",
+    ] = "auto",
+    exact_count: Annotated[
+        bool,
+        "Summary mode only: page through every result to report an exact item_count. By default a "
+        "paginated summary stops once its sample is filled and reports has_more instead.",
+    ] = False,
+) -> dict:
+    return _invoke_operation(client_fqn, operation, params, fields, max_results, result_mode, exact_count)
+
+
+def _set_client_timeout(client: Any, timeout: Any) -> Any:
+    """Set the SDK client's (connect, read) timeout and return the previous value."""
+    base_client = getattr(client, "base_client", None)
+    if base_client is None or not hasattr(base_client, "timeout"):
+        return None
+    previous = base_client.timeout
+    base_client.timeout = timeout
+    return previous
+
+
+def _run_batch_call(call: Any, timeout_seconds: float, started: Dict[int, float], index: int):
+    started[index] = time.monotonic()
+    if not isinstance(call, dict):
+        return {"error": "each call must be an object with client_fqn, operation and optional params"}
+    client_fqn = call.get("client_fqn")
+    operation = call.get("operation")
+    if not isinstance(client_fqn, str) or not isinstance(operation, str):
+        return {
+            "client": client_fqn,
+            "operation": operation,
+            "error": "each call needs string client_fqn and operation values",
+        }
+    unknown = sorted(set(call) - _BATCH_CALL_KEYS)
+    if unknown:
+        return {"client": client_fqn, "operation": operation, "error": f"unsupported call keys: {unknown}"}
+
+    leases: List[Tuple[_ClientLease, Any]] = []
+
+    def acquire(fqn: str) -> Any:
+        lease = _CLIENT_CACHE.checkout(fqn)
+        timeout = (min(_BATCH_CONNECT_TIMEOUT_SECONDS, timeout_seconds), timeout_seconds)
+        leases.append((lease, _set_client_timeout(lease.client, timeout)))
+        return lease.client
+
+    try:
+        return _invoke_operation(
+            client_fqn,
+            operation,
+            call.get("params"),
+            call.get("fields"),
+            call.get("max_results"),
+            call.get("result_mode", "auto"),
+            acquire_client=acquire,
+        )
+    finally:
+        # Cached clients outlive the batch, so they go back with their own timeout.
+        for lease, previous_timeout in leases:
+            _set_client_timeout(lease.client, previous_timeout)
+            lease.release()
+
+
+@mcp.tool(
+    description=(
+        "Invoke several independent OCI Python SDK operations concurrently in one round trip, e.g. "
+        "get_instance for many OCIDs. Each call is {client_fqn, operation, params, fields?, max_results?, "
+        "result_mode?} with the same meaning as invoke_oci_api. Results come back in input order; a failing "
+        "call returns its own error without affecting the others."
+    )
+)
+def invoke_oci_api_batch(
+    calls: Annotated[
+        List[Dict[str, Any]],
+        f"Independent calls to run (at most {_MAX_BATCH_CALLS}). Do not batch calls that depend on each "
+        "other's results.",
+    ],
+    max_workers: Annotated[int, f"Maximum calls in flight at once (1-{_MAX_BATCH_WORKERS})."] = 8,
+    timeout_seconds: Annotated[
+        float, "Per-call timeout. A call still running after this is reported as timed out."
+    ] = 60.0,
+) -> dict:
+    if not isinstance(calls, list) or not calls:
+        raise ValueError("calls must be a non-empty list")
+    if len(calls) > _MAX_BATCH_CALLS:
+        raise ValueError(f"calls must contain at most {_MAX_BATCH_CALLS} entries")
+    if not 1 <= max_workers <= _MAX_BATCH_WORKERS:
+        raise ValueError(f"max_workers must be between 1 and {_MAX_BATCH_WORKERS}")
+    if timeout_seconds <= 0:
+        raise ValueError("timeout_seconds must be > 0")
+
+    batch_started = time.monotonic()
+    started: Dict[int, float] = {}
+    results: List[Optional[dict]] = [None] * len(calls)
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(calls)), thread_name_prefix="oci-batch")
+    try:
+        # Each call runs in a copy of the caller's context so HTTP-mode token lookups still see the request.
+        futures = {
+            executor.submit(
+                contextvars.copy_context().run, _run_batch_call, call, timeout_seconds, started, index
+            ): index
+            for index, call in enumerate(calls)
+        }
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            running = [started[futures[f]] + timeout_seconds - now for f in pending if futures[f] in started]
+            poll = max(0.0, min(running)) if running else None
+            poll = min(poll, 0.5) if poll is not None else 0.5
+            done, pending = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as exc:
+                    results[index] = {"error": str(exc)}
+            now = time.monotonic()
+            for future in list(pending):
+                index = futures[future]
+                if index in started and now - started[index] >= timeout_seconds:
+                    call = calls[index] if isinstance(calls[index], dict) else {}
+                    results[index] = {
+                        "client": call.get("client_fqn"),
+                        "operation": call.get("operation"),
+                        "params": call.get("params") or {},
+                        "error": f"timed out after {timeout_seconds:g}s",
+                        "timed_out": True,
+                    }
+                    pending.discard(future)
+    finally:
+        # Timed-out calls cannot be interrupted; let them finish in the background.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    items = [{"index": index, **(result or {})} for index, result in enumerate(results)]
+    failed = sum(1 for item in items if "error" in item)
+    logger.info(f"invoke_oci_api_batch ran {len(items)} calls, {failed} failed")
+    return {
+        "count": len(items),
+        "succeeded": len(items) - failed,
+        "failed": failed,
+        "elapsed_seconds": round(time.monotonic() - batch_started, 3),
+        "results": items,
+    }
 
 
 @mcp.tool(
@@ -1413,14 +1940,7 @@ def list_client_operations(
     )
 )
 def list_oci_clients() -> dict:
-    clients = [
-        {
-            "client_fqn": client_fqn,
-            "module": client_fqn.rsplit(".", 1)[0],
-            "class": getattr(cls, "__name__", client_fqn.rsplit(".", 1)[-1]),
-        }
-        for client_fqn, cls in _discover_client_classes()
-    ]
+    clients = _OPERATION_CATALOG.clients()
     return {"count": len(clients), "clients": clients}
 
 
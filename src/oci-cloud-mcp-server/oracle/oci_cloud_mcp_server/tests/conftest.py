@@ -0,0 +1,25 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import pytest
+import oracle.oci_cloud_mcp_server.server as server_mod
+
+
+@pytest.fixture(autouse=True)
+def isolated_operation_catalog(monkeypatch, tmp_path):
+    """Keep every test on its own operation catalog instead of the user's cached one."""
+    monkeypatch.setenv("OCI_CLOUD_OPERATION_CATALOG_DIR", str(tmp_path / "operation-catalog"))
+    server_mod._OPERATION_CATALOG.clear()
+    yield
+    server_mod._OPERATION_CATALOG.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_client_cache():
+    """Start every test without SDK clients cached by an earlier one."""
+    server_mod._CLIENT_CACHE.clear()
+    yield
+    server_mod._CLIENT_CACHE.clear()
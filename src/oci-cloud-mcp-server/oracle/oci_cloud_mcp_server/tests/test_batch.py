@@ -0,0 +1,110 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+
+from oracle.oci_cloud_mcp_server.server import mcp
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.headers = {"opc-request-id": "req-batch"}
+
+
+@pytest.fixture
+def fake_clients(monkeypatch):
+    created = []
+    in_use = set()
+    lock = threading.Lock()
+
+    class FakeClient:
+        def __init__(self, config, signer):
+            self.base_client = SimpleNamespace(timeout=None)
+            self.call_timeouts = []
+            created.append(self)
+
+        def get_thing(self, id):
+            with lock:
+                assert self not in in_use
+                in_use.add(self)
+                self.call_timeouts.append(self.base_client.timeout)
+            try:
+                if id == "slow":
+                    time.sleep(1.0)
+                elif id == "missing":
+                    raise ValueError("thing not found")
+                else:
+                    time.sleep(0.05)
+                return FakeResponse({"id": id})
+            finally:
+                with lock:
+                    in_use.discard(self)
+
+    monkeypatch.setattr(
+        "oracle.oci_cloud_mcp_server.server.import_module",
+        lambda name: SimpleNamespace(FakeClient=FakeClient),
+    )
+    monkeypatch.setattr(
+        "oracle.oci_cloud_mcp_server.server._get_config_and_signer",
+        lambda: ({}, object()),
+    )
+    return created
+
+
+def _call(thing_id):
+    return {"client_fqn": "oci.fake.FakeClient", "operation": "get_thing", "params": {"id": thing_id}}
+
+
+class TestInvokeBatch:
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order_and_reuse_clients(self, fake_clients):
+        async with Client(mcp) as client:
+            res = (
+                await client.call_tool(
+                    "invoke_oci_api_batch",
+                    {"calls": [_call(f"t{i}") for i in range(8)], "max_workers": 3},
+                )
+            ).data
+
+        assert res["count"] == 8
+        assert res["succeeded"] == 8
+        assert [item["index"] for item in res["results"]] == list(range(8))
+        assert [item["data"] for item in res["results"]] == [{"id": f"t{i}"} for i in range(8)]
+        assert 1 <= len(fake_clients) <= 3
+        assert {t for c in fake_clients for t in c.call_timeouts} == {(10.0, 60.0)}
+        # Clients go back to the shared cache with their own timeout.
+        assert all(c.base_client.timeout is None for c in fake_clients)
+
+    @pytest.mark.asyncio
+    async def test_failures_and_timeouts_are_reported_per_item(self, fake_clients):
+        calls = [_call("a"), _call("missing"), {"operation": "get_thing"}, _call("slow"), _call("b")]
+
+        async with Client(mcp) as client:
+            res = (
+                await client.call_tool("invoke_oci_api_batch", {"calls": calls, "timeout_seconds": 0.3})
+            ).data
+
+        items = res["results"]
+        assert (res["succeeded"], res["failed"]) == (2, 3)
+        assert items[0]["data"] == {"id": "a"}
+        assert "thing not found" in items[1]["error"]
+        assert "client_fqn and operation" in items[2]["error"]
+        assert items[3]["timed_out"] is True
+        assert items[3]["error"] == "timed out after 0.3s"
+        assert items[4]["data"] == {"id": "b"}
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_batches(self, fake_clients):
+        async with Client(mcp) as client:
+            with pytest.raises(ToolError, match="at most"):
+                await client.call_tool("invoke_oci_api_batch", {"calls": [_call("x")] * 51})
@@ -302,6 +302,30 @@ class TestExtractExpectedKwargs:
         out = _extract_expected_kwargs_from_source(lambda: None)
         assert out is None
 
+    def test_reads_source_once_per_client_method(self, monkeypatch):
+        import oracle.oci_cloud_mcp_server.server as server_mod
+
+        reads = []
+        getsource = server_mod.inspect.getsource
+
+        def counting_getsource(obj):
+            reads.append(obj)
+            return getsource(obj)
+
+        class FakeClient:
+            def list_widgets(self, **kwargs):  # noqa: ARG002
+                expected_kwargs = ["limit", "page"]  # noqa: F841
+                return None
+
+        monkeypatch.setattr(server_mod.inspect, "getsource", counting_getsource)
+
+        first = _extract_expected_kwargs_from_source(FakeClient().list_widgets)
+        first.add("mutated")
+        second = _extract_expected_kwargs_from_source(FakeClient().list_widgets)
+
+        assert second == {"limit", "page"}
+        assert len(reads) == 1
+
 
 class TestAlignParamsToSignature:
     def test_renames_details_key_when_signature_requires(self):
@@ -0,0 +1,159 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastmcp import Client
+
+import oracle.oci_cloud_mcp_server.server as server_mod
+from oracle.oci_cloud_mcp_server.server import _CLIENT_CACHE, mcp
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.headers = {"opc-request-id": "req-cache"}
+
+
+@pytest.fixture
+def fake_client(monkeypatch, tmp_path):
+    config_file = tmp_path / "config"
+    config_file.write_text("[DEFAULT]\nregion=us-chicago-1\n")
+    monkeypatch.setenv("OCI_CONFIG_FILE", str(config_file))
+    signers = []
+
+    class FakeClient:
+        def __init__(self, config, signer):
+            self.config = config
+            self.signer = signer
+
+        def get_thing(self, thing_id):
+            return FakeResponse({"id": thing_id, "signer": self.signer})
+
+    def config_and_signer():
+        signers.append(f"signer-{len(signers)}")
+        return {"region": "us-chicago-1"}, signers[-1]
+
+    monkeypatch.setattr(
+        "oracle.oci_cloud_mcp_server.server.import_module",
+        lambda name: SimpleNamespace(FakeClient=FakeClient),
+    )
+    monkeypatch.setattr("oracle.oci_cloud_mcp_server.server._get_config_and_signer", config_and_signer)
+    return SimpleNamespace(cls=FakeClient, signers=signers, config_file=config_file)
+
+
+def _checkout():
+    lease = _CLIENT_CACHE.checkout("oci.fake.FakeClient")
+    lease.release()
+    return lease.client
+
+
+def _set_http_mode(monkeypatch, tokens):
+    monkeypatch.setenv("ORACLE_MCP_HOST", "127.0.0.1")
+    monkeypatch.setenv("ORACLE_MCP_PORT", "8888")
+    monkeypatch.setattr(
+        "oracle.oci_cloud_mcp_server.server.get_access_token",
+        lambda: tokens[-1],
+    )
+
+
+class TestClientCache:
+    @pytest.mark.asyncio
+    async def test_repeated_invocations_reuse_one_client(self, fake_client):
+        async with Client(mcp) as client:
+            for thing_id in ("a", "b", "c"):
+                result = (
+                    await client.call_tool(
+                        "invoke_oci_api",
+                        {
+                            "client_fqn": "oci.fake.FakeClient",
+                            "operation": "get_thing",
+                            "params": {"thing_id": thing_id},
+                        },
+                    )
+                ).data
+                assert result["data"] == {"id": thing_id, "signer": "signer-0"}
+
+        assert fake_client.signers == ["signer-0"]
+
+    def test_concurrent_checkouts_get_their_own_clients(self, fake_client):
+        first = _CLIENT_CACHE.checkout("oci.fake.FakeClient")
+        second = _CLIENT_CACHE.checkout("oci.fake.FakeClient")
+        assert first.client is not second.client
+        first.release()
+        second.release()
+
+        assert _checkout() in (first.client, second.client)
+        assert len(fake_client.signers) == 2
+
+    def test_credential_file_change_rebuilds_the_client(self, fake_client):
+        before = _checkout()
+        stat = os.stat(fake_client.config_file)
+        fake_client.config_file.write_text("[DEFAULT]\nregion=us-ashburn-1\n")
+        os.utime(fake_client.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        after = _checkout()
+
+        assert after is not before
+        assert after is _checkout()
+        assert fake_client.signers == ["signer-0", "signer-1"]
+
+    def test_client_checked_out_across_a_credential_change_is_not_pooled(self, fake_client):
+        stale = _CLIENT_CACHE.checkout("oci.fake.FakeClient")
+        stat = os.stat(fake_client.config_file)
+        fake_client.config_file.write_text("[DEFAULT]\nregion=us-ashburn-1\n")
+        os.utime(fake_client.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        fresh = _CLIENT_CACHE.checkout("oci.fake.FakeClient")
+        fresh.release()
+        stale.release()
+
+        assert _checkout() is fresh.client
+        assert _checkout() is not stale.client
+
+    def test_auth_settings_select_separate_clients(self, fake_client, monkeypatch):
+        default_profile = _checkout()
+        monkeypatch.setenv("OCI_CONFIG_PROFILE", "OTHER")
+
+        assert _checkout() is not default_profile
+        monkeypatch.delenv("OCI_CONFIG_PROFILE")
+        assert _checkout() is default_profile
+
+    def test_http_clients_are_per_caller_and_expire_with_the_token(self, fake_client, monkeypatch):
+        tokens = [SimpleNamespace(token="caller-a", expires_at=None)]
+        _set_http_mode(monkeypatch, tokens)
+        caller_a = _checkout()
+        tokens.append(SimpleNamespace(token="caller-b", expires_at=time.time() - 1))
+        caller_b = _checkout()
+        tokens.append(tokens[0])
+
+        assert caller_b is not caller_a
+        assert _checkout() is caller_a
+        tokens.append(tokens[1])
+        assert _checkout() is not caller_b
+
+    def test_cache_can_be_disabled(self, fake_client, monkeypatch):
+        monkeypatch.setenv("OCI_CLOUD_CLIENT_CACHE_SIZE", "0")
+
+        assert _checkout() is not _checkout()
+
+    def test_constructor_signature_is_inspected_once_per_class(self, fake_client, monkeypatch):
+        calls = []
+        real_signature = server_mod.inspect.signature
+
+        def counting_signature(obj):
+            calls.append(obj)
+            return real_signature(obj)
+
+        monkeypatch.setattr("oracle.oci_cloud_mcp_server.server.inspect.signature", counting_signature)
+        monkeypatch.setenv("OCI_CLOUD_CLIENT_CACHE_SIZE", "0")
+
+        _checkout()
+        _checkout()
+
+        assert calls.count(fake_client.cls.__init__) == 1
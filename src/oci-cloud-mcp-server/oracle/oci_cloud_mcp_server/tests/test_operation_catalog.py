@@ -0,0 +1,180 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import json
+import os
+
+import pytest
+from fastmcp import Client
+
+import oracle.oci_cloud_mcp_server.server as server_mod
+from oracle.oci_cloud_mcp_server.operation_catalog import OperationCatalog, OperationIndex, tokenize
+from oracle.oci_cloud_mcp_server.server import mcp
+
+
+class ComputeClient:
+    def list_instances(self, compartment_id, **kwargs):  # noqa: ARG002
+        """Lists the instances in the specified compartment."""
+        return None
+
+    def get_instance(self, instance_id, **kwargs):  # noqa: ARG002
+        """Gets information about the specified instance."""
+        return None
+
+    def get_windows_instance_initial_credentials(self, instance_id, **kwargs):  # noqa: ARG002
+        """Gets the generated credentials for the instance."""
+        expected_kwargs = ["retry_strategy", "page"]
+        return expected_kwargs
+
+
+class ObjectStorageClient:
+    def list_buckets(self, namespace_name, compartment_id, **kwargs):  # noqa: ARG002
+        """Gets a list of all BucketSummary items in a compartment."""
+        return None
+
+
+DISCOVERED = [
+    ("oci.core.ComputeClient", ComputeClient),
+    ("oci.object_storage.ObjectStorageClient", ObjectStorageClient),
+]
+
+
+def _catalog_payload(*operations, sdk_version):
+    return {
+        "format": 1,
+        "sdk_version": sdk_version,
+        "clients": [],
+        "operations": list(operations),
+    }
+
+
+class TestOperationIndex:
+    def test_tokenize_splits_names_and_folds_plurals(self):
+        assert tokenize("oci.core.ComputeClient list_instances") == [
+            "oci",
+            "core",
+            "compute",
+            "client",
+            "list",
+            "instance",
+        ]
+        assert tokenize("policies and access") == ["policy", "and", "access"]
+        assert tokenize("the vcn", stopwords={"the"}) == ["vcn"]
+
+    def test_operation_name_matches_outrank_summary_mentions(self):
+        index = OperationIndex(
+            [
+                {
+                    "client_fqn": "oci.core.ComputeClient",
+                    "operation": "get_image",
+                    "summary": "Lists instance images.",
+                },
+                {
+                    "client_fqn": "oci.core.ComputeClient",
+                    "operation": "list_instances",
+                    "summary": "Lists instances.",
+                },
+                {"client_fqn": "oci.core.ComputeClient", "operation": "get_vnic", "summary": "Gets a VNIC."},
+            ]
+        )
+
+        results = sorted(index.search(["list", "instance"], min_matched=2), reverse=True)
+
+        assert [doc_id for _, doc_id in results] == [1, 0]
+
+
+class TestOperationCatalog:
+    def test_built_once_then_loaded_from_disk(self, tmp_path):
+        path = str(tmp_path / "catalog.json")
+        calls = []
+
+        def builder():
+            calls.append(1)
+            return {
+                "clients": [{"client_fqn": "oci.core.ComputeClient"}],
+                "operations": [
+                    {
+                        "client_fqn": "oci.core.ComputeClient",
+                        "operation": "list_instances",
+                        "summary": "",
+                        "params": "",
+                        "paginated": True,
+                    }
+                ],
+            }
+
+        assert OperationCatalog(builder, "2.0.0", path=path).load()["sdk_version"] == "2.0.0"
+        cold = OperationCatalog(builder, "2.0.0", path=path)
+
+        assert cold.search(["instance"])[0][1]["operation"] == "list_instances"
+        assert cold.has_client("oci.core.ComputeClient")
+        assert calls == [1]
+
+    def test_new_sdk_version_rebuilds_and_prunes_old_catalogs(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("OCI_CLOUD_OPERATION_CATALOG_DIR", str(tmp_path))
+        (tmp_path / "operation-catalog-1.0.0.json").write_text(
+            json.dumps(_catalog_payload(sdk_version="1.0.0"))
+        )
+
+        catalog = OperationCatalog(lambda: {"clients": [], "operations": []}, "2.0.0")
+
+        assert catalog.load()["sdk_version"] == "2.0.0"
+        assert os.listdir(tmp_path) == ["operation-catalog-2.0.0.json"]
+
+    def test_unreadable_catalog_is_rebuilt(self, tmp_path):
+        path = tmp_path / "catalog.json"
+        path.write_text("{not json")
+        catalog = OperationCatalog(lambda: {"clients": [], "operations": []}, "2.0.0", path=str(path))
+
+        assert catalog.load(build=False) is None
+        assert catalog.load()["operations"] == []
+        assert json.loads(path.read_text())["sdk_version"] == "2.0.0"
+
+
+class TestCatalogBackedDiscovery:
+    def test_catalog_entries_record_summary_params_and_pagination(self):
+        entries = {
+            entry["operation"]: entry
+            for entry in server_mod._catalog_operation_entries("oci.core.ComputeClient", ComputeClient)
+        }
+
+        assert entries["list_instances"]["summary"] == "Lists the instances in the specified compartment."
+        assert entries["list_instances"]["params"] == "list_instances(compartment_id, **kwargs)"
+        assert entries["list_instances"]["paginated"] is True
+        assert entries["get_windows_instance_initial_credentials"]["paginated"] is True
+        assert entries["get_instance"]["paginated"] is False
+
+    @pytest.mark.asyncio
+    async def test_find_oci_api_builds_catalog_once_and_searches_it(self, monkeypatch):
+        discovered = []
+
+        def discover():
+            discovered.append(1)
+            return DISCOVERED
+
+        monkeypatch.setattr("oracle.oci_cloud_mcp_server.server._discover_client_classes", discover)
+
+        async with Client(mcp) as client:
+            first = (await client.call_tool("find_oci_api", {"query": "list buckets"})).data
+            server_mod._OPERATION_CATALOG.clear()
+            second = (
+                await client.call_tool(
+                    "find_oci_api",
+                    {"query": "instance get", "client_fqn": "oci.core.ComputeClient", "include_params": True},
+                )
+            ).data
+            clients = (await client.call_tool("list_oci_clients", {})).data
+
+        assert discovered == [1]
+        assert first["matches"][0]["operation"] == "list_buckets"
+        assert second["matches"][0] == {
+            "client_fqn": "oci.core.ComputeClient",
+            "operation": "get_instance",
+            "summary": "Gets information about the specified instance.",
+            "params": "get_instance(instance_id, **kwargs)",
+            "supports_pagination": False,
+        }
+        assert [c["client_fqn"] for c in clients["clients"]] == [fqn for fqn, _ in DISCOVERED]
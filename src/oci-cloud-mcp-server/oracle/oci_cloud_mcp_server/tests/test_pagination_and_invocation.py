@@ -364,3 +364,108 @@ class TestInvokeTypeErrorPropagation:
 
         assert "error" in res
         assert "unexpected keyword" in res["error"].lower()
+
+
+class _PagedThingsClient:
+    """Serves list_things in pages of page_size from total items and records each call."""
+
+    def __init__(self, total, page_size=None, total_header=False):
+        self.total = total
+        self.page_size = page_size
+        self.total_header = total_header
+        self.calls = []
+
+    def list_things(self, compartment_id, **kwargs):  # noqa: ARG002
+        expected_kwargs = ["page", "limit"]  # noqa: F841
+        self.calls.append(dict(kwargs))
+        start = int(kwargs.get("page") or 0)
+        size = kwargs.get("limit") or self.page_size or self.total
+        items = [{"id": f"thing-{i}"} for i in range(start, min(start + size, self.total))]
+        end = start + len(items)
+        headers = {"opc-request-id": f"req-{start}"}
+        if self.total_header:
+            headers["opc-total-items"] = str(self.total)
+        return SimpleNamespace(
+            data=items,
+            headers=headers,
+            has_next_page=end < self.total,
+            next_page=str(end) if end < self.total else None,
+        )
+
+
+class TestStreamingSummary:
+    async def _invoke(self, monkeypatch, fake, **arguments):
+        class FakeClient:
+            def __new__(cls, *args, **kwargs):  # noqa: ARG004
+                return fake
+
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server.import_module",
+            lambda name: SimpleNamespace(FakeClient=FakeClient),
+        )
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server._get_config_and_signer",
+            lambda: ({}, object()),
+        )
+        async with Client(mcp) as client:
+            return (
+                await client.call_tool(
+                    "invoke_oci_api",
+                    {
+                        "client_fqn": "oci.fake.FakeClient",
+                        "operation": "list_things",
+                        "params": {"compartment_id": "ocid1.compartment.oc1..example"},
+                        **arguments,
+                    },
+                )
+            ).data
+
+    @pytest.mark.asyncio
+    async def test_summary_stops_after_the_sample_page(self, monkeypatch):
+        fake = _PagedThingsClient(total=1000)
+
+        res = await self._invoke(monkeypatch, fake)
+
+        assert fake.calls == [{"limit": 5}]
+        assert res["data"]["sample"] == [{"id": f"thing-{i}"} for i in range(5)]
+        assert res["data"]["item_count"] == 5
+        assert res["data"]["item_count_exact"] is False
+        assert res["data"]["has_more"] is True
+        assert res["data"]["sample_truncated"] is True
+        assert res["result_meta"]["pages_fetched"] == 1
+
+    @pytest.mark.asyncio
+    async def test_summary_uses_total_items_header_when_present(self, monkeypatch):
+        fake = _PagedThingsClient(total=1000, total_header=True)
+
+        res = await self._invoke(monkeypatch, fake, max_results=3)
+
+        assert fake.calls == [{"limit": 3}]
+        assert res["data"]["sample_count"] == 3
+        assert res["data"]["item_count"] == 1000
+        assert res["data"]["item_count_exact"] is True
+        assert res["data"]["has_more"] is True
+
+    @pytest.mark.asyncio
+    async def test_exact_count_walks_every_page_but_keeps_the_sample_small(self, monkeypatch):
+        fake = _PagedThingsClient(total=25, page_size=10)
+
+        res = await self._invoke(monkeypatch, fake, exact_count=True, fields=["id"])
+
+        assert [call.get("page") for call in fake.calls] == [None, "10", "20"]
+        assert res["data"]["item_count"] == 25
+        assert res["data"]["item_count_exact"] is True
+        assert res["data"]["has_more"] is False
+        assert res["data"]["sample_count"] == 5
+        assert res["result_meta"]["pages_fetched"] == 3
+
+    @pytest.mark.asyncio
+    async def test_summary_of_a_short_listing_is_exact(self, monkeypatch):
+        fake = _PagedThingsClient(total=2)
+
+        res = await self._invoke(monkeypatch, fake, result_mode="summary")
+
+        assert res["data"]["item_count"] == 2
+        assert res["data"]["item_count_exact"] is True
+        assert res["data"]["has_more"] is False
+        assert res["data"]["sample_truncated"] is False
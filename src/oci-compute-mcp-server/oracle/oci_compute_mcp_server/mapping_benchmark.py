@@ -0,0 +1,176 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import oci
+from pydantic import TypeAdapter
+
+from oracle.oci_compute_mcp_server.models import (
+    Instance,
+    map_agent_config,
+    map_availability_config,
+    map_instance,
+    map_instance_options,
+    map_launch_options,
+    map_licensing_configs,
+    map_placement_constraint_details,
+    map_platform_config,
+    map_preemptible_config,
+    map_shape_config,
+    map_source_details,
+)
+
+_INSTANCES = TypeAdapter(list[Instance])
+_PROJECTED_FIELDS = ["id", "display_name", "lifecycle_state", "shape", "time_created"]
+
+
+def validated_map_instance(instance_data: oci.core.models.Instance) -> Instance:
+    """The validating mapper list_instances used before the shared mapping layer."""
+    return Instance(
+        availability_domain=getattr(instance_data, "availability_domain", None),
+        capacity_reservation_id=getattr(instance_data, "capacity_reservation_id", None),
+        compartment_id=getattr(instance_data, "compartment_id", None),
+        placement_constraint_details=map_placement_constraint_details(
+            getattr(instance_data, "placement_constraint_details", None)
+        ),
+        cluster_placement_group_id=getattr(instance_data, "cluster_placement_group_id", None),
+        dedicated_vm_host_id=getattr(instance_data, "dedicated_vm_host_id", None),
+        defined_tags=getattr(instance_data, "defined_tags", None),
+        security_attributes=getattr(instance_data, "security_attributes", None),
+        security_attributes_state=getattr(instance_data, "security_attributes_state", None),
+        display_name=getattr(instance_data, "display_name", None),
+        extended_metadata=getattr(instance_data, "extended_metadata", None),
+        fault_domain=getattr(instance_data, "fault_domain", None),
+        freeform_tags=getattr(instance_data, "freeform_tags", None),
+        id=getattr(instance_data, "id", None),
+        image_id=getattr(instance_data, "image_id", None),
+        ipxe_script=getattr(instance_data, "ipxe_script", None),
+        launch_mode=getattr(instance_data, "launch_mode", None),
+        launch_options=map_launch_options(getattr(instance_data, "launch_options", None)),
+        instance_options=map_instance_options(getattr(instance_data, "instance_options", None)),
+        availability_config=map_availability_config(getattr(instance_data, "availability_config", None)),
+        preemptible_instance_config=map_preemptible_config(
+            getattr(instance_data, "preemptible_instance_config", None)
+        ),
+        lifecycle_state=getattr(instance_data, "lifecycle_state", None),
+        metadata=getattr(instance_data, "metadata", None),
+        region=getattr(instance_data, "region", None),
+        shape=getattr(instance_data, "shape", None),
+        shape_config=map_shape_config(getattr(instance_data, "shape_config", None)),
+        is_cross_numa_node=getattr(instance_data, "is_cross_numa_node", None),
+        source_details=map_source_details(getattr(instance_data, "source_details", None)),
+        system_tags=getattr(instance_data, "system_tags", None),
+        time_created=getattr(instance_data, "time_created", None),
+        agent_config=map_agent_config(getattr(instance_data, "agent_config", None)),
+        time_maintenance_reboot_due=getattr(instance_data, "time_maintenance_reboot_due", None),
+        platform_config=map_platform_config(getattr(instance_data, "platform_config", None)),
+        instance_configuration_id=getattr(instance_data, "instance_configuration_id", None),
+        licensing_configs=map_licensing_configs(getattr(instance_data, "licensing_configs", None)),
+    )
+
+
+def sample_instance(index: int) -> oci.core.models.Instance:
+    """An instance shaped like a typical ListInstances item, with the common nested models set."""
+    models = oci.core.models
+    return models.Instance(
+        availability_domain="Uocm:PHX-AD-1",
+        compartment_id="ocid1.compartment.oc1..aaaaaaaaexample",
+        defined_tags={"Operations": {"CostCenter": "42"}},
+        display_name=f"web-{index:05d}",
+        extended_metadata={},
+        fault_domain="FAULT-DOMAIN-2",
+        freeform_tags={"env": "prod", "team": "web"},
+        id=f"ocid1.instance.oc1.phx.{index:020d}",
+        image_id="ocid1.image.oc1.phx.aaaaaaaaexample",
+        launch_mode="PARAVIRTUALIZED",
+        launch_options=models.LaunchOptions(
+            boot_volume_type="PARAVIRTUALIZED",
+            firmware="UEFI_64",
+            network_type="PARAVIRTUALIZED",
+            remote_data_volume_type="PARAVIRTUALIZED",
+            is_pv_encryption_in_transit_enabled=True,
+            is_consistent_volume_naming_enabled=True,
+        ),
+        instance_options=models.InstanceOptions(are_legacy_imds_endpoints_disabled=True),
+        availability_config=models.InstanceAvailabilityConfig(
+            is_live_migration_preferred=True, recovery_action="RESTORE_INSTANCE"
+        ),
+        lifecycle_state="RUNNING",
+        metadata={"ssh_authorized_keys": "ssh-rsa AAAA... user@example"},
+        region="phx",
+        shape="VM.Standard.E4.Flex",
+        shape_config=models.InstanceShapeConfig(
+            ocpus=2.0, memory_in_gbs=32.0, vcpus=4, baseline_ocpu_utilization="BASELINE_1_1"
+        ),
+        source_details=models.InstanceSourceViaImageDetails(
+            image_id="ocid1.image.oc1.phx.aaaaaaaaexample", boot_volume_size_in_gbs=50
+        ),
+        system_tags={"orcl-cloud": {"free-tier-retained": "true"}},
+        time_created=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        agent_config=models.InstanceAgentConfig(
+            is_monitoring_disabled=False,
+            is_management_disabled=False,
+            are_all_plugins_disabled=False,
+            plugins_config=[
+                models.InstanceAgentPluginConfigDetails(
+                    name="Compute Instance Monitoring", desired_state="ENABLED"
+                )
+            ],
+        ),
+        platform_config=models.AmdVmPlatformConfig(type="AMD_VM", is_secure_boot_enabled=False),
+    )
+
+
+def _measure(mapper: Callable[[Any], Instance], items: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(repeat, 1)):
+        started = time.perf_counter()
+        _INSTANCES.dump_python([mapper(item) for item in items], mode="json")
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print mapping plus serialization throughput for the validating and shared mappers."""
+
+    parser = argparse.ArgumentParser(description="Benchmark list_instances response mapping.")
+    parser.add_argument("--items", type=int, default=5000, help="Instances per run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per mapper; the fastest is kept.")
+    args = parser.parse_args(argv)
+
+    items = [sample_instance(i) for i in range(max(args.items, 1))]
+    mappers = {
+        "validated": validated_map_instance,
+        "constructed": map_instance,
+        "constructed_projected": lambda item: map_instance(item, _PROJECTED_FIELDS),
+    }
+    baseline = None
+    for name, mapper in mappers.items():
+        seconds = _measure(mapper, items, args.repeat)
+        baseline = baseline or seconds
+        print(
+            json.dumps(
+                {
+                    "mapper": name,
+                    "items": len(items),
+                    "seconds": round(seconds, 4),
+                    "items_per_second": round(len(items) / seconds),
+                    "speedup": round(baseline / seconds, 2),
+                }
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 
 import oci
+from oracle_mcp_common import construct_model, is_sdk_model, sdk_to_dict
 from pydantic import BaseModel, Field
 
 # Nested OCI models represented as Pydantic classes
@@ -17,6 +18,8 @@ def _oci_to_dict(obj):
     """Best-effort conversion of OCI SDK model objects to plain dicts."""
     if obj is None:
         return None
+    if is_sdk_model(obj):
+        return sdk_to_dict(obj)
     try:
         from oci.util import to_dict as oci_to_dict
 
@@ -376,54 +379,23 @@ def map_licensing_configs(items) -> list[LicensingConfig] | None:
     return result
 
 
+# Nested fields whose pydantic shape differs from the SDK model; the rest map by attribute name.
+_INSTANCE_CONVERTERS = {
+    "placement_constraint_details": map_placement_constraint_details,
+    "platform_config": map_platform_config,
+    "licensing_configs": map_licensing_configs,
+}
+
+
 def map_instance(
     instance_data: oci.core.models.Instance,
+    fields: Optional[List[str]] = None,
 ) -> Instance:
     """
     Convert an oci.core.models.Instance to oracle.oci_compute_mcp_server.Instance,
-    including all nested types.
+    including all nested types. With ``fields``, only those top-level fields are mapped.
     """
-    return Instance(
-        availability_domain=getattr(instance_data, "availability_domain", None),
-        capacity_reservation_id=getattr(instance_data, "capacity_reservation_id", None),
-        compartment_id=getattr(instance_data, "compartment_id", None),
-        placement_constraint_details=map_placement_constraint_details(
-            getattr(instance_data, "placement_constraint_details", None)
-        ),
-        cluster_placement_group_id=getattr(instance_data, "cluster_placement_group_id", None),
-        dedicated_vm_host_id=getattr(instance_data, "dedicated_vm_host_id", None),
-        defined_tags=getattr(instance_data, "defined_tags", None),
-        security_attributes=getattr(instance_data, "security_attributes", None),
-        security_attributes_state=getattr(instance_data, "security_attributes_state", None),
-        display_name=getattr(instance_data, "display_name", None),
-        extended_metadata=getattr(instance_data, "extended_metadata", None),
-        fault_domain=getattr(instance_data, "fault_domain", None),
-        freeform_tags=getattr(instance_data, "freeform_tags", None),
-        id=getattr(instance_data, "id", None),
-        image_id=getattr(instance_data, "image_id", None),
-        ipxe_script=getattr(instance_data, "ipxe_script", None),
-        launch_mode=getattr(instance_data, "launch_mode", None),
-        launch_options=map_launch_options(getattr(instance_data, "launch_options", None)),
-        instance_options=map_instance_options(getattr(instance_data, "instance_options", None)),
-        availability_config=map_availability_config(getattr(instance_data, "availability_config", None)),
-        preemptible_instance_config=map_preemptible_config(
-            getattr(instance_data, "preemptible_instance_config", None)
-        ),
-        lifecycle_state=getattr(instance_data, "lifecycle_state", None),
-        metadata=getattr(instance_data, "metadata", None),
-        region=getattr(instance_data, "region", None),
-        shape=getattr(instance_data, "shape", None),
-        shape_config=map_shape_config(getattr(instance_data, "shape_config", None)),
-        is_cross_numa_node=getattr(instance_data, "is_cross_numa_node", None),
-        source_details=map_source_details(getattr(instance_data, "source_details", None)),
-        system_tags=getattr(instance_data, "system_tags", None),
-        time_created=getattr(instance_data, "time_created", None),
-        agent_config=map_agent_config(getattr(instance_data, "agent_config", None)),
-        time_maintenance_reboot_due=getattr(instance_data, "time_maintenance_reboot_due", None),
-        platform_config=map_platform_config(getattr(instance_data, "platform_config", None)),
-        instance_configuration_id=getattr(instance_data, "instance_configuration_id", None),
-        licensing_configs=map_licensing_configs(getattr(instance_data, "licensing_configs", None)),
-    )
+    return construct_model(Instance, instance_data, fields=fields, converters=_INSTANCE_CONVERTERS)
 
 
 # endregion
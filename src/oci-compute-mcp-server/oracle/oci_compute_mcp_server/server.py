@@ -13,6 +13,7 @@ from fastmcp import FastMCP
 from fastmcp.server.auth.providers.oci import OCIProvider
 from fastmcp.server.dependencies import get_access_token
 from fastmcp.utilities.auth import parse_scopes
+from oracle_mcp_common import validate_fields
 from oracle.oci_compute_mcp_server.consts import (
     DEFAULT_MEMORY_IN_GBS,
     DEFAULT_OCPU_COUNT,
@@ -122,10 +123,16 @@ def list_instances(
             "TERMINATED",
         ]
     ] = Field(None, description="The lifecycle state of the instance to filter on"),
+    fields: Optional[list[str]] = Field(
+        None,
+        description="Only map these Instance fields, e.g. ['id', 'display_name', 'lifecycle_state']. "
+        "Other fields are returned as null. If None, every field is returned.",
+    ),
 ) -> list[Instance]:
     instances: list[Instance] = []
 
     try:
+        fields = validate_fields(Instance, fields)
         client = get_compute_client()
 
         response: oci.response.Response = None
@@ -148,7 +155,7 @@ def list_instances(
 
             data: list[oci.core.models.Instance] = response.data
             for d in data:
-                instance = map_instance(d)
+                instance = map_instance(d, fields)
                 instances.append(instance)
 
         logger.info(f"Found {len(instances)} Instances")
@@ -450,3 +450,29 @@ async def test_map_platform_config_with_plain_dict_input():
     assert result.type == "INTEL_VM"
     # 'type' should be removed from details; remaining keys preserved
     assert result.details == {"secure_boot": False, "something_else": 123}
+
+
+@pytest.mark.asyncio
+async def test_map_instance_matches_validating_mapper_and_projects_fields():
+    from oracle.oci_compute_mcp_server.mapping_benchmark import sample_instance, validated_map_instance
+
+    oci_instance = sample_instance(7)
+
+    result = map_instance(oci_instance)
+    assert result.model_dump_json() == validated_map_instance(oci_instance).model_dump_json()
+    assert result.platform_config == PlatformConfig(type="AMD_VM", details=result.platform_config.details)
+
+    projected = map_instance(oci_instance, ["id", "shape_config"])
+    assert projected.id == oci_instance.id
+    assert projected.shape_config.ocpus == 2.0
+    assert projected.display_name is None
+    assert projected.model_fields_set == {"id", "shape_config"}
+
+
+def test_mapping_benchmark_reports_each_mapper(capsys):
+    from oracle.oci_compute_mcp_server import mapping_benchmark
+
+    assert mapping_benchmark.main(["--items", "3", "--repeat", "1"]) == 0
+
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert [line.split('"')[3] for line in lines] == ["validated", "constructed", "constructed_projected"]
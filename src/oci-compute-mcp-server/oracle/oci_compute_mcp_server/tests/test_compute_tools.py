@@ -45,6 +45,34 @@ class TestComputeTools:
             assert len(result) == 1
             assert result[0]["id"] == "instance1"
 
+    @pytest.mark.asyncio
+    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
+    async def test_list_instances_maps_only_requested_fields(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_list_response = create_autospec(oci.response.Response)
+        mock_list_response.data = [
+            oci.core.models.Instance(id="instance1", display_name="Instance 1", shape="VM.Standard.E2.1")
+        ]
+        mock_list_response.has_next_page = False
+        mock_list_response.next_page = None
+        mock_client.list_instances.return_value = mock_list_response
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "list_instances",
+                    {"compartment_id": "test_compartment", "fields": ["id", "display_name"]},
+                )
+            ).structured_content["result"]
+            with pytest.raises(fastmcp.exceptions.ToolError, match="Unknown fields"):
+                await client.call_tool("list_instances", {"compartment_id": "test_compartment", "fields": ["nope"]})
+
+        assert result[0]["id"] == "instance1"
+        assert result[0]["display_name"] == "Instance 1"
+        assert result[0]["shape"] is None
+        mock_client.list_instances.assert_called_once()
+
     @pytest.mark.asyncio
     @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
     async def test_list_instances_exception(self, mock_get_client):
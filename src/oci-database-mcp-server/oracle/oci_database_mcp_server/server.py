@@ -12,6 +12,8 @@ import hmac
 import json
 import os
 import sys
+import threading
+import time
 from logging import Logger
 from pathlib import Path
 from typing import Annotated, Any, Optional
@@ -302,6 +304,8 @@ CUSTOM_DATABASE_ENDPOINT = None
 DATABASE_ENDPOINT = None
 IMDS_INSTANCE_ENDPOINT = "http://169.254.169.254/opc/v2/instance/"
 RPST_HTTP_TIMEOUT = (5, 30)
+SIGNER_REFRESH_MARGIN_SECONDS = int(os.getenv("OCI_SIGNER_REFRESH_MARGIN_SECONDS", "300"))
+SIGNER_REFRESH_RETRY_SECONDS = int(os.getenv("OCI_SIGNER_REFRESH_RETRY_SECONDS", "30"))
 
 # --- Custom RPST Authentication Functions ---
 
@@ -535,20 +539,175 @@ def initialize_rpst_auth_from_env(
     try:
         DATABASE_ENDPOINT = database_endpoint
         private_key = load_private_key(private_key_path)
-        sec_ctx = build_security_context(rci, t0, "V1", "REGULAR_RPT")
-        rpt, spst = fetch_tokens_v212(
-            database_endpoint, resource_ocid, tenancy_ocid, private_key, sec_ctx
-        )
-        rpst, session_key = fetch_rpst_from_auth(
-            auth_endpoint, tenancy_ocid, resource_ocid, private_key, rpt, spst
-        )
-        RPST_SIGNER = oci.auth.signers.SecurityTokenSigner(rpst, session_key)
+
+        def exchange_rpst(_current_signer=None):
+            # The security context is time based, so it is rebuilt for every exchange.
+            sec_ctx = build_security_context(rci, t0, "V1", "REGULAR_RPT")
+            rpt, spst = fetch_tokens_v212(
+                database_endpoint, resource_ocid, tenancy_ocid, private_key, sec_ctx
+            )
+            rpst, session_key = fetch_rpst_from_auth(
+                auth_endpoint, tenancy_ocid, resource_ocid, private_key, rpt, spst
+            )
+            return oci.auth.signers.SecurityTokenSigner(rpst, session_key)
+
+        RPST_SIGNERS.configure(exchange_rpst)
+        RPST_SIGNER = RPST_SIGNERS.get()
         print("--- RPST Authentication Successful ---", file=sys.stderr)
     except Exception as e:
         print(f"Failed to initialize RPST Auth: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+# --- Signer Management ---
+
+
+def _security_token_expiry(token) -> Optional[float]:
+    """Returns the `exp` claim (epoch seconds) of a JWT security token, or None if unreadable."""
+    if not isinstance(token, str) or token.count(".") != 2:
+        return None
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except Exception:
+        return None
+
+
+def _security_token_signer_expiry(signer) -> Optional[float]:
+    api_key = getattr(signer, "api_key", None)
+    if not isinstance(api_key, str):
+        return None
+    return _security_token_expiry(api_key.removeprefix("ST$"))
+
+
+def _federation_signer_expiry(signer) -> Optional[float]:
+    federation_client = getattr(signer, "federation_client", None)
+    if federation_client is None:
+        return None
+    return _security_token_expiry(federation_client.get_security_token())
+
+
+class SignerManager:
+    """
+    Holds one signer for an auth mode and shares it across tool calls. When the signer's
+    security token has a readable expiry, a daemon timer refreshes it
+    SIGNER_REFRESH_MARGIN_SECONDS before it expires, so tool calls keep using the current
+    signer instead of waiting on federation. Failed refreshes are retried with backoff.
+    """
+
+    def __init__(
+        self,
+        name,
+        create=None,
+        refresh=None,
+        expiry=_security_token_signer_expiry,
+        on_refresh=None,
+    ):
+        self.name = name
+        self._create = create
+        self._refresh = refresh
+        self._expiry = expiry
+        self._on_refresh = on_refresh
+        self._signer = None
+        self._timer = None
+        self._failures = 0
+        self._lock = threading.RLock()
+
+    def configure(self, create, refresh=None):
+        with self._lock:
+            self.reset()
+            self._create = create
+            self._refresh = refresh
+
+    def get(self):
+        signer = self._signer
+        if signer is not None:
+            return signer
+        with self._lock:
+            if self._signer is None:
+                self._install(self._create())
+            return self._signer
+
+    def refresh(self):
+        with self._lock:
+            current = self._signer
+            if current is None or self._refresh is None:
+                signer = self._create()
+            else:
+                signer = self._refresh(current)
+            self._install(signer)
+            return signer
+
+    def reset(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._signer = None
+            self._failures = 0
+
+    def _install(self, signer):
+        self._signer = signer
+        self._failures = 0
+        if self._on_refresh is not None:
+            self._on_refresh(signer)
+        expires_at = self._expiry(signer) if self._expiry else None
+        if expires_at is None:
+            return
+        remaining = expires_at - time.time()
+        delay = remaining - SIGNER_REFRESH_MARGIN_SECONDS
+        if delay <= 0:
+            delay = max(remaining / 2, 1)
+        self._schedule(delay)
+
+    def _schedule(self, delay):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._refresh_in_background)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+            logger.info(f"Refreshed {self.name} signer")
+        except Exception as e:
+            with self._lock:
+                self._failures += 1
+                delay = min(
+                    SIGNER_REFRESH_RETRY_SECONDS * 2 ** (self._failures - 1),
+                    SIGNER_REFRESH_MARGIN_SECONDS,
+                )
+                logger.warning(f"Failed to refresh {self.name} signer, retrying in {delay}s: {e}")
+                self._schedule(delay)
+
+
+def _set_rpst_signer(signer):
+    global RPST_SIGNER
+    RPST_SIGNER = signer
+
+
+def _refresh_instance_principal_signer(signer):
+    signer.refresh_security_token()
+    return signer
+
+
+RPST_SIGNERS = SignerManager("resource principal session token", on_refresh=_set_rpst_signer)
+INSTANCE_PRINCIPAL_SIGNERS = SignerManager(
+    "instance principal",
+    create=lambda: oci.auth.signers.InstancePrincipalsSecurityTokenSigner(),
+    refresh=_refresh_instance_principal_signer,
+    expiry=_federation_signer_expiry,
+)
+
+
+def reset_signers():
+    """Drops the cached signers and cancels their background refreshes."""
+    RPST_SIGNERS.reset()
+    INSTANCE_PRINCIPAL_SIGNERS.reset()
+
+
 def _get_oci_client_kwargs(signer=None):
     kwargs = {
         "circuit_breaker_strategy": oci.circuit_breaker.CircuitBreakerStrategy(
@@ -591,7 +750,7 @@ def get_database_client(region: str = None):
             )
     elif AUTH_METHOD == "instance_principal":
         logger.info("Using Instance Principal authentication")
-        signer = oci.auth.signers.InstancePrincipalsSecurityTokenSigner()
+        signer = INSTANCE_PRINCIPAL_SIGNERS.get()
         client_config = {"additional_user_agent": additional_user_agent}
         if region is not None:
             client_config["region"] = region
@@ -1,4 +1,6 @@
+import base64
 import inspect
+import json
 import sys
 from contextlib import ExitStack
 from types import SimpleNamespace
@@ -199,13 +201,115 @@ def test_get_database_client_supports_resource_and_instance_principals(monkeypat
     instance_signer = MagicMock(return_value="instance-signer")
     monkeypatch.setattr(server, "AUTH_METHOD", "instance_principal")
     monkeypatch.setattr(server.oci.auth.signers, "InstancePrincipalsSecurityTokenSigner", instance_signer)
-    server.get_database_client(region="us-ashburn-1")
+    server.reset_signers()
+    try:
+        server.get_database_client(region="us-ashburn-1")
+        server.get_database_client(region="us-ashburn-1")
+    finally:
+        server.reset_signers()
 
     instance_signer.assert_called_once_with()
     assert database_client.call_args.args[0]["region"] == "us-ashburn-1"
     assert database_client.call_args.kwargs["signer"] == "instance-signer"
 
 
+def _jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+class _FakeTimer:
+    created = []
+
+    def __init__(self, delay, function):
+        self.delay = delay
+        self.function = function
+        self.cancelled = False
+        _FakeTimer.created.append(self)
+
+    def start(self):
+        pass
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def test_signer_manager_refreshes_before_expiry_and_retries_with_backoff(monkeypatch):
+    _FakeTimer.created = []
+    monkeypatch.setattr(server.threading, "Timer", _FakeTimer)
+    monkeypatch.setattr(server.time, "time", lambda: 1000.0)
+    monkeypatch.setattr(server, "SIGNER_REFRESH_MARGIN_SECONDS", 300)
+    monkeypatch.setattr(server, "SIGNER_REFRESH_RETRY_SECONDS", 10)
+    signers = iter(
+        [
+            SimpleNamespace(api_key="ST$" + _jwt(2200)),
+            RuntimeError("federation unavailable"),
+            RuntimeError("federation unavailable"),
+            SimpleNamespace(api_key="ST$" + _jwt(1100)),
+        ]
+    )
+
+    def create():
+        signer = next(signers)
+        if isinstance(signer, Exception):
+            raise signer
+        return signer
+
+    refreshed = []
+    manager = server.SignerManager("test", create=create, on_refresh=refreshed.append)
+
+    first = manager.get()
+    assert manager.get() is first
+    assert _FakeTimer.created[-1].delay == 900
+
+    _FakeTimer.created[-1].function()
+    assert manager.get() is first
+    assert _FakeTimer.created[-1].delay == 10
+    _FakeTimer.created[-1].function()
+    assert _FakeTimer.created[-1].delay == 20
+
+    _FakeTimer.created[-1].function()
+    assert manager.get() is refreshed[-1]
+    assert manager.get() is not first
+    # Tokens expiring inside the refresh margin are renewed halfway to expiry.
+    assert _FakeTimer.created[-1].delay == 50
+
+    manager.reset()
+    assert _FakeTimer.created[-1].cancelled
+
+
+def test_rpst_signer_refresh_repeats_exchange_and_updates_global(monkeypatch):
+    monkeypatch.setattr(server, "_get_region_from_imds", MagicMock(return_value="us-phoenix-1"))
+    monkeypatch.setattr(server, "load_private_key", MagicMock(return_value="private-key"))
+    monkeypatch.setattr(server, "build_security_context", MagicMock(return_value="context"))
+    monkeypatch.setattr(server, "fetch_tokens_v212", MagicMock(return_value=("rpt", "spst")))
+    monkeypatch.setattr(
+        server,
+        "fetch_rpst_from_auth",
+        MagicMock(side_effect=[("rpst-1", "session-key-1"), ("rpst-2", "session-key-2")]),
+    )
+    monkeypatch.setattr(server.oci.auth.signers, "SecurityTokenSigner", lambda token, key: (token, key))
+    monkeypatch.setattr(server, "RPST_SIGNER", None)
+
+    try:
+        server.initialize_rpst_auth_from_env(
+            tenancy_ocid="tenancy",
+            private_key_path="/key.pem",
+            resource_ocid="resource",
+            rci="Y29udGV4dA==",
+            t0="2025-01-01T00:00:00Z",
+        )
+        assert server.RPST_SIGNER == ("rpst-1", "session-key-1")
+
+        server.RPST_SIGNERS.refresh()
+    finally:
+        server.reset_signers()
+
+    assert server.RPST_SIGNER == ("rpst-2", "session-key-2")
+    assert server.build_security_context.call_count == 2
+    server.load_private_key.assert_called_once_with("/key.pem")
+
+
 def test_main_prefers_cli_auth_method_and_initializes_rpst(monkeypatch):
     initialize = MagicMock()
     run = MagicMock()
@@ -5,8 +5,6 @@ from .control_plane import (
     get_digital_twin_adapter_record,
     get_digital_twin_instance_record,
     get_digital_twin_model_record,
-    get_iot_domain_group_record,
-    get_iot_domain_record,
     list_digital_twin_instances_page_record,
 )
 from .data_plane import (
@@ -20,7 +18,7 @@ from .data_plane import (
     require_token_credentials,
 )
 from .errors import error_result
-from .domain_context import derive_domain_context
+from .domain_context import load_domain_context
 from .resolvers import resolve_twin_for_tool
 
 
@@ -54,12 +52,11 @@ def resolve_twin_bundle(
     if _is_error(twin):
         return twin
 
-    domain = get_iot_domain_record(twin["iot_domain_id"])
-    domain_group = get_iot_domain_group_record(domain["iot_domain_group_id"])
-    domain_context = derive_domain_context(
-        iot_domain=domain,
-        iot_domain_group=domain_group,
-    ).model_dump()
+    loaded = load_domain_context(twin["iot_domain_id"])
+    if _is_error(loaded):
+        return loaded
+    domain, domain_group, domain_context = loaded
+    domain_context = domain_context.model_dump()
 
     adapter = None
     model = None
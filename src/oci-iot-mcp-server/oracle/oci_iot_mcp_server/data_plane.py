@@ -1,6 +1,8 @@
 import base64
 import hashlib
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
 import httpx
@@ -9,7 +11,13 @@ from .errors import error_result
 from .tool_models import DataApiTokenModel, success_result
 
 ORDS_API_DATE = "20250531"
+DATA_PLANE_TIMEOUT_SECONDS = 30.0
+COLLECTION_PAGE_SIZE = 100
+COLLECTION_SCAN_LIMIT = 500
+COLLECTION_PAGE_WORKERS = 5
 _DATA_API_TOKEN_CACHE: dict[tuple[str, ...], DataApiTokenModel] = {}
+_HTTP_CLIENTS: dict[str, httpx.Client] = {}
+_HTTP_CLIENTS_LOCK = threading.Lock()
 
 
 class DataApiTokenError(RuntimeError):
@@ -54,6 +62,28 @@ def get_cached_data_api_token(*, domain_context: dict, env: dict, now) -> DataAp
     return token
 
 
+def get_http_client(url: str) -> httpx.Client:
+    host = httpx.URL(url).host
+    with _HTTP_CLIENTS_LOCK:
+        client = _HTTP_CLIENTS.get(host)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                http2=True,
+                timeout=DATA_PLANE_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_connections=COLLECTION_PAGE_WORKERS * 2, keepalive_expiry=60.0),
+            )
+            _HTTP_CLIENTS[host] = client
+        return client
+
+
+def close_http_clients() -> None:
+    with _HTTP_CLIENTS_LOCK:
+        clients = list(_HTTP_CLIENTS.values())
+        _HTTP_CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
 def build_ords_base_url(domain_context: dict) -> str:
     return f"https://{domain_context['data_host']}/ords/{domain_context['domain_short_id']}/{ORDS_API_DATE}"
 
@@ -158,11 +188,11 @@ def mint_data_api_token(*, domain_context: dict, env: dict, now) -> DataApiToken
 
 
 def _get_json(*, url: str, token: str, params: dict) -> dict:
-    response = httpx.get(
+    response = get_http_client(url).get(
         url,
         headers={"Authorization": f"Bearer {token}"},
         params=params,
-        timeout=30.0,
+        timeout=DATA_PLANE_TIMEOUT_SECONDS,
     )
     response.raise_for_status()
     return response.json()
@@ -172,6 +202,17 @@ def get_collection_record(*, base_url: str, path: str, token: str, record_id: st
     return _get_json(url=f"{base_url}{path}/{record_id}", token=token, params={})
 
 
+def _fetch_collection_pages(*, url: str, token: str, params: dict, limit: int, offsets: list[int]) -> list[list]:
+    def fetch(offset: int) -> list:
+        page = _get_json(url=url, token=token, params={**params, "limit": limit, "offset": offset})
+        return page.get("items", [])
+
+    if len(offsets) == 1:
+        return [fetch(offsets[0])]
+    with ThreadPoolExecutor(max_workers=min(COLLECTION_PAGE_WORKERS, len(offsets))) as executor:
+        return list(executor.map(fetch, offsets))
+
+
 def list_collection_records(
     *,
     base_url: str,
@@ -180,21 +221,34 @@ def list_collection_records(
     params: dict,
     target_count: int,
 ) -> list[dict]:
+    """Page through an ORDS collection until ``target_count`` records are read.
+
+    The first page is fetched on its own. Once a full page comes back, the
+    remaining offsets are requested concurrently; a short page drops back to
+    sequential paging from the observed offset.
+    """
+    url = f"{base_url}{path}"
+    limit = min(COLLECTION_PAGE_SIZE, target_count)
     records = []
     offset = 0
-    scanned = 0
-    while len(records) < target_count and scanned < 500:
-        page = _get_json(
-            url=f"{base_url}{path}",
-            token=token,
-            params={**params, "limit": min(100, target_count), "offset": offset},
-        )
-        items = page.get("items", [])
-        if not items:
-            break
-        records.extend(items)
-        offset += len(items)
-        scanned += len(items)
+    fan_out = False
+    while len(records) < target_count and offset < COLLECTION_SCAN_LIMIT:
+        if fan_out:
+            remaining = min(target_count - len(records), COLLECTION_SCAN_LIMIT - offset)
+            offsets = list(range(offset, offset + remaining, limit))
+        else:
+            offsets = [offset]
+
+        pages = _fetch_collection_pages(url=url, token=token, params=params, limit=limit, offsets=offsets)
+        fan_out = True
+        for items in pages:
+            if not items:
+                return records[:target_count]
+            records.extend(items)
+            offset += len(items)
+            if len(items) < limit:
+                fan_out = False
+                break
 
     return records[:target_count]
 
@@ -1,6 +1,9 @@
+import copy
+
 from .control_plane import get_iot_domain_group_record, get_iot_domain_record
 from .errors import error_result, invalid_input_error
-from .resolvers import resolve_domain_selector, resolve_twin_for_tool
+from .resolver_cache import DOMAIN_CONTEXTS
+from .resolvers import cached_twin_domain_id, resolve_domain_selector, resolve_twin_for_tool
 from .tool_models import DomainContextModel
 
 
@@ -33,6 +36,34 @@ def derive_domain_context(*, iot_domain: dict, iot_domain_group: dict) -> Domain
     )
 
 
+def load_domain_context(iot_domain_id: str):
+    cached = DOMAIN_CONTEXTS.get(iot_domain_id)
+    if cached is not None:
+        iot_domain, iot_domain_group, domain_context = cached
+        return copy.deepcopy(iot_domain), copy.deepcopy(iot_domain_group), domain_context
+
+    iot_domain = get_iot_domain_record(iot_domain_id)
+    group_id = iot_domain.get("iot_domain_group_id")
+    if not group_id:
+        return error_result(
+            code="control_plane_error",
+            message="The resolved IoT domain did not include an IoT domain group identifier.",
+            resource_type="iot_domain",
+            details={"iot_domain_id": iot_domain_id},
+        )
+
+    iot_domain_group = get_iot_domain_group_record(group_id)
+    domain_context = derive_domain_context(
+        iot_domain=iot_domain,
+        iot_domain_group=iot_domain_group,
+    )
+    DOMAIN_CONTEXTS.set(
+        iot_domain_id,
+        (copy.deepcopy(iot_domain), copy.deepcopy(iot_domain_group), domain_context),
+    )
+    return iot_domain, iot_domain_group, domain_context
+
+
 def resolve_domain_context_for_tool(
     *,
     iot_domain_id: str | None = None,
@@ -42,7 +73,8 @@ def resolve_domain_context_for_tool(
     digital_twin_instance_id: str | None = None,
     digital_twin_instance_name: str | None = None,
 ) -> dict:
-    if digital_twin_instance_id or digital_twin_instance_name:
+    domain_id = cached_twin_domain_id(digital_twin_instance_id) if digital_twin_instance_id else None
+    if domain_id is None and (digital_twin_instance_id or digital_twin_instance_name):
         twin = resolve_twin_for_tool(
             digital_twin_instance_id=digital_twin_instance_id,
             digital_twin_instance_name=digital_twin_instance_name,
@@ -54,7 +86,7 @@ def resolve_domain_context_for_tool(
         if isinstance(twin, dict) and twin.get("ok") is False:
             return twin
         domain_id = twin["iot_domain_id"]
-    else:
+    elif domain_id is None:
         domain_result = resolve_domain_selector(
             iot_domain_id=iot_domain_id,
             iot_domain_display_name=iot_domain_display_name,
@@ -80,18 +112,7 @@ def resolve_domain_context_for_tool(
             retry_hint="Retry with an IoT domain selector or a digital twin selector.",
         )
 
-    iot_domain = get_iot_domain_record(domain_id)
-    group_id = iot_domain.get("iot_domain_group_id")
-    if not group_id:
-        return error_result(
-            code="control_plane_error",
-            message="The resolved IoT domain did not include an IoT domain group identifier.",
-            resource_type="iot_domain",
-            details={"iot_domain_id": domain_id},
-        )
-
-    iot_domain_group = get_iot_domain_group_record(group_id)
-    return derive_domain_context(
-        iot_domain=iot_domain,
-        iot_domain_group=iot_domain_group,
-    ).model_dump()
+    loaded = load_domain_context(domain_id)
+    if isinstance(loaded, dict):
+        return loaded
+    return loaded[2].model_dump()
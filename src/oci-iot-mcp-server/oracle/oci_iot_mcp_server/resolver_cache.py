@@ -0,0 +1,95 @@
+import os
+import threading
+import time
+
+DEFAULT_RESOLVER_CACHE_TTL_SECONDS = 300.0
+
+
+def resolver_cache_ttl_seconds() -> float:
+    value = os.getenv("OCI_IOT_RESOLVER_CACHE_TTL_SECONDS")
+    if not value:
+        return DEFAULT_RESOLVER_CACHE_TTL_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        return DEFAULT_RESOLVER_CACHE_TTL_SECONDS
+
+
+class TtlCache:
+    def __init__(self, *, clock=time.monotonic):
+        self._clock = clock
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value) -> None:
+        ttl_seconds = resolver_cache_ttl_seconds()
+        if ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl_seconds, value)
+
+    def discard(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard_where(self, predicate) -> None:
+        with self._lock:
+            for key in [key for key, (_, value) in self._entries.items() if predicate(key, value)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# (compartment_id, iot_domain_display_name, domain_short_id) -> IoT domain record
+DOMAIN_RECORDS = TtlCache()
+# (iot_domain_id, digital_twin_instance_name) -> digital twin instance OCID
+TWIN_IDS = TtlCache()
+# digital twin instance OCID -> IoT domain OCID
+TWIN_DOMAIN_IDS = TtlCache()
+# IoT domain OCID -> (iot_domain record, iot_domain_group record, DomainContextModel)
+DOMAIN_CONTEXTS = TtlCache()
+
+
+def clear_resolver_cache() -> None:
+    for cache in (DOMAIN_RECORDS, TWIN_IDS, TWIN_DOMAIN_IDS, DOMAIN_CONTEXTS):
+        cache.clear()
+
+
+def invalidate_compartment_domains(compartment_id: str) -> None:
+    DOMAIN_RECORDS.discard_where(lambda key, _: key[0] == compartment_id)
+
+
+def invalidate_iot_domain(iot_domain_id: str) -> None:
+    DOMAIN_RECORDS.discard_where(lambda _, value: value["id"] == iot_domain_id)
+    TWIN_IDS.discard_where(lambda key, _: key[0] == iot_domain_id)
+    TWIN_DOMAIN_IDS.discard_where(lambda _, value: value == iot_domain_id)
+    DOMAIN_CONTEXTS.discard(iot_domain_id)
+
+
+def invalidate_iot_domain_group(iot_domain_group_id: str) -> None:
+    DOMAIN_CONTEXTS.discard_where(lambda _, value: value[2].iot_domain_group_id == iot_domain_group_id)
+
+
+def invalidate_domain_twin_names(iot_domain_id: str) -> None:
+    TWIN_IDS.discard_where(lambda key, _: key[0] == iot_domain_id)
+
+
+def invalidate_digital_twin_instance(digital_twin_instance_id: str) -> None:
+    TWIN_IDS.discard_where(lambda _, value: value == digital_twin_instance_id)
+    TWIN_DOMAIN_IDS.discard(digital_twin_instance_id)
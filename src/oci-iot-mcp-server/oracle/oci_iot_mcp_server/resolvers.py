@@ -1,9 +1,12 @@
+import copy
+
 from .control_plane import (
     get_digital_twin_instance_record,
     list_digital_twin_instances_records,
     list_iot_domains_records,
 )
 from .errors import ambiguity_error, invalid_input_error, not_found_error
+from .resolver_cache import DOMAIN_RECORDS, TWIN_DOMAIN_IDS, TWIN_IDS
 from .tool_models import success_result
 
 
@@ -11,6 +14,33 @@ def _first_label(host: str | None) -> str | None:
     return host.split(".", 1)[0] if host else None
 
 
+def _remember_twin(twin: dict) -> dict:
+    if twin.get("id") and twin.get("iot_domain_id"):
+        TWIN_DOMAIN_IDS.set(twin["id"], twin["iot_domain_id"])
+    return twin
+
+
+def _cached_twin_by_name(*, iot_domain_id: str, digital_twin_instance_name: str | None) -> dict | None:
+    cache_key = (iot_domain_id, digital_twin_instance_name)
+    twin_id = TWIN_IDS.get(cache_key)
+    if twin_id is None:
+        return None
+
+    try:
+        twin = get_digital_twin_instance_record(digital_twin_instance_id=twin_id)
+    except Exception:
+        TWIN_IDS.discard(cache_key)
+        return None
+    if twin.get("name") != digital_twin_instance_name or twin.get("iot_domain_id") != iot_domain_id:
+        TWIN_IDS.discard(cache_key)
+        return None
+    return _remember_twin(twin)
+
+
+def cached_twin_domain_id(digital_twin_instance_id: str) -> str | None:
+    return TWIN_DOMAIN_IDS.get(digital_twin_instance_id)
+
+
 def resolve_domain_selector(
     *,
     iot_domain_id: str | None = None,
@@ -32,6 +62,11 @@ def resolve_domain_selector(
             retry_hint="Retry with iot_domain_id or include compartment_id.",
         )
 
+    cache_key = (compartment_id, iot_domain_display_name, domain_short_id)
+    cached_domain = DOMAIN_RECORDS.get(cache_key)
+    if cached_domain is not None:
+        return success_result(copy.deepcopy(cached_domain))
+
     matches = []
     for row in list_iot_domains_records(compartment_id=compartment_id):
         if iot_domain_display_name and row.get("name") == iot_domain_display_name:
@@ -66,6 +101,7 @@ def resolve_domain_selector(
             ],
         )
 
+    DOMAIN_RECORDS.set(cache_key, copy.deepcopy(unique_matches[0]))
     return success_result(unique_matches[0])
 
 
@@ -77,8 +113,10 @@ def resolve_twin_selector(
 ) -> dict:
     if digital_twin_instance_id:
         return success_result(
-            get_digital_twin_instance_record(
-                digital_twin_instance_id=digital_twin_instance_id
+            _remember_twin(
+                get_digital_twin_instance_record(
+                    digital_twin_instance_id=digital_twin_instance_id
+                )
             )
         )
 
@@ -90,6 +128,13 @@ def resolve_twin_selector(
             retry_hint="Retry with digital_twin_instance_id or include iot_domain_id.",
         )
 
+    cached_twin = _cached_twin_by_name(
+        iot_domain_id=iot_domain_id,
+        digital_twin_instance_name=digital_twin_instance_name,
+    )
+    if cached_twin is not None:
+        return success_result(cached_twin)
+
     matches = [
         row
         for row in list_digital_twin_instances_records(iot_domain_id=iot_domain_id)
@@ -122,7 +167,8 @@ def resolve_twin_selector(
             ],
         )
 
-    return success_result(matches[0])
+    TWIN_IDS.set((iot_domain_id, digital_twin_instance_name), matches[0]["id"])
+    return success_result(_remember_twin(matches[0]))
 
 
 def resolve_twin_for_tool(
@@ -8,6 +8,7 @@ import json
 import logging
 import os
 import time
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from functools import lru_cache
 from typing import Annotated, Any, Optional
@@ -54,7 +55,9 @@ from .control_plane import (
 from .data_plane import (
     DataApiTokenError,
     build_ords_base_url,
+    close_http_clients,
     get_cached_data_api_token,
+    get_http_client,
     get_raw_command_record,
     list_raw_command_records,
     list_rejected_data_records,
@@ -64,6 +67,13 @@ from .data_plane import (
 from .domain_context import resolve_domain_context_for_tool
 from .errors import ambiguity_error, error_result, invalid_input_error, not_found_error
 from .polling import wait_for_raw_command_terminal_state, wait_for_snapshot_update
+from .resolver_cache import (
+    invalidate_compartment_domains,
+    invalidate_digital_twin_instance,
+    invalidate_domain_twin_names,
+    invalidate_iot_domain,
+    invalidate_iot_domain_group,
+)
 from .resolvers import resolve_twin_for_tool
 from .tool_models import success_result
 
@@ -71,8 +81,18 @@ from .tool_models import success_result
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP):
+    """Close the pooled IoT Data API HTTP clients when the server shuts down."""
+    try:
+        yield {}
+    finally:
+        close_http_clients()
+
+
 # Create FastMCP instance
-mcp = FastMCP(name=__project__)
+mcp = FastMCP(name=__project__, lifespan=server_lifespan)
 JSON_ADAPTER = TypeAdapter(Any)
 IOT_DATA_API_TIMEOUT_SECONDS = 30.0
 
@@ -253,7 +273,7 @@ def _call_iot_data_api(
         headers["opc-request-id"] = opc_request_id
 
     try:
-        response = httpx.get(
+        response = get_http_client(url).get(
             url,
             headers=headers,
             timeout=IOT_DATA_API_TIMEOUT_SECONDS,
@@ -1587,6 +1607,7 @@ def create_digital_twin_instance(
             kwargs["opc_request_id"] = opc_request_id
 
         digital_twin_instance = get_iot_client().create_digital_twin_instance(**kwargs)
+        invalidate_domain_twin_names(iot_domain_id)
         from .models import DigitalTwinInstanceModel
 
         return DigitalTwinInstanceModel.from_oci_model(digital_twin_instance.data).model_dump()
@@ -1698,6 +1719,7 @@ def delete_digital_twin_instance(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response = get_iot_client().delete_digital_twin_instance(**kwargs)
+        invalidate_digital_twin_instance(digital_twin_instance_id)
         return _response_to_dict(response)
     except Exception as e:
         logger.error(f"Error deleting digital twin instance {digital_twin_instance_id}: {e}")
@@ -1921,6 +1943,7 @@ def update_digital_twin_instance(
             kwargs["opc_request_id"] = opc_request_id
 
         digital_twin_instance = get_iot_client().update_digital_twin_instance(**kwargs)
+        invalidate_digital_twin_instance(digital_twin_instance_id)
         from .models import DigitalTwinInstanceModel
 
         return DigitalTwinInstanceModel.from_oci_model(digital_twin_instance.data).model_dump()
@@ -2064,6 +2087,7 @@ def create_iot_domain(
             kwargs["opc_request_id"] = opc_request_id
 
         iot_domain = get_iot_client().create_iot_domain(**kwargs)
+        invalidate_compartment_domains(compartment_id)
         from .models import IoTDomainModel
 
         return IoTDomainModel.from_oci_model(iot_domain.data).model_dump()
@@ -2146,6 +2170,8 @@ def change_iot_domain_compartment(
             kwargs["opc_retry_token"] = opc_retry_token
 
         response = get_iot_client().change_iot_domain_compartment(**kwargs)
+        invalidate_iot_domain(iot_domain_id)
+        invalidate_compartment_domains(compartment_id)
         return _response_to_dict(response)
     except Exception as e:
         logger.error(f"Error changing IoT domain compartment for {iot_domain_id}: {e}")
@@ -2235,6 +2261,7 @@ def change_iot_domain_group_compartment(
             kwargs["opc_retry_token"] = opc_retry_token
 
         response = get_iot_client().change_iot_domain_group_compartment(**kwargs)
+        invalidate_iot_domain_group(iot_domain_group_id)
         return _response_to_dict(response)
     except Exception as e:
         logger.error(f"Error changing IoT domain group compartment for {iot_domain_group_id}: {e}")
@@ -2301,6 +2328,7 @@ def configure_iot_domain_data_access(
             kwargs["opc_retry_token"] = opc_retry_token
 
         response = get_iot_client().configure_iot_domain_data_access(**kwargs)
+        invalidate_iot_domain(iot_domain_id)
         return _response_to_dict(response)
     except Exception as e:
         logger.error(f"Error configuring IoT domain data access for {iot_domain_id}: {e}")
@@ -2345,6 +2373,7 @@ def configure_iot_domain_group_data_access(
             kwargs["opc_retry_token"] = opc_retry_token
 
         response = get_iot_client().configure_iot_domain_group_data_access(**kwargs)
+        invalidate_iot_domain_group(iot_domain_group_id)
         return _response_to_dict(response)
     except Exception as e:
         logger.error(f"Error configuring IoT domain group data access for {iot_domain_group_id}: {e}")
@@ -2390,6 +2419,7 @@ def update_iot_domain(
             kwargs["opc_request_id"] = opc_request_id
 
         response = get_iot_client().update_iot_domain(**kwargs)
+        invalidate_iot_domain(iot_domain_id)
         return _response_to_dict(response)
     except Exception as e:
         logger.error(f"Error updating IoT domain {iot_domain_id}: {e}")
@@ -2438,6 +2468,7 @@ def update_iot_domain_group(
             kwargs["opc_request_id"] = opc_request_id
 
         response = get_iot_client().update_iot_domain_group(**kwargs)
+        invalidate_iot_domain_group(iot_domain_group_id)
         return _response_to_dict(response)
     except Exception as e:
         logger.error(f"Error updating IoT domain group {iot_domain_group_id}: {e}")
@@ -2466,6 +2497,7 @@ def delete_iot_domain(
             kwargs["opc_request_id"] = opc_request_id
 
         response = get_iot_client().delete_iot_domain(**kwargs)
+        invalidate_iot_domain(iot_domain_id)
         return _response_to_dict(response)
     except Exception as e:
         logger.error(f"Error deleting IoT domain {iot_domain_id}: {e}")
@@ -2494,6 +2526,7 @@ def delete_iot_domain_group(
             kwargs["opc_request_id"] = opc_request_id
 
         response = get_iot_client().delete_iot_domain_group(**kwargs)
+        invalidate_iot_domain_group(iot_domain_group_id)
         return _response_to_dict(response)
     except Exception as e:
         logger.error(f"Error deleting IoT domain group {iot_domain_group_id}: {e}")
@@ -1,6 +1,7 @@
 import pytest
 
 from oracle.oci_iot_mcp_server.client import clear_iot_client_cache
+from oracle.oci_iot_mcp_server.resolver_cache import clear_resolver_cache
 
 
 @pytest.fixture(autouse=True)
@@ -8,3 +9,10 @@ def reset_iot_client_cache():
     clear_iot_client_cache()
     yield
     clear_iot_client_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_resolver_cache():
+    clear_resolver_cache()
+    yield
+    clear_resolver_cache()
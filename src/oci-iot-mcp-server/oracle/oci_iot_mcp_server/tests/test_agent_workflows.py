@@ -2,6 +2,7 @@ import importlib
 
 import pytest
 
+import oracle.oci_iot_mcp_server.domain_context as domain_context
 from oracle.oci_iot_mcp_server.data_plane import DataApiTokenError
 from oracle.oci_iot_mcp_server.tool_models import DataApiTokenModel
 
@@ -27,7 +28,7 @@ def test_get_twin_platform_context_returns_related_resources(monkeypatch):
         },
     )
     monkeypatch.setattr(
-        agent_workflows,
+        domain_context,
         "get_iot_domain_record",
         lambda _id: {
             "id": "domain-1",
@@ -38,7 +39,7 @@ def test_get_twin_platform_context_returns_related_resources(monkeypatch):
         },
     )
     monkeypatch.setattr(
-        agent_workflows,
+        domain_context,
         "get_iot_domain_group_record",
         lambda _id: {
             "id": "group-1",
@@ -82,7 +83,7 @@ def test_get_twin_platform_context_includes_gateway_for_indirect_twin(monkeypatc
         },
     )
     monkeypatch.setattr(
-        agent_workflows,
+        domain_context,
         "get_iot_domain_record",
         lambda _id: {
             "id": "domain-1",
@@ -93,7 +94,7 @@ def test_get_twin_platform_context_includes_gateway_for_indirect_twin(monkeypatc
         },
     )
     monkeypatch.setattr(
-        agent_workflows,
+        domain_context,
         "get_iot_domain_group_record",
         lambda _id: {
             "id": "group-1",
@@ -143,7 +144,7 @@ def test_get_twin_platform_context_lists_bounded_indirect_children_for_gateway(m
         },
     )
     monkeypatch.setattr(
-        agent_workflows,
+        domain_context,
         "get_iot_domain_record",
         lambda _id: {
             "id": "domain-1",
@@ -154,7 +155,7 @@ def test_get_twin_platform_context_lists_bounded_indirect_children_for_gateway(m
         },
     )
     monkeypatch.setattr(
-        agent_workflows,
+        domain_context,
         "get_iot_domain_group_record",
         lambda _id: {
             "id": "group-1",
@@ -582,7 +583,7 @@ def test_resolve_twin_bundle_leaves_adapter_and_model_empty_when_absent(monkeypa
         },
     )
     monkeypatch.setattr(
-        agent_workflows,
+        domain_context,
         "get_iot_domain_record",
         lambda _id: {
             "id": "domain-1",
@@ -593,7 +594,7 @@ def test_resolve_twin_bundle_leaves_adapter_and_model_empty_when_absent(monkeypa
         },
     )
     monkeypatch.setattr(
-        agent_workflows,
+        domain_context,
         "get_iot_domain_group_record",
         lambda _id: {
             "id": "group-1",
@@ -1,4 +1,5 @@
 from datetime import UTC, datetime
+from types import SimpleNamespace
 
 import pytest
 
@@ -8,8 +9,10 @@ from oracle.oci_iot_mcp_server.data_plane import (
     build_ords_base_url,
     build_twin_filter,
     clear_data_api_token_cache,
+    close_http_clients,
     encode_q,
     get_cached_data_api_token,
+    get_http_client,
     list_collection_records,
     mint_data_api_token,
     require_token_credentials,
@@ -284,7 +287,7 @@ def test_get_json_sends_bearer_token_and_raises_for_status(monkeypatch):
         observed["timeout"] = timeout
         return FakeResponse()
 
-    monkeypatch.setattr(data_plane.httpx, "get", fake_get)
+    monkeypatch.setattr(data_plane, "get_http_client", lambda url: SimpleNamespace(get=fake_get))
 
     payload = data_plane._get_json(
         url="https://example.com/data",
@@ -351,6 +354,111 @@ def test_list_collection_records_stops_when_page_is_empty(monkeypatch):
     ]
 
 
+def test_list_collection_records_fetches_remaining_pages_concurrently_after_full_page(monkeypatch):
+    observed_offsets = []
+
+    def fake_get_json(**kwargs):
+        offset = kwargs["params"]["offset"]
+        observed_offsets.append(offset)
+        assert kwargs["params"]["limit"] == 100
+        return {"items": [{"id": str(index)} for index in range(offset, min(offset + 100, 250))]}
+
+    monkeypatch.setattr(data_plane, "_get_json", fake_get_json)
+
+    records = list_collection_records(
+        base_url="https://example.com/base",
+        path="/historizedData",
+        token="token-123",
+        params={},
+        target_count=400,
+    )
+
+    assert [record["id"] for record in records] == [str(index) for index in range(250)]
+    assert observed_offsets[0] == 0
+    assert sorted(observed_offsets[1:4]) == [100, 200, 300]
+    assert observed_offsets[4:] == [250]
+
+
+def test_list_collection_records_resumes_sequentially_after_short_page(monkeypatch):
+    observed_offsets = []
+    sizes = {0: 100, 100: 100, 200: 40, 300: 100, 240: 0}
+
+    def fake_get_json(**kwargs):
+        offset = kwargs["params"]["offset"]
+        observed_offsets.append(offset)
+        return {"items": [{"id": str(offset + index)} for index in range(sizes[offset])]}
+
+    monkeypatch.setattr(data_plane, "_get_json", fake_get_json)
+
+    records = list_collection_records(
+        base_url="https://example.com/base",
+        path="/snapshotData",
+        token="token-123",
+        params={},
+        target_count=400,
+    )
+
+    assert len(records) == 240
+    assert records[-1] == {"id": "239"}
+    assert observed_offsets[0] == 0
+    assert sorted(observed_offsets[1:4]) == [100, 200, 300]
+    assert observed_offsets[4:] == [240]
+
+
+def test_list_collection_records_caps_scan_at_limit(monkeypatch):
+    observed_offsets = []
+
+    def fake_get_json(**kwargs):
+        observed_offsets.append(kwargs["params"]["offset"])
+        return {"items": [{"id": "x"}] * 100}
+
+    monkeypatch.setattr(data_plane, "_get_json", fake_get_json)
+
+    records = list_collection_records(
+        base_url="https://example.com/base",
+        path="/rawCommandData",
+        token="token-123",
+        params={},
+        target_count=1000,
+    )
+
+    assert len(records) == 500
+    assert sorted(observed_offsets) == [0, 100, 200, 300, 400]
+
+
+def test_get_http_client_reuses_one_http2_client_per_host():
+    try:
+        first = get_http_client("https://a.example.com/ords/x/rawData")
+        second = get_http_client("https://a.example.com/ords/y/snapshotData?limit=1")
+        other = get_http_client("https://b.example.com/ords/x/rawData")
+
+        assert first is second
+        assert first is not other
+    finally:
+        close_http_clients()
+
+    assert first.is_closed
+    assert get_http_client("https://a.example.com/ords/x/rawData") is not first
+    close_http_clients()
+
+
+def test_get_http_client_enables_http2(monkeypatch):
+    created = []
+    real_client = data_plane.httpx.Client
+
+    def client(**kwargs):
+        created.append(kwargs)
+        return real_client(**kwargs)
+
+    monkeypatch.setattr(data_plane.httpx, "Client", client)
+    try:
+        get_http_client("https://a.example.com/ords/x/rawData")
+    finally:
+        close_http_clients()
+
+    assert [kwargs["http2"] for kwargs in created] == [True]
+
+
 def test_collection_wrappers_use_expected_paths_and_filters(monkeypatch):
     observed_get = {}
     observed_list = []
@@ -0,0 +1,199 @@
+from types import SimpleNamespace
+
+import oracle.oci_iot_mcp_server.domain_context as domain_context
+import oracle.oci_iot_mcp_server.resolvers as resolvers
+from oracle.oci_iot_mcp_server import resolver_cache, server
+from oracle.oci_iot_mcp_server.domain_context import resolve_domain_context_for_tool
+from oracle.oci_iot_mcp_server.resolver_cache import TtlCache
+from oracle.oci_iot_mcp_server.resolvers import resolve_domain_selector, resolve_twin_for_tool
+
+DOMAIN = {
+    "id": "domain-ocid",
+    "name": "factory-domain",
+    "iot_domain_group_id": "group-ocid",
+    "device_host": "abc123.device.iot.us-phoenix-1.oci.oraclecloud.com",
+    "db_allowed_identity_domain_host": "id.example.com",
+}
+DOMAIN_GROUP = {
+    "id": "group-ocid",
+    "name": "factory-group",
+    "data_host": "xyz987.data.iot.us-phoenix-1.oci.oraclecloud.com",
+}
+
+
+def _count_calls(calls: list, name: str, result):
+    def fake(*args, **kwargs):
+        calls.append(name)
+        return result(*args, **kwargs) if callable(result) else result
+
+    return fake
+
+
+def test_ttl_cache_expires_entries_and_honors_disabled_ttl(monkeypatch):
+    now = [100.0]
+    cache = TtlCache(clock=lambda: now[0])
+    monkeypatch.setenv("OCI_IOT_RESOLVER_CACHE_TTL_SECONDS", "10")
+
+    cache.set("key", "value")
+    now[0] = 109.0
+    assert cache.get("key") == "value"
+    now[0] = 110.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+    monkeypatch.setenv("OCI_IOT_RESOLVER_CACHE_TTL_SECONDS", "0")
+    cache.set("key", "value")
+    assert cache.get("key") is None
+
+
+def test_resolver_cache_ttl_falls_back_to_default_for_invalid_values(monkeypatch):
+    monkeypatch.setenv("OCI_IOT_RESOLVER_CACHE_TTL_SECONDS", "soon")
+
+    assert resolver_cache.resolver_cache_ttl_seconds() == resolver_cache.DEFAULT_RESOLVER_CACHE_TTL_SECONDS
+
+
+def test_resolve_domain_selector_caches_display_name_lookup(monkeypatch):
+    calls = []
+    monkeypatch.setattr(resolvers, "list_iot_domains_records", _count_calls(calls, "list_domains", [DOMAIN]))
+
+    first = resolve_domain_selector(iot_domain_display_name="factory-domain", compartment_id="comp-1")
+    second = resolve_domain_selector(iot_domain_display_name="factory-domain", compartment_id="comp-1")
+
+    assert first["data"]["id"] == "domain-ocid"
+    assert first == second == {"ok": True, "data": DOMAIN}
+    assert calls == ["list_domains"]
+
+    second["data"]["name"] = "mutated"
+    assert resolve_domain_selector(iot_domain_display_name="factory-domain", compartment_id="comp-1") == first
+
+    resolver_cache.invalidate_compartment_domains("comp-1")
+    resolve_domain_selector(iot_domain_display_name="factory-domain", compartment_id="comp-1")
+    assert calls == ["list_domains", "list_domains"]
+
+
+def test_resolve_twin_for_tool_reuses_cached_twin_id(monkeypatch):
+    calls = []
+    twin = {"id": "twin-ocid", "name": "pump-01", "iot_domain_id": "domain-ocid"}
+    monkeypatch.setattr(resolvers, "list_iot_domains_records", _count_calls(calls, "list_domains", [DOMAIN]))
+    monkeypatch.setattr(
+        resolvers,
+        "list_digital_twin_instances_records",
+        _count_calls(calls, "list_twins", [twin]),
+    )
+    monkeypatch.setattr(
+        resolvers,
+        "get_digital_twin_instance_record",
+        _count_calls(calls, "get_twin", dict(twin)),
+    )
+    selectors = {
+        "digital_twin_instance_name": "pump-01",
+        "iot_domain_display_name": "factory-domain",
+        "compartment_id": "comp-1",
+    }
+
+    assert resolve_twin_for_tool(**selectors)["id"] == "twin-ocid"
+    assert resolve_twin_for_tool(**selectors)["id"] == "twin-ocid"
+
+    assert calls == ["list_domains", "list_twins", "get_twin"]
+    assert resolvers.cached_twin_domain_id("twin-ocid") == "domain-ocid"
+
+
+def test_resolve_twin_for_tool_drops_cached_id_when_twin_was_renamed(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        resolvers,
+        "list_digital_twin_instances_records",
+        _count_calls(calls, "list_twins", [{"id": "twin-2", "name": "pump-01", "iot_domain_id": "domain-ocid"}]),
+    )
+    monkeypatch.setattr(
+        resolvers,
+        "get_digital_twin_instance_record",
+        _count_calls(calls, "get_twin", {"id": "twin-1", "name": "pump-renamed", "iot_domain_id": "domain-ocid"}),
+    )
+    resolver_cache.TWIN_IDS.set(("domain-ocid", "pump-01"), "twin-1")
+
+    result = resolve_twin_for_tool(digital_twin_instance_name="pump-01", iot_domain_id="domain-ocid")
+
+    assert result["id"] == "twin-2"
+    assert calls == ["get_twin", "list_twins"]
+    assert resolver_cache.TWIN_IDS.get(("domain-ocid", "pump-01")) == "twin-2"
+
+
+def test_resolve_domain_context_for_tool_caches_context_by_domain_and_twin(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        resolvers,
+        "get_digital_twin_instance_record",
+        _count_calls(calls, "get_twin", {"id": "twin-ocid", "iot_domain_id": "domain-ocid"}),
+    )
+    monkeypatch.setattr(domain_context, "get_iot_domain_record", _count_calls(calls, "get_domain", DOMAIN))
+    monkeypatch.setattr(
+        domain_context,
+        "get_iot_domain_group_record",
+        _count_calls(calls, "get_domain_group", DOMAIN_GROUP),
+    )
+
+    first = resolve_domain_context_for_tool(digital_twin_instance_id="twin-ocid")
+    second = resolve_domain_context_for_tool(digital_twin_instance_id="twin-ocid")
+    by_domain = resolve_domain_context_for_tool(iot_domain_id="domain-ocid")
+
+    assert first == second == by_domain
+    assert first["domain_short_id"] == "abc123"
+    assert calls == ["get_twin", "get_domain", "get_domain_group"]
+
+    resolver_cache.invalidate_iot_domain_group("group-ocid")
+    resolve_domain_context_for_tool(digital_twin_instance_id="twin-ocid")
+    assert calls == ["get_twin", "get_domain", "get_domain_group", "get_domain", "get_domain_group"]
+
+
+def test_load_domain_context_returns_copies_of_cached_records(monkeypatch):
+    monkeypatch.setattr(domain_context, "get_iot_domain_record", lambda _id: dict(DOMAIN))
+    monkeypatch.setattr(domain_context, "get_iot_domain_group_record", lambda _id: dict(DOMAIN_GROUP))
+
+    iot_domain, _, _ = domain_context.load_domain_context("domain-ocid")
+    iot_domain["name"] = "mutated"
+    cached_domain, _, context = domain_context.load_domain_context("domain-ocid")
+
+    assert cached_domain["name"] == "factory-domain"
+    assert context.iot_domain_group_id == "group-ocid"
+
+
+def test_invalidate_iot_domain_drops_names_twins_and_context():
+    resolver_cache.DOMAIN_RECORDS.set(("comp-1", "factory-domain", None), DOMAIN)
+    resolver_cache.TWIN_IDS.set(("domain-ocid", "pump-01"), "twin-ocid")
+    resolver_cache.TWIN_DOMAIN_IDS.set("twin-ocid", "domain-ocid")
+    resolver_cache.DOMAIN_CONTEXTS.set("domain-ocid", ({}, {}, None))
+    resolver_cache.DOMAIN_RECORDS.set(("comp-1", "other-domain", None), {**DOMAIN, "id": "domain-other"})
+
+    resolver_cache.invalidate_iot_domain("domain-ocid")
+
+    assert len(resolver_cache.DOMAIN_RECORDS) == 1
+    assert len(resolver_cache.TWIN_IDS) == 0
+    assert len(resolver_cache.TWIN_DOMAIN_IDS) == 0
+    assert len(resolver_cache.DOMAIN_CONTEXTS) == 0
+
+
+def test_mutating_tools_invalidate_resolver_cache(monkeypatch):
+    resolver_cache.TWIN_IDS.set(("domain-ocid", "pump-01"), "twin-ocid")
+    resolver_cache.TWIN_DOMAIN_IDS.set("twin-ocid", "domain-ocid")
+    resolver_cache.DOMAIN_RECORDS.set(("comp-1", "factory-domain", None), DOMAIN)
+    response = SimpleNamespace(status=202, request_id="req-1", headers={}, data=None)
+    monkeypatch.setattr(
+        server,
+        "get_iot_client",
+        lambda: SimpleNamespace(
+            delete_digital_twin_instance=lambda **kwargs: response,
+            update_iot_domain=lambda **kwargs: response,
+        ),
+    )
+    monkeypatch.setattr(server.oci.iot.models, "UpdateIotDomainDetails", lambda **kwargs: kwargs)
+
+    server.delete_digital_twin_instance(digital_twin_instance_id="twin-ocid")
+
+    assert resolver_cache.TWIN_IDS.get(("domain-ocid", "pump-01")) is None
+    assert resolver_cache.TWIN_DOMAIN_IDS.get("twin-ocid") is None
+    assert resolver_cache.DOMAIN_RECORDS.get(("comp-1", "factory-domain", None)) == DOMAIN
+
+    server.update_iot_domain(iot_domain_id="domain-ocid", display_name="renamed")
+
+    assert resolver_cache.DOMAIN_RECORDS.get(("comp-1", "factory-domain", None)) is None
@@ -26,6 +26,10 @@ def _response(*, status: int = 202, request_id: str = "req-123", headers: dict |
     return SimpleNamespace(status=status, request_id=request_id, headers=headers or {}, data=data)
 
 
+def _patch_http_get(monkeypatch, fake_get):
+    monkeypatch.setattr(server, "get_http_client", lambda url: SimpleNamespace(get=fake_get))
+
+
 def _simple_model(identifier: str, **kwargs):
     return SimpleNamespace(id=identifier, **kwargs)
 
@@ -461,7 +465,7 @@ def test_call_iot_data_api_handles_json_text_and_structured_errors(monkeypatch):
             request=httpx.Request("GET", url),
         )
 
-    monkeypatch.setattr(server.httpx, "get", fake_get)
+    _patch_http_get(monkeypatch, fake_get)
 
     result = server._call_iot_data_api(
         resource_path="/rawData",
@@ -478,9 +482,8 @@ def test_call_iot_data_api_handles_json_text_and_structured_errors(monkeypatch):
     assert captured["headers"]["opc-request-id"] == "opc-1"
     assert captured["timeout"] == 30.0
 
-    monkeypatch.setattr(
-        server.httpx,
-        "get",
+    _patch_http_get(
+        monkeypatch,
         lambda url, *, headers, timeout: httpx.Response(
             200,
             headers={"Content-Type": "text/plain"},
@@ -503,9 +506,8 @@ def test_call_iot_data_api_handles_json_text_and_structured_errors(monkeypatch):
         json={"message": "bad"},
         request=request,
     )
-    monkeypatch.setattr(
-        server.httpx,
-        "get",
+    _patch_http_get(
+        monkeypatch,
         lambda url, *, headers, timeout: (_ for _ in ()).throw(
             httpx.HTTPStatusError("boom", request=request, response=response)
         ),
@@ -521,9 +523,8 @@ def test_call_iot_data_api_handles_json_text_and_structured_errors(monkeypatch):
     assert result["error"]["details"]["status_code"] == 500
     assert logged and "IoT Data API request failed" in logged[0]
 
-    monkeypatch.setattr(
-        server.httpx,
-        "get",
+    _patch_http_get(
+        monkeypatch,
         lambda url, *, headers, timeout: (_ for _ in ()).throw(httpx.TimeoutException("slow")),
     )
     result = server._call_iot_data_api(
@@ -534,9 +535,8 @@ def test_call_iot_data_api_handles_json_text_and_structured_errors(monkeypatch):
     assert result["ok"] is False
     assert result["error"]["code"] == "data_plane_timeout"
 
-    monkeypatch.setattr(
-        server.httpx,
-        "get",
+    _patch_http_get(
+        monkeypatch,
         lambda url, *, headers, timeout: (_ for _ in ()).throw(
             httpx.RequestError("network down", request=httpx.Request("GET", url))
         ),
@@ -2160,3 +2160,12 @@ def test_direct_data_api_tool_returns_missing_access_token_error(monkeypatch):
 
     assert result["ok"] is False
     assert result["error"]["code"] == "missing_access_token"
+
+
+@pytest.mark.asyncio
+async def test_server_shutdown_closes_pooled_data_api_clients():
+    async with Client(server.mcp):
+        http_client = server.get_http_client("https://data.example.com/ords/abc123/rawData")
+        assert not http_client.is_closed
+
+    assert http_client.is_closed
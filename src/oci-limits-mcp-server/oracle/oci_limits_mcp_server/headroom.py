@@ -0,0 +1,309 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+from typing import Callable, Optional
+
+import oci
+
+from .utils import (
+    list_limit_definitions_with_pagination,
+    list_limit_values_with_pagination,
+)
+
+logger = Logger(__name__, level="INFO")
+
+DEFAULT_DEFINITION_CACHE_TTL_SECONDS = 3600.0
+DEFAULT_MAX_WORKERS = 8
+# Throttled (HTTP 429) calls are retried with exponential backoff and full jitter.
+MAX_RATE_LIMIT_RETRIES = 5
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 8.0
+
+
+def definition_cache_ttl_seconds() -> float:
+    value = os.getenv("OCI_LIMITS_DEFINITION_CACHE_TTL_SECONDS")
+    if not value:
+        return DEFAULT_DEFINITION_CACHE_TTL_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        return DEFAULT_DEFINITION_CACHE_TTL_SECONDS
+
+
+def default_max_workers() -> int:
+    value = os.getenv("OCI_LIMITS_HEADROOM_MAX_WORKERS")
+    try:
+        return max(1, int(value)) if value else DEFAULT_MAX_WORKERS
+    except ValueError:
+        return DEFAULT_MAX_WORKERS
+
+
+def _endpoint(client) -> str:
+    endpoint = getattr(getattr(client, "base_client", None), "endpoint", None)
+    return endpoint if isinstance(endpoint, str) and endpoint else "default"
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    return isinstance(error, oci.exceptions.ServiceError) and error.status == 429
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    headers = getattr(error, "headers", None) or {}
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class CallStats:
+    """Thread-safe counters for the API calls made while building a report."""
+
+    def __init__(self):
+        self.calls = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def record(self, *, throttled: bool = False) -> None:
+        with self._lock:
+            self.calls += 1
+            if throttled:
+                self.throttled += 1
+
+
+def call_with_backoff(
+    fn: Callable,
+    *args,
+    stats: Optional[CallStats] = None,
+    sleep: Callable[[float], None] = time.sleep,
+    **kwargs,
+):
+    """Call ``fn`` and retry it while the service answers 429, honoring Retry-After when sent."""
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        try:
+            result = fn(*args, **kwargs)
+            if stats is not None:
+                stats.record()
+            return result
+        except Exception as e:
+            if not _is_rate_limited(e):
+                if stats is not None:
+                    stats.record()
+                raise
+            if stats is not None:
+                stats.record(throttled=True)
+            if attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            delay = _retry_after_seconds(e)
+            if delay is None:
+                delay = random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt))
+            sleep(min(delay, BACKOFF_MAX_SECONDS))
+
+
+class LimitDefinitionCache:
+    """Limit definitions per (region, tenancy, subscription), kept in memory for a TTL.
+
+    Definitions only change when services add limits, so one ListLimitDefinitions walk over
+    every service is shared by all headroom reports until the TTL passes.
+    """
+
+    def __init__(self, *, clock=time.time):
+        self._clock = clock
+        self._entries: dict[tuple, tuple[float, list]] = {}
+        self._lock = threading.Lock()
+
+    def definitions(self, client, compartment_id: str, subscription_id: Optional[str] = None) -> list:
+        ttl_seconds = definition_cache_ttl_seconds()
+        key = (_endpoint(client), compartment_id, subscription_id)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and self._clock() - entry[0] < ttl_seconds:
+            return entry[1]
+        items = call_with_backoff(
+            list_limit_definitions_with_pagination,
+            client,
+            compartment_id=compartment_id,
+            subscription_id=subscription_id,
+        )
+        if ttl_seconds > 0:
+            with self._lock:
+                self._entries[key] = (self._clock(), items)
+        return items
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+LIMIT_DEFINITIONS = LimitDefinitionCache()
+
+
+def _utilization(used, available) -> Optional[float]:
+    if used is None or available is None:
+        return None
+    total = used + available
+    if total <= 0:
+        return None
+    return used / total
+
+
+def _headroom_row(definition, value, availability) -> dict:
+    used = availability.used
+    available = availability.available
+    if used is None and available is None:
+        used = availability.fractional_usage
+        available = availability.fractional_availability
+    utilization = _utilization(used, available)
+    return {
+        "serviceName": definition.service_name,
+        "limitName": definition.name,
+        "scopeType": definition.scope_type,
+        "availabilityDomain": getattr(value, "availability_domain", None),
+        "limitValue": getattr(value, "value", None),
+        "effectiveQuotaValue": availability.effective_quota_value,
+        "used": used,
+        "available": available,
+        "utilization": None if utilization is None else round(utilization, 4),
+        "headroom": None if utilization is None else round(1 - utilization, 4),
+    }
+
+
+def headroom_report(
+    client_factory: Callable,
+    compartment_id: str,
+    *,
+    utilization_threshold: float = 0.8,
+    service_names: Optional[list[str]] = None,
+    availability_domains: Optional[list[str]] = None,
+    subscription_id: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict:
+    """
+    Evaluate resource availability for every limit that supports it and report the ones at or
+    above ``utilization_threshold``, tightest headroom first.
+
+    Limit values (one paginated call per service) decide what to evaluate: limits whose value is
+    0 in a scope are skipped, and AD-scoped limits are evaluated in each AD the values list. The
+    availability GETs then fan out over ``max_workers`` threads, each with its own client.
+    """
+    stats = CallStats()
+    local = threading.local()
+
+    def client():
+        if not hasattr(local, "client"):
+            local.client = client_factory()
+        return local.client
+
+    wanted_services = {name.lower() for name in service_names} if service_names else None
+    wanted_ads = {ad.lower() for ad in availability_domains} if availability_domains else None
+
+    definitions = [
+        d
+        for d in LIMIT_DEFINITIONS.definitions(client(), compartment_id, subscription_id)
+        if d.is_resource_availability_supported
+        and not d.is_deprecated
+        and (wanted_services is None or (d.service_name or "").lower() in wanted_services)
+    ]
+    by_service: dict[str, dict[str, object]] = {}
+    for d in definitions:
+        by_service.setdefault(d.service_name, {})[d.name] = d
+
+    errors: list[dict] = []
+
+    def list_values(service_name: str):
+        return call_with_backoff(
+            list_limit_values_with_pagination,
+            client(),
+            compartment_id=compartment_id,
+            service_name=service_name,
+            subscription_id=subscription_id,
+            stats=stats,
+            sleep=sleep,
+        )
+
+    def get_availability(task):
+        definition, value = task
+        response = call_with_backoff(
+            client().get_resource_availability,
+            service_name=definition.service_name,
+            limit_name=definition.name,
+            compartment_id=compartment_id,
+            availability_domain=getattr(value, "availability_domain", None),
+            subscription_id=subscription_id,
+            stats=stats,
+            sleep=sleep,
+        )
+        return response.data
+
+    workers = max(1, max_workers or default_max_workers())
+    tasks: list[tuple] = []
+    skipped_zero = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="limits-headroom") as executor:
+        services = sorted(by_service)
+        value_futures = [executor.submit(list_values, name) for name in services]
+        for service_name, future in zip(services, value_futures):
+            try:
+                values = future.result()
+            except Exception as e:
+                errors.append({"serviceName": service_name, "error": str(e)})
+                continue
+            limits = by_service[service_name]
+            for value in values:
+                definition = limits.get(value.name)
+                if definition is None or value.scope_type != definition.scope_type:
+                    continue
+                if definition.scope_type == "AD" and wanted_ads is not None:
+                    if (value.availability_domain or "").lower() not in wanted_ads:
+                        continue
+                if not value.value:
+                    skipped_zero += 1
+                    continue
+                tasks.append((definition, value))
+
+        availability_futures = [executor.submit(get_availability, task) for task in tasks]
+        rows = []
+        for (definition, value), future in zip(tasks, availability_futures):
+            try:
+                row = _headroom_row(definition, value, future.result())
+            except Exception as e:
+                errors.append(
+                    {
+                        "serviceName": definition.service_name,
+                        "limitName": definition.name,
+                        "availabilityDomain": getattr(value, "availability_domain", None),
+                        "error": str(e),
+                    }
+                )
+                continue
+            if row["utilization"] is not None and row["utilization"] >= utilization_threshold:
+                rows.append(row)
+
+    rows.sort(key=lambda r: (r["headroom"], r["available"], r["serviceName"], r["limitName"]))
+    return {
+        "compartmentId": compartment_id,
+        "utilizationThreshold": utilization_threshold,
+        "limits": rows,
+        "evaluated": len(tasks),
+        "skippedZeroValue": skipped_zero,
+        "errors": errors,
+        "apiCalls": stats.calls,
+        "throttledCalls": stats.throttled,
+    }
+
+
+__all__ = [
+    "LIMIT_DEFINITIONS",
+    "LimitDefinitionCache",
+    "call_with_backoff",
+    "headroom_report",
+]
@@ -13,6 +13,7 @@ from fastmcp import FastMCP
 from pydantic import Field
 
 from . import __project__, __version__
+from .headroom import headroom_report
 from .models import (
     map_limit_definition_summary,
     map_limit_value_summary,
@@ -344,6 +345,58 @@ def get_resource_availability(
         raise
 
 
+@mcp.tool(
+    description=(
+        "Tenancy-wide limits headroom report: evaluates resource availability for every limit "
+        "(per AD for AD-scoped limits) in parallel and returns only the limits whose utilization "
+        "is at or above utilization_threshold, sorted by headroom (tightest first)."
+    )
+)
+def get_limits_headroom(
+    compartment_id: str = Field(
+        ..., description="OCID of the root compartment (tenancy)"
+    ),
+    utilization_threshold: float = Field(
+        0.8,
+        description="Minimum used / (used + available) for a limit to be reported",
+        ge=0,
+        le=1,
+    ),
+    service_names: Optional[list[str]] = Field(
+        None, description="Only evaluate these services (e.g. ['compute', 'database'])"
+    ),
+    availability_domains: Optional[list[str]] = Field(
+        None,
+        description="Only evaluate AD-scoped limits in these ADs. Defaults to every AD with a limit value.",
+    ),
+    subscription_id: Optional[str] = Field(
+        None, description="Subscription OCID filter"
+    ),
+    max_workers: Optional[int] = Field(
+        None,
+        description="Concurrent API calls. Defaults to OCI_LIMITS_HEADROOM_MAX_WORKERS or 8.",
+        ge=1,
+        le=32,
+    ),
+) -> dict:
+    """
+    Fans out GET /20190729/services/{serviceName}/limits/{limitName}/resourceAvailability
+    """
+    try:
+        return headroom_report(
+            get_limits_client,
+            compartment_id,
+            utilization_threshold=utilization_threshold,
+            service_names=service_names,
+            availability_domains=availability_domains,
+            subscription_id=subscription_id,
+            max_workers=max_workers,
+        )
+    except Exception as e:
+        logger.error(f"Error in get_limits_headroom: {e}")
+        raise
+
+
 def main() -> None:
     mcp.run()
 
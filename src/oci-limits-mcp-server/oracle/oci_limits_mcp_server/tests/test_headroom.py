@@ -0,0 +1,209 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from unittest.mock import MagicMock, create_autospec, patch
+
+import oci
+import pytest
+from fastmcp import Client
+from oracle.oci_limits_mcp_server import headroom
+from oracle.oci_limits_mcp_server.server import mcp
+
+TENANCY_ID = "ocid1.tenancy.oc1..xxxx"
+
+
+@pytest.fixture(autouse=True)
+def clear_definition_cache():
+    headroom.LIMIT_DEFINITIONS.clear()
+    yield
+    headroom.LIMIT_DEFINITIONS.clear()
+
+
+def _response(data):
+    response = create_autospec(oci.response.Response)
+    response.data = data
+    response.has_next_page = False
+    response.next_page = None
+    return response
+
+
+def _definition(service, name, scope="REGION", supported=True, deprecated=False):
+    return oci.limits.models.LimitDefinitionSummary(
+        service_name=service,
+        name=name,
+        scope_type=scope,
+        is_resource_availability_supported=supported,
+        is_deprecated=deprecated,
+    )
+
+
+def _value(name, value, scope="REGION", ad=None):
+    return oci.limits.models.LimitValueSummary(
+        name=name, scope_type=scope, availability_domain=ad, value=value
+    )
+
+
+DEFINITIONS = [
+    _definition("compute", "standard-e4-core-count", scope="AD"),
+    _definition("compute", "custom-image-count"),
+    _definition("compute", "old-limit", deprecated=True),
+    _definition("database", "adb-ocpu-count"),
+    _definition("database", "no-availability", supported=False),
+]
+VALUES = {
+    "compute": [
+        _value("standard-e4-core-count", 100, scope="AD", ad="AD-1"),
+        _value("standard-e4-core-count", 100, scope="AD", ad="AD-2"),
+        _value("standard-e4-core-count", 0, scope="AD", ad="AD-3"),
+        _value("custom-image-count", 25),
+        _value("old-limit", 10),
+    ],
+    "database": [_value("adb-ocpu-count", 8), _value("no-availability", 5)],
+}
+USAGE = {
+    ("standard-e4-core-count", "AD-1"): (90, 10),
+    ("standard-e4-core-count", "AD-2"): (20, 80),
+    ("custom-image-count", None): (24, 1),
+    ("adb-ocpu-count", None): (7, 1),
+}
+
+
+def _client():
+    client = MagicMock()
+    client.list_limit_definitions.return_value = _response(DEFINITIONS)
+
+    def values(service_name, **kwargs):
+        # LimitsClient.list_limit_values rejects any scope_type outside its enum, None included.
+        if "scope_type" in kwargs and kwargs["scope_type"] not in ("GLOBAL", "REGION", "AD"):
+            raise ValueError("Invalid value for scope_type, must be one of ['GLOBAL', 'REGION', 'AD']")
+        return _response(VALUES[service_name])
+
+    client.list_limit_values.side_effect = values
+
+    def availability(limit_name, availability_domain=None, **_):
+        used, available = USAGE[(limit_name, availability_domain)]
+        return _response(oci.limits.models.ResourceAvailability(used=used, available=available))
+
+    client.get_resource_availability.side_effect = availability
+    return client
+
+
+class TestHeadroomReport:
+    def test_lists_values_without_scope_type(self):
+        client = _client()
+
+        report = headroom.headroom_report(lambda: client, TENANCY_ID, utilization_threshold=0.0)
+
+        assert report["errors"] == []
+        assert report["limits"]
+        for call in client.list_limit_values.call_args_list:
+            assert "scope_type" not in call.kwargs
+
+    def test_reports_limits_above_threshold_sorted_by_headroom(self):
+        client = _client()
+
+        report = headroom.headroom_report(lambda: client, TENANCY_ID, utilization_threshold=0.85)
+
+        assert [(r["limitName"], r["availabilityDomain"]) for r in report["limits"]] == [
+            ("custom-image-count", None),
+            ("standard-e4-core-count", "AD-1"),
+            ("adb-ocpu-count", None),
+        ]
+        assert report["limits"][0]["utilization"] == 0.96
+        assert report["limits"][0]["headroom"] == 0.04
+        assert report["limits"][0]["limitValue"] == 25
+        assert report["evaluated"] == 4
+        assert report["skippedZeroValue"] == 1
+        assert report["errors"] == []
+        assert report["apiCalls"] == 6
+        assert client.get_resource_availability.call_count == 4
+
+    def test_filters_services_and_availability_domains(self):
+        client = _client()
+
+        report = headroom.headroom_report(
+            lambda: client,
+            TENANCY_ID,
+            utilization_threshold=0,
+            service_names=["Compute"],
+            availability_domains=["ad-2"],
+        )
+
+        assert [(r["limitName"], r["availabilityDomain"]) for r in report["limits"]] == [
+            ("custom-image-count", None),
+            ("standard-e4-core-count", "AD-2"),
+        ]
+        assert client.list_limit_values.call_count == 1
+
+    def test_definitions_are_cached_between_reports(self):
+        client = _client()
+
+        headroom.headroom_report(lambda: client, TENANCY_ID)
+        headroom.headroom_report(lambda: client, TENANCY_ID)
+
+        assert client.list_limit_definitions.call_count == 1
+
+    def test_rate_limited_calls_are_retried_and_other_errors_reported(self):
+        client = _client()
+        throttled = oci.exceptions.ServiceError(429, "TooManyRequests", {"retry-after": "0.25"}, "slow down")
+        calls = {"adb-ocpu-count": 0}
+        default = client.get_resource_availability.side_effect
+
+        def availability(limit_name, **kwargs):
+            if limit_name == "adb-ocpu-count":
+                calls[limit_name] += 1
+                if calls[limit_name] < 3:
+                    raise throttled
+            if limit_name == "custom-image-count":
+                raise oci.exceptions.ServiceError(404, "NotFound", {}, "gone")
+            return default(limit_name, **kwargs)
+
+        client.get_resource_availability.side_effect = availability
+        sleeps = []
+
+        report = headroom.headroom_report(lambda: client, TENANCY_ID, sleep=sleeps.append)
+
+        assert sleeps == [0.25, 0.25]
+        assert report["throttledCalls"] == 2
+        assert [r["limitName"] for r in report["limits"]] == ["standard-e4-core-count", "adb-ocpu-count"]
+        assert report["errors"] == [
+            {
+                "serviceName": "compute",
+                "limitName": "custom-image-count",
+                "availabilityDomain": None,
+                "error": str(oci.exceptions.ServiceError(404, "NotFound", {}, "gone")),
+            }
+        ]
+
+    def test_backoff_gives_up_after_max_retries(self):
+        throttled = oci.exceptions.ServiceError(429, "TooManyRequests", {}, "slow down")
+        fn = MagicMock(side_effect=throttled)
+        sleeps = []
+
+        with pytest.raises(oci.exceptions.ServiceError):
+            headroom.call_with_backoff(fn, sleep=sleeps.append)
+
+        assert fn.call_count == headroom.MAX_RATE_LIMIT_RETRIES + 1
+        assert len(sleeps) == headroom.MAX_RATE_LIMIT_RETRIES
+        assert all(0 <= s <= headroom.BACKOFF_MAX_SECONDS for s in sleeps)
+
+
+class TestHeadroomTool:
+    @pytest.mark.asyncio
+    @patch("oracle.oci_limits_mcp_server.server.get_limits_client")
+    async def test_get_limits_headroom(self, mock_get_client):
+        mock_get_client.return_value = _client()
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "get_limits_headroom",
+                    {"compartment_id": TENANCY_ID, "utilization_threshold": 0.9, "max_workers": 2},
+                )
+            ).structured_content
+
+        assert [r["limitName"] for r in result["limits"]] == ["custom-image-count", "standard-e4-core-count"]
+        assert result["utilizationThreshold"] == 0.9
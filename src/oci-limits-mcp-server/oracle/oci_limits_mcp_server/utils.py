@@ -88,7 +88,7 @@ def list_limit_values_with_pagination(
     client: oci.limits.LimitsClient,
     compartment_id: str,
     service_name: str,
-    scope_type: str,
+    scope_type: Optional[str] = None,
     availability_domain: Optional[str] = None,
     name: Optional[str] = None,
     sort_by: str = "name",
@@ -102,11 +102,14 @@ def list_limit_values_with_pagination(
         next_page = page
         has_next_page = True
 
+        # The SDK validates scope_type against its enum even when it is None, so only send it when set.
+        scope_kwargs = {"scope_type": scope_type} if scope_type else {}
+
         while has_next_page:
             response = client.list_limit_values(
                 compartment_id=compartment_id,
                 service_name=service_name,
-                scope_type=scope_type,
+                **scope_kwargs,
                 availability_domain=availability_domain,
                 name=name,
                 sort_by=sort_by,
@@ -0,0 +1,129 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import json
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+_MISSING = object()
+
+
+def _lookup(obj: Any, parts: List[str]) -> Any:
+    for part in parts:
+        if not isinstance(obj, dict) or part not in obj:
+            return _MISSING
+        obj = obj[part]
+    return obj
+
+
+def field_value(record: Dict[str, Any], path: str) -> Any:
+    """
+    Value of a dotted field path in a search result record, or None when it is absent.
+
+    Paths are resolved against the record first and then against its ``logContent``, so the
+    names used in search queries (``data.statusCode``, ``source``, ``type``) work as written.
+    """
+    parts = path.split(".")
+    value = _lookup(record, parts)
+    if value is _MISSING:
+        value = _lookup(record.get("logContent"), parts)
+    return None if value is _MISSING else value
+
+
+def record_time(record: Dict[str, Any]) -> Optional[float]:
+    """Epoch seconds of a search result record, from ``datetime`` (epoch millis) or ``logContent.time``."""
+    value = record.get("datetime")
+    if value is None:
+        value = field_value(record, "time")
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value / 1000.0
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    return None
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+def _iso(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class LogAggregator:
+    """
+    Streaming reducer over search result records.
+
+    Records are folded into counters as pages arrive and are not kept, apart from the first
+    ``sample_size`` of them (up to ``max_sample_bytes`` of JSON), so memory stays proportional to
+    the number of distinct groups and time buckets rather than to the number of records scanned.
+    """
+
+    def __init__(
+        self,
+        group_by: Optional[List[str]] = None,
+        *,
+        top_n: int = 20,
+        interval_seconds: Optional[int] = None,
+        sample_size: int = 3,
+        max_sample_bytes: int = 20000,
+    ):
+        self.group_by = list(group_by or [])
+        self.top_n = top_n
+        self.interval_seconds = interval_seconds
+        self.sample_size = sample_size
+        self.max_sample_bytes = max_sample_bytes
+        self.count = 0
+        self.earliest: Optional[float] = None
+        self.latest: Optional[float] = None
+        self.groups: Counter = Counter()
+        self.buckets: Counter = Counter()
+        self.samples: List[Dict[str, Any]] = []
+        self._sample_bytes = 0
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.count += 1
+        if self.group_by:
+            self.groups[tuple(_hashable(field_value(record, path)) for path in self.group_by)] += 1
+        seconds = record_time(record)
+        if seconds is not None:
+            self.earliest = seconds if self.earliest is None else min(self.earliest, seconds)
+            self.latest = seconds if self.latest is None else max(self.latest, seconds)
+            if self.interval_seconds:
+                self.buckets[int(seconds // self.interval_seconds) * self.interval_seconds] += 1
+        if len(self.samples) < self.sample_size:
+            size = len(json.dumps(record, default=str))
+            if self._sample_bytes + size <= self.max_sample_bytes:
+                self.samples.append(record)
+                self._sample_bytes += size
+
+    def top_groups(self) -> List[Dict[str, Any]]:
+        return [
+            {"key": dict(zip(self.group_by, key)), "count": count}
+            for key, count in self.groups.most_common(self.top_n)
+        ]
+
+    def histogram(self) -> List[Dict[str, Any]]:
+        return [{"start": _iso(start), "count": self.buckets[start]} for start in sorted(self.buckets)]
+
+    def time_range(self) -> Dict[str, Optional[str]]:
+        return {
+            "earliest": None if self.earliest is None else _iso(self.earliest),
+            "latest": None if self.latest is None else _iso(self.latest),
+        }
@@ -504,3 +504,74 @@ def map_search_response(
 
 
 # endregion
+
+# region LogAggregation
+
+
+class LogGroupCount(BaseModel):
+    """Number of scanned records sharing one combination of ``group_by`` values."""
+
+    key: Dict[str, Any] = Field(..., description="The group_by field paths and their values.")
+    count: int = Field(..., description="Number of records with these values.")
+
+
+class LogHistogramBucket(BaseModel):
+    """Number of scanned records in one time bucket."""
+
+    start: str = Field(..., description="Start of the bucket, RFC 3339 in UTC.")
+    count: int = Field(..., description="Number of records in the bucket.")
+
+
+class LogAggregation(BaseModel):
+    """Aggregates computed over the records of an automatically paginated log search."""
+
+    search_query: str = Field(..., description="The log search query that was run.")
+    time_start: str = Field(..., description="Start of the searched time range.")
+    time_end: str = Field(..., description="End of the searched time range.")
+    records_scanned: int = Field(..., description="Number of search results folded into the aggregates.")
+    pages: int = Field(..., description="Number of search pages fetched.")
+    bytes_scanned: int = Field(..., description="Approximate JSON size of the scanned search results.")
+    elapsed_seconds: float = Field(..., description="Wall-clock time spent fetching and aggregating.")
+    complete: bool = Field(..., description="Whether every page of the search was scanned.")
+    stop_reason: Optional[Literal["time_budget", "byte_budget", "record_budget"]] = Field(
+        None, description="The budget that stopped pagination early, if any."
+    )
+    next_page: Optional[str] = Field(
+        None,
+        description="Page token to resume the scan from when it stopped early. "
+        "Pass it back as page to continue; the aggregates do not carry over.",
+    )
+    earliest: Optional[str] = Field(None, description="Time of the earliest scanned record.")
+    latest: Optional[str] = Field(None, description="Time of the latest scanned record.")
+    distinct_groups: int = Field(0, description="Number of distinct group_by value combinations seen.")
+    groups: List[LogGroupCount] = Field(
+        default_factory=list, description="The most frequent group_by value combinations, by count."
+    )
+    histogram: List[LogHistogramBucket] = Field(
+        default_factory=list, description="Record counts per time bucket, in time order."
+    )
+    samples: List[SearchResult] = Field(default_factory=list, description="The first scanned records.")
+    console_url: str = Field(..., description="Link to the same search in the OCI Console logging search.")
+
+
+# endregion
+
+# region LogTail
+
+
+class LogTail(BaseModel):
+    """New records of a followed log search, with the cursor to continue from."""
+
+    records: List[SearchResult] = Field(
+        default_factory=list, description="Records not returned by earlier calls, oldest first."
+    )
+    cursor: str = Field(..., description="Pass this back as cursor to get only the records after these.")
+    has_more: bool = Field(
+        False, description="Whether more new records were already available; call again right away."
+    )
+    polls: int = Field(..., description="Number of searches run during this call.")
+    time_start: str = Field(..., description="Start of the last searched time range.")
+    time_end: str = Field(..., description="End of the last searched time range.")
+
+
+# endregion
@@ -4,8 +4,13 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import asyncio
+import json
 import os
+import re
+import time
 import urllib.parse
+from datetime import datetime, timezone
 from logging import Logger
 from typing import Optional
 
@@ -14,12 +19,16 @@ from fastmcp import FastMCP
 from fastmcp.server.auth.providers.oci import OCIProvider
 from fastmcp.server.dependencies import get_access_token
 from fastmcp.utilities.auth import parse_scopes
+from oracle.oci_logging_mcp_server.aggregation import LogAggregator
 from oracle.oci_logging_mcp_server.models import (
     Log,
+    LogAggregation,
     LogGroup,
     LogGroupSummary,
     LogSummary,
+    LogTail,
     SearchResponse,
+    SearchResult,
     map_log,
     map_log_group,
     map_log_group_summary,
@@ -31,6 +40,7 @@ from oracle.oci_logging_mcp_server.scripts import (
     SEARCH_LOG_SCRIPT,
     get_script_content,
 )
+from oracle.oci_logging_mcp_server.tail import TailCursor, format_millis
 from pydantic import Field
 
 from . import __project__, __version__
@@ -309,6 +319,16 @@ def get_paginated_event_types(
     )
 
 
+def _logging_search_url(search_query: str, time_start: str, time_end: str) -> str:
+    return (
+        "https://cloud.oracle.com/logging/search?"
+        f"searchQuery={urllib.parse.quote(search_query)}&"
+        f"start={urllib.parse.quote(time_start)}&"
+        f"end={urllib.parse.quote(time_end)}&"
+        "timeOption=custom"
+    )
+
+
 @mcp.tool(
     description="Perform an advanced search on logs. "
     "Useful for searching for logs on specific resources, specific events, or from specific time frames. "
@@ -369,12 +389,9 @@ def search_logs(
             raise ValueError(
                 f"Search response is too large ({response_size} bytes) for context window. "
                 "Please narrow search to a smaller time frame or smaller limit, "
+                "use aggregate_logs, "
                 "or follow the link to the logging plugin: "
-                "https://cloud.oracle.com/logging/search?"
-                f"searchQuery={urllib.parse.quote(search_query)}&"
-                f"start={urllib.parse.quote(time_start)}&"
-                f"end={urllib.parse.quote(time_end)}&"
-                "timeOption=custom"
+                f"{_logging_search_url(search_query, time_start, time_end)}"
             )
 
         return search_response
@@ -384,6 +401,212 @@ def search_logs(
         raise e
 
 
+# The largest page the log search API returns.
+AGGREGATE_PAGE_SIZE = 1000
+
+
+@mcp.tool(
+    description="Run a log search over every page of results and return aggregates instead of raw records: "
+    "counts grouped by one or more fields (top N), a histogram over time buckets, and a few sample records. "
+    "Use this to answer questions such as how many errors per host occurred in a time range, "
+    "rather than paging through search_logs. "
+    "Filtering belongs in the query, for example "
+    "search \"<compartment_ocid>\" | where data.statusCode >= 500. "
+    "For query syntax, you MUST access resource://search-log-query-syntax-guide. "
+    "Pagination stops at the time, byte or record budget; "
+    "complete is false and next_page is set when it does."
+)
+def aggregate_logs(
+    time_start: str = Field(
+        ...,
+        description="Start filter log's date and time, in the format defined by RFC 3339. "
+        "The time must be supplied in UTC timezone.",
+    ),
+    time_end: str = Field(
+        ...,
+        description="End filter log's date and time, in the format defined by RFC 3339. "
+        "The time must be supplied in UTC timezone.",
+    ),
+    search_query: str = Field(..., description="The log search query."),
+    group_by: Optional[list[str]] = Field(
+        None,
+        description="Field paths to count records by, as used in queries (for example data.statusCode or "
+        "source). Records are counted per combination of values. If None, records are only counted.",
+    ),
+    top_n: int = Field(20, description="Number of most frequent groups to return.", ge=1, le=500),
+    interval_seconds: Optional[int] = Field(
+        None,
+        description="Width of the histogram time buckets in seconds. If None, no histogram is returned.",
+        ge=1,
+    ),
+    sample_size: int = Field(3, description="Number of sample records to return.", ge=0, le=20),
+    max_seconds: float = Field(30.0, description="Time budget for fetching pages, in seconds.", gt=0, le=300),
+    max_bytes: int = Field(
+        50_000_000,
+        description="Budget for the approximate JSON size of the fetched search results, in bytes.",
+        ge=1,
+    ),
+    max_records: int = Field(500_000, description="Budget for the number of search results to scan.", ge=1),
+    page: Optional[str] = Field(
+        None, description="The next_page token of an earlier aggregate_logs call to resume from."
+    ),
+) -> LogAggregation:
+    try:
+        client = get_logging_search_client()
+        aggregator = LogAggregator(
+            group_by, top_n=top_n, interval_seconds=interval_seconds, sample_size=sample_size
+        )
+        search_logs_details = oci.loggingsearch.models.SearchLogsDetails(
+            time_start=time_start,
+            time_end=time_end,
+            search_query=search_query,
+            is_return_field_info=False,
+        )
+
+        started = time.monotonic()
+        pages = 0
+        bytes_scanned = 0
+        stop_reason = None
+        next_page = page
+        while True:
+            response: oci.response.Response = client.search_logs(
+                search_logs_details=search_logs_details,
+                limit=AGGREGATE_PAGE_SIZE,
+                page=next_page,
+            )
+            pages += 1
+            records = [
+                getattr(r, "data", None) or {} for r in getattr(response.data, "results", None) or []
+            ]
+            bytes_scanned += len(json.dumps(records, default=str))
+            for record in records:
+                aggregator.add(record)
+
+            next_page = getattr(response, "next_page", None)
+            if not next_page:
+                break
+            if aggregator.count >= max_records:
+                stop_reason = "record_budget"
+            elif bytes_scanned >= max_bytes:
+                stop_reason = "byte_budget"
+            elif time.monotonic() - started >= max_seconds:
+                stop_reason = "time_budget"
+            if stop_reason:
+                break
+
+        logger.info(f"Aggregated {aggregator.count} log records from {pages} pages")
+        return LogAggregation(
+            search_query=search_query,
+            time_start=time_start,
+            time_end=time_end,
+            records_scanned=aggregator.count,
+            pages=pages,
+            bytes_scanned=bytes_scanned,
+            elapsed_seconds=round(time.monotonic() - started, 3),
+            complete=stop_reason is None,
+            stop_reason=stop_reason,
+            next_page=next_page if stop_reason else None,
+            **aggregator.time_range(),
+            distinct_groups=len(aggregator.groups),
+            groups=aggregator.top_groups(),
+            histogram=aggregator.histogram(),
+            samples=[SearchResult(data=record) for record in aggregator.samples],
+            console_url=_logging_search_url(search_query, time_start, time_end),
+        )
+
+    except Exception as e:
+        logger.error(f"Error in aggregate_logs tool: {str(e)}")
+        raise e
+
+
+# Sorting is appended by tail_logs so the oldest records are returned first.
+_SORT_CLAUSE = re.compile(r"\|\s*sort\s+by\b", re.IGNORECASE)
+
+
+def _utc_now_millis() -> int:
+    return int(datetime.now(timezone.utc).timestamp() * 1000)
+
+
+@mcp.tool(
+    description="Follow a log search: return only the log records that arrived since the previous call. "
+    "The first call, without a cursor, returns the records of the last lookback_seconds. "
+    "Every call returns a cursor; pass it back with the same search_query to continue from there. "
+    "Set wait_seconds to keep polling until new records arrive or the wait ends. "
+    "The query must not contain a sort clause; records are returned oldest first. "
+    "For query syntax, you MUST access resource://search-log-query-syntax-guide."
+)
+async def tail_logs(
+    search_query: str = Field(..., description="The log search query, without a sort clause."),
+    cursor: Optional[str] = Field(None, description="The cursor returned by the previous tail_logs call."),
+    lookback_seconds: int = Field(
+        300, description="How far back the first call (without a cursor) starts.", ge=1, le=86400
+    ),
+    max_records: int = Field(100, description="The maximum number of records to return.", ge=1, le=1000),
+    wait_seconds: float = Field(
+        0, description="How long to keep polling for new records when there are none yet.", ge=0, le=120
+    ),
+    poll_interval_seconds: float = Field(5, description="Pause between polls while waiting.", ge=1, le=60),
+) -> LogTail:
+    try:
+        if _SORT_CLAUSE.search(search_query):
+            raise ValueError("tail_logs sorts records itself; remove the sort clause from search_query")
+        if cursor:
+            position = TailCursor.decode(cursor, search_query)
+        else:
+            position = TailCursor.start(search_query, _utc_now_millis() - lookback_seconds * 1000)
+
+        client = get_logging_search_client()
+        deadline = time.monotonic() + wait_seconds
+        polls = 0
+        while True:
+            time_start = format_millis(position.datetime_ms)
+            time_end = format_millis(_utc_now_millis())
+            search_logs_details = oci.loggingsearch.models.SearchLogsDetails(
+                time_start=time_start,
+                time_end=time_end,
+                search_query=f"{search_query} | sort by datetime asc",
+                is_return_field_info=False,
+            )
+            records = []
+            next_page = None
+            while True:
+                response: oci.response.Response = await asyncio.to_thread(
+                    client.search_logs,
+                    search_logs_details=search_logs_details,
+                    # Records at the boundary millisecond come back again and are dropped by id.
+                    limit=min(max_records + len(position.ids), AGGREGATE_PAGE_SIZE),
+                    page=next_page,
+                )
+                records.extend(
+                    getattr(r, "data", None) or {} for r in getattr(response.data, "results", None) or []
+                )
+                next_page = getattr(response, "next_page", None)
+                if not next_page or len(records) >= max_records + len(position.ids):
+                    break
+            polls += 1
+
+            new_records, has_more = position.advance(records, max_records)
+            has_more = has_more or bool(next_page)
+            remaining = deadline - time.monotonic()
+            if new_records or remaining <= 0:
+                break
+            await asyncio.sleep(min(poll_interval_seconds, remaining))
+
+        logger.info(f"Found {len(new_records)} new log records after {polls} polls")
+        return LogTail(
+            records=[SearchResult(data=record) for record in new_records],
+            cursor=position.encode(),
+            has_more=has_more,
+            polls=polls,
+            time_start=time_start,
+            time_end=time_end,
+        )
+
+    except Exception as e:
+        logger.error(f"Error in tail_logs tool: {str(e)}")
+        raise e
+
+
 def main():
 
     host = os.getenv("ORACLE_MCP_HOST")
@@ -0,0 +1,91 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import base64
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from oracle.oci_logging_mcp_server.aggregation import field_value, record_time
+
+
+def _query_key(search_query: str) -> str:
+    return hashlib.sha256(search_query.strip().encode()).hexdigest()[:16]
+
+
+def record_id(record: Dict[str, Any]) -> str:
+    """The log entry id (``logContent.id``), or a digest of the record when it has none."""
+    value = field_value(record, "id")
+    if value is not None:
+        return str(value)
+    return hashlib.sha256(json.dumps(record, sort_keys=True, default=str).encode()).hexdigest()[:32]
+
+
+def format_millis(millis: int) -> str:
+    """RFC 3339 UTC timestamp with millisecond precision."""
+    moment = datetime.fromtimestamp(millis / 1000.0, tz=timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{millis % 1000:03d}Z"
+
+
+class TailCursor:
+    """
+    Position of a log follow: the time of the newest record returned and the ids of the
+    records returned at exactly that time.
+
+    The next search starts at that time (inclusive), so records sharing the boundary
+    millisecond are fetched again and dropped by id, and nothing at the boundary is skipped.
+    The cursor travels to the caller as an opaque token, tied to the query it was issued for.
+    """
+
+    def __init__(self, query_key: str, datetime_ms: int, ids: Optional[List[str]] = None):
+        self.query_key = query_key
+        self.datetime_ms = datetime_ms
+        self.ids = set(ids or ())
+
+    @classmethod
+    def start(cls, search_query: str, datetime_ms: int) -> "TailCursor":
+        return cls(_query_key(search_query), datetime_ms)
+
+    @classmethod
+    def decode(cls, token: str, search_query: str) -> "TailCursor":
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+            cursor = cls(payload["q"], int(payload["t"]), [str(i) for i in payload["ids"]])
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"Invalid tail cursor: {e}") from e
+        if cursor.query_key != _query_key(search_query):
+            raise ValueError("The tail cursor was issued for a different search_query")
+        return cursor
+
+    def encode(self) -> str:
+        payload = {"q": self.query_key, "t": self.datetime_ms, "ids": sorted(self.ids)}
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+    def _millis(self, record: Dict[str, Any]) -> int:
+        seconds = record_time(record)
+        return self.datetime_ms if seconds is None else int(round(seconds * 1000))
+
+    def advance(self, records: List[Dict[str, Any]], limit: int) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Return up to ``limit`` records not yet seen, oldest first, and move the cursor past them.
+
+        The boolean is True when more unseen records were left for the next call.
+        """
+        unseen = []
+        for record in records:
+            millis = self._millis(record)
+            if millis < self.datetime_ms or (millis == self.datetime_ms and record_id(record) in self.ids):
+                continue
+            unseen.append((millis, record))
+        unseen.sort(key=lambda item: item[0])
+        taken = unseen[:limit]
+        for millis, record in taken:
+            if millis != self.datetime_ms:
+                self.datetime_ms = millis
+                self.ids = set()
+            self.ids.add(record_id(record))
+        return [record for _, record in taken], len(unseen) > limit
@@ -0,0 +1,37 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from oracle.oci_logging_mcp_server.aggregation import LogAggregator, field_value, record_time
+
+
+class TestLogAggregation:
+    def test_field_value_resolves_query_paths_against_log_content(self):
+        record = {
+            "datetime": 1735689600000,
+            "logContent": {"source": "web-1", "data": {"request": {"status": 502}}},
+        }
+
+        assert field_value(record, "datetime") == 1735689600000
+        assert field_value(record, "source") == "web-1"
+        assert field_value(record, "data.request.status") == 502
+        assert field_value(record, "data.missing") is None
+
+    def test_record_time_reads_epoch_millis_or_log_content_time(self):
+        assert record_time({"datetime": 1735689600000}) == 1735689600.0
+        assert record_time({"logContent": {"time": "2025-01-01T00:00:00Z"}}) == 1735689600.0
+        assert record_time({"logContent": {"time": "not a time"}}) is None
+
+    def test_aggregator_counts_combinations_and_limits_samples(self):
+        aggregator = LogAggregator(["data.host", "data.tags"], top_n=1, sample_size=2, max_sample_bytes=150)
+        for host in ["a", "a", "b"]:
+            aggregator.add({"logContent": {"data": {"host": host, "tags": ["x"], "pad": "y" * 20}}})
+
+        assert aggregator.count == 3
+        assert len(aggregator.groups) == 2
+        assert aggregator.top_groups() == [{"key": {"data.host": "a", "data.tags": '["x"]'}, "count": 2}]
+        assert len(aggregator.samples) == 1
+        assert aggregator.histogram() == []
+        assert aggregator.time_range() == {"earliest": None, "latest": None}
@@ -0,0 +1,50 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import pytest
+from oracle.oci_logging_mcp_server.tail import TailCursor, format_millis, record_id
+
+
+def _record(record_id, millis):
+    return {"datetime": millis, "logContent": {"id": record_id}}
+
+
+class TestTailCursor:
+    def test_advance_skips_boundary_ids_and_older_records(self):
+        cursor = TailCursor.start("search *", 1000)
+        cursor.ids = {"seen"}
+
+        records, has_more = cursor.advance(
+            [_record("late", 999), _record("seen", 1000), _record("b", 2000), _record("a", 1000)], limit=10
+        )
+
+        assert [r["logContent"]["id"] for r in records] == ["a", "b"]
+        assert has_more is False
+        assert (cursor.datetime_ms, cursor.ids) == (2000, {"b"})
+
+    def test_advance_stops_at_limit_and_keeps_all_ids_at_the_boundary(self):
+        cursor = TailCursor.start("search *", 0)
+
+        records, has_more = cursor.advance([_record("a", 5), _record("b", 5), _record("c", 7)], limit=2)
+
+        assert [r["logContent"]["id"] for r in records] == ["a", "b"]
+        assert has_more is True
+        assert (cursor.datetime_ms, cursor.ids) == (5, {"a", "b"})
+
+    def test_encode_round_trips_and_rejects_garbage(self):
+        cursor = TailCursor.start("search *", 1735689600123)
+        cursor.ids = {"x", "y"}
+
+        decoded = TailCursor.decode(cursor.encode(), "search *")
+
+        assert (decoded.datetime_ms, decoded.ids) == (1735689600123, {"x", "y"})
+        with pytest.raises(ValueError, match="Invalid tail cursor"):
+            TailCursor.decode("not-a-cursor", "search *")
+
+    def test_record_id_falls_back_to_a_content_digest(self):
+        assert record_id({"logContent": {"id": 42}}) == "42"
+        assert record_id({"a": 1, "b": 2}) == record_id({"b": 2, "a": 1})
+        assert format_millis(1735689600123) == "2025-01-01T00:00:00.123Z"
@@ -445,6 +445,194 @@ class TestLoggingTools:
                     },
                 )
 
+    @pytest.mark.asyncio
+    @patch("oracle.oci_logging_mcp_server.server.get_logging_search_client")
+    async def test_aggregate_logs_follows_pages_and_aggregates(self, mock_get_client):
+        def page(records, next_page):
+            resp = create_autospec(oci.response.Response)
+            resp.data = oci.loggingsearch.models.SearchResponse(
+                results=[oci.loggingsearch.models.SearchResult(data=r) for r in records]
+            )
+            resp.next_page = next_page
+            return resp
+
+        def record(host, status, minute):
+            return {
+                "datetime": 1735689600000 + minute * 60000,
+                "logContent": {"data": {"host": host, "statusCode": status}},
+            }
+
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.search_logs.side_effect = [
+            page([record("a", 500, 0), record("b", 503, 1)], "p2"),
+            page([record("a", 500, 2)], None),
+        ]
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "aggregate_logs",
+                    {
+                        "time_start": "2025-01-01T00:00:00Z",
+                        "time_end": "2025-01-01T01:00:00Z",
+                        "search_query": "search * | where data.statusCode >= 500",
+                        "group_by": ["data.host"],
+                        "interval_seconds": 120,
+                        "sample_size": 1,
+                    },
+                )
+            ).structured_content
+
+        assert [c.kwargs["page"] for c in mock_client.search_logs.call_args_list] == [None, "p2"]
+        assert mock_client.search_logs.call_args.kwargs["limit"] == server.AGGREGATE_PAGE_SIZE
+        assert result["complete"] is True
+        assert result["next_page"] is None
+        assert (result["records_scanned"], result["pages"], result["distinct_groups"]) == (3, 2, 2)
+        assert result["groups"] == [
+            {"key": {"data.host": "a"}, "count": 2},
+            {"key": {"data.host": "b"}, "count": 1},
+        ]
+        assert result["histogram"] == [
+            {"start": "2025-01-01T00:00:00Z", "count": 2},
+            {"start": "2025-01-01T00:02:00Z", "count": 1},
+        ]
+        assert (result["earliest"], result["latest"]) == ("2025-01-01T00:00:00Z", "2025-01-01T00:02:00Z")
+        assert len(result["samples"]) == 1
+        assert result["console_url"].startswith("https://cloud.oracle.com/logging/search?searchQuery=search")
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_logging_mcp_server.server.get_logging_search_client")
+    async def test_aggregate_logs_stops_at_record_budget_with_resume_token(self, mock_get_client):
+        resp = create_autospec(oci.response.Response)
+        resp.data = oci.loggingsearch.models.SearchResponse(
+            results=[oci.loggingsearch.models.SearchResult(data={"n": i}) for i in range(5)]
+        )
+        resp.next_page = "p2"
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.search_logs.return_value = resp
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "aggregate_logs",
+                    {
+                        "time_start": "2025-01-01T00:00:00Z",
+                        "time_end": "2025-01-01T01:00:00Z",
+                        "search_query": "search *",
+                        "max_records": 5,
+                        "page": "p1",
+                    },
+                )
+            ).structured_content
+
+        assert mock_client.search_logs.call_count == 1
+        assert mock_client.search_logs.call_args.kwargs["page"] == "p1"
+        assert result["complete"] is False
+        assert result["stop_reason"] == "record_budget"
+        assert result["next_page"] == "p2"
+        assert result["groups"] == []
+        assert result["histogram"] == []
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_logging_mcp_server.server.get_logging_search_client")
+    async def test_aggregate_logs_exception_propagates(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.search_logs.side_effect = Exception("boom")
+
+        async with Client(mcp) as client:
+            with pytest.raises(ToolError):
+                await client.call_tool(
+                    "aggregate_logs",
+                    {
+                        "time_start": "2025-01-01T00:00:00Z",
+                        "time_end": "2025-01-01T01:00:00Z",
+                        "search_query": "search *",
+                    },
+                )
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_logging_mcp_server.server._utc_now_millis", return_value=1735689900000)
+    @patch("oracle.oci_logging_mcp_server.server.get_logging_search_client")
+    async def test_tail_logs_returns_only_records_after_the_cursor(self, mock_get_client, _mock_now):
+        def page(*records):
+            resp = create_autospec(oci.response.Response)
+            resp.data = oci.loggingsearch.models.SearchResponse(
+                results=[
+                    oci.loggingsearch.models.SearchResult(data={"datetime": t, "logContent": {"id": i}})
+                    for i, t in records
+                ]
+            )
+            resp.next_page = None
+            return resp
+
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.search_logs.side_effect = [
+            page(("a", 1735689700000), ("b", 1735689800000)),
+            page(("b", 1735689800000), ("c", 1735689800000), ("d", 1735689850000)),
+        ]
+
+        async with Client(mcp) as client:
+            first = (
+                await client.call_tool("tail_logs", {"search_query": "search *", "lookback_seconds": 300})
+            ).structured_content
+            second = (
+                await client.call_tool("tail_logs", {"search_query": "search *", "cursor": first["cursor"]})
+            ).structured_content
+
+        first_details, second_details = [
+            c.kwargs["search_logs_details"] for c in mock_client.search_logs.call_args_list
+        ]
+        assert first_details.time_start == "2025-01-01T00:00:00.000Z"
+        assert first_details.search_query == "search * | sort by datetime asc"
+        assert second_details.time_start == "2025-01-01T00:03:20.000Z"
+        assert second_details.time_end == "2025-01-01T00:05:00.000Z"
+        assert [r["data"]["logContent"]["id"] for r in first["records"]] == ["a", "b"]
+        assert [r["data"]["logContent"]["id"] for r in second["records"]] == ["c", "d"]
+        assert (second["polls"], second["has_more"]) == (1, False)
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_logging_mcp_server.server.get_logging_search_client")
+    async def test_tail_logs_polls_until_new_records_arrive(self, mock_get_client):
+        empty = create_autospec(oci.response.Response)
+        empty.data = oci.loggingsearch.models.SearchResponse(results=[])
+        empty.next_page = None
+        arrived = create_autospec(oci.response.Response)
+        arrived.data = oci.loggingsearch.models.SearchResponse(
+            results=[oci.loggingsearch.models.SearchResult(data={"logContent": {"id": "x"}})]
+        )
+        arrived.next_page = None
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.search_logs.side_effect = [empty, arrived]
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "tail_logs",
+                    {"search_query": "search *", "wait_seconds": 30, "poll_interval_seconds": 1},
+                )
+            ).structured_content
+
+        assert result["polls"] == 2
+        assert [r["data"]["logContent"]["id"] for r in result["records"]] == ["x"]
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_logging_mcp_server.server.get_logging_search_client")
+    async def test_tail_logs_rejects_sort_clause_and_foreign_cursor(self, mock_get_client):
+        cursor = server.TailCursor.start("search other", 0).encode()
+
+        async with Client(mcp) as client:
+            with pytest.raises(ToolError, match="sort clause"):
+                await client.call_tool("tail_logs", {"search_query": "search * | SORT BY datetime desc"})
+            with pytest.raises(ToolError, match="different search_query"):
+                await client.call_tool("tail_logs", {"search_query": "search *", "cursor": cursor})
+
+        mock_get_client.assert_not_called()
+
     @pytest.mark.asyncio
     @patch("oracle.oci_logging_mcp_server.server.get_script_content")
     async def test_search_log_query_syntax_guide_resource(self, mock_get_script):
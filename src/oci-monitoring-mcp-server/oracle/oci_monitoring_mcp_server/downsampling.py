@@ -0,0 +1,109 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# (epoch seconds, value)
+Point = Tuple[float, float]
+
+
+def lttb(points: Sequence[Point], threshold: int) -> List[Point]:
+    """
+    Largest-Triangle-Three-Buckets downsampling of time-ordered ``points`` to ``threshold`` points.
+
+    The first and last points are kept; every bucket in between contributes the point forming the
+    largest triangle with the previously kept point and the average of the next bucket, which
+    preserves peaks and troughs far better than picking every n-th point.
+    """
+    if threshold >= len(points) or threshold <= 0:
+        return list(points)
+    if threshold == 1:
+        return [points[-1]]
+    if threshold == 2:
+        return [points[0], points[-1]]
+
+    sampled = [points[0]]
+    bucket_size = (len(points) - 2) / (threshold - 2)
+    kept = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, len(points))
+        next_bucket = points[next_start:next_end] or [points[-1]]
+        avg_t = sum(t for t, _ in next_bucket) / len(next_bucket)
+        avg_v = sum(v for _, v in next_bucket) / len(next_bucket)
+
+        kept_t, kept_v = points[kept]
+        best_area = -1.0
+        best = start
+        for index in range(start, end):
+            t, v = points[index]
+            area = abs((kept_t - avg_t) * (v - kept_v) - (kept_t - t) * (avg_v - kept_v))
+            if area > best_area:
+                best_area = area
+                best = index
+        sampled.append(points[best])
+        kept = best
+    sampled.append(points[-1])
+    return sampled
+
+
+def bucket_stats(points: Sequence[Point], buckets: int) -> List[Dict[str, float]]:
+    """Split time-ordered ``points`` into at most ``buckets`` equal-count runs with min, max and mean each."""
+    if not points or buckets <= 0:
+        return []
+    size = math.ceil(len(points) / buckets)
+    result = []
+    for start in range(0, len(points), size):
+        values = [v for _, v in points[start : start + size]]
+        result.append(
+            {
+                "timestamp": points[start][0],
+                "count": len(values),
+                "min": min(values),
+                "max": max(values),
+                "avg": sum(values) / len(values),
+            }
+        )
+    return result
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Linearly interpolated percentile of an ascending sequence."""
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(points: Sequence[Point]) -> Optional[Dict[str, float]]:
+    """Count, min, max, mean, p50, p95, last value and least-squares slope per hour of ``points``."""
+    if not points:
+        return None
+    values = [v for _, v in points]
+    ordered = sorted(values)
+    count = len(values)
+    mean = sum(values) / count
+    slope = 0.0
+    if count > 1:
+        mean_t = sum(t for t, _ in points) / count
+        variance = sum((t - mean_t) ** 2 for t, _ in points)
+        if variance:
+            slope = sum((t - mean_t) * (v - mean) for t, v in points) / variance * 3600
+    return {
+        "count": count,
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": mean,
+        "p50": _percentile(ordered, 0.5),
+        "p95": _percentile(ordered, 0.95),
+        "last": values[-1],
+        "slope_per_hour": slope,
+    }
@@ -0,0 +1,148 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import difflib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+_DEFAULT_TTL_SECONDS = 900
+_DEFAULT_MAX_ENTRIES = 32
+# Fuzzy matches scoring below this SequenceMatcher ratio are dropped.
+_FUZZY_CUTOFF = 0.6
+
+
+def catalog_ttl_seconds() -> int:
+    value = os.getenv("OCI_MONITORING_METRIC_CATALOG_TTL_SECONDS")
+    try:
+        return max(0, int(value)) if value else _DEFAULT_TTL_SECONDS
+    except ValueError:
+        return _DEFAULT_TTL_SECONDS
+
+
+class MetricCatalog:
+    """
+    Namespace -> metric name -> dimension keys for one compartment, folded from ListMetrics.
+
+    ListMetrics returns one entry per metric and dimension set, so a tenancy-wide listing
+    repeats each metric once per resource. Only the dimension keys, resource groups and the
+    number of series are kept per metric.
+    """
+
+    def __init__(self, metrics: Iterable[Any], built_at: Optional[float] = None):
+        self.built_at = time.time() if built_at is None else built_at
+        self.metrics: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for metric in metrics:
+            namespace = getattr(metric, "namespace", None) or ""
+            name = getattr(metric, "name", None) or ""
+            entry = self.metrics.setdefault(
+                (namespace, name), {"dimension_keys": set(), "resource_groups": set(), "series_count": 0}
+            )
+            entry["dimension_keys"].update((getattr(metric, "dimensions", None) or {}).keys())
+            resource_group = getattr(metric, "resource_group", None)
+            if resource_group:
+                entry["resource_groups"].add(resource_group)
+            entry["series_count"] += 1
+
+    def namespaces(self) -> List[str]:
+        return sorted({namespace for namespace, _ in self.metrics})
+
+    def _entry(self, namespace: str, name: str, score: float) -> Dict[str, Any]:
+        entry = self.metrics[(namespace, name)]
+        return {
+            "namespace": namespace,
+            "name": name,
+            "dimension_keys": sorted(entry["dimension_keys"]),
+            "resource_groups": sorted(entry["resource_groups"]),
+            "series_count": entry["series_count"],
+            "score": round(score, 3),
+        }
+
+    def search(
+        self, query: Optional[str] = None, *, namespace: Optional[str] = None, match: str = "fuzzy"
+    ) -> List[Dict[str, Any]]:
+        """
+        Metrics whose name matches ``query``, best first; every metric when ``query`` is empty.
+
+        ``match="prefix"`` keeps case-insensitive name prefixes. ``match="fuzzy"`` also accepts
+        substrings and close spellings, scored exact > prefix > substring > similarity.
+        ``namespace`` restricts results to namespaces starting with it.
+        """
+        needle = (query or "").strip().lower()
+        namespace_prefix = (namespace or "").strip().lower()
+        scored = []
+        for ns, name in self.metrics:
+            if namespace_prefix and not ns.lower().startswith(namespace_prefix):
+                continue
+            lowered = name.lower()
+            if not needle or lowered == needle:
+                score = 1.0
+            elif lowered.startswith(needle):
+                score = 0.9
+            elif match == "prefix":
+                continue
+            elif needle in lowered:
+                score = 0.8
+            else:
+                ratio = difflib.SequenceMatcher(None, needle, lowered).ratio()
+                if ratio < _FUZZY_CUTOFF:
+                    continue
+                score = ratio * 0.8
+            scored.append((-score, ns, name))
+        scored.sort()
+        return [self._entry(ns, name, -score) for score, ns, name in scored]
+
+
+class MetricCatalogCache:
+    """
+    Built catalogs keyed by (identity, compartment, subtree flag), kept for ``ttl_seconds``.
+
+    A catalog is built once per key even when several callers ask at the same time; the others
+    wait for it. At most ``max_entries`` catalogs are kept, least recently used first out.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[Callable[[], int]] = None,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ):
+        self._ttl_seconds = ttl_seconds or catalog_ttl_seconds
+        self._max_entries = max_entries
+        self._catalogs: "OrderedDict[Hashable, MetricCatalog]" = OrderedDict()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: Hashable, builder: Callable[[], MetricCatalog], *, refresh: bool = False
+    ) -> Tuple[MetricCatalog, bool]:
+        """Return (catalog, whether it came from the cache), building it with ``builder`` when needed."""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                catalog = self._catalogs.get(key)
+                if (
+                    catalog is not None
+                    and not refresh
+                    and time.time() - catalog.built_at < self._ttl_seconds()
+                ):
+                    self._catalogs.move_to_end(key)
+                    return catalog, True
+            catalog = builder()
+            with self._lock:
+                self._catalogs[key] = catalog
+                self._catalogs.move_to_end(key)
+                while len(self._catalogs) > self._max_entries:
+                    evicted, _ = self._catalogs.popitem(last=False)
+                    self._key_locks.pop(evicted, None)
+            return catalog, False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._catalogs.clear()
+            self._key_locks.clear()
@@ -361,3 +361,95 @@ class SummarizeMetricsDataDetails(BaseModel):
         None,
         description="The time window used to aggregate metrics, e.g., '1m', '5m', '1h'.",
     )
+
+
+class MetricQuery(BaseModel):
+    """One query of a batched metric data request."""
+
+    query: str = Field(
+        ...,
+        description="The Monitoring Query Language (MQL) expression, e.g. 'CpuUtilization[1m].mean()'.",
+    )
+    namespace: str = Field(
+        "oci_compute", description="The source service or application emitting the metric."
+    )
+    resource_group: Optional[str] = Field(None, description="Resource group specified for the metric.")
+
+
+class MetricBucket(BaseModel):
+    """Minimum, maximum and mean of a run of consecutive datapoints."""
+
+    timestamp: datetime = Field(..., description="Timestamp of the first datapoint in the bucket.")
+    count: int = Field(..., description="Number of datapoints in the bucket.")
+    min: float = Field(..., description="Smallest value in the bucket.")
+    max: float = Field(..., description="Largest value in the bucket.")
+    avg: float = Field(..., description="Mean value of the bucket.")
+
+
+class MetricSeriesSummary(BaseModel):
+    """Summary statistics of one time series."""
+
+    count: int = Field(..., description="Number of datapoints.")
+    min: float = Field(..., description="Smallest value.")
+    max: float = Field(..., description="Largest value.")
+    mean: float = Field(..., description="Mean value.")
+    p50: float = Field(..., description="Median value.")
+    p95: float = Field(..., description="95th percentile value.")
+    last: float = Field(..., description="Value of the latest datapoint.")
+    slope_per_hour: float = Field(
+        ..., description="Least-squares trend of the value, in units per hour. Positive means rising."
+    )
+
+
+class MetricSeries(BaseModel):
+    """One time series of a batched metric query, downsampled or summarized."""
+
+    name: Optional[str] = Field(None, description="The metric name (for example, CpuUtilization).")
+    dimensions: Optional[Dict[str, str]] = Field(
+        None, description="Dimensions that qualify the series (for example, resourceId)."
+    )
+    resolution: Optional[str] = Field(None, description="The resolution of the returned datapoints.")
+    point_count: int = Field(..., description="Number of datapoints returned by the Monitoring service.")
+    summary: Optional[MetricSeriesSummary] = Field(None, description="Summary statistics of the series.")
+    aggregated_datapoints: Optional[List[AggregatedDatapoint]] = Field(
+        None, description="Datapoints, downsampled with LTTB in lttb mode or left as is in raw mode."
+    )
+    buckets: Optional[List[MetricBucket]] = Field(
+        None, description="Per-bucket min, max and mean in min_max_avg mode."
+    )
+
+
+class MetricQueryResult(BaseModel):
+    """The series returned for one query of a batched metric data request."""
+
+    query: str = Field(..., description="The MQL query.")
+    namespace: str = Field(..., description="The metric namespace the query ran against.")
+    series: List[MetricSeries] = Field(default_factory=list, description="One entry per returned time series.")
+    error: Optional[str] = Field(None, description="Why the query failed, if it did.")
+
+
+class MetricDefinition(BaseModel):
+    """A metric in the metric catalog of a compartment."""
+
+    namespace: str = Field(..., description="The source service or application emitting the metric.")
+    name: str = Field(..., description="The metric name (for example, CpuUtilization).")
+    dimension_keys: List[str] = Field(
+        default_factory=list, description="Dimension names the metric is published with."
+    )
+    resource_groups: List[str] = Field(
+        default_factory=list, description="Resource groups the metric is published in, if any."
+    )
+    series_count: int = Field(..., description="Number of distinct dimension sets (time series) listed.")
+    score: float = Field(..., description="How well the name matches the query, from 0 to 1.")
+
+
+class MetricCatalogResult(BaseModel):
+    """Metric definitions found in the cached metric catalog of a compartment."""
+
+    compartment_id: str = Field(..., description="The OCID of the compartment.")
+    compartment_id_in_subtree: bool = Field(..., description="Whether subcompartments are included.")
+    cached: bool = Field(..., description="Whether the catalog was served from the cache.")
+    built_at: datetime = Field(..., description="When the catalog was built from ListMetrics.")
+    namespaces: List[str] = Field(default_factory=list, description="Every namespace in the catalog.")
+    total_matches: int = Field(..., description="Number of metrics matching the query.")
+    matches: List[MetricDefinition] = Field(default_factory=list, description="The best matches, best first.")
@@ -4,10 +4,13 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import asyncio
+import hashlib
 import os
-from datetime import datetime, timezone
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from logging import Logger
-from typing import Annotated, List, Optional, Tuple
+from typing import Annotated, List, Literal, Optional, Tuple
 
 import oci
 from fastmcp import Context, FastMCP
@@ -20,12 +23,22 @@ from oracle.oci_monitoring_mcp_server.alarm_models import (
     AlarmSummary,
     map_alarm_summary,
 )
+from oracle.oci_monitoring_mcp_server.downsampling import bucket_stats, lttb, summarize
+from oracle.oci_monitoring_mcp_server.metric_catalog import MetricCatalog, MetricCatalogCache
 from oracle.oci_monitoring_mcp_server.metric_models import (
+    AggregatedDatapoint,
     CompartmentField,
     CompartmentIdInSubtreeField,
     ExampleNamespaces,
     Metric,
+    MetricBucket,
+    MetricCatalogResult,
     MetricData,
+    MetricDefinition,
+    MetricQuery,
+    MetricQueryResult,
+    MetricSeries,
+    MetricSeriesSummary,
     NamespaceField,
     map_metric,
     map_metric_data,
@@ -130,7 +143,8 @@ def list_alarms(
     description="This tool returns the available metric definitions. "
     "Use this tool when you do not know the name of the metric "
     "or want to see all the available metric namespaces in a compartment. "
-    "If there are no results found, remove the metric name or namespace fields. ",
+    "If there are no results found, remove the metric name or namespace fields. "
+    "To look up metric names, namespaces or dimensions by name, prefer find_metric_definitions.",
 )
 async def list_metric_definitions(
     context: Context,
@@ -196,6 +210,92 @@ async def list_metric_definitions(
         raise
 
 
+_METRIC_CATALOGS = MetricCatalogCache()
+# The largest page ListMetrics returns.
+_LIST_METRICS_PAGE_SIZE = 1000
+
+
+def _catalog_identity() -> str:
+    """Who the catalog is built for, so callers with different permissions never share one."""
+    if os.getenv("ORACLE_MCP_HOST") and os.getenv("ORACLE_MCP_PORT"):
+        token = get_access_token()
+        return hashlib.sha256((token.token if token else "").encode()).hexdigest()
+    return f"{os.getenv('OCI_CONFIG_FILE', oci.config.DEFAULT_LOCATION)}:" + os.getenv(
+        "OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE
+    )
+
+
+def _build_metric_catalog(compartment_id: str, compartment_id_in_subtree: bool) -> MetricCatalog:
+    """List every metric of the compartment, following all pages, and fold them into a catalog."""
+    monitoring_client = get_monitoring_client()
+    metrics = []
+    next_page = None
+    while True:
+        response: Response | None = monitoring_client.list_metrics(
+            compartment_id,
+            list_metrics_details=ListMetricsDetails(),
+            compartment_id_in_subtree=compartment_id_in_subtree,
+            limit=_LIST_METRICS_PAGE_SIZE,
+            page=next_page,
+        )
+        if response is None:
+            raise RuntimeError("There was no response returned from the Monitoring API")
+        metrics.extend(response.data or [])
+        next_page = response.next_page if response.has_next_page else None
+        if not next_page:
+            break
+    logger.info(f"Built metric catalog for {compartment_id} from {len(metrics)} metric definitions")
+    return MetricCatalog(metrics)
+
+
+@mcp.tool(
+    name="find_metric_definitions",
+    description="Find metric names, namespaces and dimension names in a compartment by name, "
+    "using a cached catalog of every metric definition. "
+    "Use this before writing an MQL query when you do not know the exact metric name, namespace "
+    "or dimensions. The first call lists all metric definitions; later calls are local lookups "
+    "until the catalog expires. "
+    "match prefix keeps names starting with query; fuzzy also accepts substrings and close spellings. "
+    "Leave query empty to list every metric, optionally within a namespace.",
+)
+async def find_metric_definitions(
+    context: Context,
+    compartment_id: str = CompartmentField,
+    query: Optional[str] = Field(
+        None, description="The metric name, or part of it, to look for.", examples=["CpuUtil"]
+    ),
+    namespace: Optional[str] = Field(
+        None, description="Only return metrics from namespaces starting with this value.", examples=["oci_"]
+    ),
+    match: Literal["prefix", "fuzzy"] = Field("fuzzy", description="How query is matched to metric names."),
+    limit: int = Field(50, description="The maximum number of metrics to return.", ge=1, le=1000),
+    compartment_id_in_subtree: bool = CompartmentIdInSubtreeField,
+    refresh: bool = Field(False, description="Rebuild the catalog even if the cached one has not expired."),
+) -> MetricCatalogResult:
+    try:
+        key = (_catalog_identity(), compartment_id, compartment_id_in_subtree)
+        catalog, cached = await asyncio.to_thread(
+            _METRIC_CATALOGS.get,
+            key,
+            lambda: _build_metric_catalog(compartment_id, compartment_id_in_subtree),
+            refresh=refresh,
+        )
+        matches = catalog.search(query, namespace=namespace, match=match)
+        return MetricCatalogResult(
+            compartment_id=compartment_id,
+            compartment_id_in_subtree=compartment_id_in_subtree,
+            cached=cached,
+            built_at=datetime.fromtimestamp(catalog.built_at, tz=timezone.utc),
+            namespaces=catalog.namespaces(),
+            total_matches=len(matches),
+            matches=[MetricDefinition(**entry) for entry in matches[:limit]],
+        )
+    except Exception as e:
+        logger.error(f"Error in find_metric_definitions: {str(e)}")
+        await context.error(f"Error finding metric definitions: {str(e)}")
+        raise
+
+
 def _prepare_time_parameters(start_time, end_time) -> Tuple[datetime, datetime]:
     """Process time parameters and calculate the period."""
     # Convert string times to datetime objects
@@ -314,6 +414,180 @@ async def get_metrics_data(
         raise
 
 
+# Upper bounds for one get_metrics_data_batch call.
+_MAX_BATCH_QUERIES = 50
+_MAX_BATCH_CONCURRENCY = 16
+
+MetricsDataMode = Literal["lttb", "min_max_avg", "summary", "raw"]
+
+
+def _epoch_seconds(timestamp) -> float:
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
+def _from_epoch_seconds(seconds: float) -> datetime:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc)
+
+
+def _metric_series(
+    metric_data: oci.monitoring.models.MetricData, mode: MetricsDataMode, max_points: int
+) -> MetricSeries:
+    points = sorted(
+        (_epoch_seconds(p.timestamp), float(p.value))
+        for p in getattr(metric_data, "aggregated_datapoints", None) or []
+        if getattr(p, "timestamp", None) is not None and getattr(p, "value", None) is not None
+    )
+    summary = summarize(points)
+    series = MetricSeries(
+        name=getattr(metric_data, "name", None),
+        dimensions=getattr(metric_data, "dimensions", None),
+        resolution=getattr(metric_data, "resolution", None),
+        point_count=len(points),
+        summary=MetricSeriesSummary(**summary) if summary else None,
+    )
+    if mode in ("lttb", "raw"):
+        sampled = lttb(points, max_points) if mode == "lttb" else points
+        series.aggregated_datapoints = [
+            AggregatedDatapoint(timestamp=_from_epoch_seconds(t), value=v) for t, v in sampled
+        ]
+    elif mode == "min_max_avg":
+        series.buckets = [
+            MetricBucket(**{**bucket, "timestamp": _from_epoch_seconds(bucket["timestamp"])})
+            for bucket in bucket_stats(points, max_points)
+        ]
+    return series
+
+
+def _run_metric_query(
+    monitoring_client,
+    compartment_id: str,
+    metric_query: MetricQuery,
+    start_time: str,
+    end_time: str,
+    resolution: Optional[str],
+    compartment_id_in_subtree: bool,
+    mode: MetricsDataMode,
+    max_points: int,
+) -> MetricQueryResult:
+    """Run one query and reduce its series; called in a worker thread."""
+    response: Response | None = monitoring_client.summarize_metrics_data(
+        compartment_id,
+        summarize_metrics_data_details=SummarizeMetricsDataDetails(
+            namespace=metric_query.namespace,
+            query=metric_query.query,
+            start_time=start_time,
+            end_time=end_time,
+            resource_group=metric_query.resource_group,
+            resolution=resolution,
+        ),
+        compartment_id_in_subtree=compartment_id_in_subtree,
+    )
+    if response is None:
+        raise RuntimeError("There was no response returned from the Monitoring API")
+    return MetricQueryResult(
+        query=metric_query.query,
+        namespace=metric_query.namespace,
+        series=[_metric_series(metric_data, mode, max_points) for metric_data in response.data or []],
+    )
+
+
+@mcp.tool(
+    name="get_metrics_data_batch",
+    description="Retrieve aggregated metric data for many MQL queries at once, for example one query per "
+    "namespace or per metric, and return compact series instead of every datapoint. "
+    "mode lttb (default) downsamples each series to max_points points keeping peaks and troughs; "
+    "min_max_avg returns up to max_points buckets with min, max and mean; "
+    "summary returns only statistics (p50, p95, max, trend slope) per series; raw returns every datapoint. "
+    "Every series includes summary statistics. Prefer this tool over get_metrics_data for long time "
+    "ranges, many resources, or several metrics. "
+    "You MUST use the MQL Syntax Guide resource before using this tool to get the queries.",
+)
+async def get_metrics_data_batch(
+    context: Context,
+    compartment_id: str = CompartmentField,
+    queries: List[MetricQuery] = Field(
+        ...,
+        description="The queries to run, each with its MQL expression and namespace.",
+        min_length=1,
+        max_length=_MAX_BATCH_QUERIES,
+    ),
+    start_time: Optional[str] = Field(
+        None,
+        description="The beginning of the time range, in RFC3339 format. "
+        "If no value is provided, this value will be 3 hours before end_time.",
+        examples=["2023-02-01T01:02:29.600Z"],
+    ),
+    end_time: Optional[str] = Field(
+        None,
+        description="The end of the time range, in RFC3339 format. "
+        "If no value is provided, this value will be the timestamp representing when the call was sent.",
+        examples=["2023-02-01T04:02:29.600Z"],
+    ),
+    resolution: Optional[str] = Field(
+        "1m",
+        description="The time between calculated aggregation windows. "
+        "The resolution must be equal or less than the interval in the queries.",
+        examples=["1m", "5m", "1h", "1d"],
+    ),
+    compartment_id_in_subtree: bool = CompartmentIdInSubtreeField,
+    mode: MetricsDataMode = Field(
+        "lttb", description="How each series is reduced: lttb, min_max_avg, summary or raw."
+    ),
+    max_points: int = Field(
+        120, description="Points (lttb) or buckets (min_max_avg) to keep per series.", ge=3, le=2000
+    ),
+    max_concurrency: int = Field(
+        8, description="How many queries run at the same time.", ge=1, le=_MAX_BATCH_CONCURRENCY
+    ),
+) -> List[MetricQueryResult]:
+    start_time_obj, end_time_obj = _prepare_time_parameters(start_time, end_time)
+    if start_time_obj is None:
+        start_time_obj = end_time_obj - timedelta(hours=3)
+    start_time = start_time_obj.isoformat().replace("+00:00", "Z")
+    end_time = end_time_obj.isoformat().replace("+00:00", "Z")
+    logger.info(f"Running {len(queries)} metric queries with up to {max_concurrency} at a time")
+
+    pending = deque(enumerate(queries))
+    results: List[MetricQueryResult | None] = [None] * len(queries)
+
+    async def worker():
+        # Each worker owns one client, so no client is used by two threads at once.
+        monitoring_client = None
+        while pending:
+            index, metric_query = pending.popleft()
+            try:
+                if monitoring_client is None:
+                    monitoring_client = await asyncio.to_thread(get_monitoring_client)
+                results[index] = await asyncio.to_thread(
+                    _run_metric_query,
+                    monitoring_client,
+                    compartment_id,
+                    metric_query,
+                    start_time,
+                    end_time,
+                    resolution,
+                    compartment_id_in_subtree,
+                    mode,
+                    max_points,
+                )
+            except Exception as e:
+                logger.error(f"Error in get_metrics_data_batch for {metric_query.query}: {str(e)}")
+                results[index] = MetricQueryResult(
+                    query=metric_query.query, namespace=metric_query.namespace, error=str(e)
+                )
+
+    await asyncio.gather(*(worker() for _ in range(min(max_concurrency, len(queries)))))
+
+    failed = sum(1 for result in results if result.error)
+    if failed:
+        await context.warning(f"{failed} of {len(queries)} metric queries failed")
+    return results
+
+
 @mcp.resource(
     name="MQL Syntax Guide",
     uri="resource://monitoring-query-syntax-guide",
@@ -0,0 +1,46 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import pytest
+from oracle.oci_monitoring_mcp_server.downsampling import bucket_stats, lttb, summarize
+
+
+class TestDownsampling:
+    def test_lttb_keeps_endpoints_and_spikes(self):
+        points = [(float(t), 100.0 if t == 37 else 1.0) for t in range(200)]
+
+        sampled = lttb(points, 20)
+
+        assert len(sampled) == 20
+        assert sampled[0] == points[0]
+        assert sampled[-1] == points[-1]
+        assert (37.0, 100.0) in sampled
+        assert [t for t, _ in sampled] == sorted(t for t, _ in sampled)
+
+    def test_lttb_returns_short_series_unchanged(self):
+        points = [(0.0, 1.0), (1.0, 2.0)]
+
+        assert lttb(points, 10) == points
+        assert lttb(points * 3, 2) == [points[0], points[1]]
+
+    def test_bucket_stats_splits_into_equal_count_runs(self):
+        buckets = bucket_stats([(float(t), float(t)) for t in range(5)], 2)
+
+        assert buckets == [
+            {"timestamp": 0.0, "count": 3, "min": 0.0, "max": 2.0, "avg": 1.0},
+            {"timestamp": 3.0, "count": 2, "min": 3.0, "max": 4.0, "avg": 3.5},
+        ]
+
+    def test_summarize_reports_percentiles_and_trend(self):
+        summary = summarize([(t * 60.0, float(t)) for t in range(11)])
+
+        assert summary["count"] == 11
+        assert (summary["min"], summary["max"], summary["last"]) == (0.0, 10.0, 10.0)
+        assert summary["p50"] == 5.0
+        assert summary["p95"] == pytest.approx(9.5)
+        assert summary["slope_per_hour"] == pytest.approx(60.0)
+        assert summarize([]) is None
+        assert summarize([(0.0, 3.0)])["slope_per_hour"] == 0.0
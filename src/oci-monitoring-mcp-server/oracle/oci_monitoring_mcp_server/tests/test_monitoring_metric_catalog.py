@@ -0,0 +1,53 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import oci
+from oracle.oci_monitoring_mcp_server.metric_catalog import MetricCatalog, MetricCatalogCache
+
+
+def _catalog(*names):
+    return MetricCatalog(oci.monitoring.models.Metric(namespace=ns, name=name) for ns, name in names)
+
+
+class TestMetricCatalog:
+    def test_search_ranks_exact_prefix_substring_then_similar(self):
+        catalog = _catalog(
+            ("oci_computeagent", "DiskBytesRead"),
+            ("oci_computeagent", "DiskBytesReadRate"),
+            ("oci_blockstore", "VolumeReadThroughput"),
+            ("oci_computeagent", "DiskBytesRaed"),
+            ("oci_vcn", "VnicToNetworkBytes"),
+        )
+
+        names = [m["name"] for m in catalog.search("diskbytesread")]
+        assert names == ["DiskBytesRead", "DiskBytesReadRate", "DiskBytesRaed"]
+        assert [m["name"] for m in catalog.search("read")] == [
+            "VolumeReadThroughput",
+            "DiskBytesRead",
+            "DiskBytesReadRate",
+        ]
+        assert [m["name"] for m in catalog.search("Read", match="prefix")] == []
+        assert [m["name"] for m in catalog.search("bytes", namespace="oci_v")] == ["VnicToNetworkBytes"]
+        assert len(catalog.search()) == 5
+
+    def test_cache_expires_after_ttl_and_evicts_least_recently_used(self):
+        ttl = [60]
+        cache = MetricCatalogCache(ttl_seconds=lambda: ttl[0], max_entries=2)
+        builds = []
+
+        def builder(name):
+            return lambda: builds.append(name) or _catalog(("ns", name))
+
+        assert cache.get("a", builder("a"))[1] is False
+        assert cache.get("a", builder("a"))[1] is True
+        cache.get("b", builder("b"))
+        cache.get("a", builder("a"))
+        cache.get("c", builder("c"))
+        assert cache.get("a", builder("a"))[1] is True
+        assert cache.get("b", builder("b"))[1] is False
+        ttl[0] = 0
+        assert cache.get("b", builder("b"))[1] is False
+        assert builds == ["a", "b", "c", "b", "b"]
@@ -4,7 +4,7 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, Mock, mock_open, patch
 
 import oci
@@ -228,6 +228,176 @@ class TestMonitoringTools:
         assert result == "There was no response returned from the Monitoring API"
 
 
+    @pytest.mark.asyncio
+    @patch("oracle.oci_monitoring_mcp_server.server.get_monitoring_client")
+    async def test_get_metrics_data_batch_downsamples_and_isolates_failures(self, mock_get_client):
+        start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+        def series(resource_id, values):
+            return oci.monitoring.models.MetricData(
+                name="CpuUtilization",
+                dimensions={"resourceId": resource_id},
+                resolution="1m",
+                aggregated_datapoints=[
+                    oci.monitoring.models.AggregatedDatapoint(
+                        timestamp=start + timedelta(minutes=i), value=float(value)
+                    )
+                    for i, value in enumerate(values)
+                ],
+            )
+
+        def summarize_metrics_data(compartment_id, summarize_metrics_data_details, **kwargs):
+            if summarize_metrics_data_details.namespace == "oci_lbaas":
+                raise RuntimeError("namespace not authorized")
+            response = Mock()
+            response.data = [series("instance1", range(100)), series("instance2", [5] * 10)]
+            return response
+
+        mock_get_client.return_value = Mock()
+        mock_get_client.return_value.summarize_metrics_data.side_effect = summarize_metrics_data
+
+        async with Client(mcp) as client:
+            call_tool_result = await client.call_tool(
+                "get_metrics_data_batch",
+                {
+                    "compartment_id": "compartment1",
+                    "queries": [
+                        {"query": "CpuUtilization[1m].mean()"},
+                        {"query": "HttpRequests[1m].sum()", "namespace": "oci_lbaas"},
+                    ],
+                    "start_time": "2023-01-01T00:00:00Z",
+                    "end_time": "2023-01-01T02:00:00Z",
+                    "max_points": 10,
+                },
+            )
+        cpu, lbaas = call_tool_result.structured_content["result"]
+
+        assert lbaas["error"] == "namespace not authorized"
+        assert lbaas["series"] == []
+        assert cpu["error"] is None
+        rising, flat = cpu["series"]
+        assert rising["point_count"] == 100
+        assert len(rising["aggregated_datapoints"]) == 10
+        assert rising["aggregated_datapoints"][0]["value"] == 0.0
+        assert rising["aggregated_datapoints"][-1]["value"] == 99.0
+        assert rising["summary"]["max"] == 99.0
+        assert rising["summary"]["slope_per_hour"] == pytest.approx(60.0)
+        assert flat["summary"]["p95"] == 5.0
+        assert flat["buckets"] is None
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_monitoring_mcp_server.server.get_monitoring_client")
+    async def test_get_metrics_data_batch_summary_and_bucket_modes(self, mock_get_client):
+        metric = oci.monitoring.models.MetricData(
+            name="CpuUtilization",
+            aggregated_datapoints=[
+                oci.monitoring.models.AggregatedDatapoint(timestamp=f"2023-01-01T00:0{i}:00Z", value=v)
+                for i, v in enumerate([1.0, 9.0, 2.0, 4.0])
+            ],
+        )
+        mock_get_client.return_value = Mock()
+        mock_get_client.return_value.summarize_metrics_data.return_value = Mock(data=[metric])
+
+        async with Client(mcp) as client:
+            results = {}
+            for mode in ("summary", "min_max_avg"):
+                call_tool_result = await client.call_tool(
+                    "get_metrics_data_batch",
+                    {
+                        "compartment_id": "compartment1",
+                        "queries": [{"query": "CpuUtilization[1m].mean()"}],
+                        "mode": mode,
+                        "max_points": 3,
+                    },
+                )
+                results[mode] = call_tool_result.structured_content["result"][0]["series"][0]
+
+        assert results["summary"]["aggregated_datapoints"] is None
+        assert results["summary"]["buckets"] is None
+        assert results["summary"]["summary"]["last"] == 4.0
+        assert [(b["count"], b["min"], b["max"], b["avg"]) for b in results["min_max_avg"]["buckets"]] == [
+            (2, 1.0, 9.0, 5.0),
+            (2, 2.0, 4.0, 3.0),
+        ]
+        details = mock_get_client.return_value.summarize_metrics_data.call_args.kwargs[
+            "summarize_metrics_data_details"
+        ]
+        start = datetime.fromisoformat(details.start_time.replace("Z", "+00:00"))
+        end = datetime.fromisoformat(details.end_time.replace("Z", "+00:00"))
+        assert end - start == timedelta(hours=3)
+
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_monitoring_mcp_server.server.get_monitoring_client")
+    async def test_find_metric_definitions_builds_paginated_catalog_once(self, mock_get_client):
+        server._METRIC_CATALOGS.clear()
+
+        def metric(namespace, name, resource_id):
+            return oci.monitoring.models.Metric(
+                namespace=namespace, name=name, dimensions={"resourceId": resource_id, "shape": "E4"}
+            )
+
+        first_page = Mock(has_next_page=True, next_page="p2")
+        first_page.data = [metric("oci_computeagent", "CpuUtilization", "i1")]
+        second_page = Mock(has_next_page=False, next_page=None)
+        second_page.data = [
+            metric("oci_computeagent", "CpuUtilization", "i2"),
+            metric("oci_computeagent", "MemoryUtilization", "i1"),
+            metric("oci_lbaas", "HttpRequests", "lb1"),
+        ]
+        mock_get_client.return_value = Mock()
+        mock_get_client.return_value.list_metrics.side_effect = [first_page, second_page]
+
+        async with Client(mcp) as client:
+            fuzzy = (
+                await client.call_tool(
+                    "find_metric_definitions", {"compartment_id": "compartment1", "query": "CpuUtilisation"}
+                )
+            ).structured_content
+            prefix = (
+                await client.call_tool(
+                    "find_metric_definitions",
+                    {"compartment_id": "compartment1", "query": "http", "match": "prefix"},
+                )
+            ).structured_content
+
+        list_metrics = mock_get_client.return_value.list_metrics
+        assert [c.kwargs["page"] for c in list_metrics.call_args_list] == [None, "p2"]
+        assert list_metrics.call_args.kwargs["limit"] == 1000
+        assert (fuzzy["cached"], prefix["cached"]) == (False, True)
+        assert fuzzy["namespaces"] == ["oci_computeagent", "oci_lbaas"]
+        assert fuzzy["matches"][0]["name"] == "CpuUtilization"
+        assert fuzzy["matches"][0]["dimension_keys"] == ["resourceId", "shape"]
+        assert fuzzy["matches"][0]["series_count"] == 2
+        assert [m["name"] for m in prefix["matches"]] == ["HttpRequests"]
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_monitoring_mcp_server.server.get_monitoring_client")
+    async def test_find_metric_definitions_refresh_rebuilds_per_subtree_flag(self, mock_get_client):
+        server._METRIC_CATALOGS.clear()
+        page = Mock(has_next_page=False, next_page=None)
+        page.data = [oci.monitoring.models.Metric(namespace="oci_vcn", name="VnicToNetworkBytes")]
+        mock_get_client.return_value = Mock()
+        mock_get_client.return_value.list_metrics.return_value = page
+
+        async with Client(mcp) as client:
+            for arguments in (
+                {"compartment_id": "tenancy"},
+                {"compartment_id": "tenancy", "compartment_id_in_subtree": True},
+                {"compartment_id": "tenancy", "compartment_id_in_subtree": True},
+                {"compartment_id": "tenancy", "refresh": True},
+            ):
+                result = (await client.call_tool("find_metric_definitions", arguments)).structured_content
+
+        subtree_flags = [
+            c.kwargs["compartment_id_in_subtree"]
+            for c in mock_get_client.return_value.list_metrics.call_args_list
+        ]
+        assert subtree_flags == [False, True, False]
+        assert result["cached"] is False
+        assert result["total_matches"] == 1
+
+
 class TestInternals:
     def test_prepare_time_parameters(self):
         start, end = server._prepare_time_parameters("2023-01-01T00:00:00Z", None)
@@ -415,3 +415,21 @@ def map_object_version_summary(obj: oci.object_storage.models.ObjectVersionSumma
         version_id=getattr(obj, "version_id", None),
         is_delete_marker=getattr(obj, "is_delete_marker", None),
     )
+
+
+class TransferMetrics(BaseModel):
+    bytes: int = Field(..., description="Bytes transferred over the network by this call.")
+    seconds: float = Field(..., description="Wall-clock duration of the transfer.")
+    mib_per_second: float = Field(..., description="Throughput in MiB per second.")
+    parts: int = Field(..., description="Number of ranges or parts transferred by this call.")
+    parallelism: int = Field(..., description="Number of concurrent ranges or parts used.")
+
+
+class DownloadResult(BaseModel):
+    object_name: str = Field(..., description="The name of the downloaded object.")
+    file_path: str = Field(..., description="The local file the object was written to.")
+    object_size: int = Field(..., description="The size of the whole object in bytes.")
+    range_start: Optional[int] = Field(None, description="First downloaded byte, for a range download.")
+    range_end: Optional[int] = Field(None, description="Last downloaded byte, for a range download.")
+    etag: Optional[str] = Field(None, description="The entity tag of the downloaded object version.")
+    metrics: TransferMetrics = Field(..., description="Throughput of the download.")
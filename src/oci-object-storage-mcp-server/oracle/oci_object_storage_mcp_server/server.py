@@ -8,7 +8,7 @@ import os
 import tempfile
 from logging import Logger
 from pathlib import Path
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 
 import oci
 from fastmcp import FastMCP
@@ -18,6 +18,7 @@ from fastmcp.utilities.auth import parse_scopes
 from oracle.oci_object_storage_mcp_server.models import (
     Bucket,
     BucketSummary,
+    DownloadResult,
     ListObjects,
     ObjectSummary,
     ObjectVersionCollection,
@@ -26,6 +27,12 @@ from oracle.oci_object_storage_mcp_server.models import (
     map_object_summary,
     map_object_version_summary,
 )
+from oracle.oci_object_storage_mcp_server.transfer import (
+    MEBIBYTE,
+    MultipartUploadError,
+    download_to_file,
+    upload_from_file,
+)
 
 from . import __project__, __version__
 
@@ -33,6 +40,11 @@ logger = Logger(__name__, level="INFO")
 
 mcp = FastMCP(name=__project__)
 
+# Concurrent range requests or parts per transfer; the SDK client's connection pool holds 10.
+_MAX_TRANSFER_PARALLELISM = 10
+# Object Storage requires every part but the last to be at least 10 MiB.
+_MIN_PART_SIZE_MIB = 10
+
 _SENSITIVE_UPLOAD_PREFIXES = (
     Path.home() / ".oci",
     Path.home() / ".ssh",
@@ -73,6 +85,44 @@ def _resolve_upload_path(file_path: str) -> Path:
     return resolved_path
 
 
+def _get_download_root() -> Path:
+    root = os.getenv("OCI_MCP_DOWNLOAD_ROOT")
+    if root:
+        return Path(root).expanduser().resolve()
+    return (Path(tempfile.gettempdir()) / "oci-mcp-downloads").resolve()
+
+
+def _resolve_download_path(file_path: str, object_name: str, overwrite: bool) -> Path:
+    download_root = _get_download_root()
+    if not file_path:
+        file_path = object_name.rstrip("/").rsplit("/", 1)[-1]
+        if not file_path:
+            raise ValueError(
+                f"Cannot derive a file name from object name '{object_name}'; provide file_path."
+            )
+    path = Path(file_path).expanduser()
+    if not path.is_absolute():
+        path = download_root / path
+    resolved_path = path.resolve(strict=False)
+    if not _path_is_relative_to(resolved_path, download_root) or resolved_path == download_root:
+        raise ValueError(
+            f"Rejected download path '{file_path}': resolved path is outside configured download root "
+            f"'{download_root}'."
+        )
+    for prefix in _SENSITIVE_UPLOAD_PREFIXES:
+        resolved_prefix = prefix.expanduser().resolve(strict=False)
+        if resolved_path == resolved_prefix or _path_is_relative_to(resolved_path, resolved_prefix):
+            raise ValueError(f"Rejected download path '{file_path}': path is in a sensitive location.")
+    if resolved_path.exists() and (not resolved_path.is_file() or not overwrite):
+        raise ValueError(
+            f"Rejected download path '{file_path}': file already exists; set overwrite to replace it."
+            if resolved_path.is_file()
+            else f"Rejected download path '{file_path}': path is not a regular file."
+        )
+    resolved_path.parent.mkdir(parents=True, exist_ok=True)
+    return resolved_path
+
+
 def _get_http_config_and_signer():
     if not (os.getenv("ORACLE_MCP_HOST") and os.getenv("ORACLE_MCP_PORT")):
         return None, None
@@ -265,7 +315,60 @@ def get_object(
     return map_object_summary(obj)
 
 
-@mcp.tool(description="Upload an object to an object storage bucket")
+@mcp.tool(
+    description="Download an object, or a byte range of it, from an object storage bucket to a local file. "
+    "The object is streamed to disk in chunks; large objects are fetched as parallel range requests. "
+    "Returns the file path and throughput metrics."
+)
+def download_object(
+    bucket_name: Annotated[str, "The name of the bucket"],
+    compartment_id: Annotated[
+        str,
+        "The OCID of the compartment."
+        "If compartment id is not provided, use the root compartment id or the tenancy id",
+    ],
+    object_name: Annotated[str, "The name of the object"],
+    file_path: Annotated[
+        str,
+        "Optional path of the local file to write, absolute or relative to the download root. "
+        "If not provided, the last segment of the object name is used",
+    ] = "",
+    version_id: Annotated[str, "Optional version ID of the object"] = "",
+    range_start: Annotated[Optional[int], "Optional first byte to download (0-based, inclusive)"] = None,
+    range_end: Annotated[Optional[int], "Optional last byte to download (inclusive)"] = None,
+    part_size_mib: Annotated[int, "Size of each parallel range request in MiB"] = 64,
+    parallelism: Annotated[int, f"Number of concurrent range requests, 1 to {_MAX_TRANSFER_PARALLELISM}"] = 4,
+    overwrite: Annotated[bool, "Whether to replace an existing local file"] = False,
+) -> DownloadResult:
+    if part_size_mib < 1:
+        raise ValueError("part_size_mib must be at least 1.")
+    if not 1 <= parallelism <= _MAX_TRANSFER_PARALLELISM:
+        raise ValueError(f"parallelism must be between 1 and {_MAX_TRANSFER_PARALLELISM}.")
+    resolved_file_path = _resolve_download_path(file_path, object_name, overwrite)
+
+    object_storage_client = get_object_storage_client()
+    namespace_name = get_object_storage_namespace(compartment_id)
+    result = download_to_file(
+        object_storage_client,
+        namespace_name,
+        bucket_name,
+        object_name,
+        resolved_file_path,
+        version_id=version_id or None,
+        range_start=range_start,
+        range_end=range_end,
+        part_size=part_size_mib * MEBIBYTE,
+        parallelism=parallelism,
+    )
+    return DownloadResult(**result)
+
+
+@mcp.tool(
+    description="Upload an object to an object storage bucket. "
+    "Files larger than the part size are uploaded as a parallel multipart upload; "
+    "if one fails, its upload_id is returned and passing it back as resume_upload_id "
+    "uploads only the missing parts. Returns throughput metrics."
+)
 def upload_object(
     bucket_name: Annotated[str, "The name of the bucket"],
     compartment_id: Annotated[
@@ -279,12 +382,25 @@ def upload_object(
         "Optional name of the object to upload"
         "If the object name is not provided, use the file name as the object name",
     ] = "",
+    part_size_mib: Annotated[
+        int,
+        "Multipart part size in MiB, at least 10. Files up to this size are uploaded in a single request. "
+        "A resumed upload must use the same part size",
+    ] = 128,
+    parallelism: Annotated[
+        int, f"Number of parts uploaded concurrently, 1 to {_MAX_TRANSFER_PARALLELISM}"
+    ] = 3,
+    resume_upload_id: Annotated[str, "Optional upload_id of a failed multipart upload to resume"] = "",
 ):
     try:
         resolved_file_path = _resolve_upload_path(file_path)
     except Exception as e:
         logger.warning("Rejected upload path %s: %s", file_path, e)
         return {"error": str(e)}
+    if part_size_mib < _MIN_PART_SIZE_MIB:
+        return {"error": f"part_size_mib must be at least {_MIN_PART_SIZE_MIB}."}
+    if not 1 <= parallelism <= _MAX_TRANSFER_PARALLELISM:
+        return {"error": f"parallelism must be between 1 and {_MAX_TRANSFER_PARALLELISM}."}
 
     object_storage_client = get_object_storage_client()
     namespace_name = get_object_storage_namespace(compartment_id)
@@ -292,9 +408,24 @@ def upload_object(
     logger.info("Checking file at path: %s", resolved_file_path)
     object_name = object_name or resolved_file_path.name
     try:
-        with open(resolved_file_path, "rb") as file:
-            object_storage_client.put_object(namespace_name, bucket_name, object_name, file)
-        return {"message": "Object uploaded successfully"}
+        result = upload_from_file(
+            object_storage_client,
+            namespace_name,
+            bucket_name,
+            object_name,
+            resolved_file_path,
+            part_size=part_size_mib * MEBIBYTE,
+            parallelism=parallelism,
+            resume_upload_id=resume_upload_id or None,
+        )
+        return {"message": "Object uploaded successfully", **result}
+    except MultipartUploadError as e:
+        return {
+            "error": str(e),
+            "upload_id": e.upload_id,
+            "message": "Call upload_object again with resume_upload_id set to upload_id "
+            "to finish the upload.",
+        }
     except Exception as e:
         return {"error": str(e)}
 
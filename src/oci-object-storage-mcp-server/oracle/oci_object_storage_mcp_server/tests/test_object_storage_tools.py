@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, create_autospec, mock_open, patch
 import oci
 import pytest
 from fastmcp import Client
+from fastmcp.exceptions import ToolError
 from fastmcp.server.dependencies import AccessToken
 from oracle.oci_object_storage_mcp_server import server
 from oracle.oci_object_storage_mcp_server.models import (
@@ -293,6 +294,182 @@ class TestObjectStorageTools:
         assert "outside configured upload root" in result["error"]
         mock_get_client.assert_not_called()
 
+    @pytest.mark.asyncio
+    @patch("oracle.oci_object_storage_mcp_server.server.upload_from_file")
+    @patch("oracle.oci_object_storage_mcp_server.server.get_object_storage_client")
+    async def test_upload_object_multipart_options(self, mock_get_client, mock_upload, tmp_path, monkeypatch):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        monkeypatch.setenv("OCI_MCP_UPLOAD_ROOT", str(tmp_path))
+        mock_namespace_response = create_autospec(oci.response.Response)
+        mock_namespace_response.data = "test_namespace"
+        mock_client.get_namespace.return_value = mock_namespace_response
+        mock_upload.return_value = {
+            "object_name": "big.bin",
+            "multipart": True,
+            "upload_id": "upload-1",
+            "resumed_parts": 2,
+            "etag": "etag",
+            "metrics": {"bytes": 10, "seconds": 1.0, "mib_per_second": 0.0, "parts": 1, "parallelism": 5},
+        }
+        p = tmp_path / "big.bin"
+        p.write_bytes(b"x")
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "upload_object",
+                    {
+                        "bucket_name": "bucket1",
+                        "compartment_id": "test_compartment",
+                        "file_path": str(p),
+                        "part_size_mib": 32,
+                        "parallelism": 5,
+                        "resume_upload_id": "upload-1",
+                    },
+                )
+            ).structured_content
+
+        assert result["message"] == "Object uploaded successfully"
+        assert result["resumed_parts"] == 2
+        assert result["metrics"]["parallelism"] == 5
+        _, kwargs = mock_upload.call_args
+        assert kwargs == {"part_size": 32 * 1024 * 1024, "parallelism": 5, "resume_upload_id": "upload-1"}
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_object_storage_mcp_server.server.upload_from_file")
+    @patch("oracle.oci_object_storage_mcp_server.server.get_object_storage_client")
+    async def test_upload_object_returns_upload_id_on_multipart_failure(
+        self, mock_get_client, mock_upload, tmp_path, monkeypatch
+    ):
+        mock_get_client.return_value = MagicMock()
+        monkeypatch.setenv("OCI_MCP_UPLOAD_ROOT", str(tmp_path))
+        mock_upload.side_effect = server.MultipartUploadError("upload-1", RuntimeError("part 3 failed"))
+        p = tmp_path / "big.bin"
+        p.write_bytes(b"x")
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "upload_object",
+                    {"bucket_name": "bucket1", "compartment_id": "test_compartment", "file_path": str(p)},
+                )
+            ).structured_content
+
+        assert result["error"] == "part 3 failed"
+        assert result["upload_id"] == "upload-1"
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_object_storage_mcp_server.server.get_object_storage_client")
+    async def test_upload_object_rejects_small_part_size(self, mock_get_client, tmp_path, monkeypatch):
+        monkeypatch.setenv("OCI_MCP_UPLOAD_ROOT", str(tmp_path))
+        p = tmp_path / "file.txt"
+        p.write_bytes(b"x")
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "upload_object",
+                    {
+                        "bucket_name": "bucket1",
+                        "compartment_id": "test_compartment",
+                        "file_path": str(p),
+                        "part_size_mib": 1,
+                    },
+                )
+            ).structured_content
+
+        assert "part_size_mib must be at least 10" in result["error"]
+        mock_get_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_object_storage_mcp_server.server.download_to_file")
+    @patch("oracle.oci_object_storage_mcp_server.server.get_object_storage_client")
+    async def test_download_object(self, mock_get_client, mock_download, tmp_path, monkeypatch):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        monkeypatch.setenv("OCI_MCP_DOWNLOAD_ROOT", str(tmp_path))
+        mock_namespace_response = create_autospec(oci.response.Response)
+        mock_namespace_response.data = "test_namespace"
+        mock_client.get_namespace.return_value = mock_namespace_response
+        mock_download.return_value = {
+            "object_name": "logs/app.log",
+            "file_path": str(tmp_path / "app.log"),
+            "object_size": 100,
+            "range_start": 10,
+            "range_end": 19,
+            "etag": "etag",
+            "metrics": {"bytes": 10, "seconds": 0.1, "mib_per_second": 0.0, "parts": 1, "parallelism": 1},
+        }
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "download_object",
+                    {
+                        "bucket_name": "bucket1",
+                        "compartment_id": "test_compartment",
+                        "object_name": "logs/app.log",
+                        "range_start": 10,
+                        "range_end": 19,
+                        "parallelism": 2,
+                    },
+                )
+            ).structured_content
+
+        assert result["range_start"] == 10
+        assert result["metrics"]["bytes"] == 10
+        args, kwargs = mock_download.call_args
+        assert args == (
+            mock_client,
+            "test_namespace",
+            "bucket1",
+            "logs/app.log",
+            tmp_path.resolve() / "app.log",
+        )
+        assert kwargs["range_start"] == 10
+        assert kwargs["range_end"] == 19
+        assert kwargs["version_id"] is None
+        assert kwargs["parallelism"] == 2
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_object_storage_mcp_server.server.get_object_storage_client")
+    async def test_download_object_rejects_path_outside_download_root(
+        self, mock_get_client, tmp_path, monkeypatch
+    ):
+        download_root = tmp_path / "downloads"
+        monkeypatch.setenv("OCI_MCP_DOWNLOAD_ROOT", str(download_root))
+
+        async with Client(mcp) as client:
+            with pytest.raises(ToolError, match="outside configured download root"):
+                await client.call_tool(
+                    "download_object",
+                    {
+                        "bucket_name": "bucket1",
+                        "compartment_id": "test_compartment",
+                        "object_name": "obj",
+                        "file_path": "../escape.txt",
+                    },
+                )
+
+        mock_get_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_object_storage_mcp_server.server.get_object_storage_client")
+    async def test_download_object_refuses_to_overwrite(self, mock_get_client, tmp_path, monkeypatch):
+        monkeypatch.setenv("OCI_MCP_DOWNLOAD_ROOT", str(tmp_path))
+        (tmp_path / "obj").write_text("keep", encoding="utf-8")
+
+        async with Client(mcp) as client:
+            with pytest.raises(ToolError, match="already exists"):
+                await client.call_tool(
+                    "download_object",
+                    {"bucket_name": "bucket1", "compartment_id": "test_compartment", "object_name": "obj"},
+                )
+
+        assert (tmp_path / "obj").read_text(encoding="utf-8") == "keep"
+        mock_get_client.assert_not_called()
+
 
 class TestServer:
     @patch("oracle.oci_object_storage_mcp_server.server.oci.auth.signers.TokenExchangeSigner", return_value="signer")
@@ -0,0 +1,244 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from oracle.oci_object_storage_mcp_server.transfer import (
+    MultipartUploadError,
+    TransferStats,
+    _ranges,
+    download_to_file,
+    upload_from_file,
+)
+
+
+class FakeObjectClient:
+    """Serves one object from memory, honouring the range header like Object Storage does."""
+
+    def __init__(self, content: bytes, etag: str = "etag-1"):
+        self.content = content
+        self.etag = etag
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def head_object(self, namespace_name, bucket_name, object_name, **kwargs):
+        return SimpleNamespace(headers={"content-length": str(len(self.content)), "etag": self.etag})
+
+    def get_object(self, namespace_name, bucket_name, object_name, **kwargs):
+        with self._lock:
+            self.requests.append(kwargs)
+        data = self.content
+        byte_range = kwargs.get("range")
+        if byte_range:
+            first, last = byte_range[len("bytes=") :].split("-")
+            data = data[int(first) : int(last) + 1]
+
+        def stream(chunk_size, decode_content=True):
+            for offset in range(0, len(data), chunk_size):
+                yield data[offset : offset + chunk_size]
+
+        return SimpleNamespace(data=SimpleNamespace(raw=SimpleNamespace(stream=stream)))
+
+
+class FakeAssembler:
+    """Stands in for MultipartObjectAssembler, reporting progress for every part it is given."""
+
+    instances = []
+    fail_upload = False
+
+    def __init__(self, client, namespace_name, bucket_name, object_name, part_size, **kwargs):
+        self.part_size = part_size
+        self.kwargs = kwargs
+        self.manifest = {"uploadId": None, "parts": []}
+        self.resumed_with = None
+        FakeAssembler.instances.append(self)
+
+    def add_parts_from_file(self, file_path):
+        with open(file_path, "rb") as f:
+            size = len(f.read())
+        self.manifest["parts"] = [
+            {"size": min(self.part_size, size - offset)} for offset in range(0, size, self.part_size)
+        ]
+
+    def new_upload(self):
+        self.manifest["uploadId"] = "upload-1"
+
+    def upload(self, progress_callback=None):
+        if FakeAssembler.fail_upload:
+            raise RuntimeError("part 2 failed")
+        for part in self.manifest["parts"]:
+            progress_callback(part["size"])
+
+    def resume(self, upload_id, progress_callback=None):
+        self.resumed_with = upload_id
+        self.upload(progress_callback)
+
+    def commit(self):
+        return SimpleNamespace(headers={"etag": "etag-multipart"})
+
+
+@pytest.fixture
+def fake_assembler():
+    FakeAssembler.instances = []
+    FakeAssembler.fail_upload = False
+    with patch(
+        "oracle.oci_object_storage_mcp_server.transfer.oci.object_storage.MultipartObjectAssembler",
+        FakeAssembler,
+    ):
+        yield FakeAssembler
+
+
+class TestRanges:
+    def test_ranges_cover_span_inclusively(self):
+        assert _ranges(0, 9, 4) == [(0, 3), (4, 7), (8, 9)]
+        assert _ranges(5, 5, 4) == [(5, 5)]
+
+    def test_transfer_stats_metrics(self):
+        stats = TransferStats(parallelism=2)
+        stats.add(1024)
+        stats.add_part()
+        metrics = stats.metrics()
+        assert metrics["bytes"] == 1024
+        assert metrics["parts"] == 1
+        assert metrics["parallelism"] == 2
+        assert metrics["mib_per_second"] >= 0
+
+
+class TestDownloadToFile:
+    def test_downloads_whole_object_in_one_request(self, tmp_path):
+        client = FakeObjectClient(b"hello world")
+        target = tmp_path / "out.txt"
+
+        result = download_to_file(client, "ns", "bucket", "obj", target)
+
+        assert target.read_bytes() == b"hello world"
+        assert result["object_size"] == 11
+        assert result["range_start"] is None
+        assert result["metrics"]["bytes"] == 11
+        assert len(client.requests) == 1
+        assert "range" not in client.requests[0]
+        assert client.requests[0]["if_match"] == "etag-1"
+
+    def test_downloads_large_object_as_parallel_ranges(self, tmp_path):
+        content = bytes(range(256)) * 40
+        client = FakeObjectClient(content)
+        target = tmp_path / "out.bin"
+
+        result = download_to_file(client, "ns", "bucket", "obj", target, part_size=1000, parallelism=4)
+
+        assert target.read_bytes() == content
+        assert len(client.requests) == 11
+        assert all(request["range"].startswith("bytes=") for request in client.requests)
+        assert result["metrics"]["parts"] == 11
+        assert result["metrics"]["parallelism"] == 4
+        assert not (tmp_path / "out.bin.part").exists()
+
+    def test_downloads_byte_range(self, tmp_path):
+        client = FakeObjectClient(b"0123456789")
+        target = tmp_path / "slice.txt"
+
+        result = download_to_file(client, "ns", "bucket", "obj", target, range_start=2, range_end=50)
+
+        assert target.read_bytes() == b"23456789"
+        assert result["range_start"] == 2
+        assert result["range_end"] == 9
+        assert client.requests[0]["range"] == "bytes=2-9"
+
+    def test_rejects_range_outside_object(self, tmp_path):
+        client = FakeObjectClient(b"0123456789")
+
+        with pytest.raises(ValueError, match="outside the object"):
+            download_to_file(client, "ns", "bucket", "obj", tmp_path / "x", range_start=20)
+
+    def test_failed_range_leaves_no_partial_file(self, tmp_path):
+        client = FakeObjectClient(b"x" * 5000)
+        original_get_object = client.get_object
+
+        def flaky_get_object(*args, **kwargs):
+            if kwargs.get("range") == "bytes=3000-3999":
+                raise RuntimeError("connection reset")
+            return original_get_object(*args, **kwargs)
+
+        client.get_object = flaky_get_object
+        target = tmp_path / "out.bin"
+
+        with pytest.raises(RuntimeError, match="connection reset"):
+            download_to_file(client, "ns", "bucket", "obj", target, part_size=1000, parallelism=2)
+
+        assert not target.exists()
+        assert not (tmp_path / "out.bin.part").exists()
+
+    def test_downloads_empty_object(self, tmp_path):
+        client = FakeObjectClient(b"")
+        target = tmp_path / "empty"
+
+        result = download_to_file(client, "ns", "bucket", "obj", target)
+
+        assert target.read_bytes() == b""
+        assert result["metrics"]["bytes"] == 0
+        assert client.requests == []
+
+
+class TestUploadFromFile:
+    def test_small_file_uses_single_put(self, tmp_path, fake_assembler):
+        client = MagicMock()
+        client.put_object.return_value = SimpleNamespace(headers={"etag": "etag-put"})
+        source = tmp_path / "small.txt"
+        source.write_bytes(b"hello")
+
+        result = upload_from_file(client, "ns", "bucket", "small.txt", source, part_size=1024)
+
+        client.put_object.assert_called_once()
+        assert result["multipart"] is False
+        assert result["etag"] == "etag-put"
+        assert result["metrics"]["bytes"] == 5
+        assert fake_assembler.instances == []
+
+    def test_large_file_uses_parallel_multipart(self, tmp_path, fake_assembler):
+        client = MagicMock()
+        source = tmp_path / "large.bin"
+        source.write_bytes(b"x" * 2500)
+
+        result = upload_from_file(client, "ns", "bucket", "large.bin", source, part_size=1000, parallelism=3)
+
+        client.put_object.assert_not_called()
+        assembler = fake_assembler.instances[0]
+        assert assembler.kwargs == {"allow_parallel_uploads": True, "parallel_process_count": 3}
+        assert result["multipart"] is True
+        assert result["upload_id"] == "upload-1"
+        assert result["etag"] == "etag-multipart"
+        assert result["metrics"]["bytes"] == 2500
+        assert result["metrics"]["parts"] == 3
+
+    def test_failed_multipart_reports_upload_id(self, tmp_path, fake_assembler):
+        fake_assembler.fail_upload = True
+        source = tmp_path / "large.bin"
+        source.write_bytes(b"x" * 2500)
+
+        with pytest.raises(MultipartUploadError) as excinfo:
+            upload_from_file(MagicMock(), "ns", "bucket", "large.bin", source, part_size=1000)
+
+        assert excinfo.value.upload_id == "upload-1"
+        assert "part 2 failed" in str(excinfo.value)
+
+    @patch("oracle.oci_object_storage_mcp_server.transfer.oci.pagination.list_call_get_all_results")
+    def test_resume_counts_only_new_parts(self, mock_list_all, tmp_path, fake_assembler):
+        mock_list_all.return_value = SimpleNamespace(data=[SimpleNamespace(size=1000)])
+        source = tmp_path / "large.bin"
+        source.write_bytes(b"x" * 2500)
+
+        result = upload_from_file(
+            MagicMock(), "ns", "bucket", "large.bin", source, part_size=1000, resume_upload_id="upload-9"
+        )
+
+        assert fake_assembler.instances[0].resumed_with == "upload-9"
+        assert result["upload_id"] == "upload-9"
+        assert result["resumed_parts"] == 1
+        assert result["metrics"]["bytes"] == 1500
+        assert result["metrics"]["parts"] == 2
@@ -0,0 +1,270 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import oci
+
+logger = Logger(__name__, level="INFO")
+
+MEBIBYTE = 1024 * 1024
+# Size of the reads from a download response stream and of each write to the local file.
+STREAM_CHUNK_SIZE = MEBIBYTE
+
+
+class MultipartUploadError(Exception):
+    """A multipart upload failed after it was created; ``upload_id`` can be passed back to resume it."""
+
+    def __init__(self, upload_id: str, cause: Exception):
+        super().__init__(str(cause))
+        self.upload_id = upload_id
+
+
+class TransferStats:
+    """Bytes moved by one transfer and how long it took, safe to update from worker threads."""
+
+    def __init__(self, parallelism: int = 1):
+        self.parallelism = parallelism
+        self.parts = 0
+        self.bytes = 0
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(self, count: int) -> None:
+        with self._lock:
+            self.bytes += count
+
+    def add_part(self) -> None:
+        with self._lock:
+            self.parts += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        seconds = max(time.monotonic() - self._started, 1e-6)
+        return {
+            "bytes": self.bytes,
+            "seconds": round(seconds, 3),
+            "mib_per_second": round(self.bytes / MEBIBYTE / seconds, 3),
+            "parts": self.parts,
+            "parallelism": self.parallelism,
+        }
+
+
+def _ranges(start: int, end: int, part_size: int) -> List[Tuple[int, int]]:
+    """Inclusive byte ranges of at most ``part_size`` bytes covering ``start``..``end``."""
+    return [(offset, min(offset + part_size, end + 1) - 1) for offset in range(start, end + 1, part_size)]
+
+
+def _fetch_range(
+    client,
+    namespace_name: str,
+    bucket_name: str,
+    object_name: str,
+    path: Path,
+    file_offset: int,
+    byte_range: Optional[Tuple[int, int]],
+    stats: TransferStats,
+    **kwargs,
+) -> None:
+    if byte_range is not None:
+        kwargs["range"] = f"bytes={byte_range[0]}-{byte_range[1]}"
+    response = client.get_object(namespace_name, bucket_name, object_name, **kwargs)
+    with open(path, "r+b") as f:
+        f.seek(file_offset)
+        for chunk in response.data.raw.stream(STREAM_CHUNK_SIZE, decode_content=False):
+            f.write(chunk)
+            stats.add(len(chunk))
+    stats.add_part()
+
+
+def download_to_file(
+    client,
+    namespace_name: str,
+    bucket_name: str,
+    object_name: str,
+    path: Path,
+    *,
+    version_id: Optional[str] = None,
+    range_start: Optional[int] = None,
+    range_end: Optional[int] = None,
+    part_size: int = 64 * MEBIBYTE,
+    parallelism: int = 4,
+) -> Dict[str, Any]:
+    """
+    Stream an object, or the inclusive byte range ``range_start``..``range_end`` of it, to ``path``.
+
+    Spans larger than ``part_size`` are fetched as ``parallelism`` concurrent range GETs, each
+    pinned to the object's ETag so a concurrent overwrite fails the download instead of mixing
+    two versions. Data goes to ``<path>.part`` and replaces ``path`` only once complete.
+    """
+    version_kwargs = {"version_id": version_id} if version_id else {}
+    head = client.head_object(namespace_name, bucket_name, object_name, **version_kwargs)
+    size = int(head.headers["content-length"])
+    etag = head.headers.get("etag")
+    start = 0 if range_start is None else range_start
+    end = size - 1 if range_end is None else min(range_end, size - 1)
+    if size == 0 and range_start is None and range_end is None:
+        end = -1
+    elif start < 0 or start > end:
+        raise ValueError(f"Byte range {range_start}-{range_end} is outside the object (size {size}).")
+    ranged = range_start is not None or range_end is not None
+    span = end - start + 1
+
+    ranges = _ranges(start, end, part_size) if span > 0 else []
+    workers = max(1, min(parallelism, len(ranges)))
+    stats = TransferStats(workers)
+    partial = path.with_name(path.name + ".part")
+    try:
+        with open(partial, "wb") as f:
+            f.truncate(span)
+        if len(ranges) <= 1:
+            if span > 0:
+                _fetch_range(
+                    client,
+                    namespace_name,
+                    bucket_name,
+                    object_name,
+                    partial,
+                    0,
+                    (start, end) if ranged else None,
+                    stats,
+                    if_match=etag,
+                    **version_kwargs,
+                )
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        _fetch_range,
+                        client,
+                        namespace_name,
+                        bucket_name,
+                        object_name,
+                        partial,
+                        first - start,
+                        (first, last),
+                        stats,
+                        if_match=etag,
+                        **version_kwargs,
+                    )
+                    for first, last in ranges
+                ]
+                for future in futures:
+                    future.result()
+        if stats.bytes != span:
+            raise IOError(f"Downloaded {stats.bytes} bytes of {object_name}, expected {span}.")
+        os.replace(partial, path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+    metrics = stats.metrics()
+    logger.info(f"Downloaded {object_name}: {metrics}")
+    return {
+        "object_name": object_name,
+        "file_path": str(path),
+        "object_size": size,
+        "range_start": start if ranged else None,
+        "range_end": end if ranged else None,
+        "etag": etag,
+        "metrics": metrics,
+    }
+
+
+def _uploaded_part_bytes(client, namespace_name, bucket_name, object_name, upload_id) -> Tuple[int, int]:
+    """Number and total size of the parts the service already holds for ``upload_id``."""
+    parts = oci.pagination.list_call_get_all_results(
+        client.list_multipart_upload_parts, namespace_name, bucket_name, object_name, upload_id
+    ).data
+    return len(parts), sum(part.size for part in parts)
+
+
+def upload_from_file(
+    client,
+    namespace_name: str,
+    bucket_name: str,
+    object_name: str,
+    path: Path,
+    *,
+    part_size: int = 128 * MEBIBYTE,
+    parallelism: int = 3,
+    resume_upload_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Upload ``path``, as one PUT when it fits in a part and as a parallel multipart upload otherwise.
+
+    Multipart uploads go through the SDK's MultipartObjectAssembler (the engine behind
+    UploadManager). The upload id is reported as soon as the upload exists, so a failed upload
+    can be finished later with ``resume_upload_id``; resuming uploads only the parts the service
+    does not already hold, and needs the same file and ``part_size``.
+    """
+    file_size = path.stat().st_size
+    if resume_upload_id is None and file_size <= part_size:
+        stats = TransferStats()
+        with open(path, "rb") as f:
+            response = client.put_object(namespace_name, bucket_name, object_name, f)
+        stats.add(file_size)
+        stats.add_part()
+        return {
+            "object_name": object_name,
+            "multipart": False,
+            "upload_id": None,
+            "resumed_parts": 0,
+            "etag": (getattr(response, "headers", None) or {}).get("etag"),
+            "metrics": stats.metrics(),
+        }
+
+    stats = TransferStats(parallelism)
+    assembler = oci.object_storage.MultipartObjectAssembler(
+        client,
+        namespace_name,
+        bucket_name,
+        object_name,
+        part_size=part_size,
+        allow_parallel_uploads=parallelism > 1,
+        parallel_process_count=parallelism,
+    )
+    assembler.add_parts_from_file(str(path))
+    resumed_parts = resumed_bytes = 0
+
+    def progress(count: int) -> None:
+        stats.add(count)
+        stats.add_part()
+
+    if resume_upload_id:
+        upload_id = resume_upload_id
+        resumed_parts, resumed_bytes = _uploaded_part_bytes(
+            client, namespace_name, bucket_name, object_name, upload_id
+        )
+        upload = lambda: assembler.resume(upload_id=upload_id, progress_callback=progress)  # noqa: E731
+    else:
+        assembler.new_upload()
+        upload_id = assembler.manifest["uploadId"]
+        upload = lambda: assembler.upload(progress_callback=progress)  # noqa: E731
+    try:
+        upload()
+        response = assembler.commit()
+    except Exception as e:
+        raise MultipartUploadError(upload_id, e) from e
+
+    # The assembler reports resumed parts as progress without sending them again.
+    stats.bytes -= resumed_bytes
+    stats.parts -= resumed_parts
+    metrics = stats.metrics()
+    logger.info(f"Uploaded {object_name} in {len(assembler.manifest['parts'])} parts: {metrics}")
+    return {
+        "object_name": object_name,
+        "multipart": True,
+        "upload_id": upload_id,
+        "resumed_parts": resumed_parts,
+        "etag": (getattr(response, "headers", None) or {}).get("etag"),
+        "metrics": metrics,
+    }
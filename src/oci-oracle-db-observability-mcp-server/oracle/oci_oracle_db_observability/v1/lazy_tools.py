@@ -0,0 +1,153 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+from logging import Logger
+from pathlib import Path
+from typing import Any
+
+import fastmcp
+from fastmcp import FastMCP
+from fastmcp.tools import Tool
+from fastmcp.tools.base import ToolResult
+
+
+LAZY_TOOLS_ENV = "ORACLE_MCP_LAZY_TOOLS"
+TOOL_MANIFEST_FILENAME = "tool_manifest.json"
+SERVER_PACKAGES = {
+    "opsi": "oracle.oci_oracle_db_observability.v1.oci_opsi_mcp_server",
+    "dbm": "oracle.oci_oracle_db_observability.v1.oci_dbm_mcp_server",
+}
+
+logger = Logger(__name__, level="INFO")
+
+
+def lazy_tools_enabled() -> bool:
+    """Return whether tools should be served from the precomputed manifest."""
+
+    return os.getenv(LAZY_TOOLS_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def tool_manifest_path(package: str) -> Path:
+    module = importlib.import_module(package)
+    return Path(module.__file__).with_name(TOOL_MANIFEST_FILENAME)
+
+
+class ManifestTool(Tool):
+    """Tool advertised from the manifest that imports its implementation on first call."""
+
+    tools_module: str
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        module = importlib.import_module(self.tools_module)
+        tool = await module.mcp.get_tool(self.name)
+        return await tool.run(arguments)
+
+
+def build_tool_manifest(mcp: FastMCP) -> dict[str, Any]:
+    """Serialize the registered tools of an eagerly loaded server."""
+
+    registered = asyncio.run(mcp.list_tools(run_middleware=False))
+    return {
+        "fastmcp_version": fastmcp.__version__,
+        "tools": [
+            tool.to_mcp_tool().model_dump(mode="json", by_alias=True, exclude_none=True)
+            for tool in sorted(registered, key=lambda tool: tool.name)
+        ]
+    }
+
+
+def load_tool_manifest(path: Path) -> dict[str, Any]:
+    with path.open(encoding="utf-8") as manifest_file:
+        return json.load(manifest_file)
+
+
+def manifest_matches_fastmcp(manifest: dict[str, Any]) -> bool:
+    """Return whether the manifest was generated by the installed fastmcp version."""
+
+    return manifest.get("fastmcp_version") == fastmcp.__version__
+
+
+def manifest_tools(manifest: dict[str, Any], tools_module: str) -> list[ManifestTool]:
+    return [
+        ManifestTool(
+            name=entry["name"],
+            title=entry.get("title"),
+            description=entry.get("description"),
+            parameters=entry["inputSchema"],
+            output_schema=entry.get("outputSchema"),
+            annotations=entry.get("annotations"),
+            tags=set(entry.get("_meta", {}).get("fastmcp", {}).get("tags", [])),
+            tools_module=tools_module,
+        )
+        for entry in manifest["tools"]
+    ]
+
+
+def build_lazy_server(mcp: FastMCP, package: str) -> FastMCP:
+    """Create a server with the same identity as ``mcp`` whose tools load on first call.
+
+    Tool schemas are generated by fastmcp, so a manifest written by another fastmcp version may
+    not match what the tools would register. In that case the tools are imported eagerly and
+    ``mcp`` is returned instead.
+    """
+
+    manifest = load_tool_manifest(tool_manifest_path(package))
+    if not manifest_matches_fastmcp(manifest):
+        logger.warning(
+            "Tool manifest for %s was generated with fastmcp %s but %s is installed; loading tools eagerly",
+            package,
+            manifest.get("fastmcp_version", "unknown"),
+            fastmcp.__version__,
+        )
+        importlib.import_module(f"{package}.tools")
+        return mcp
+    lazy_mcp = FastMCP(name=mcp.name, instructions=mcp.instructions)
+    for tool in manifest_tools(manifest, f"{package}.tools"):
+        lazy_mcp.add_tool(tool)
+    return lazy_mcp
+
+
+def render_tool_manifest(package: str) -> str:
+    tools = importlib.import_module(f"{package}.tools")
+    return json.dumps(build_tool_manifest(tools.mcp), indent=1, sort_keys=True) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Regenerate or verify the checked-in tool manifests."""
+
+    parser = argparse.ArgumentParser(description="Write the precomputed OPSI/DBM tool manifests.")
+    parser.add_argument("servers", nargs="*", metavar="{dbm,opsi}", help="Servers to process (default: all).")
+    parser.add_argument("--check", action="store_true", help="Fail if a checked-in manifest is stale.")
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.servers) - set(SERVER_PACKAGES))
+    if unknown:
+        parser.error(f"unknown server(s): {', '.join(unknown)}")
+
+    stale = []
+    for server in args.servers or sorted(SERVER_PACKAGES):
+        package = SERVER_PACKAGES[server]
+        path = tool_manifest_path(package)
+        rendered = render_tool_manifest(package)
+        if args.check:
+            if not path.exists() or path.read_text(encoding="utf-8") != rendered:
+                stale.append(str(path))
+            continue
+        path.write_text(rendered, encoding="utf-8")
+
+    for path in stale:
+        print(f"Stale tool manifest: {path}")
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
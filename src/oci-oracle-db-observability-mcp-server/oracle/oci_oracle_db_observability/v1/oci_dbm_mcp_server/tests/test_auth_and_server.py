@@ -10,7 +10,7 @@ import asyncio
 import logging
 from types import SimpleNamespace
 
-from oracle.oci_oracle_db_observability.v1 import auth
+from oracle.oci_oracle_db_observability.v1 import auth, lazy_tools
 from oracle.oci_oracle_db_observability.v1.oci_dbm_mcp_server import server, tools
 
 TEST_LOGGER = logging.getLogger(__name__)
@@ -165,3 +165,37 @@ def test_server_registers_expected_tools() -> None:
 
     for tool in registered:
         assert tool.annotations == tools.TOOL_ANNOTATIONS[tool.name]
+
+
+def test_tool_manifest_matches_eager_registration() -> None:
+    manifest = lazy_tools.load_tool_manifest(lazy_tools.tool_manifest_path(server.__package__))
+
+    assert manifest == lazy_tools.build_tool_manifest(tools.mcp)
+
+
+def test_lazy_server_loads_tools_eagerly_for_other_fastmcp_version(monkeypatch) -> None:
+    monkeypatch.setattr(lazy_tools.fastmcp, "__version__", "0.0.0")
+
+    assert lazy_tools.build_lazy_server(server.mcp, server.__package__) is server.mcp
+
+
+def test_lazy_server_serves_manifest_and_delegates_on_call(monkeypatch) -> None:
+    lazy_mcp = lazy_tools.build_lazy_server(server.mcp, server.__package__)
+    eager = {tool.name: tool for tool in asyncio.run(tools.mcp.list_tools(run_middleware=False))}
+    lazy = {tool.name: tool for tool in asyncio.run(lazy_mcp.list_tools(run_middleware=False))}
+
+    assert lazy.keys() == eager.keys()
+    for name, tool in lazy.items():
+        assert tool.to_mcp_tool() == eager[name].to_mcp_tool()
+
+    monkeypatch.setattr(
+        tools,
+        "invoke_identity",
+        lambda method_name, **kwargs: {"method": method_name, **kwargs},
+    )
+    result = asyncio.run(lazy["get_compartment"].run({"compartment_id": "ocid1.compartment.oc1..example"}))
+
+    assert result.structured_content == {
+        "method": "get_compartment",
+        "compartment_id": "ocid1.compartment.oc1..example",
+    }
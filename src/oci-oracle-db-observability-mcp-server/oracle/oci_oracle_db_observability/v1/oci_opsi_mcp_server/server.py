@@ -8,27 +8,39 @@ from __future__ import annotations
 
 import os
 
+from fastmcp import FastMCP
 from fastmcp.server.auth.providers.oci import OCIProvider
 from fastmcp.utilities.auth import parse_scopes
 
+from oracle.oci_oracle_db_observability.v1.lazy_tools import build_lazy_server, lazy_tools_enabled
+
 from . import __project__
-from . import tools as _tools  # noqa: F401
 from .mcp import mcp
 
+if not lazy_tools_enabled():
+    from . import tools as _tools  # noqa: F401
+
 
 def _default_required_scopes() -> list[str]:
     server_name = __project__.removeprefix("oracle.oci-").removesuffix("-mcp-server")
     return f"openid profile email oci_mcp.{server_name.replace('-', '_')}.invoke".split()
 
 
+def _server() -> FastMCP:
+    if lazy_tools_enabled():
+        return build_lazy_server(mcp, __package__)
+    return mcp
+
+
 def main() -> None:
     """Run the OPSI MCP server with stdio or HTTP transport."""
 
+    server = _server()
     host = os.getenv("ORACLE_MCP_HOST")
     port = os.getenv("ORACLE_MCP_PORT")
 
     if not (host and port):
-        mcp.run()
+        server.run()
         return
 
     domain = os.getenv("IDCS_DOMAIN")
@@ -42,7 +54,7 @@ def main() -> None:
             "Set IDCS_DOMAIN, IDCS_CLIENT_ID, IDCS_CLIENT_SECRET, IDCS_AUDIENCE, "
             "ORACLE_MCP_BASE_URL, ORACLE_MCP_HOST, and ORACLE_MCP_PORT."
         )
-    mcp.auth = OCIProvider(
+    server.auth = OCIProvider(
         config_url=f"https://{domain}/.well-known/openid-configuration",
         client_id=client_id,
         client_secret=client_secret,
@@ -50,7 +62,7 @@ def main() -> None:
         required_scopes=parse_scopes(os.getenv("IDCS_REQUIRED_SCOPES")) or _default_required_scopes(),
         base_url=base_url,
     )
-    mcp.run(transport="http", host=host, port=int(port))
+    server.run(transport="http", host=host, port=int(port))
 
 
 if __name__ == "__main__":
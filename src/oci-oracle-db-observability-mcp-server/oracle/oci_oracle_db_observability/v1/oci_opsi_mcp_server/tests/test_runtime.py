@@ -12,6 +12,7 @@ from typing import Any
 import oci
 import pytest
 
+from oracle.oci_oracle_db_observability.v1 import pagination
 from oracle.oci_oracle_db_observability.v1.oci_opsi_mcp_server import models, runtime, tools
 
 
@@ -272,6 +273,40 @@ def test_list_tool_auto_paginates_collection_with_next_page(monkeypatch) -> None
     assert calls[1]["limit"] == 9
 
 
+def test_page_capability_is_introspected_once_per_client_method(monkeypatch) -> None:
+    source_reads: list[Any] = []
+    getsource = pagination.inspect.getsource
+
+    def counting_getsource(obj: Any) -> str:
+        source_reads.append(obj)
+        return getsource(obj)
+
+    class FakeClient:
+        def list_widgets(self, page=None, limit=None, **kwargs):
+            expected_kwargs = ["limit", "page"]  # noqa: F841
+            return _Response([])
+
+        def get_widget(self, widget_id):
+            expected_kwargs = ["opc_request_id"]  # noqa: F841
+            return _Response({})
+
+    monkeypatch.setattr(pagination.inspect, "getsource", counting_getsource)
+
+    for _ in range(3):
+        client = FakeClient()
+        assert pagination._method_accepts_page(client.list_widgets) is True
+        assert pagination._method_accepts_page(client.get_widget) is False
+
+    assert [obj.__name__ for obj in source_reads] == ["list_widgets", "get_widget"]
+
+
+def test_page_capability_matches_sdk_expected_kwargs() -> None:
+    client_class = oci.opsi.OperationsInsightsClient
+
+    assert pagination._method_accepts_page(client_class.list_database_insights) is True
+    assert pagination._method_accepts_page(client_class.get_database_insight) is False
+
+
 def test_list_tool_uses_opc_next_page_header_fallback(monkeypatch) -> None:
     calls: list[dict[str, Any]] = []
 
@@ -7,6 +7,7 @@ https://oss.oracle.com/licenses/upl.
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
 import inspect
 import re
 from typing import Any
@@ -28,7 +29,7 @@ def _expected_kwargs_from_source(method: Callable[..., Any]) -> set[str] | None:
     return set(_KWARG_RE.findall(match.group(1)))
 
 
-def _method_accepts_page(method: Callable[..., Any]) -> bool:
+def _introspect_accepts_page(method: Callable[..., Any]) -> bool:
     expected_kwargs = _expected_kwargs_from_source(method)
     if expected_kwargs is not None:
         return "page" in expected_kwargs
@@ -40,6 +41,25 @@ def _method_accepts_page(method: Callable[..., Any]) -> bool:
     return "page" in signature.parameters
 
 
+@lru_cache(maxsize=None)
+def _function_accepts_page(function: Callable[..., Any]) -> bool:
+    return _introspect_accepts_page(function)
+
+
+def _method_accepts_page(method: Callable[..., Any]) -> bool:
+    """Return whether an SDK method takes ``page``, introspecting each client method once.
+
+    Bound methods share their class-level function, so the source scan runs once
+    per (client class, method) rather than on every tool invocation.
+    """
+
+    function = getattr(method, "__func__", method)
+    try:
+        return _function_accepts_page(function)
+    except TypeError:
+        return _introspect_accepts_page(method)
+
+
 def _next_page_token(response: Any) -> str | None:
     token = getattr(response, "next_page", None)
     if token:
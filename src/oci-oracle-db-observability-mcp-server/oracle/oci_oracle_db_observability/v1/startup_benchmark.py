@@ -0,0 +1,67 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any
+
+from oracle.oci_oracle_db_observability.v1.lazy_tools import LAZY_TOOLS_ENV, SERVER_PACKAGES
+
+
+_PROBE = """
+import asyncio, json, resource, sys, time
+started = time.perf_counter()
+import {package}.server as server
+mcp = server._server()
+tools = asyncio.run(mcp.list_tools(run_middleware=False))
+elapsed = time.perf_counter() - started
+maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    "import_seconds": round(elapsed, 3),
+    "max_rss_mib": round(maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1),
+    "tool_count": len(tools),
+    "models_loaded": "{package}.models" in sys.modules,
+}}))
+"""
+
+
+def measure_startup(server: str, *, lazy: bool) -> dict[str, Any]:
+    """Import a server in a fresh interpreter and report its startup cost."""
+
+    env = dict(os.environ)
+    env[LAZY_TOOLS_ENV] = "1" if lazy else "0"
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(package=SERVER_PACKAGES[server])],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {"server": server, "mode": "lazy" if lazy else "eager", **result}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print startup time and peak RSS for eager and lazy tool registration."""
+
+    parser = argparse.ArgumentParser(description="Benchmark OPSI/DBM server startup.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per server and mode; the fastest is kept.")
+    args = parser.parse_args(argv)
+
+    for server in sorted(SERVER_PACKAGES):
+        for lazy in (False, True):
+            runs = [measure_startup(server, lazy=lazy) for _ in range(max(args.repeat, 1))]
+            print(json.dumps(min(runs, key=lambda run: run["import_seconds"])))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -35,9 +35,11 @@ import configparser
 import json
 import logging
 import os
+import threading
 import time
 import traceback
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from logging.handlers import RotatingFileHandler
 from typing import Annotated, Any, Callable, Literal, Optional
 
@@ -1366,6 +1368,166 @@ def get_compartment_by_name_tool(
         return json.dumps({"error": f"Compartment '{name}' not found."})
 
 
+# Protected database summaries scan compartments and fetch per-PD details on a bounded
+# worker pool. Scans that exceed the time budget return the counts gathered so far.
+_SUMMARY_MAX_WORKERS = int(os.getenv("ORACLE_MCP_SUMMARY_MAX_WORKERS", "8"))
+_SUMMARY_TIME_BUDGET_SECONDS = float(os.getenv("ORACLE_MCP_SUMMARY_TIME_BUDGET_SECONDS", "120"))
+_PENDING = object()
+
+
+def _protected_database_id(item: Any) -> Optional[str]:
+    pd_id = getattr(item, "id", None) or (getattr(item, "data", None) and getattr(item.data, "id", None))
+    if pd_id is None:
+        try:
+            pd_id = (getattr(item, "__dict__", None) or {}).get("id")
+        except Exception:
+            pd_id = None
+    return pd_id or None
+
+
+def _protected_database_field(obj: Any, name: str, camel_name: Optional[str] = None) -> Any:
+    """Reads a field from an SDK model, a plain object or a dict, tolerating SDK shape differences."""
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        value = obj.get(name)
+        return value if value is not None or not camel_name else obj.get(camel_name)
+    value = getattr(obj, name, None)
+    if value is None:
+        try:
+            obj_dict = getattr(obj, "__dict__", None) or {}
+            value = obj_dict.get(name)
+            if value is None and camel_name:
+                value = obj_dict.get(camel_name)
+        except Exception:
+            value = None
+    return value
+
+
+def _protected_database_health(obj: Any) -> Optional[str]:
+    return _protected_database_field(obj, "health") or None
+
+
+def _protected_database_redo_enabled(pd: Any) -> Optional[bool]:
+    redo_enabled = _protected_database_field(pd, "is_redo_logs_shipped", "isRedoLogsShipped")
+    # Fallback: some SDK/reporting expose Real-time protection under metrics as is_redo_logs_enabled
+    if redo_enabled is None:
+        metrics = _protected_database_field(pd, "metrics")
+        redo_enabled = _protected_database_field(metrics, "is_redo_logs_enabled", "isRedoLogsEnabled")
+    return redo_enabled
+
+
+def _backup_space_used_in_gbs(metrics: Any) -> Any:
+    return _protected_database_field(metrics, "backup_space_used_in_gbs", "backupSpaceUsedInGbs")
+
+
+def _list_protected_database_items(client, compartment_id: str, list_kwargs: dict) -> list[Any]:
+    items: list[Any] = []
+    has_next_page = True
+    next_page: Optional[str] = None
+    while has_next_page:
+        response: oci.response.Response = client.list_protected_databases(
+            compartment_id=compartment_id, page=next_page, **list_kwargs
+        )
+        has_next_page = response.has_next_page
+        next_page = response.next_page if hasattr(response, "next_page") else None
+        data = response.data
+        items.extend(getattr(data, "items", data) or [])
+    return items
+
+
+def _scan_protected_databases(
+    client_factory: Callable[[], Any],
+    comp_ids: list[str],
+    *,
+    list_kwargs: Optional[dict] = None,
+    include: Callable[[Any], bool] = lambda item: True,
+    needs_detail: Callable[[Any], bool] = lambda item: True,
+    time_budget_seconds: Optional[float] = None,
+) -> tuple[dict[str, list[tuple[Any, Any]]], list[str]]:
+    """
+    Lists protected databases in every compartment and GETs the ones that need details,
+    running both on a shared bounded pool. Detail GETs for a compartment start as soon
+    as its listing completes. Each worker thread builds its own client with client_factory.
+
+    When the time budget expires, queued calls are cancelled and calls already in flight
+    are abandoned: they run to completion on their worker's client, which nothing else
+    uses, and their results are discarded.
+
+    Returns ({compartmentId: [(summary, detail)]}, incompleteCompartmentIds). detail is the
+    full ProtectedDatabase, the exception raised by its GET, or None when not fetched.
+    Entries whose GET had not finished within the time budget are omitted and their
+    compartments are reported as incomplete. Listing errors are raised.
+    """
+    budget = _SUMMARY_TIME_BUDGET_SECONDS if time_budget_seconds is None else time_budget_seconds
+    deadline = time.monotonic() + budget
+    entries: dict[str, list[list[Any]]] = {comp: [] for comp in comp_ids}
+    local = threading.local()
+
+    def worker_client():
+        if not hasattr(local, "client"):
+            local.client = client_factory()
+        return local.client
+
+    def list_items(comp: str) -> list[Any]:
+        return _list_protected_database_items(worker_client(), comp, list_kwargs or {})
+
+    def get_detail(pd_id: str):
+        return worker_client().get_protected_database(protected_database_id=pd_id)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, _SUMMARY_MAX_WORKERS))
+    try:
+        listings = {executor.submit(list_items, comp): comp for comp in comp_ids}
+        details: dict[Future, list[Any]] = {}
+        pending: set[Future] = set(listings)
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in details:
+                    entry = details.pop(future)
+                    try:
+                        entry[1] = future.result().data
+                    except Exception as e:
+                        entry[1] = e
+                    continue
+                comp = listings[future]
+                for item in future.result():
+                    if not include(item):
+                        continue
+                    pd_id = _protected_database_id(item)
+                    if not pd_id:
+                        continue
+                    entry = [item, None]
+                    entries[comp].append(entry)
+                    if needs_detail(item):
+                        entry[1] = _PENDING
+                        detail_future = executor.submit(get_detail, pd_id)
+                        details[detail_future] = entry
+                        pending.add(detail_future)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    incomplete = {listings[future] for future in pending if future in listings}
+    incomplete.update(
+        comp for comp, comp_entries in entries.items() if any(entry[1] is _PENDING for entry in comp_entries)
+    )
+    if incomplete:
+        logger.warning(
+            "Protected database scan exceeded %ss budget; %s of %s compartments incomplete",
+            budget,
+            len(incomplete),
+            len(comp_ids),
+        )
+    scanned = {
+        comp: [(item, detail) for item, detail in comp_entries if detail is not _PENDING]
+        for comp, comp_entries in entries.items()
+    }
+    return scanned, [comp for comp in comp_ids if comp in incomplete]
+
+
 @mcp.tool(
     description=(
         "Lists protected databases in a compartment with optional filters. The "
@@ -1793,6 +1955,12 @@ def summarize_protected_database_health(
         "When true, scans the full subtree under compartment_id (including child compartments) and returns aggregated counts plus per-compartment breakdown.",
     ] = False,
     region: Annotated[Optional[str], "OCI region to execute the request in (e.g., us-ashburn-1)"] = None,
+    time_budget_seconds: Annotated[
+        Optional[float],
+        "Maximum seconds to spend scanning. When exceeded, counts gathered so far are returned with "
+        "partial=true and the unfinished compartments listed. "
+        "Defaults to ORACLE_MCP_SUMMARY_TIME_BUDGET_SECONDS (120).",
+    ] = None,
 ) -> ProtectedDatabaseHealthCounts:
     """
     Summarizes Protected Database health status counts (PROTECTED, WARNING, ALERT, UNKNOWN) in a compartment.
@@ -1802,7 +1970,6 @@ def summarize_protected_database_health(
     """
     try:
         request_id = uuid.uuid4().hex
-        client = get_recovery_client(region, request_id=request_id)
         comp_id = compartment_id or get_tenancy()
         comp_ids = _compartment_ids_for_tool(
             comp_id,
@@ -1818,9 +1985,14 @@ def summarize_protected_database_health(
 
         per_compartment: list[dict] = []
 
-        has_next_page = True
-        next_page: Optional[str] = None
-
+        # Fetch ACTIVE PDs; GET only those whose list summary lacks health
+        scan, incomplete = _scan_protected_databases(
+            lambda: get_recovery_client(region, request_id=request_id),
+            comp_ids,
+            list_kwargs={"lifecycle_state": "ACTIVE"},
+            needs_detail=lambda item: not _protected_database_health(item),
+            time_budget_seconds=time_budget_seconds,
+        )
         for each_comp in comp_ids:
             c_protected = 0
             c_warning = 0
@@ -1828,76 +2000,28 @@ def summarize_protected_database_health(
             c_unknown = 0
             c_scanned = 0
 
-            has_next_page = True
-            next_page = None
-
-            while has_next_page:
-                # Fetch ACTIVE PDs page by page
-                list_kwargs = {
-                    "compartment_id": each_comp,
-                    "page": next_page,
-                    "lifecycle_state": "ACTIVE",
-                }
-                response: oci.response.Response = client.list_protected_databases(**list_kwargs)
-                has_next_page = response.has_next_page
-                next_page = response.next_page if hasattr(response, "next_page") else None
-
-                data = response.data
-                items = getattr(data, "items", data)
-                for item in items or []:
-                    # Try to read health from list summary; shape can vary by SDK versions
-                    health = getattr(item, "health", None)
-                    if not health and hasattr(item, "__dict__"):
-                        try:
-                            health = item.__dict__.get("health")
-                        except Exception:
-                            health = None
-
-                    # Robustly extract PD OCID to allow follow-up GET if required
-                    pd_id = getattr(item, "id", None) or (
-                        getattr(item, "data", None) and getattr(item.data, "id", None)
-                    )
-                    logger.debug(f"Item structure: {item}")
-                    if pd_id is None:
-                        try:
-                            item_dict = getattr(item, "__dict__", None) or {}
-                            pd_id = item_dict.get("id")
-                        except Exception:
-                            pd_id = None
-                    if not pd_id:
-                        # Can't fetch details; skip counting this entry
-                        continue
-
-                    scanned += 1
-                    c_scanned += 1
-
-                    # If health is not on the summary, fetch the full resource
-                    if not health:
-                        try:
-                            pd_resp: oci.response.Response = client.get_protected_database(
-                                protected_database_id=pd_id
-                            )
-                            pd = pd_resp.data
-                            health = getattr(pd, "health", None)
-                            if not health and hasattr(pd, "__dict__"):
-                                health = pd.__dict__.get("health")
-                        except Exception:
-                            health = None
-
-                    # Increment appropriate counters
-                    if health == "PROTECTED":
-                        protected += 1
-                        c_protected += 1
-                    elif health == "WARNING":
-                        warning += 1
-                        c_warning += 1
-                    elif health == "ALERT":
-                        alert += 1
-                        c_alert += 1
-                    else:
-                        # unknown/None health
-                        unknown += 1
-                        c_unknown += 1
+            for item, pd in scan[each_comp]:
+                scanned += 1
+                c_scanned += 1
+
+                health = _protected_database_health(item)
+                if not health and pd is not None and not isinstance(pd, Exception):
+                    health = _protected_database_health(pd)
+
+                # Increment appropriate counters
+                if health == "PROTECTED":
+                    protected += 1
+                    c_protected += 1
+                elif health == "WARNING":
+                    warning += 1
+                    c_warning += 1
+                elif health == "ALERT":
+                    alert += 1
+                    c_alert += 1
+                else:
+                    # unknown/None health
+                    unknown += 1
+                    c_unknown += 1
 
             per_compartment.append(
                 {
@@ -1954,6 +2078,8 @@ def summarize_protected_database_health(
             "aggregated": agg_dict,
             "per_compartment": per_compartment,
             "compartmentIdsScanned": comp_ids,
+            "partial": bool(incomplete),
+            "compartmentIdsIncomplete": incomplete,
         }
     except Exception as e:
         logger.error(f"Error in summarize_protected_database_health tool: {str(e)}")
@@ -1980,6 +2106,12 @@ def summarize_protected_database_redo_status(
         "When true, scans the full subtree under compartment_id (including child compartments) and returns aggregated counts plus per-compartment breakdown.",
     ] = False,
     region: Annotated[Optional[str], "OCI region to execute the request in (e.g., us-ashburn-1)"] = None,
+    time_budget_seconds: Annotated[
+        Optional[float],
+        "Maximum seconds to spend scanning. When exceeded, counts gathered so far are returned with "
+        "partial=true and the unfinished compartments listed. "
+        "Defaults to ORACLE_MCP_SUMMARY_TIME_BUDGET_SECONDS (120).",
+    ] = None,
 ) -> ProtectedDatabaseRedoCounts:
     """
     Summarizes redo transport enablement for Protected Databases in a compartment.
@@ -1988,7 +2120,6 @@ def summarize_protected_database_redo_status(
     """
     try:
         request_id = uuid.uuid4().hex
-        client = get_recovery_client(region, request_id=request_id)
         comp_id = compartment_id or get_tenancy()
         comp_ids = _compartment_ids_for_tool(
             comp_id,
@@ -2000,80 +2131,29 @@ def summarize_protected_database_redo_status(
         disabled = 0
         per_compartment: list[dict] = []
 
-        has_next_page = True
-        next_page: Optional[str] = None
-
+        # List ACTIVE PDs and GET each to assess redo status
+        scan, incomplete = _scan_protected_databases(
+            lambda: get_recovery_client(region, request_id=request_id),
+            comp_ids,
+            list_kwargs={"lifecycle_state": "ACTIVE"},
+            time_budget_seconds=time_budget_seconds,
+        )
         for each_comp in comp_ids:
             c_enabled = 0
             c_disabled = 0
 
-            has_next_page = True
-            next_page = None
-
-            while has_next_page:
-                # List ACTIVE PDs to assess redo status via GET per PD
-                list_kwargs = {
-                    "compartment_id": each_comp,
-                    "page": next_page,
-                    "lifecycle_state": "ACTIVE",
-                }
-                response: oci.response.Response = client.list_protected_databases(**list_kwargs)
-                has_next_page = response.has_next_page
-                next_page = response.next_page if hasattr(response, "next_page") else None
-
-                data = response.data
-                items = getattr(data, "items", data)
-                for item in items or []:
-                    # Robustly get the PD OCID from summary item
-                    pd_id = getattr(item, "id", None) or (
-                        getattr(item, "data", None) and getattr(item.data, "id", None)
-                    )
-                    if pd_id is None:
-                        try:
-                            item_dict = getattr(item, "__dict__", None) or {}
-                            pd_id = item_dict.get("id")
-                        except Exception:
-                            pd_id = None
-                    if not pd_id:
-                        continue
+            for _item, pd in scan[each_comp]:
+                redo_enabled = None if isinstance(pd, Exception) else _protected_database_redo_enabled(pd)
 
-                    # Fetch full Protected Database to read is_redo_logs_shipped (primary)
-                    redo_enabled = None
-                    try:
-                        pd_resp: oci.response.Response = client.get_protected_database(
-                            protected_database_id=pd_id
-                        )
-                        pd = pd_resp.data
-                        redo_enabled = getattr(pd, "is_redo_logs_shipped", None)
-                        if redo_enabled is None and hasattr(pd, "__dict__"):
-                            redo_enabled = pd.__dict__.get("is_redo_logs_shipped") or pd.__dict__.get(
-                                "isRedoLogsShipped"
-                            )
-                        # Fallback: some SDK/reporting expose Real-time protection
-                        # under metrics as is_redo_logs_enabled
-                        if redo_enabled is None:
-                            try:
-                                m = getattr(pd, "metrics", None)
-                                if m is not None:
-                                    redo_enabled = getattr(m, "is_redo_logs_enabled", None)
-                                    if redo_enabled is None and hasattr(m, "__dict__"):
-                                        redo_enabled = m.__dict__.get(
-                                            "is_redo_logs_enabled"
-                                        ) or m.__dict__.get("isRedoLogsEnabled")
-                            except Exception:
-                                pass
-                    except Exception:
-                        redo_enabled = None
-
-                    if redo_enabled is True:
-                        enabled += 1
-                        c_enabled += 1
-                    elif redo_enabled is False:
-                        disabled += 1
-                        c_disabled += 1
-                    else:
-                        # None/unknown -> do not count
-                        pass
+                if redo_enabled is True:
+                    enabled += 1
+                    c_enabled += 1
+                elif redo_enabled is False:
+                    disabled += 1
+                    c_disabled += 1
+                else:
+                    # None/unknown -> do not count
+                    pass
 
             per_compartment.append(
                 {
@@ -2121,6 +2201,8 @@ def summarize_protected_database_redo_status(
             "aggregated": agg_dict,
             "per_compartment": per_compartment,
             "compartmentIdsScanned": comp_ids,
+            "partial": bool(incomplete),
+            "compartmentIdsIncomplete": incomplete,
         }
     except Exception as e:
         logger.error(f"Error in summarize_protected_database_redo_status tool: {e}")
@@ -2151,6 +2233,12 @@ def summarize_backup_space_used(
         Optional[str],
         "Canonical OCI region (e.g., us-ashburn-1) to execute the request in.",
     ] = None,
+    time_budget_seconds: Annotated[
+        Optional[float],
+        "Maximum seconds to spend scanning. When exceeded, counts gathered so far are returned with "
+        "partial=true and the unfinished compartments listed. "
+        "Defaults to ORACLE_MCP_SUMMARY_TIME_BUDGET_SECONDS (120).",
+    ] = None,
 ) -> dict:
     """
     Sums backup space used (GB) by Protected Databases in a compartment.
@@ -2162,7 +2250,6 @@ def summarize_backup_space_used(
     try:
         request_id = uuid.uuid4().hex
         comp_id = _resolve_compartment_id(compartment_id, default_to_tenancy=True)
-        client = get_recovery_client(region, request_id=request_id)
         comp_ids = _compartment_ids_for_tool(
             comp_id,
             fetch_for_child_compartment=fetch_for_child_compartment,
@@ -2174,109 +2261,44 @@ def summarize_backup_space_used(
         missing_metrics = 0
         per_compartment: list[dict] = []
 
+        # Include only ACTIVE or DELETE_SCHEDULED PDs (exclude DELETED and others).
+        # Metrics are not reliably exposed on list summaries; always GET the full PD.
+        scan, incomplete = _scan_protected_databases(
+            lambda: get_recovery_client(region, request_id=request_id),
+            comp_ids,
+            include=lambda item: (
+                _protected_database_field(item, "lifecycle_state", "lifecycleState")
+                in ("ACTIVE", "DELETE_SCHEDULED")
+            ),
+            time_budget_seconds=time_budget_seconds,
+        )
         for each_comp in comp_ids:
             c_sum_gb = 0.0
             c_scanned = 0
             c_missing_metrics = 0
 
-            has_next_page = True
-            next_page = None
+            for item, pd_obj in scan[each_comp]:
+                scanned += 1
+                c_scanned += 1
 
-            while has_next_page:
-                list_kwargs = {
-                    "compartment_id": each_comp,
-                    "page": next_page,
-                }
-                response: oci.response.Response = client.list_protected_databases(**list_kwargs)
-                has_next_page = response.has_next_page
-                next_page = response.next_page if hasattr(response, "next_page") else None
-
-                data = response.data
-                items = getattr(data, "items", data)
-
-                for item in items or []:
-                    # Filter by lifecycle state: include only ACTIVE or DELETE_SCHEDULED
-                    # (exclude DELETED and others)
-                    try:
-                        lifecycle_state = getattr(item, "lifecycle_state", None)
-                        if not lifecycle_state and hasattr(item, "__dict__"):
-                            lifecycle_state = (getattr(item, "__dict__", {}) or {}).get(
-                                "lifecycle_state"
-                            ) or (getattr(item, "__dict__", {}) or {}).get("lifecycleState")
-                    except Exception:
-                        lifecycle_state = None
-                    if lifecycle_state not in ("ACTIVE", "DELETE_SCHEDULED"):
-                        # Skip PDs that are not ACTIVE or DELETE_SCHEDULED (e.g., DELETED, CREATING, etc.)
-                        continue
-
-                    # Robustly get the PD OCID from summary item (same as redo status tool)
-                    pd_id = getattr(item, "id", None) or (
-                        getattr(item, "data", None) and getattr(item.data, "id", None)
-                    )
-                    logger.debug(f"Item structure: {item}")
-                    if pd_id is None:
-                        try:
-                            item_dict = getattr(item, "__dict__", None) or {}
-                            pd_id = item_dict.get("id")
-                        except Exception:
-                            pd_id = None
-                    if not pd_id:
-                        continue
-
-                    scanned += 1
-                    c_scanned += 1
-
-                    # Always fetch the full Protected Database to read metrics reliably
-                    gb_val = None
-                    try:
-                        pd_resp: oci.response.Response = client.get_protected_database(
-                            protected_database_id=pd_id
-                        )
-                        pd_obj = pd_resp.data
-                        metrics = getattr(pd_obj, "metrics", None)
-                        if metrics is None and hasattr(pd_obj, "__dict__"):
-                            metrics = getattr(pd_obj, "__dict__", {}).get("metrics")
-                        # metrics may be a model or a dict; normalise access
-                        if metrics is not None:
-                            if hasattr(metrics, "backup_space_used_in_gbs"):
-                                gb_val = getattr(metrics, "backup_space_used_in_gbs", None)
-                            if gb_val is None and hasattr(metrics, "__dict__"):
-                                gb_val = metrics.__dict__.get(
-                                    "backup_space_used_in_gbs"
-                                ) or metrics.__dict__.get("backupSpaceUsedInGbs")
-                            if gb_val is None and isinstance(metrics, dict):
-                                gb_val = metrics.get("backup_space_used_in_gbs") or metrics.get(
-                                    "backupSpaceUsedInGbs"
-                                )
-                    except Exception:
-                        # If GET fails, fall back to any summary metrics representation
-                        try:
-                            m = getattr(item, "metrics", None)
-                            if m is not None:
-                                gb_val = getattr(m, "backup_space_used_in_gbs", None)
-                                if gb_val is None and hasattr(m, "__dict__"):
-                                    gb_val = m.__dict__.get("backup_space_used_in_gbs") or m.__dict__.get(
-                                        "backupSpaceUsedInGbs"
-                                    )
-                                if gb_val is None and isinstance(m, dict):
-                                    gb_val = m.get("backup_space_used_in_gbs") or m.get(
-                                        "backupSpaceUsedInGbs"
-                                    )
-                        except Exception:
-                            gb_val = None
+                if isinstance(pd_obj, Exception):
+                    # If GET fails, fall back to any summary metrics representation
+                    gb_val = _backup_space_used_in_gbs(getattr(item, "metrics", None))
+                else:
+                    gb_val = _backup_space_used_in_gbs(_protected_database_field(pd_obj, "metrics"))
 
-                    if gb_val is None:
-                        missing_metrics += 1
-                        c_missing_metrics += 1
+                if gb_val is None:
+                    missing_metrics += 1
+                    c_missing_metrics += 1
 
-                    # Ensure numeric value; treat missing/non-numeric as 0.0
-                    try:
-                        gb = float(gb_val) if gb_val is not None else 0.0
-                    except Exception:
-                        gb = 0.0
+                # Ensure numeric value; treat missing/non-numeric as 0.0
+                try:
+                    gb = float(gb_val) if gb_val is not None else 0.0
+                except Exception:
+                    gb = 0.0
 
-                    sum_gb += gb
-                    c_sum_gb += gb
+                sum_gb += gb
+                c_sum_gb += gb
 
             per_compartment.append(
                 {
@@ -2321,6 +2343,8 @@ def summarize_backup_space_used(
             "per_compartment": per_compartment,
             "compartmentIdsScanned": comp_ids,
             "missingMetricsCount": missing_metrics,
+            "partial": bool(incomplete),
+            "compartmentIdsIncomplete": incomplete,
         }
         # logger.info(f"Returning dict result: {result}")
         # return result
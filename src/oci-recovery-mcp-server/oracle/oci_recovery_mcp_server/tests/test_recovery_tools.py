@@ -5,6 +5,7 @@ https://oss.oracle.com/licenses/upl.
 """
 
 import inspect
+import threading
 from contextlib import ExitStack
 from types import SimpleNamespace
 from unittest.mock import MagicMock, create_autospec, patch
@@ -29,6 +30,16 @@ def _response(data, *, has_next_page=False, next_page=None):
     )
 
 
+def _by_protected_database_id(responses):
+    def get_protected_database(protected_database_id):
+        response = responses[protected_database_id]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return get_protected_database
+
+
 def _raise(error):
     raise error
 
@@ -1676,10 +1687,12 @@ def test_summary_tools_cover_fallback_counts_and_metrics(monkeypatch):
             SimpleNamespace(display_name="missing id"),
         ]
     )
-    recovery_client.get_protected_database.side_effect = [
-        _response(SimpleNamespace(health="ALERT")),
-        _response(SimpleNamespace()),
-    ]
+    recovery_client.get_protected_database.side_effect = _by_protected_database_id(
+        {
+            "pd2": _response(SimpleNamespace(health="ALERT")),
+            "pd3": _response(SimpleNamespace()),
+        }
+    )
 
     health = server.summarize_protected_database_health(
         compartment_id=None, region="us-ashburn-1"
@@ -1713,11 +1726,13 @@ def test_summary_tools_cover_fallback_counts_and_metrics(monkeypatch):
             SimpleNamespace(display_name="missing id"),
         ]
     )
-    recovery_client.get_protected_database.side_effect = [
-        _response(SimpleNamespace(is_redo_logs_shipped=True)),
-        _response(SimpleNamespace(is_redo_logs_shipped=False)),
-        _response(SimpleNamespace(metrics=SimpleNamespace(is_redo_logs_enabled=True))),
-    ]
+    recovery_client.get_protected_database.side_effect = _by_protected_database_id(
+        {
+            "pd1": _response(SimpleNamespace(is_redo_logs_shipped=True)),
+            "pd2": _response(SimpleNamespace(is_redo_logs_shipped=False)),
+            "pd3": _response(SimpleNamespace(metrics=SimpleNamespace(is_redo_logs_enabled=True))),
+        }
+    )
 
     redo = server.summarize_protected_database_redo_status(
         compartment_id="compartment", region="us-ashburn-1"
@@ -1744,11 +1759,13 @@ def test_summary_tools_cover_fallback_counts_and_metrics(monkeypatch):
             SimpleNamespace(id="pd3", lifecycle_state="ACTIVE"),
         ]
     )
-    recovery_client.get_protected_database.side_effect = [
-        RuntimeError("fall back to summary metrics"),
-        _response(SimpleNamespace(metrics={"backupSpaceUsedInGbs": 3.5})),
-        _response(SimpleNamespace(metrics={})),
-    ]
+    recovery_client.get_protected_database.side_effect = _by_protected_database_id(
+        {
+            "pd1": RuntimeError("fall back to summary metrics"),
+            "pd2": _response(SimpleNamespace(metrics={"backupSpaceUsedInGbs": 3.5})),
+            "pd3": _response(SimpleNamespace(metrics={})),
+        }
+    )
 
     backup_space = server.summarize_backup_space_used(
         compartment_id="compartment", region="us-ashburn-1"
@@ -1759,6 +1776,119 @@ def test_summary_tools_cover_fallback_counts_and_metrics(monkeypatch):
     assert backup_space["missingMetricsCount"] == 1
 
 
+def test_summary_tools_scan_compartment_subtree_concurrently(monkeypatch):
+    recovery_client = MagicMock()
+    monkeypatch.setattr(
+        server,
+        "get_recovery_client",
+        lambda region=None, request_id=None: recovery_client,
+    )
+    monkeypatch.setattr(
+        server,
+        "_compartment_ids_for_tool",
+        lambda comp_id, **_kwargs: ["comp-a", "comp-b"],
+    )
+    pages = {
+        ("comp-a", None): _response(
+            [SimpleNamespace(id="pd-a1", health="PROTECTED"), SimpleNamespace(id="pd-a2")],
+            has_next_page=True,
+            next_page="page-2",
+        ),
+        ("comp-a", "page-2"): _response([SimpleNamespace(id="pd-a3")]),
+        ("comp-b", None): _response([SimpleNamespace(id="pd-b1")]),
+    }
+    recovery_client.list_protected_databases.side_effect = lambda compartment_id, page, **_kwargs: pages[
+        (compartment_id, page)
+    ]
+    recovery_client.get_protected_database.side_effect = _by_protected_database_id(
+        {
+            "pd-a2": _response(SimpleNamespace(health="WARNING")),
+            "pd-a3": RuntimeError("get failed"),
+            "pd-b1": _response(SimpleNamespace(health="ALERT")),
+        }
+    )
+
+    health = server.summarize_protected_database_health("root", fetch_for_child_compartment=True)
+
+    assert health["aggregated"]["total"] == 4
+    assert [
+        (entry["compartmentId"], entry["protected"], entry["warning"], entry["unknown"], entry["alert"])
+        for entry in health["per_compartment"]
+    ] == [("comp-a", 1, 1, 1, 0), ("comp-b", 0, 0, 0, 1)]
+    assert health["partial"] is False
+    assert health["compartmentIdsIncomplete"] == []
+    fetched = recovery_client.get_protected_database.call_args_list
+    assert {call.kwargs["protected_database_id"] for call in fetched} == {"pd-a2", "pd-a3", "pd-b1"}
+
+
+def test_summary_scan_returns_partial_results_when_time_budget_expires(monkeypatch):
+    recovery_client = MagicMock()
+    release = threading.Event()
+    monkeypatch.setattr(
+        server,
+        "get_recovery_client",
+        lambda region=None, request_id=None: recovery_client,
+    )
+    monkeypatch.setattr(
+        server,
+        "_compartment_ids_for_tool",
+        lambda comp_id, **_kwargs: ["comp-fast", "comp-slow"],
+    )
+    recovery_client.list_protected_databases.side_effect = lambda compartment_id, **_kwargs: _response(
+        [SimpleNamespace(id=f"{compartment_id}-pd")]
+    )
+
+    def get_protected_database(protected_database_id):
+        if protected_database_id == "comp-slow-pd":
+            release.wait(5)
+        return _response(SimpleNamespace(is_redo_logs_shipped=True))
+
+    recovery_client.get_protected_database.side_effect = get_protected_database
+
+    try:
+        redo = server.summarize_protected_database_redo_status("root", time_budget_seconds=0.2)
+    finally:
+        release.set()
+
+    assert redo["aggregated"]["enabled"] == 1
+    assert redo["partial"] is True
+    assert redo["compartmentIdsIncomplete"] == ["comp-slow"]
+    assert [entry["total"] for entry in redo["per_compartment"]] == [1, 0]
+
+
+def test_summary_scan_gives_each_worker_its_own_client(monkeypatch):
+    monkeypatch.setattr(server, "_SUMMARY_MAX_WORKERS", 3)
+    owners: dict[int, int] = {}
+    lock = threading.Lock()
+
+    def make_client():
+        client = MagicMock()
+        with lock:
+            owners[id(client)] = threading.get_ident()
+
+        def owned_by_caller():
+            assert owners[id(client)] == threading.get_ident()
+
+        def list_protected_databases(compartment_id, **_kwargs):
+            owned_by_caller()
+            return _response([SimpleNamespace(id=f"{compartment_id}-pd{n}") for n in range(3)])
+
+        def get_protected_database(protected_database_id):
+            owned_by_caller()
+            return _response(SimpleNamespace(health="PROTECTED"))
+
+        client.list_protected_databases.side_effect = list_protected_databases
+        client.get_protected_database.side_effect = get_protected_database
+        return client
+
+    scan, incomplete = server._scan_protected_databases(make_client, ["comp-a", "comp-b", "comp-c"])
+
+    assert incomplete == []
+    assert all(len(scan[comp]) == 3 for comp in scan)
+    assert all(detail.health == "PROTECTED" for entries in scan.values() for _item, detail in entries)
+    assert 1 <= len(owners) <= 3
+
+
 def test_database_tools_cover_compartment_paths_and_backup_enrichment(monkeypatch):
     db_client = MagicMock()
     recovery_client = MagicMock()
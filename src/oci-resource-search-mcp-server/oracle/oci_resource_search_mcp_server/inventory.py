@@ -0,0 +1,345 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Opt-in local resource inventory backed by SQLite.
+
+The inventory is empty until ``sync_resource_inventory`` is called for a tenancy (optionally a
+single compartment). The first sync of a scope reads every resource through Resource Search. Later
+syncs are incremental: they only query resources created since the previous sync plus resources
+that moved to TERMINATED/DELETED. A full re-read runs again once the last one is older than
+``OCI_RESOURCE_SEARCH_INVENTORY_FULL_SYNC_SECONDS``; that is also what picks up renames, moves and
+purged resources. Lookups are local SQLite reads against indexes on display name, type,
+compartment and tags.
+"""
+
+import difflib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from logging import Logger
+from typing import Optional
+
+from oci.resource_search.models import StructuredSearchDetails
+from oracle.oci_resource_search_mcp_server.models import ResourceSummary, map_resource_summary
+from oracle.oci_resource_search_mcp_server.type_catalog import cache_dir
+
+logger = Logger(__name__, level="INFO")
+
+DEFAULT_FULL_SYNC_SECONDS = 86400.0
+# Incremental syncs re-read resources created this long before the previous sync started, to cover
+# clock skew and Resource Search indexing delay.
+SYNC_OVERLAP = timedelta(minutes=10)
+SEARCH_PAGE_SIZE = 1000
+MATCH_MODES = ("exact", "prefix", "contains", "fuzzy")
+FUZZY_CUTOFF = 0.6
+TERMINAL_STATES = ("TERMINATED", "DELETED")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    identifier TEXT PRIMARY KEY,
+    tenant_id TEXT NOT NULL,
+    display_name TEXT,
+    name_lower TEXT,
+    resource_type TEXT,
+    compartment_id TEXT,
+    lifecycle_state TEXT,
+    time_created TEXT,
+    summary TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resources_name ON resources (name_lower);
+CREATE INDEX IF NOT EXISTS resources_type ON resources (resource_type, name_lower);
+CREATE INDEX IF NOT EXISTS resources_compartment ON resources (compartment_id, resource_type);
+CREATE TABLE IF NOT EXISTS resource_tags (
+    identifier TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS resource_tags_key ON resource_tags (key, value);
+CREATE INDEX IF NOT EXISTS resource_tags_identifier ON resource_tags (identifier);
+CREATE TABLE IF NOT EXISTS sync_state (
+    tenant_id TEXT NOT NULL,
+    compartment_id TEXT NOT NULL,
+    watermark TEXT NOT NULL,
+    last_full_sync REAL NOT NULL,
+    last_sync REAL NOT NULL,
+    PRIMARY KEY (tenant_id, compartment_id)
+);
+"""
+
+
+def inventory_file() -> str:
+    value = os.getenv("OCI_RESOURCE_SEARCH_INVENTORY_FILE")
+    if value:
+        return os.path.expanduser(value)
+    return os.path.join(cache_dir(), "inventory.sqlite3")
+
+
+def full_sync_seconds() -> float:
+    value = os.getenv("OCI_RESOURCE_SEARCH_INVENTORY_FULL_SYNC_SECONDS")
+    if not value:
+        return DEFAULT_FULL_SYNC_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        return DEFAULT_FULL_SYNC_SECONDS
+
+
+def _iso(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _tag_rows(summary: ResourceSummary) -> list[tuple[str, str, str]]:
+    rows = [("", key.lower(), str(value)) for key, value in (summary.freeform_tags or {}).items()]
+    for namespace, tags in (summary.defined_tags or {}).items():
+        for key, value in (tags or {}).items():
+            rows.append((namespace.lower(), key.lower(), str(value)))
+    return rows
+
+
+def _parse_tag(tag: str) -> tuple[Optional[str], str, Optional[str]]:
+    """Split ``[namespace.]key[=value]`` into its parts (namespace None when not given)."""
+    key, has_value, value = tag.partition("=")
+    namespace, dot, bare_key = key.partition(".")
+    if not dot:
+        namespace, bare_key = None, key
+    return (
+        namespace.strip().lower() if namespace is not None else None,
+        bare_key.strip().lower(),
+        value.strip() if has_value else None,
+    )
+
+
+class ResourceInventory:
+    """SQLite store of Resource Search results with incremental sync and indexed lookups."""
+
+    def __init__(self, *, path: str | None = None, clock=time.time):
+        self._path = path
+        self._clock = clock
+        self._connection: sqlite3.Connection | None = None
+        self._connection_path: str | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def path(self) -> str:
+        return self._path or inventory_file()
+
+    def _db(self) -> sqlite3.Connection:
+        path = self.path
+        if self._connection is None or self._connection_path != path:
+            self.close()
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._connection, self._connection_path = connection, path
+        return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+            self._connection = self._connection_path = None
+
+    # -- sync -----------------------------------------------------------------------------------
+
+    def _search(self, client, tenant_id: str, query: str):
+        next_page = None
+        while True:
+            response = client.search_resources(
+                tenant_id=tenant_id,
+                search_details=StructuredSearchDetails(type="Structured", query=query),
+                page=next_page,
+                limit=SEARCH_PAGE_SIZE,
+            )
+            yield from response.data.items
+            next_page = getattr(response, "next_page", None) if response.has_next_page else None
+            if not next_page:
+                return
+
+    def _upsert(self, db: sqlite3.Connection, tenant_id: str, items, synced_at: float) -> set[str]:
+        seen = set()
+        for item in items:
+            summary = map_resource_summary(item)
+            if not summary.identifier:
+                continue
+            summary.search_context = None
+            seen.add(summary.identifier)
+            db.execute(
+                "INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    summary.identifier,
+                    tenant_id,
+                    summary.display_name,
+                    (summary.display_name or "").lower(),
+                    (summary.resource_type or "").lower(),
+                    summary.compartment_id,
+                    summary.lifecycle_state,
+                    summary.time_created.isoformat() if summary.time_created else None,
+                    summary.model_dump_json(exclude_none=True),
+                    synced_at,
+                ),
+            )
+            db.execute("DELETE FROM resource_tags WHERE identifier = ?", (summary.identifier,))
+            db.executemany(
+                "INSERT INTO resource_tags VALUES (?, ?, ?, ?)",
+                [(summary.identifier, *row) for row in _tag_rows(summary)],
+            )
+        return seen
+
+    def sync(self, client, tenant_id: str, compartment_id: str | None = None, *, full: bool = False) -> dict:
+        """Bring the inventory for a tenancy (or one compartment) up to date."""
+        started = self._clock()
+        started_at = datetime.fromtimestamp(started, tz=timezone.utc)
+        scope = f"compartmentId = '{compartment_id}'" if compartment_id else None
+        with self._lock:
+            db = self._db()
+            state = db.execute(
+                "SELECT * FROM sync_state WHERE tenant_id = ? AND compartment_id = ?",
+                (tenant_id, compartment_id or ""),
+            ).fetchone()
+            due = state is None or started - state["last_full_sync"] >= full_sync_seconds()
+            mode = "full" if full or due else "incremental"
+
+            removed = 0
+            with db:
+                if mode == "full":
+                    query = "query all resources" + (f" where {scope}" if scope else "")
+                    seen = self._upsert(db, tenant_id, self._search(client, tenant_id, query), started)
+                    stale = [
+                        row["identifier"]
+                        for row in db.execute(
+                            "SELECT identifier FROM resources WHERE tenant_id = ?"
+                            + (" AND compartment_id = ?" if compartment_id else ""),
+                            (tenant_id, compartment_id) if compartment_id else (tenant_id,),
+                        )
+                        if row["identifier"] not in seen
+                    ]
+                    for identifier in stale:
+                        db.execute("DELETE FROM resources WHERE identifier = ?", (identifier,))
+                        db.execute("DELETE FROM resource_tags WHERE identifier = ?", (identifier,))
+                    removed = len(stale)
+                    last_full_sync = started
+                else:
+                    since = datetime.fromisoformat(state["watermark"].replace("Z", "+00:00")) - SYNC_OVERLAP
+                    terminal = " || ".join(f"lifecycleState = '{s}'" for s in TERMINAL_STATES)
+                    conditions = [f"timeCreated >= '{_iso(since)}'", f"({terminal})"]
+                    seen = set()
+                    for condition in conditions:
+                        where = f"{scope} && {condition}" if scope else condition
+                        seen |= self._upsert(
+                            db, tenant_id, self._search(client, tenant_id, f"query all resources where {where}"), started
+                        )
+                    last_full_sync = state["last_full_sync"]
+                db.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, ?)",
+                    (tenant_id, compartment_id or "", _iso(started_at), last_full_sync, started),
+                )
+            total = db.execute("SELECT COUNT(*) FROM resources WHERE tenant_id = ?", (tenant_id,)).fetchone()[0]
+
+        return {
+            "mode": mode,
+            "tenant_id": tenant_id,
+            "compartment_id": compartment_id,
+            "upserted": len(seen),
+            "removed": removed,
+            "total_resources": total,
+            "elapsed_seconds": round(self._clock() - started, 3),
+        }
+
+    # -- query ----------------------------------------------------------------------------------
+
+    def query(
+        self,
+        *,
+        tenant_id: str | None = None,
+        name: str | None = None,
+        match: str = "prefix",
+        resource_type: str | None = None,
+        compartment_id: str | None = None,
+        lifecycle_state: str | None = None,
+        tag: str | None = None,
+        include_terminated: bool = False,
+        limit: int = 50,
+    ) -> list[ResourceSummary]:
+        """Filter the inventory; ``match`` controls how ``name`` is compared to display names."""
+        if match not in MATCH_MODES:
+            raise ValueError(f"match must be one of {', '.join(MATCH_MODES)}")
+        clauses, params = [], []
+        if tenant_id:
+            clauses.append("r.tenant_id = ?")
+            params.append(tenant_id)
+        if resource_type:
+            clauses.append("r.resource_type = ?")
+            params.append(resource_type.lower())
+        if compartment_id:
+            clauses.append("r.compartment_id = ?")
+            params.append(compartment_id)
+        if lifecycle_state:
+            clauses.append("UPPER(r.lifecycle_state) = ?")
+            params.append(lifecycle_state.upper())
+        elif not include_terminated:
+            clauses.append(f"COALESCE(UPPER(r.lifecycle_state), '') NOT IN ({', '.join('?' * len(TERMINAL_STATES))})")
+            params.extend(TERMINAL_STATES)
+        if tag:
+            namespace, key, value = _parse_tag(tag)
+            tag_clauses = ["t.key = ?"]
+            tag_params = [key]
+            if namespace is not None:
+                tag_clauses.append("t.namespace = ?")
+                tag_params.append(namespace)
+            if value is not None:
+                tag_clauses.append("t.value = ?")
+                tag_params.append(value)
+            clauses.append(
+                "r.identifier IN (SELECT t.identifier FROM resource_tags t WHERE " + " AND ".join(tag_clauses) + ")"
+            )
+            params.extend(tag_params)
+
+        needle = (name or "").lower()
+        if needle and match == "exact":
+            clauses.append("r.name_lower = ?")
+            params.append(needle)
+        elif needle and match == "prefix":
+            # A range scan keeps the name index usable, unlike LIKE on a case-folded column.
+            clauses.append("r.name_lower >= ? AND r.name_lower < ?")
+            params.extend([needle, needle + "\U0010ffff"])
+        elif needle and match == "contains":
+            clauses.append("instr(r.name_lower, ?) > 0")
+            params.append(needle)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        fuzzy = bool(needle) and match == "fuzzy"
+        sql = f"SELECT r.name_lower, r.summary FROM resources r{where} ORDER BY r.name_lower"
+        if not fuzzy:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._db().execute(sql, params).fetchall()
+
+        if fuzzy:
+            scored = []
+            for row in rows:
+                ratio = difflib.SequenceMatcher(None, needle, row["name_lower"]).ratio()
+                if needle in row["name_lower"]:
+                    ratio = max(ratio, 0.9)
+                if ratio >= FUZZY_CUTOFF:
+                    scored.append((-ratio, row["name_lower"], row))
+            rows = [row for *_, row in sorted(scored, key=lambda entry: entry[:2])[:limit]]
+        return [ResourceSummary.model_validate(json.loads(row["summary"])) for row in rows]
+
+    def synced(self, tenant_id: str | None = None) -> bool:
+        """Whether any scope (of the tenancy, when given) has been synced."""
+        sql = "SELECT 1 FROM sync_state" + (" WHERE tenant_id = ?" if tenant_id else "") + " LIMIT 1"
+        with self._lock:
+            return self._db().execute(sql, (tenant_id,) if tenant_id else ()).fetchone() is not None
+
+
+INVENTORY = ResourceInventory()
@@ -19,6 +19,8 @@ from oracle.oci_resource_search_mcp_server.models import (
     ResourceSummary,
     map_resource_summary,
 )
+from oracle.oci_resource_search_mcp_server.inventory import INVENTORY, MATCH_MODES
+from oracle.oci_resource_search_mcp_server.type_catalog import RESOURCE_TYPES
 from pydantic import Field
 
 from . import __project__, __version__
@@ -43,35 +45,21 @@ def _validate_display_name(display_name: str) -> str:
     return display_name
 
 
-def _list_resource_type_names(client) -> set[str]:
-    resource_type_names: set[str] = set()
-    has_next_page = True
-    next_page = None
-
-    while has_next_page:
-        kwargs = {"page": next_page} if next_page else {}
-        response = client.list_resource_types(**kwargs)
-        resource_type_names.update(
-            resource_type.name.lower() for resource_type in response.data
-        )
-
-        has_next_page = getattr(response, "has_next_page", False) is True
-        next_page = getattr(response, "next_page", None) if has_next_page else None
-        if has_next_page and not next_page:
-            break
-
-    return resource_type_names
-
-
 def _validate_resource_type(client, resource_type: str) -> str:
     normalized = resource_type.lower()
     if not _RESOURCE_TYPE_RE.fullmatch(normalized):
         raise ValueError("resource_type must contain only lowercase letters, digits, and underscores.")
-    if normalized not in _list_resource_type_names(client):
+    if not RESOURCE_TYPES.contains(client, normalized):
         raise ValueError(f"resource_type '{resource_type}' is not supported by OCI Resource Search.")
     return normalized
 
 
+def _require_local_inventory_mode() -> None:
+    # One inventory file would be shared by every authenticated HTTP caller, leaking resources across users.
+    if os.getenv("ORACLE_MCP_HOST") and os.getenv("ORACLE_MCP_PORT"):
+        raise RuntimeError("The local resource inventory is only available with the stdio transport.")
+
+
 def _get_http_config_and_signer():
     if not (os.getenv("ORACLE_MCP_HOST") and os.getenv("ORACLE_MCP_PORT")):
         return None, None
@@ -353,7 +341,10 @@ def search_resources_by_type(
         raise e
 
 
-@mcp.tool(description="Returns a list of all supported OCI resource types")
+@mcp.tool(
+    description="Returns a list of all supported OCI resource types. "
+    "The catalog is cached per region and refreshed in the background."
+)
 def list_resource_types(
     limit: Optional[int] = Field(
         None,
@@ -361,37 +352,83 @@ def list_resource_types(
         ge=1,
     ),
 ) -> list[str]:
-    resource_types: list[str] = []
-
     try:
         client = get_search_client()
+        resource_types = list(RESOURCE_TYPES.names(client))
+        if limit is not None:
+            resource_types = resource_types[:limit]
 
-        response: oci.response.Response = None
-        has_next_page = True
-        next_page: str = None
+        logger.info(f"Found {len(resource_types)} resource types")
+        return resource_types
 
-        while has_next_page and (limit is None or len(resource_types) < limit):
-            kwargs = {
-                "page": next_page,
-                "limit": limit,
-            }
+    except Exception as e:
+        logger.error(f"Error in list_resource_types tool: {str(e)}")
+        raise e
 
-            response = client.list_resource_types(**kwargs)
-            has_next_page = response.has_next_page
-            next_page = response.next_page if hasattr(response, "next_page") else None
 
-            data: list[oci.resource_search.models.ResourceType] = response.data
-            for d in data:
-                resource_types.append(d.name)
+@mcp.tool(
+    description="Builds or incrementally updates the opt-in local resource inventory for a tenancy or compartment. "
+    "The first sync reads every resource; later syncs only fetch newly created and terminated resources, "
+    "with a periodic full re-read to pick up renames and moves."
+)
+def sync_resource_inventory(
+    tenant_id: str = Field(..., description="The OCID of the tenancy to index"),
+    compartment_id: Optional[str] = Field(
+        None, description="Restrict the sync to resources directly in this compartment. If None, the whole tenancy"
+    ),
+    full: bool = Field(False, description="Force a full re-read instead of an incremental sync"),
+) -> dict:
+    _require_local_inventory_mode()
+    if compartment_id is not None:
+        compartment_id = _validate_compartment_id(compartment_id)
 
-        logger.info(f"Found {len(resource_types)} resource types")
-        return resource_types
+    try:
+        client = get_search_client()
+        result = INVENTORY.sync(client, tenant_id, compartment_id, full=full)
+        logger.info(f"Inventory {result['mode']} sync upserted {result['upserted']} resources")
+        return result
 
     except Exception as e:
-        logger.error(f"Error in list_resource_types tool: {str(e)}")
+        logger.error(f"Error in sync_resource_inventory tool: {str(e)}")
         raise e
 
 
+@mcp.tool(
+    description="Looks up resources in the local inventory built by sync_resource_inventory, without calling OCI. "
+    "Supports exact, prefix, contains and fuzzy display-name matching plus type, compartment, state and tag filters."
+)
+def query_resource_inventory(
+    name: Optional[str] = Field(None, description="Display name (or part of it) to match, case-insensitive"),
+    match: str = Field("prefix", description=f"How to match name: one of {', '.join(MATCH_MODES)}"),
+    resource_type: Optional[str] = Field(None, description="Resource type, e.g. instance or autonomousdatabase"),
+    compartment_id: Optional[str] = Field(None, description="The OCID of the compartment containing the resource"),
+    lifecycle_state: Optional[str] = Field(None, description="Lifecycle state, e.g. RUNNING or AVAILABLE"),
+    tag: Optional[str] = Field(
+        None,
+        description="Tag filter as key, key=value or namespace.key=value (defined tags); keys are case-insensitive",
+    ),
+    tenant_id: Optional[str] = Field(None, description="Only return resources synced for this tenancy"),
+    include_terminated: bool = Field(False, description="Include TERMINATED and DELETED resources"),
+    limit: int = Field(50, description="The maximum amount of resources to return", ge=1),
+) -> list[ResourceSummary]:
+    _require_local_inventory_mode()
+    if not INVENTORY.synced(tenant_id):
+        raise ValueError("The local resource inventory is empty; call sync_resource_inventory first.")
+    resources = INVENTORY.query(
+        tenant_id=tenant_id,
+        name=name,
+        match=match,
+        resource_type=resource_type,
+        compartment_id=compartment_id,
+        lifecycle_state=lifecycle_state,
+        tag=tag,
+        include_terminated=include_terminated,
+        limit=limit,
+    )
+    logger.info(f"Found {len(resources)} Resources in the local inventory")
+    return resources
+
+
 def main():
 
     host = os.getenv("ORACLE_MCP_HOST")
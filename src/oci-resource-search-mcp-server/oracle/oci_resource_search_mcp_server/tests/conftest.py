@@ -0,0 +1,19 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import pytest
+from oracle.oci_resource_search_mcp_server.inventory import INVENTORY
+from oracle.oci_resource_search_mcp_server.type_catalog import RESOURCE_TYPES
+
+
+@pytest.fixture(autouse=True)
+def isolated_local_caches(tmp_path, monkeypatch):
+    monkeypatch.setenv("OCI_RESOURCE_SEARCH_TYPE_CACHE_FILE", str(tmp_path / "resource_types.json"))
+    monkeypatch.setenv("OCI_RESOURCE_SEARCH_INVENTORY_FILE", str(tmp_path / "inventory.sqlite3"))
+    RESOURCE_TYPES.clear()
+    yield
+    RESOURCE_TYPES.clear()
+    INVENTORY.close()
@@ -0,0 +1,204 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, create_autospec, patch
+
+import oci
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+from oracle.oci_resource_search_mcp_server import inventory
+from oracle.oci_resource_search_mcp_server.server import mcp
+
+TENANT_ID = "ocid1.tenancy.oc1..aaaaaaaaexample"
+COMPARTMENT_ID = "ocid1.compartment.oc1..aaaaaaaaexample"
+OTHER_COMPARTMENT_ID = "ocid1.compartment.oc1..bbbbbbbbexample"
+START = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc).timestamp()
+
+
+def _resource(identifier, name, resource_type="Instance", compartment_id=COMPARTMENT_ID, state="RUNNING", **kwargs):
+    return oci.resource_search.models.ResourceSummary(
+        identifier=identifier,
+        display_name=name,
+        resource_type=resource_type,
+        compartment_id=compartment_id,
+        lifecycle_state=state,
+        time_created=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        **kwargs,
+    )
+
+
+def _page(items, next_page=None):
+    response = create_autospec(oci.response.Response)
+    response.data = oci.resource_search.models.ResourceSummaryCollection(items=items)
+    response.has_next_page = next_page is not None
+    response.next_page = next_page
+    return response
+
+
+class _SearchClient:
+    """Answers StructuredSearchDetails queries from a dict of query -> list of pages."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.queries = []
+
+    def search_resources(self, tenant_id, search_details, page, limit):
+        self.queries.append((search_details.query, page))
+        index = int(page) if page else 0
+        pages = self.pages[search_details.query]
+        return _page(pages[index], str(index + 1) if index + 1 < len(pages) else None)
+
+
+FULL_QUERY = "query all resources"
+FLEET = [
+    _resource("i1", "web-01", freeform_tags={"Env": "prod"}),
+    _resource("i2", "web-02", freeform_tags={"Env": "dev"}),
+    _resource(
+        "a1",
+        "Sales ADB",
+        resource_type="AutonomousDatabase",
+        compartment_id=OTHER_COMPARTMENT_ID,
+        state="AVAILABLE",
+        defined_tags={"Finance": {"CostCenter": "42"}},
+    ),
+    _resource("i3", "old-batch", state="TERMINATED"),
+]
+
+
+@pytest.fixture
+def synced():
+    store = inventory.ResourceInventory(clock=lambda: START)
+    client = _SearchClient({FULL_QUERY: [FLEET[:2], FLEET[2:]]})
+    result = store.sync(client, TENANT_ID)
+    yield store, result, client
+    store.close()
+
+
+class TestResourceInventory:
+    def test_full_sync_pages_through_search_and_records_state(self, synced):
+        store, result, client = synced
+
+        assert result["mode"] == "full"
+        assert result["upserted"] == 4
+        assert result["total_resources"] == 4
+        assert client.queries == [(FULL_QUERY, None), (FULL_QUERY, "1")]
+        assert store.synced(TENANT_ID) is True
+        assert store.synced("ocid1.tenancy.oc1..other") is False
+
+    def test_name_matching_modes(self, synced):
+        store, _, _ = synced
+
+        def names(**kwargs):
+            return [r.display_name for r in store.query(**kwargs)]
+
+        assert names(name="WEB") == ["web-01", "web-02"]
+        assert names(name="web-02", match="exact") == ["web-02"]
+        assert names(name="adb", match="contains") == ["Sales ADB"]
+        assert names(name="wbe-01", match="fuzzy")[0] == "web-01"
+        assert names(name="zzz", match="fuzzy") == []
+        with pytest.raises(ValueError, match="match must be one of"):
+            store.query(name="web", match="regex")
+
+    def test_filters_use_type_compartment_state_and_tags(self, synced):
+        store, _, _ = synced
+
+        def ids(**kwargs):
+            return [r.identifier for r in store.query(**kwargs)]
+
+        assert ids(resource_type="autonomousdatabase") == ["a1"]
+        assert ids(compartment_id=COMPARTMENT_ID) == ["i1", "i2"]
+        assert ids(compartment_id=COMPARTMENT_ID, include_terminated=True) == ["i3", "i1", "i2"]
+        assert ids(lifecycle_state="terminated") == ["i3"]
+        assert ids(tag="env=prod") == ["i1"]
+        assert ids(tag="env") == ["i1", "i2"]
+        assert ids(tag="finance.costcenter=42") == ["a1"]
+        assert ids(tag="other.costcenter=42") == []
+        assert ids(limit=1) == ["a1"]
+
+        adb = store.query(resource_type="autonomousdatabase")[0]
+        assert adb.defined_tags == {"Finance": {"CostCenter": "42"}}
+        assert adb.time_created == datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def test_incremental_sync_fetches_new_and_terminated_resources(self, synced):
+        store, _, _ = synced
+        created_query = "query all resources where timeCreated >= '2025-06-01T11:50:00Z'"
+        terminal_query = "query all resources where (lifecycleState = 'TERMINATED' || lifecycleState = 'DELETED')"
+        client = _SearchClient(
+            {
+                created_query: [[_resource("i4", "web-03")]],
+                terminal_query: [[_resource("i2", "web-02", state="TERMINATED")]],
+            }
+        )
+
+        result = store.sync(client, TENANT_ID)
+
+        assert result["mode"] == "incremental"
+        assert result["upserted"] == 2
+        assert result["removed"] == 0
+        assert [q for q, _ in client.queries] == [created_query, terminal_query]
+        assert [r.identifier for r in store.query(name="web")] == ["i1", "i4"]
+
+    def test_full_sync_removes_vanished_resources_within_scope_only(self, synced):
+        store, _, _ = synced
+        scoped_query = f"query all resources where compartmentId = '{COMPARTMENT_ID}'"
+        client = _SearchClient({scoped_query: [[FLEET[0]]]})
+
+        result = store.sync(client, TENANT_ID, COMPARTMENT_ID)
+
+        assert result["mode"] == "full"
+        assert result["removed"] == 2
+        assert [r.identifier for r in store.query(include_terminated=True)] == ["a1", "i1"]
+
+    def test_full_sync_is_forced_once_the_last_one_is_old(self, synced, monkeypatch):
+        store, _, _ = synced
+        monkeypatch.setenv("OCI_RESOURCE_SEARCH_INVENTORY_FULL_SYNC_SECONDS", "0")
+        client = _SearchClient({FULL_QUERY: [[FLEET[0]]]})
+
+        assert store.sync(client, TENANT_ID)["mode"] == "full"
+
+
+class TestInventoryTools:
+    @pytest.mark.asyncio
+    async def test_query_requires_a_sync(self):
+        async with Client(mcp) as client:
+            with pytest.raises(ToolError, match="sync_resource_inventory"):
+                await client.call_tool("query_resource_inventory", {"name": "web"})
+
+    @pytest.mark.asyncio
+    async def test_inventory_is_disabled_for_http_transport(self, monkeypatch):
+        monkeypatch.setenv("ORACLE_MCP_HOST", "127.0.0.1")
+        monkeypatch.setenv("ORACLE_MCP_PORT", "8000")
+        async with Client(mcp) as client:
+            with pytest.raises(ToolError, match="stdio"):
+                await client.call_tool("sync_resource_inventory", {"tenant_id": TENANT_ID})
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_resource_search_mcp_server.server.get_search_client")
+    async def test_sync_then_query(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.search_resources.return_value = _page(FLEET)
+        mock_get_client.return_value = mock_client
+
+        async with Client(mcp) as client:
+            synced = (
+                await client.call_tool(
+                    "sync_resource_inventory", {"tenant_id": TENANT_ID, "compartment_id": COMPARTMENT_ID}
+                )
+            ).structured_content
+            found = (
+                await client.call_tool("query_resource_inventory", {"name": "web-0", "tag": "env=dev"})
+            ).structured_content["result"]
+            with pytest.raises(ToolError):
+                await client.call_tool(
+                    "sync_resource_inventory", {"tenant_id": TENANT_ID, "compartment_id": "not-an-ocid"}
+                )
+
+        assert synced["mode"] == "full"
+        assert synced["upserted"] == 4
+        assert [r["identifier"] for r in found] == ["i2"]
+        mock_client.search_resources.assert_called_once()
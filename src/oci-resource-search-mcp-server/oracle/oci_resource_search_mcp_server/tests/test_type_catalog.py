@@ -0,0 +1,154 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, create_autospec, patch
+
+import oci
+import pytest
+from fastmcp import Client
+from oracle.oci_resource_search_mcp_server import type_catalog
+from oracle.oci_resource_search_mcp_server.server import mcp
+
+TENANT_ID = "ocid1.tenancy.oc1..aaaaaaaaexample"
+COMPARTMENT_ID = "ocid1.compartment.oc1..aaaaaaaaexample"
+ENDPOINT = "https://query.us-ashburn-1.oci.oraclecloud.com"
+
+
+def _types_response(*names):
+    response = create_autospec(oci.response.Response)
+    response.data = [oci.resource_search.models.ResourceType(name=name) for name in names]
+    response.has_next_page = False
+    response.next_page = None
+    return response
+
+
+def _client(*names, endpoint=ENDPOINT):
+    client = MagicMock()
+    client.base_client.endpoint = endpoint
+    client.list_resource_types.return_value = _types_response(*names)
+    return client
+
+
+class TestResourceTypeCatalog:
+    def test_names_are_cached_per_region_and_persisted(self, tmp_path):
+        path = str(tmp_path / "types.json")
+        catalog = type_catalog.ResourceTypeCatalog(path=path)
+        client = _client("Instance", "DbSystem")
+        other_region = _client("Instance", endpoint="https://query.eu-frankfurt-1.oci.oraclecloud.com")
+
+        assert catalog.names(client) == ["Instance", "DbSystem"]
+        assert catalog.names(client) == ["Instance", "DbSystem"]
+        assert catalog.names(other_region) == ["Instance"]
+        assert client.list_resource_types.call_count == 1
+        assert other_region.list_resource_types.call_count == 1
+
+        with open(path) as f:
+            persisted = json.load(f)
+        assert persisted["regions"][ENDPOINT]["names"] == ["Instance", "DbSystem"]
+
+        cold = type_catalog.ResourceTypeCatalog(path=path)
+        fresh_client = _client("unused")
+        assert cold.names(fresh_client) == ["Instance", "DbSystem"]
+        fresh_client.list_resource_types.assert_not_called()
+
+    def test_stale_entry_is_served_while_refreshing_in_background(self, tmp_path):
+        now = [1000.0]
+        catalog = type_catalog.ResourceTypeCatalog(path=str(tmp_path / "types.json"), clock=lambda: now[0])
+        client = _client("instance")
+        catalog.names(client)
+
+        refreshed = threading.Event()
+        client.list_resource_types.side_effect = lambda **_: (refreshed.set(), _types_response("instance", "vcn"))[1]
+        now[0] += type_catalog.DEFAULT_TYPE_CACHE_TTL_SECONDS + 1
+
+        assert catalog.names(client) == ["instance"]
+        assert refreshed.wait(timeout=5)
+        for _ in range(100):
+            if catalog.names(client) == ["instance", "vcn"]:
+                break
+            time.sleep(0.01)
+        assert catalog.names(client) == ["instance", "vcn"]
+
+    def test_unknown_type_rereads_catalog_at_most_once_per_interval(self, tmp_path):
+        now = [1000.0]
+        catalog = type_catalog.ResourceTypeCatalog(path=str(tmp_path / "types.json"), clock=lambda: now[0])
+        client = _client("instance")
+        catalog.names(client)
+        client.list_resource_types.return_value = _types_response("instance", "newtype")
+
+        # The catalog was just read, so a miss right away does not re-read it.
+        assert catalog.contains(client, "newtype") is False
+        assert client.list_resource_types.call_count == 1
+
+        now[0] += type_catalog.MISS_REFRESH_INTERVAL_SECONDS
+        assert catalog.contains(client, "newtype") is True
+        assert client.list_resource_types.call_count == 2
+        assert catalog.contains(client, "bogus") is False
+        assert client.list_resource_types.call_count == 2
+
+        now[0] += type_catalog.MISS_REFRESH_INTERVAL_SECONDS
+        assert catalog.contains(client, "bogus") is False
+        assert client.list_resource_types.call_count == 3
+
+    def test_failed_miss_reread_still_counts_toward_interval(self, tmp_path):
+        now = [1000.0]
+        catalog = type_catalog.ResourceTypeCatalog(path=str(tmp_path / "types.json"), clock=lambda: now[0])
+        client = _client("instance")
+        catalog.names(client)
+        client.list_resource_types.side_effect = oci.exceptions.ServiceError(500, "InternalError", {}, "boom")
+
+        now[0] += type_catalog.MISS_REFRESH_INTERVAL_SECONDS
+        with pytest.raises(oci.exceptions.ServiceError):
+            catalog.contains(client, "newtype")
+        assert client.list_resource_types.call_count == 2
+
+        assert catalog.contains(client, "newtype") is False
+        assert client.list_resource_types.call_count == 2
+
+    def test_zero_ttl_disables_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("OCI_RESOURCE_SEARCH_TYPE_CACHE_TTL_SECONDS", "0")
+        path = tmp_path / "types.json"
+        catalog = type_catalog.ResourceTypeCatalog(path=str(path))
+        client = _client("instance")
+
+        catalog.names(client)
+        catalog.names(client)
+
+        assert client.list_resource_types.call_count == 2
+        assert not path.exists()
+
+    def test_unreadable_cache_file_is_ignored(self, tmp_path):
+        path = tmp_path / "types.json"
+        path.write_text("{not json")
+        catalog = type_catalog.ResourceTypeCatalog(path=str(path))
+
+        assert catalog.names(_client("instance")) == ["instance"]
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_resource_search_mcp_server.server.get_search_client")
+    async def test_list_resource_types_and_typed_search_share_catalog(self, mock_get_client):
+        client = _client("instance", "volume", "dbsystem")
+        search_response = create_autospec(oci.response.Response)
+        search_response.data = oci.resource_search.models.ResourceSummaryCollection(items=[])
+        search_response.has_next_page = False
+        search_response.next_page = None
+        client.search_resources.return_value = search_response
+        mock_get_client.return_value = client
+
+        async with Client(mcp) as mcp_client:
+            listed = (await mcp_client.call_tool("list_resource_types", {"limit": 2})).data
+            for _ in range(3):
+                await mcp_client.call_tool(
+                    "search_resources_by_type",
+                    {"tenant_id": TENANT_ID, "compartment_id": COMPARTMENT_ID, "resource_type": "dbsystem"},
+                )
+
+        assert listed == ["instance", "volume"]
+        assert client.list_resource_types.call_count == 1
+        assert client.search_resources.call_count == 3
@@ -0,0 +1,190 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import json
+import os
+import threading
+import time
+from logging import Logger
+
+logger = Logger(__name__, level="INFO")
+
+DEFAULT_TYPE_CACHE_TTL_SECONDS = 86400.0
+# A type missing from the cached catalog triggers a synchronous re-read, at most this often per region.
+MISS_REFRESH_INTERVAL_SECONDS = 60.0
+_CACHE_FILE_VERSION = 1
+
+
+def type_cache_ttl_seconds() -> float:
+    value = os.getenv("OCI_RESOURCE_SEARCH_TYPE_CACHE_TTL_SECONDS")
+    if not value:
+        return DEFAULT_TYPE_CACHE_TTL_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        return DEFAULT_TYPE_CACHE_TTL_SECONDS
+
+
+def cache_dir() -> str:
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "oci-resource-search-mcp-server")
+
+
+def type_cache_file() -> str:
+    value = os.getenv("OCI_RESOURCE_SEARCH_TYPE_CACHE_FILE")
+    if value:
+        return os.path.expanduser(value)
+    return os.path.join(cache_dir(), "resource_types.json")
+
+
+def region_key(client) -> str:
+    """Cache key for a search client: its service endpoint, which encodes the region."""
+    endpoint = getattr(getattr(client, "base_client", None), "endpoint", None)
+    return endpoint if isinstance(endpoint, str) and endpoint else "default"
+
+
+def fetch_resource_type_names(client) -> list[str]:
+    """Page through ListResourceTypes and return every type name, in service order."""
+    names: list[str] = []
+    has_next_page = True
+    next_page = None
+
+    while has_next_page:
+        kwargs = {"page": next_page} if next_page else {}
+        response = client.list_resource_types(**kwargs)
+        names.extend(resource_type.name for resource_type in response.data)
+
+        has_next_page = getattr(response, "has_next_page", False) is True
+        next_page = getattr(response, "next_page", None) if has_next_page else None
+        if has_next_page and not next_page:
+            break
+
+    return names
+
+
+class ResourceTypeCatalog:
+    """Resource Search type catalog per region, persisted to disk and refreshed in the background.
+
+    A fresh entry is served from memory. A stale entry (older than the TTL, typically loaded from
+    disk on a cold start) is still served while a background thread re-reads the catalog. Only a
+    region with no entry at all blocks on ListResourceTypes.
+    """
+
+    def __init__(self, *, path: str | None = None, clock=time.time):
+        self._path = path
+        self._clock = clock
+        self._entries: dict[str, tuple[float, list[str]]] = {}
+        self._loaded = False
+        self._refreshing: set[str] = set()
+        self._miss_refreshed_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self._path or type_cache_file()
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, "r") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable resource type cache {self.path}: {e}")
+            return
+        if not isinstance(payload, dict) or payload.get("version") != _CACHE_FILE_VERSION:
+            return
+        for key, entry in (payload.get("regions") or {}).items():
+            try:
+                self._entries[key] = (float(entry["fetched_at"]), [str(name) for name in entry["names"]])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def _save(self) -> None:
+        payload = {
+            "version": _CACHE_FILE_VERSION,
+            "regions": {key: {"fetched_at": at, "names": names} for key, (at, names) in self._entries.items()},
+        }
+        path = self.path
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist resource type cache {path}: {e}")
+
+    def _store(self, key: str, names: list[str]) -> list[str]:
+        with self._lock:
+            now = self._clock()
+            self._entries[key] = (now, names)
+            self._miss_refreshed_at[key] = now
+            if type_cache_ttl_seconds() > 0:
+                self._save()
+        return names
+
+    def refresh(self, client) -> list[str]:
+        """Re-read the catalog for the client's region and store it."""
+        return self._store(region_key(client), fetch_resource_type_names(client))
+
+    def _refresh_in_background(self, client, key: str) -> None:
+        def run():
+            try:
+                self.refresh(client)
+            except Exception as e:
+                logger.warning(f"Background resource type refresh failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        threading.Thread(target=run, name="resource-type-refresh", daemon=True).start()
+
+    def names(self, client) -> list[str]:
+        """Return the cached type names for the client's region, fetching them if unknown."""
+        ttl_seconds = type_cache_ttl_seconds()
+        if ttl_seconds <= 0:
+            return fetch_resource_type_names(client)
+        key = region_key(client)
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+        if entry is None:
+            return self.refresh(client)
+        fetched_at, names = entry
+        if self._clock() - fetched_at >= ttl_seconds:
+            self._refresh_in_background(client, key)
+        return names
+
+    def contains(self, client, resource_type: str) -> bool:
+        """Whether ``resource_type`` (lowercase) is a known type, re-reading once on a recent miss."""
+        if resource_type in {name.lower() for name in self.names(client)}:
+            return True
+        if type_cache_ttl_seconds() <= 0:
+            return False
+        key = region_key(client)
+        now = self._clock()
+        with self._lock:
+            if now - self._miss_refreshed_at.get(key, float("-inf")) < MISS_REFRESH_INTERVAL_SECONDS:
+                return False
+            self._miss_refreshed_at[key] = now
+        return resource_type in {name.lower() for name in self.refresh(client)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._miss_refreshed_at.clear()
+            self._loaded = False
+
+
+RESOURCE_TYPES = ResourceTypeCatalog()
@@ -1565,6 +1565,165 @@ class TestEssbaseToolDispatch:
         result = json.loads(fn(app_name='S', db_name='B', ctx=ctx))
         assert 'items' in result
 
+    def _outline_ess(self):
+        tree = {'Year': ['Qtr1', 'Qtr2'], 'Qtr1': ['Jan', 'Feb'],
+                'Qtr2': ['Apr'], 'Jan': [], 'Feb': [], 'Apr': []}
+        ess = MagicMock()
+        ess.dimensions.get_children.side_effect = \
+            lambda app, db, name, limit: {
+                'items': [{'name': c, 'level': 0} for c in tree[name]]}
+        return ess
+
+    def test_essbase_browse_outline_caches_tree(self):
+        from mcp.server.fastmcp import FastMCP
+        from oracle.data_studio_mcp_server.tools import essbase_tools
+        mcp_server = FastMCP('test')
+        essbase_tools.register_tools(mcp_server)
+        fn = mcp_server._tool_manager._tools['essbase_browse_outline'].fn
+        ess = self._outline_ess()
+        ctx = self._make_ctx(ess)
+
+        first = json.loads(fn(app_name='S', db_name='B', parent='Year',
+                              depth=2, ctx=ctx))
+        assert first['members'] == [
+            {'name': 'Qtr1', 'level': 0,
+             'children': [{'name': 'Jan', 'level': 0},
+                          {'name': 'Feb', 'level': 0}]},
+            {'name': 'Qtr2', 'level': 0,
+             'children': [{'name': 'Apr', 'level': 0}]}]
+        assert ess.dimensions.get_children.call_count == 3
+
+        again = json.loads(fn(app_name='S', db_name='B', parent='Year',
+                              depth=2, ctx=ctx))
+        assert again == first
+        assert ess.dimensions.get_children.call_count == 3
+
+        # Deeper walk only fetches the new level; a sub-parent reuses it.
+        fn(app_name='S', db_name='B', parent='Year', depth=3, ctx=ctx)
+        assert ess.dimensions.get_children.call_count == 6
+        sub = json.loads(fn(app_name='S', db_name='B', parent='Qtr1',
+                            depth=1, ctx=ctx))
+        assert [m['name'] for m in sub['members']] == ['Jan', 'Feb']
+        assert ess.dimensions.get_children.call_count == 6
+
+        top = {'items': [{'name': 'Year'}]}
+        ess.dimensions.get_outline.return_value = top
+        fn(app_name='S', db_name='B', ctx=ctx)
+        fn(app_name='S', db_name='B', ctx=ctx)
+        ess.dimensions.get_outline.assert_called_once()
+
+    def test_essbase_browse_outline_does_not_expand_unnamed_members(self):
+        from mcp.server.fastmcp import FastMCP
+        from oracle.data_studio_mcp_server.tools import essbase_tools
+        mcp_server = FastMCP('test')
+        essbase_tools.register_tools(mcp_server)
+        fn = mcp_server._tool_manager._tools['essbase_browse_outline'].fn
+        ess = MagicMock()
+
+        def children(app, db, name, limit):
+            if name == '':
+                raise RuntimeError('member name is required')
+            return {'items': [{'name': 'Qtr1'}, {'level': 0}]} \
+                if name == 'Year' else {'items': []}
+        ess.dimensions.get_children.side_effect = children
+        ctx = self._make_ctx(ess)
+
+        out = json.loads(fn(app_name='S', db_name='B', parent='Year',
+                            depth=2, ctx=ctx))
+        assert out['members'] == [{'name': 'Qtr1'}, {'level': 0}]
+        assert ess.dimensions.get_children.call_count == 2
+
+    def test_essbase_edit_outline_invalidates_cached_tree(self):
+        from mcp.server.fastmcp import FastMCP
+        from oracle.data_studio_mcp_server.tools import essbase_tools
+        mcp_server = FastMCP('test')
+        essbase_tools.register_tools(mcp_server)
+        tools = mcp_server._tool_manager._tools
+        browse = tools['essbase_browse_outline'].fn
+        edit = tools['essbase_edit_outline'].fn
+        ess = self._outline_ess()
+        ess.dimensions.batch_outline_edit.return_value = {'ok': True}
+        ctx = self._make_ctx(ess)
+
+        browse(app_name='S', db_name='B', parent='Year', depth=1, ctx=ctx)
+        edit(app_name='S', db_name='B', action='add', member_name='Qtr3',
+             parent_name='Year', ctx=ctx)
+        browse(app_name='S', db_name='B', parent='Year', depth=1, ctx=ctx)
+        assert ess.dimensions.get_children.call_count == 2
+
+    def test_essbase_load_data_invalidates_after_job_completes(self):
+        from mcp.server.fastmcp import FastMCP
+        from oracle.data_studio_mcp_server.tools import essbase_tools
+        mcp_server = FastMCP('test')
+        essbase_tools.register_tools(mcp_server)
+        tools = mcp_server._tool_manager._tools
+        browse = tools['essbase_browse_outline'].fn
+        load = tools['essbase_load_data'].fn
+        ess = self._outline_ess()
+        ctx = self._make_ctx(ess)
+        ess.jobs.execute.return_value = {'id': 7}
+
+        def wait(job_id):
+            # A browse while the job runs caches the pre-job outline.
+            browse(app_name='S', db_name='B', parent='Year', depth=1,
+                   ctx=ctx)
+            return {'statusCode': 200}
+        ess.jobs.wait_for_completion.side_effect = wait
+
+        load(app_name='S', db_name='B', rule_file='r', ctx=ctx)
+        assert ess.dimensions.get_children.call_count == 1
+        browse(app_name='S', db_name='B', parent='Year', depth=1, ctx=ctx)
+        assert ess.dimensions.get_children.call_count == 2
+
+    def test_essbase_search_members_caches_ancestors(self):
+        from mcp.server.fastmcp import FastMCP
+        from oracle.data_studio_mcp_server.tools import essbase_tools
+        mcp_server = FastMCP('test')
+        essbase_tools.register_tools(mcp_server)
+        fn = mcp_server._tool_manager._tools['essbase_search_members'].fn
+        ess = MagicMock()
+        ess.dimensions.search_members.side_effect = lambda *a, **k: {
+            'items': [{'name': 'Jan'}, {'name': 'Feb'}, {'name': 'Bad'}]}
+
+        def ancestors(app, db, name):
+            if name == 'Bad':
+                raise RuntimeError('member not found')
+            return {'items': [{'name': 'Qtr1'}, {'name': 'Year'}]}
+        ess.dimensions.get_member_ancestors.side_effect = ancestors
+        ctx = self._make_ctx(ess)
+
+        first = json.loads(fn(app_name='S', db_name='B', pattern='*',
+                              ctx=ctx))
+        second = json.loads(fn(app_name='S', db_name='B', pattern='*',
+                               ctx=ctx))
+        assert first == second
+        assert first['count'] == 3
+        assert first['matches'][0]['ancestors']['items'][0]['name'] == 'Qtr1'
+        assert 'ancestors' not in first['matches'][2]
+        assert first['_errors'] == ['ancestors/Bad: member not found']
+        # Jan/Feb cached after the first search; Bad is retried.
+        assert ess.dimensions.get_member_ancestors.call_count == 4
+
+    def test_outline_cache_ttl_and_app_invalidation(self):
+        from oracle.data_studio_mcp_server.tools._outline_cache import (
+            OutlineCache)
+        now = [0.0]
+        cache = OutlineCache(ttl_seconds=10, clock=lambda: now[0])
+        ess = MagicMock()
+        ess.dimensions.get_outline.return_value = {'items': []}
+        cache.dimensions(ess, 'S', 'B')
+        cache.dimensions(ess, 's', 'b')
+        assert ess.dimensions.get_outline.call_count == 1
+        now[0] = 10.0
+        cache.dimensions(ess, 'S', 'B')
+        assert ess.dimensions.get_outline.call_count == 2
+        cache.dimensions(ess, 'S', 'Other')
+        cache.invalidate('S')
+        cache.dimensions(ess, 'S', 'B')
+        cache.dimensions(ess, 'S', 'Other')
+        assert ess.dimensions.get_outline.call_count == 5
+        assert cache.tree(ess, 'S', 'B', 'Year', 0) is None
+
     def test_essbase_describe_database(self):
         from mcp.server.fastmcp import FastMCP
         from oracle.data_studio_mcp_server.tools import essbase_tools
@@ -5231,6 +5390,184 @@ class TestBoundRows:
         assert env['rows'] == 'not a list'
 
 
+class TestSourceCaps:
+    '''Row caps pushed into the MDX / SQL sent to the server.'''
+
+    def test_cap_mdx_rows_wraps_row_axis(self):
+        from oracle.data_studio_mcp_server.tools._helpers import (
+            cap_mdx_rows)
+        mdx = ('SELECT {[Measures].[Sales]} ON COLUMNS, '
+               '{[Year].Children, [Market].[East, West]} ON ROWS '
+               'FROM Sample.Basic WHERE ([Scenario].[Actual])')
+        assert cap_mdx_rows(mdx, 11) == (
+            'SELECT {[Measures].[Sales]} ON COLUMNS, '
+            'Head({[Year].Children, [Market].[East, West]}, 11) ON ROWS '
+            'FROM Sample.Basic WHERE ([Scenario].[Actual])')
+        axis = cap_mdx_rows(
+            "WITH MEMBER [Measures].[X] AS '[Sales], 2' "
+            'SELECT [Product].Members ON AXIS(1), {[X]} ON AXIS(0) '
+            'FROM [Sample].[Basic]', 5)
+        assert 'Head([Product].Members, 5) ON AXIS(1), {[X]}' in axis
+
+    def test_cap_mdx_rows_skips_unsafe_queries(self):
+        from oracle.data_studio_mcp_server.tools._helpers import (
+            cap_mdx_rows)
+        assert cap_mdx_rows('SELECT {[Sales]} ON COLUMNS, NON EMPTY '
+                            '[Year].Members ON ROWS FROM S.B', 5) is None
+        assert cap_mdx_rows('SELECT {[Sales]} ON COLUMNS FROM S.B', 5) \
+            is None
+        assert cap_mdx_rows('SELECT...', 5) is None
+        assert cap_mdx_rows(None, 5) is None
+
+    def test_cap_sql_rows(self):
+        from oracle.data_studio_mcp_server.tools._helpers import (
+            cap_sql_rows)
+        assert cap_sql_rows('select a from t;\n', 3) == (
+            'SELECT * FROM (select a from t) FETCH FIRST 3 ROWS ONLY')
+        assert cap_sql_rows('DELETE FROM t', 3) is None
+        assert cap_sql_rows('SELECT 1 FROM dual; DROP TABLE t', 3) is None
+
+    def test_source_capped_envelopes_drop_original_count(self):
+        from oracle.data_studio_mcp_server.tools._helpers import (
+            bound_mdx_result, bound_rows)
+        env = bound_rows(list(range(6)), max_rows=5, source_capped=True)
+        assert env == {'rows': [0, 1, 2, 3, 4], 'truncated': True,
+                       'source_capped': True, 'max_rows': 5}
+        result = TestBoundMdxResult()._axes_response(n_rows=6)
+        bounded = bound_mdx_result(result, max_rows=5, source_capped=True)
+        assert bounded['truncated'] is True
+        assert bounded['source_capped'] is True
+        assert 'original_row_count' not in bounded
+        assert len(bounded['axes'][1]['tuples']) == 5
+
+
+class TestResultExport:
+    '''Spill-to-file exports under ~/.oracle-data-studio/exports.'''
+
+    def test_mdx_result_table_flattens_axes_shape(self):
+        from oracle.data_studio_mcp_server.tools._result_export import (
+            mdx_result_table)
+        result = TestBoundMdxResult()._axes_response(n_rows=2, n_cols=2)
+        columns, rows = mdx_result_table(result)
+        assert columns == ['Time', 'c0', 'c1']
+        assert rows == [['r0', 0, 1], ['r1', 2, 3]]
+        with pytest.raises(ValueError):
+            mdx_result_table({'unexpected': True})
+
+    def test_spill_writes_private_csv(self, tmp_path, monkeypatch):
+        import csv
+        from oracle.data_studio_mcp_server.tools import _result_export
+        monkeypatch.setattr(_result_export, 'EXPORT_DIR', tmp_path / 'x')
+        columns, rows = _result_export.rows_table(
+            [{'A': 1, 'B': 'x'}, {'A': 2, 'C': None}])
+        info = _result_export.spill(columns, rows, export_format='CSV',
+                                    stem='Sample/Basic')
+        assert info['format'] == 'csv'
+        assert info['row_count'] == 2
+        assert os.path.dirname(info['path']) == str(tmp_path / 'x')
+        assert os.path.basename(info['path']).startswith('Sample_Basic_')
+        assert os.stat(info['path']).st_mode & 0o777 == 0o600
+        with open(info['path'], newline='') as f:
+            assert list(csv.reader(f)) == [
+                ['A', 'B', 'C'], ['1', 'x', ''], ['2', '', '']]
+        with pytest.raises(ValueError, match='export_format'):
+            _result_export.spill(columns, rows, export_format='xlsx',
+                                 stem='s')
+
+
+class TestLogTail:
+
+    def test_new_mode_returns_only_appended_lines(self):
+        from oracle.data_studio_mcp_server.tools._helpers import LogTail
+        tail = LogTail()
+        first = tail.read('A', ['l1', 'l2', 'l3'], mode='new', limit=2)
+        assert first['lines'] == ['l2', 'l3']
+        assert first['reset'] is True
+        second = tail.read('A', ['l1', 'l2', 'l3', 'l4'], mode='new')
+        assert second['lines'] == ['l4']
+        assert second['new_lines'] == 1
+        assert second['reset'] is False
+
+    def test_rewritten_log_resets_cursor(self):
+        from oracle.data_studio_mcp_server.tools._helpers import LogTail
+        tail = LogTail()
+        tail.read('A', ['old 1', 'old 2'], mode='tail')
+        result = tail.read('A', ['new 1'], mode='new')
+        assert result['lines'] == ['new 1']
+        assert result['reset'] is True
+
+    def test_grep_applies_before_limit(self):
+        from oracle.data_studio_mcp_server.tools._helpers import LogTail
+        tail = LogTail()
+        lines = ['INFO a', 'ERROR b', 'INFO c', 'ERROR d']
+        result = tail.read('A', lines, mode='tail', limit=1, grep='ERROR')
+        assert result['lines'] == ['ERROR d']
+        assert result['matched_lines'] == 2
+        full = tail.read('A', lines, mode='full', grep='ERROR')
+        assert full['lines'] == ['ERROR b', 'ERROR d']
+
+    def test_invalid_mode_and_pattern_raise(self):
+        from oracle.data_studio_mcp_server.tools._helpers import LogTail
+        with pytest.raises(ValueError, match='Invalid grep pattern'):
+            LogTail().read('A', [], mode='tail', grep='(')
+        with pytest.raises(ValueError, match='Unknown mode'):
+            LogTail().read('A', [], mode='head')
+
+    def test_log_lines_normalises_payloads(self):
+        from oracle.data_studio_mcp_server.tools._helpers import log_lines
+        assert log_lines(b'a\nb') == ['a', 'b']
+        assert log_lines(['x', {'k': 1}]) == ['x', '{"k": 1}']
+        assert log_lines(None) == []
+        assert log_lines({'k': 1}) == ['{', '  "k": 1', '}']
+
+    @mcp_required
+    def test_essbase_get_logs_tail_modes(self):
+        from mcp.server.fastmcp import FastMCP
+        from oracle.data_studio_mcp_server.tools import essbase_tools
+        mcp_server = FastMCP('test')
+        essbase_tools.register_tools(mcp_server)
+        fn = mcp_server._tool_manager._tools['essbase_get_logs'].fn
+        ess = MagicMock()
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context = {'essbase': ess}
+
+        ess.applications.get_latest_log.return_value = b'a\nb\nc'
+        first = json.loads(fn(app_name='S', mode='new', lines=1, ctx=ctx))
+        ess.applications.get_latest_log.return_value = \
+            'a\nb\nc\nERROR d\ne'
+        second = json.loads(fn(app_name='S', mode='new', grep='ERROR',
+                               ctx=ctx))
+        bad = json.loads(fn(app_name='S', mode='head', ctx=ctx))
+        full = json.loads(fn(app_name='S', ctx=ctx))
+
+        assert first['application'] == 'S'
+        assert first['lines'] == ['c']
+        assert second['lines'] == ['ERROR d']
+        assert second['new_lines'] == 2
+        assert 'Unknown mode' in bad['error']
+        assert full['log'] == 'a\nb\nc\nERROR d\ne'
+
+    @mcp_required
+    def test_essbase_get_logs_new_mode_is_per_connection(self):
+        from mcp.server.fastmcp import FastMCP
+        from oracle.data_studio_mcp_server.tools import essbase_tools
+        mcp_server = FastMCP('test')
+        essbase_tools.register_tools(mcp_server)
+        fn = mcp_server._tool_manager._tools['essbase_get_logs'].fn
+        ess = MagicMock()
+        ess.applications.get_latest_log.return_value = 'a\nb'
+        one, other = MagicMock(), MagicMock()
+        one.request_context.lifespan_context = {'essbase': ess}
+        other.request_context.lifespan_context = {'essbase': ess}
+
+        fn(app_name='S', mode='new', ctx=one)
+        ess.applications.get_latest_log.return_value = 'a\nb\nc'
+        assert json.loads(fn(app_name='S', mode='new', ctx=other))[
+            'lines'] == ['a', 'b', 'c']
+        assert json.loads(fn(app_name='S', mode='new', ctx=one))[
+            'lines'] == ['c']
+
+
 class TestQueryToolsRespectMaxRows:
     '''End-to-end: essbase_query / essbase_export_data / adp_query_av
     pass `max_rows` through and surface `truncated: true`.'''
@@ -5347,6 +5684,124 @@ class TestQueryToolsRespectMaxRows:
         assert len(result['rows']) == 3
 
 
+    def test_essbase_query_pushes_cap_into_mdx(self):
+        from mcp.server.fastmcp import FastMCP
+        from oracle.data_studio_mcp_server.tools import essbase_tools
+        mcp_server = FastMCP('test')
+        essbase_tools.register_tools(mcp_server)
+        ess = MagicMock()
+        ess.grid.execute_mdx.return_value = {
+            'axes': [
+                {'tuples': [{'members': [{'name': 'Sales'}]}]},
+                {'tuples': [{'members': [{'name': f'r{i}'}]}
+                             for i in range(11)]},
+            ],
+            'cells': [{'value': i} for i in range(11)],
+        }
+        result = json.loads(self._ess_query(
+            mcp_server, ess, app_name='S', db_name='B', max_rows=10,
+            mdx='SELECT {[Sales]} ON COLUMNS, [Year].Levels(0).Members '
+                'ON ROWS FROM S.B'))
+        sent = ess.grid.execute_mdx.call_args.args[2]
+        assert 'Head([Year].Levels(0).Members, 11) ON ROWS' in sent
+        assert result['truncated'] is True
+        assert result['source_capped'] is True
+        assert 'original_row_count' not in result
+
+    def test_essbase_export_data_spills_full_result(self, tmp_path,
+                                                     monkeypatch):
+        from mcp.server.fastmcp import FastMCP
+        from oracle.data_studio_mcp_server.tools import (
+            essbase_tools, _result_export)
+        monkeypatch.setattr(_result_export, 'EXPORT_DIR', tmp_path)
+        mcp_server = FastMCP('test')
+        essbase_tools.register_tools(mcp_server)
+        ess = MagicMock()
+        ess.grid.execute_mdx.return_value = {
+            'axes': [
+                {'tuples': [{'members': [{'name': 'Sales'}]}]},
+                {'tuples': [{'members': [{'name': f'r{i}'}]}
+                             for i in range(30)]},
+            ],
+            'cells': [{'value': i} for i in range(30)],
+        }
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context = {'essbase': ess}
+        fn = mcp_server._tool_manager._tools['essbase_export_data'].fn
+        mdx = 'SELECT {[Sales]} ON COLUMNS, [Year].Members ON ROWS FROM S.B'
+        result = json.loads(fn(app_name='S', db_name='B', mdx=mdx,
+                                max_rows=5, export_format='csv', ctx=ctx))
+        # Exports are never capped at the source.
+        assert ess.grid.execute_mdx.call_args.args[2] == mdx
+        assert result['row_count'] == 30
+        assert result['columns'] == ['row', 'Sales']
+        assert result['preview'][0] == ['r0', 0]
+        with open(result['path']) as f:
+            assert len(f.read().splitlines()) == 31
+        bad = json.loads(fn(app_name='S', db_name='B', mdx=mdx,
+                             export_format='xlsx', ctx=ctx))
+        assert 'export_format' in bad['error']
+
+    def test_adp_query_analytic_view_caps_in_database(self):
+        from mcp.server.fastmcp import FastMCP
+        from oracle.data_studio_mcp_server.tools import adp_tools
+        mcp_server = FastMCP('test')
+        adp_tools.register_tools(mcp_server)
+        adp = MagicMock()
+        adp.rest.expired = None
+        adp.Analytics.is_exist.return_value = True
+        adp.Analytics.get_sql_simple.return_value = json.dumps(
+            {'sql': 'SELECT * FROM SALES_AV HIERARCHIES (TIME)'})
+        adp.Misc.run_query.return_value = [{'i': i} for i in range(11)]
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context = {'adp': adp}
+        fn = mcp_server._tool_manager._tools['adp_query_analytic_view'].fn
+        result = json.loads(fn(av_name='SALES_AV', max_rows=10, ctx=ctx))
+        adp.Misc.run_query.assert_called_once_with(
+            'SELECT * FROM (SELECT * FROM SALES_AV HIERARCHIES (TIME)) '
+            'FETCH FIRST 11 ROWS ONLY', limit=11)
+        adp.Analytics.get_data_simple.assert_not_called()
+        assert result['truncated'] is True
+        assert result['source_capped'] is True
+        assert len(result['rows']) == 10
+
+    def test_generated_sql_reads_getsql_reply(self):
+        from oracle.data_studio_mcp_server.tools.adp_tools import (
+            _generated_sql)
+        # adp.Analytics.get_sql returns the getSQL response body as text.
+        assert _generated_sql('{"sql": "SELECT 1 FROM DUAL"}') == \
+            'SELECT 1 FROM DUAL'
+        assert _generated_sql({'sql': 'SELECT 1 FROM DUAL'}) == \
+            'SELECT 1 FROM DUAL'
+        assert _generated_sql(
+            '{"message": "Analytic view does not exist"}') is None
+        assert _generated_sql('<html>error</html>') is None
+
+    def test_adp_query_analytic_view_warns_when_not_capped(self, caplog):
+        from mcp.server.fastmcp import FastMCP
+        from oracle.data_studio_mcp_server.tools import adp_tools
+        mcp_server = FastMCP('test')
+        adp_tools.register_tools(mcp_server)
+        adp = MagicMock()
+        adp.rest.expired = None
+        adp.Analytics.is_exist.return_value = True
+        adp.Analytics.get_sql_simple.return_value = json.dumps(
+            {'statement': 'SELECT * FROM SALES_AV'})
+        adp.Analytics.get_data_simple.return_value = [
+            {'i': i} for i in range(11)]
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context = {'adp': adp}
+        fn = mcp_server._tool_manager._tools['adp_query_analytic_view'].fn
+        with caplog.at_level('WARNING',
+                             logger='oracle-data-studio-mcp'):
+            result = json.loads(fn(av_name='SALES_AV', max_rows=10,
+                                   ctx=ctx))
+        adp.Misc.run_query.assert_not_called()
+        assert 'source_capped' not in result
+        assert len(result['rows']) == 10
+        assert "object with keys ['statement']" in caplog.text
+
+
 # ====================================================================== #
 #  R5 — Server wiring: audit + profile applied at startup                 #
 # ====================================================================== #
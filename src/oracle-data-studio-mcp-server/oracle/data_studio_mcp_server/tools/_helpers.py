@@ -4,9 +4,12 @@
 
 '''Shared helpers for upleveled MCP tools.'''
 
+import hashlib
 import json
 import logging
 import re
+import threading
+from collections import OrderedDict
 from typing import Optional
 
 logger = logging.getLogger('oracle-data-studio-mcp')
@@ -316,7 +319,7 @@ def _coerce_int_max_rows(max_rows, default: int = DEFAULT_MAX_ROWS) -> int:
     return n
 
 
-def bound_mdx_result(result, max_rows=None) -> dict:
+def bound_mdx_result(result, max_rows=None, source_capped=False) -> dict:
     '''Apply a row cap to an Essbase MDX response.
 
     The Essbase REST surface returns either an "axes + cells" shape
@@ -328,10 +331,20 @@ def bound_mdx_result(result, max_rows=None) -> dict:
 
     Returns a (possibly mutated) dict. Non-dict inputs (or shapes we
     don't recognise) pass through unchanged.
+
+    Pass `source_capped=True` when the query was already limited to
+    `max_rows + 1` rows at the source (see `cap_mdx_rows`): the real
+    row count is then unknown, so `original_row_count` is replaced by
+    `source_capped: true`.
     '''
     cap = _coerce_int_max_rows(max_rows)
     if not isinstance(result, dict):
         return result
+    if source_capped:
+        result = bound_mdx_result(result, max_rows=cap)
+        if result.pop('original_row_count', None) is not None:
+            result['source_capped'] = True
+        return result
 
     # axes + cells shape
     axes = result.get('axes')
@@ -382,7 +395,7 @@ def bound_mdx_result(result, max_rows=None) -> dict:
     return result
 
 
-def bound_rows(rows, max_rows=None) -> dict:
+def bound_rows(rows, max_rows=None, source_capped=False) -> dict:
     '''Apply a row cap to a list-of-dicts (or list-of-anything) result.
 
     Returns an envelope::
@@ -391,7 +404,9 @@ def bound_rows(rows, max_rows=None) -> dict:
          'original_row_count': N, 'max_rows': cap}
 
     Useful for SDK calls that return a bare list (ADP analytic-view
-    reads, search results, ...).
+    reads, search results, ...). With `source_capped=True` (rows were
+    fetched with `FETCH FIRST max_rows + 1`) a truncated envelope
+    carries `source_capped: true` instead of an original row count.
     '''
     cap = _coerce_int_max_rows(max_rows)
     if not isinstance(rows, list):
@@ -401,10 +416,211 @@ def bound_rows(rows, max_rows=None) -> dict:
     if total <= cap:
         return {'rows': rows, 'truncated': False,
                 'original_row_count': total, 'max_rows': cap}
+    if source_capped:
+        return {'rows': rows[:cap], 'truncated': True,
+                'source_capped': True, 'max_rows': cap}
     return {'rows': rows[:cap], 'truncated': True,
             'original_row_count': total, 'max_rows': cap}
 
 
+# Caps pushed down to the source. Trimming after the fetch still pays
+# for transferring and parsing the whole result; these rewrite the
+# query so the server stops after `max_rows + 1` rows (the extra row
+# tells us whether anything was cut). Each returns None when the query
+# cannot be rewritten safely, and the caller falls back to trimming.
+
+_MDX_ROWS_CLAUSE = re.compile(
+    r'^(?P<set>.*?)\s(?P<on>ON\s+(?:ROWS|AXIS\s*\(\s*1\s*\)|1))\s*$',
+    re.IGNORECASE | re.DOTALL)
+_MDX_NOT_WRAPPABLE = re.compile(r'\b(?:NON\s+EMPTY|PROPERTIES)\b',
+                                re.IGNORECASE)
+
+
+def _mdx_mask(mdx: str) -> str:
+    '''Blank out quoted text and everything nested in (), {} or [].
+
+    Keeps offsets intact so top-level keywords and commas found in the
+    mask can be used to slice the original query.
+    '''
+    out = []
+    depth = 0
+    quote = None
+    for ch in mdx:
+        if quote:
+            out.append(' ')
+            if ch == quote:
+                quote = None
+            continue
+        if ch in '\'"':
+            quote = ch
+            out.append(' ')
+        elif ch == '[':
+            quote = ']'
+            out.append(' ')
+        elif ch in '({':
+            out.append(ch if depth == 0 else ' ')
+            depth += 1
+        elif ch in ')}':
+            depth = max(depth - 1, 0)
+            out.append(ch if depth == 0 else ' ')
+        else:
+            out.append(ch if depth == 0 else ' ')
+    return ''.join(out)
+
+
+def cap_mdx_rows(mdx: str, limit: int) -> Optional[str]:
+    '''Wrap the row-axis set of an MDX SELECT in ``Head(set, limit)``.
+
+    Only plain axes are rewritten; NON EMPTY rows (Head would run
+    before empty rows are dropped), DIMENSION PROPERTIES clauses and
+    queries without a row axis return None.
+    '''
+    if not isinstance(mdx, str):
+        return None
+    mask = _mdx_mask(mdx)
+    select = re.search(r'\bSELECT\b', mask, re.IGNORECASE)
+    if not select:
+        return None
+    frm = re.search(r'\bFROM\b', mask[select.end():], re.IGNORECASE)
+    if not frm:
+        return None
+    start, end = select.end(), select.end() + frm.start()
+    bounds = [start] + [start + i + 1 for i, ch in
+                        enumerate(mask[start:end]) if ch == ',']
+    bounds.append(end + 1)
+    for lo, hi in zip(bounds, bounds[1:]):
+        clause = mdx[lo:hi - 1]
+        m = _MDX_ROWS_CLAUSE.match(clause)
+        if not m:
+            continue
+        if _MDX_NOT_WRAPPABLE.search(_mdx_mask(m.group('set'))):
+            return None
+        rows = 'Head({}, {}) {}'.format(
+            m.group('set').strip(), int(limit), m.group('on'))
+        lead = clause[:len(clause) - len(clause.lstrip())]
+        trail = clause[len(clause.rstrip()):]
+        return mdx[:lo] + lead + rows + trail + mdx[hi - 1:]
+    return None
+
+
+def cap_sql_rows(sql: str, limit: int) -> Optional[str]:
+    '''Wrap a single SELECT in ``FETCH FIRST limit ROWS ONLY``.'''
+    if not isinstance(sql, str):
+        return None
+    text = sql.strip().rstrip(';').strip()
+    if not re.match(r'(?is)^(?:SELECT|WITH)\b', text) or ';' in text:
+        return None
+    return 'SELECT * FROM ({}) FETCH FIRST {} ROWS ONLY'.format(
+        text, int(limit))
+
+
+# ────────────────────────────────────────────────────────────────────
+#  Incremental log tailing
+# ────────────────────────────────────────────────────────────────────
+# Application logs run to megabytes and a monitoring loop re-reads
+# them every few seconds. `LogTail` remembers, per log, how many lines
+# were already returned plus a checksum of the lines just before that
+# offset, so the next read returns only appended lines. A checksum
+# mismatch means the log rolled over; the reader restarts at the tail.
+# Tools keep their cursors in the lifespan context (`get_log_tail`), so
+# 'new' is tracked per connection rather than per process.
+#
+# `ReportTail` in oracle-goldengate-mcp-server (report_tail.py) follows
+# the same cursor rules. It is a copy rather than an import because the
+# two servers ship separately and share no dependency: the only shared
+# library, oracle-mcp-common, pins fastmcp 3.4.2 and the OCI SDK, while
+# this server pins fastmcp 3.2.4 and GoldenGate uses neither. Keep the
+# cursor rules of both copies in step.
+
+TAIL_MODES = ('full', 'new', 'tail')
+DEFAULT_TAIL_LINES = 200
+_TAIL_ANCHOR_LINES = 3
+
+
+def log_lines(result) -> list:
+    '''Normalise an SDK log payload (bytes, str, list, dict) to lines.'''
+    if isinstance(result, bytes):
+        result = result.decode('utf-8', errors='replace')
+    if isinstance(result, str):
+        return result.splitlines()
+    if isinstance(result, list):
+        return [item if isinstance(item, str) else json.dumps(item, default=str)
+                for item in result]
+    if result is None:
+        return []
+    return json.dumps(result, indent=2, default=str).splitlines()
+
+
+def _tail_anchor(lines, offset) -> str:
+    window = '\n'.join(lines[max(offset - _TAIL_ANCHOR_LINES, 0):offset])
+    return hashlib.sha256(window.encode('utf-8')).hexdigest()
+
+
+class LogTail:
+    '''Per-log read cursors (line offset + boundary checksum), bounded LRU.'''
+
+    def __init__(self, max_logs: int = 256):
+        self.max_logs = max_logs
+        self._cursors = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(self, key, lines, *, mode: str, limit=None, grep: str = None) -> dict:
+        '''Select lines for *mode* and advance the cursor for *key*.
+
+        ``full`` returns every (matching) line, ``tail`` the last *limit*
+        lines, ``new`` only lines appended since the previous read of the
+        same key (the first read behaves like ``tail``). *grep* is a
+        regular expression applied before the *limit*.
+
+        Raises ValueError for an unknown mode or an invalid pattern.
+        '''
+        if mode not in TAIL_MODES:
+            raise ValueError(f'Unknown mode: {mode}. Use {"/".join(TAIL_MODES)}.')
+        try:
+            pattern = re.compile(grep) if grep else None
+        except re.error as exc:
+            raise ValueError(f'Invalid grep pattern: {exc}') from None
+        cap = _coerce_int_max_rows(limit, DEFAULT_TAIL_LINES)
+
+        with self._lock:
+            offset = None
+            cursor = self._cursors.get(key) if mode == 'new' else None
+            if cursor and cursor[0] <= len(lines) \
+                    and _tail_anchor(lines, cursor[0]) == cursor[1]:
+                offset = cursor[0]
+            window = lines[offset:] if offset is not None else lines
+            if pattern is not None:
+                window = [ln for ln in window if pattern.search(ln)]
+            selected = window if mode == 'full' else window[-cap:]
+            self._cursors[key] = (len(lines), _tail_anchor(lines, len(lines)))
+            self._cursors.move_to_end(key)
+            while len(self._cursors) > self.max_logs:
+                self._cursors.popitem(last=False)
+
+        return {'mode': mode,
+                'lines': selected,
+                'returned_lines': len(selected),
+                'matched_lines': len(window),
+                'omitted_lines': len(window) - len(selected),
+                'total_lines': len(lines),
+                'new_lines': len(lines) - offset if offset is not None else None,
+                'reset': mode == 'new' and offset is None}
+
+
+def get_log_tail(ctx, name: str) -> LogTail:
+    '''Return the *name* log cursors stored in the lifespan context.
+
+    The cursors live beside the service client they read from, so two
+    connections never advance each other's 'new' position.
+    '''
+    lc = ctx.request_context.lifespan_context
+    key = '_log_tail_' + name
+    tail = lc.get(key)
+    if tail is None:
+        tail = lc.setdefault(key, LogTail())
+    return tail
+
+
 # ────────────────────────────────────────────────────────────────────
 #  Connection / metadata redaction by profile (LLM02)
 # ────────────────────────────────────────────────────────────────────
@@ -0,0 +1,202 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v1.0 as shown at
+# https://oss.oracle.com/licenses/upl.
+
+'''Per-(app, db) Essbase outline cache for the browse/search tools.
+
+The outline is loaded lazily as tools touch it and kept as compact
+parallel arrays — ``names[i]``, ``parents[i]`` and ``children[i]``
+(member indexes, ``None`` until fetched) plus the member properties
+returned by ``get_children``. Missing children are fetched level by
+level with a bounded thread pool, so a depth-5 browse costs at most
+five rounds of concurrent REST calls instead of one call per member,
+and repeat browsing answers from memory.
+
+The cache lives in the lifespan context next to the Essbase client, so
+it is scoped to that connection. Tools that change an outline
+(outline edits, dimension-build loads, workbook imports, app/db
+rename/delete) call `invalidate_outline`.
+'''
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+OUTLINE_FETCH_WORKERS = 8
+OUTLINE_CACHE_TTL_SECONDS = 600
+CHILDREN_LIMIT = 200
+
+_CONTEXT_KEY = 'essbase_outline_cache'
+
+
+class _Outline:
+    '''Compact parent/child arrays for one (app, db) outline.'''
+
+    __slots__ = ('names', 'parents', 'children', 'props', 'index',
+                 'dimensions', 'ancestors', 'loaded_at')
+
+    def __init__(self, loaded_at: float):
+        self.names = []
+        self.parents = []
+        self.children = []
+        self.props = []
+        self.index = {}
+        self.dimensions = None
+        self.ancestors = {}
+        self.loaded_at = loaded_at
+
+    def add(self, name: str, parent: int, props: dict) -> int:
+        i = len(self.names)
+        self.names.append(name)
+        self.parents.append(parent)
+        self.children.append(None)
+        self.props.append(props)
+        # Shared members repeat a name; the index keeps the first one.
+        self.index.setdefault(name, i)
+        return i
+
+    def node(self, name: str) -> int:
+        i = self.index.get(name)
+        return i if i is not None else self.add(name, -1, {'name': name})
+
+    def subtree(self, i: int, depth: int):
+        '''Nested member dicts below node *i*, matching the uncached shape.'''
+        items = []
+        for c in self.children[i] or []:
+            item = dict(self.props[c])
+            if depth > 1 and self.children[c]:
+                item['children'] = self.subtree(c, depth - 1)
+            items.append(item)
+        return items
+
+
+def _member_name(item) -> str:
+    return item.get('name', item.get('memberName', '')) \
+        if isinstance(item, dict) else ''
+
+
+class OutlineCache:
+    '''Lazily populated outlines keyed by (app, db), with a TTL.'''
+
+    def __init__(self, ttl_seconds: float = OUTLINE_CACHE_TTL_SECONDS,
+                 max_workers: int = OUTLINE_FETCH_WORKERS,
+                 clock=time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.max_workers = max_workers
+        self._clock = clock
+        self._outlines = {}
+        self._lock = threading.RLock()
+
+    def _outline(self, app_name: str, db_name: str) -> _Outline:
+        key = (app_name.lower(), db_name.lower())
+        with self._lock:
+            outline = self._outlines.get(key)
+            now = self._clock()
+            if outline is None or now - outline.loaded_at >= self.ttl_seconds:
+                outline = self._outlines[key] = _Outline(now)
+            return outline
+
+    def invalidate(self, app_name: str, db_name: str = None) -> None:
+        '''Drop one database outline, or every database of an app.'''
+        with self._lock:
+            for key in list(self._outlines):
+                if key[0] == app_name.lower() and (
+                        db_name is None or key[1] == db_name.lower()):
+                    del self._outlines[key]
+
+    def dimensions(self, ess, app_name: str, db_name: str):
+        '''Top-level outline (``get_outline``), cached.'''
+        outline = self._outline(app_name, db_name)
+        if outline.dimensions is None:
+            outline.dimensions = ess.dimensions.get_outline(app_name, db_name)
+        return outline.dimensions
+
+    def tree(self, ess, app_name: str, db_name: str, parent: str, depth: int):
+        '''Children of *parent* nested *depth* levels deep.
+
+        Unfetched levels are loaded breadth-first: every member of the
+        current level whose children are unknown is fetched concurrently
+        before moving to the next level.
+        '''
+        if depth <= 0:
+            return None
+        outline = self._outline(app_name, db_name)
+        with self._lock:
+            root = outline.node(parent)
+        level = [root]
+        for _ in range(depth):
+            missing = [i for i in level if outline.children[i] is None]
+            if missing:
+                self._fetch_children(ess, app_name, db_name, outline, missing)
+            level = [c for i in level for c in outline.children[i] or []]
+            if not level:
+                break
+        return outline.subtree(root, depth)
+
+    def _fetch_children(self, ess, app_name, db_name, outline, members):
+        def fetch(i):
+            data = ess.dimensions.get_children(
+                app_name, db_name, outline.names[i], limit=CHILDREN_LIMIT)
+            return i, data.get('items', data.get('data', []))
+
+        workers = max(1, min(self.max_workers, len(members)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(fetch, members))
+        with self._lock:
+            for i, items in results:
+                if outline.children[i] is not None:
+                    continue
+                kids = []
+                for item in items:
+                    if not isinstance(item, dict):
+                        continue
+                    c = outline.add(_member_name(item), i, item)
+                    if not outline.names[c]:
+                        # Listed but never expanded, like the uncached walk.
+                        outline.children[c] = []
+                    kids.append(c)
+                outline.children[i] = kids
+
+    def ancestors(self, ess, app_name: str, db_name: str, names):
+        '''Map member name -> (ancestors, exception) for *names*.
+
+        Cached answers are reused; misses are fetched concurrently and
+        only successful lookups are cached.
+        '''
+        outline = self._outline(app_name, db_name)
+        found = {n: (outline.ancestors[n], None)
+                 for n in names if n in outline.ancestors}
+        missing = [n for n in dict.fromkeys(names) if n not in found]
+        if not missing:
+            return found
+
+        def fetch(name):
+            try:
+                return name, ess.dimensions.get_member_ancestors(
+                    app_name, db_name, name), None
+            except Exception as exc:
+                return name, None, exc
+
+        workers = max(1, min(self.max_workers, len(missing)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for name, result, exc in pool.map(fetch, missing):
+                if exc is None:
+                    outline.ancestors[name] = result
+                found[name] = (result, exc)
+        return found
+
+
+def get_outline_cache(ctx) -> OutlineCache:
+    '''Return the outline cache stored beside the Essbase client.'''
+    lc = ctx.request_context.lifespan_context
+    cache = lc.get(_CONTEXT_KEY)
+    if cache is None:
+        cache = lc.setdefault(_CONTEXT_KEY, OutlineCache())
+    return cache
+
+
+def invalidate_outline(ctx, app_name: str, db_name: str = None) -> None:
+    '''Forget cached outline data after a tool changed it.'''
+    if ctx is None or not app_name:
+        return
+    get_outline_cache(ctx).invalidate(app_name, db_name)
@@ -0,0 +1,166 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v1.0 as shown at
+# https://oss.oracle.com/licenses/upl.
+
+'''Spill large query results to a local file instead of the chat.
+
+Export-style tools normally hand back at most `max_rows` rows. When the
+caller asks for an `export_format`, the full result is flattened to a
+table and written under ``~/.oracle-data-studio/exports`` (CSV with the
+standard library, Parquet when ``pyarrow`` is installed). The tool then
+returns the file path, the row count and a short preview, so a
+multi-million-cell export never passes through the model context.
+
+Files are created owner-readable only, next to the credential config.
+'''
+
+import csv
+import os
+import re
+import time
+
+from ..credential_store import CONFIG_DIR
+
+EXPORT_FORMATS = ('csv', 'parquet')
+EXPORT_DIR = CONFIG_DIR / 'exports'
+PREVIEW_ROWS = 10
+
+
+# ── Flattening ───────────────────────────────────────────────────────
+
+def _member_label(tup) -> str:
+    '''"Member / Member" label for an axis tuple in any of the shapes.'''
+    if isinstance(tup, dict):
+        tup = tup.get('members', tup.get('name', ''))
+    if not isinstance(tup, list):
+        tup = [tup]
+    names = []
+    for m in tup:
+        if isinstance(m, dict):
+            m = m.get('name', m.get('memberName', ''))
+        names.append(str(m))
+    return ' / '.join(names)
+
+
+def _cell_value(cell):
+    if isinstance(cell, dict):
+        return cell.get('value', cell.get('formattedValue'))
+    return cell
+
+
+def mdx_result_table(result):
+    '''Flatten an Essbase MDX response into (columns, rows).
+
+    Understands the same "axes + cells" and "slice + ranges" shapes as
+    `bound_mdx_result`; raises ValueError for anything else.
+    '''
+    if isinstance(result, dict):
+        axes = result.get('axes')
+        if isinstance(axes, list) and len(axes) >= 2 \
+                and all(isinstance(a, dict) for a in axes[:2]):
+            col_tuples = axes[0].get('tuples') or []
+            row_tuples = axes[1].get('tuples') or []
+            dims = [d.get('name', '') if isinstance(d, dict) else str(d)
+                    for d in axes[1].get('dimensions') or []]
+            header = [' / '.join(dims) or 'row'] + [
+                _member_label(t) for t in col_tuples]
+            cells = result.get('cells') or result.get('data') or []
+            width = len(col_tuples)
+            rows = [[_member_label(t)] + [
+                _cell_value(c) for c in cells[r * width:(r + 1) * width]]
+                for r, t in enumerate(row_tuples)]
+            return header, rows
+
+        sl = result.get('slice')
+        if isinstance(sl, dict) and isinstance(sl.get('rows'), list):
+            columns = sl.get('columns') or []
+            ranges = (sl.get('data') or {}).get('ranges') or [{}]
+            values = ranges[0].get('values') or []
+            width = len(columns)
+            header = ['row'] + [_member_label(c) for c in columns]
+            rows = [[_member_label(t)] + [
+                _cell_value(v) for v in values[r * width:(r + 1) * width]]
+                for r, t in enumerate(sl['rows'])]
+            return header, rows
+
+    raise ValueError('Result shape cannot be exported as a table.')
+
+
+def rows_table(rows):
+    '''Flatten a list of row dicts (or lists) into (columns, rows).'''
+    if not isinstance(rows, list):
+        raise ValueError('Result shape cannot be exported as a table.')
+    columns = []
+    for row in rows:
+        if isinstance(row, dict):
+            columns.extend(k for k in row if k not in columns)
+    if columns:
+        return columns, [[r.get(c) if isinstance(r, dict) else r
+                          for c in columns] for r in rows]
+    width = max((len(r) for r in rows if isinstance(r, list)), default=1)
+    return ['col{}'.format(i + 1) for i in range(width)], [
+        r if isinstance(r, list) else [r] for r in rows]
+
+
+# ── Writing ──────────────────────────────────────────────────────────
+
+def _export_path(stem: str, fmt: str):
+    EXPORT_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    safe = re.sub(r'[^\w.\-]+', '_', stem).strip('._') or 'export'
+    name = '{}_{}.{}'.format(safe, time.strftime('%Y%m%dT%H%M%S'), fmt)
+    path = EXPORT_DIR / name
+    n = 1
+    while path.exists():
+        path = EXPORT_DIR / '{}-{}'.format(n, name)
+        n += 1
+    return path
+
+
+def _write_csv(path, columns, rows):
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(rows)
+
+
+def _write_parquet(path, columns, rows):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError(
+            'Parquet export requires pyarrow; install it or use '
+            "export_format='csv'.") from None
+    arrays = {}
+    for i, c in enumerate(columns):
+        values = [r[i] if i < len(r) else None for r in rows]
+        try:
+            arrays[c] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed cell types (e.g. numbers and "#Missing"): keep as text.
+            arrays[c] = pa.array(
+                [None if v is None else str(v) for v in values])
+    table = pa.table(arrays)
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        pq.write_table(table, f)
+
+
+def spill(columns, rows, *, export_format: str, stem: str) -> dict:
+    '''Write a table to a new export file and describe it.'''
+    fmt = (export_format or '').lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError('export_format must be one of: {}'.format(
+            ', '.join(EXPORT_FORMATS)))
+    path = _export_path(stem, fmt)
+    writer = _write_parquet if fmt == 'parquet' else _write_csv
+    writer(path, columns, rows)
+    return {
+        'path': str(path),
+        'format': fmt,
+        'row_count': len(rows),
+        'columns': columns,
+        'bytes': path.stat().st_size,
+        'preview': rows[:PREVIEW_ROWS],
+    }
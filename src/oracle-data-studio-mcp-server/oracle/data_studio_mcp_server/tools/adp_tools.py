@@ -19,6 +19,74 @@ from ._helpers import safe_call, build_response, err, fmt
 logger = logging.getLogger('oracle-data-studio-mcp')
 
 
+def _generated_sql(result):
+    '''Pull the SQL text out of an ``Analytics.get_sql*`` reply.
+
+    The SDK returns the getSQL response body as JSON text of the form
+    ``{"sql": "..."}``; a missing AV answers ``{"message": ...}``
+    instead. Returns None for any other reply.
+    '''
+    if isinstance(result, str):
+        try:
+            result = json.loads(result)
+        except ValueError:
+            return None
+    if isinstance(result, dict) and isinstance(result.get('sql'), str):
+        return result['sql']
+    return None
+
+
+def _reply_shape(result) -> str:
+    '''Short description of an SDK reply for log messages.'''
+    if isinstance(result, str):
+        try:
+            result = json.loads(result)
+        except ValueError:
+            return 'non-JSON text'
+    if isinstance(result, dict):
+        return 'object with keys {}'.format(sorted(result))
+    return type(result).__name__
+
+
+def _query_av_capped(client, av_name, owner, limit):
+    '''Read at most `limit` AV rows with the cap applied in the database.
+
+    Runs the AV's generated SQL wrapped in ``FETCH FIRST`` through the
+    ORDS SQL endpoint (which also gets `limit` as its page size).
+    Returns None when that path is not usable, so the caller can fall
+    back to ``get_data_simple`` plus trimming; the reason is logged as
+    a warning because the fallback reads the whole view.
+    '''
+    from ._helpers import cap_sql_rows
+    try:
+        reply = client.Analytics.get_sql_simple(av_name, owner)
+        generated = _generated_sql(reply)
+        if generated is None:
+            logger.warning('Capped AV query for %s skipped: getSQL returned '
+                           '%s, expected {"sql": ...}', av_name,
+                           _reply_shape(reply))
+            return None
+        sql = cap_sql_rows(generated, limit)
+        if sql is None:
+            logger.warning('Capped AV query for %s skipped: generated SQL '
+                           'is not a single SELECT', av_name)
+            return None
+        rows = client.Misc.run_query(sql, limit=limit)
+        if isinstance(rows, str):
+            rows = json.loads(rows)
+        if isinstance(rows, dict):
+            rows = rows.get('items', rows.get('rows'))
+        if not isinstance(rows, list):
+            logger.warning('Capped AV query for %s skipped: run_query '
+                           'returned %s', av_name, _reply_shape(rows))
+            return None
+        return rows
+    except Exception as exc:
+        logger.warning('Capped AV query for %s failed, falling back: %s',
+                       av_name, exc)
+        return None
+
+
 def register_tools(mcp: FastMCP):
 
     # NOTE: Pure SQL tools (execute_sql, discover_schema, explain_table,
@@ -109,6 +177,7 @@ def register_tools(mcp: FastMCP):
                                  show_sql: bool = False,
                                  owner: str = None,
                                  max_rows: int = 1000,
+                                 export_format: str = None,
                                  ctx: Context = None) -> str:
         """Query data from an Analytic View with auto-discovered dimensions and measures.
 
@@ -116,18 +185,29 @@ def register_tools(mcp: FastMCP):
         cap fires, the response is wrapped in
         ``{"rows": [...], "truncated": true, "original_row_count": N,
         "max_rows": M}`` so the caller can decide whether to re-query
-        with a tighter filter.
+        with a tighter filter. The cap is applied in the database
+        (``FETCH FIRST max_rows + 1 ROWS ONLY`` around the generated
+        AV SQL); the envelope then reports `source_capped: true`
+        instead of `original_row_count`.
+
+        Set `export_format` ('csv' or 'parquet') to write every row to
+        a local file and return its path with a short preview.
 
         Args:
             av_name: Analytic View name.
             show_sql: If true, return the generated SQL instead of data.
             owner: Schema owner (defaults to current user).
             max_rows: Maximum rows to return (default 1000).
+            export_format: 'csv' or 'parquet' to spill to a file.
         """
-        from ._helpers import bound_rows
+        from ._helpers import _coerce_int_max_rows, bound_rows
+        from ._result_export import EXPORT_FORMATS, rows_table, spill
         client = get_adp(ctx)
         if not client:
             return err(_NO_CONN_MSG)
+        if export_format and export_format.lower() not in EXPORT_FORMATS:
+            return err('export_format must be one of: {}'.format(
+                ', '.join(EXPORT_FORMATS)))
         try:
             if not client.Analytics.is_exist(av_name, owner):
                 return err(f'Analytic view "{av_name}" does not exist.')
@@ -138,8 +218,13 @@ def register_tools(mcp: FastMCP):
                     return result
                 return json.dumps(result, indent=2, default=str)
 
-            # Data path: apply the row cap and surface truncation flag.
-            rows = client.Analytics.get_data_simple(av_name, owner)
+            cap = _coerce_int_max_rows(max_rows)
+            rows = None
+            if not export_format:
+                rows = _query_av_capped(client, av_name, owner, cap + 1)
+            source_capped = rows is not None
+            if rows is None:
+                rows = client.Analytics.get_data_simple(av_name, owner)
             # SDK may return a list, a JSON-string list, or an envelope dict.
             if isinstance(rows, str):
                 try:
@@ -150,7 +235,13 @@ def register_tools(mcp: FastMCP):
                 inner = rows.get('items') or rows.get('rows')
                 if isinstance(inner, list):
                     rows = inner
-            bounded = bound_rows(rows, max_rows=max_rows)
+            if export_format:
+                columns, table = rows_table(rows)
+                return json.dumps(
+                    spill(columns, table, export_format=export_format,
+                          stem=av_name), indent=2, default=str)
+            bounded = bound_rows(rows, max_rows=cap,
+                                 source_capped=source_capped)
             return json.dumps(bounded, indent=2, default=str)
         except Exception as exc:
             return err(str(exc))
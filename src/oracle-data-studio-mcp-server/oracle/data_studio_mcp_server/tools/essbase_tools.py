@@ -14,7 +14,9 @@ import logging
 from mcp.server.fastmcp import FastMCP, Context
 
 from ._essbase_connect import get_essbase
-from ._helpers import safe_call, build_response, err, fmt
+from ._helpers import (safe_call, safe_err, build_response, err, fmt,
+                       get_log_tail, log_lines)
+from ._outline_cache import get_outline_cache, invalidate_outline
 
 logger = logging.getLogger('oracle-data-studio-mcp')
 
@@ -151,7 +153,10 @@ def register_tools(mcp: FastMCP):
         Results are capped at `max_rows` (default 1000). When the cap
         fires, `truncated: true`, `original_row_count`, and `max_rows`
         are added to the response so the caller can decide whether to
-        re-query with a tighter WHERE clause.
+        re-query with a tighter WHERE clause. Where the row axis allows
+        it the cap is pushed into the query (``Head(set, max_rows + 1)``)
+        so Essbase never sends the rest; the response then carries
+        `source_capped: true` instead of `original_row_count`.
 
         Args:
             app_name: Application name.
@@ -160,13 +165,17 @@ def register_tools(mcp: FastMCP):
             max_rows: Maximum row-axis tuples to return. Default 1000.
                 Hard floor 1; values ≤0 fall back to the default.
         """
-        from ._helpers import bound_mdx_result
+        from ._helpers import (
+            _coerce_int_max_rows, bound_mdx_result, cap_mdx_rows)
         ess = get_essbase(ctx)
         if not ess:
             return err(_NO)
         try:
-            result = ess.grid.execute_mdx(app_name, db_name, mdx)
-            result = bound_mdx_result(result, max_rows=max_rows)
+            cap = _coerce_int_max_rows(max_rows)
+            capped = cap_mdx_rows(mdx, cap + 1)
+            result = ess.grid.execute_mdx(app_name, db_name, capped or mdx)
+            result = bound_mdx_result(result, max_rows=cap,
+                                      source_capped=capped is not None)
             return json.dumps(result, indent=2, default=str)
         except Exception as exc:
             return err(str(exc))
@@ -192,26 +201,12 @@ def register_tools(mcp: FastMCP):
             return err(_NO)
         try:
             depth = min(depth, 5)
+            cache = get_outline_cache(ctx)
             if parent is None:
-                outline = ess.dimensions.get_outline(app_name, db_name)
+                outline = cache.dimensions(ess, app_name, db_name)
                 return json.dumps(outline, indent=2, default=str)
 
-            def _get_tree(par, lvl):
-                if lvl <= 0:
-                    return None
-                children_data = ess.dimensions.get_children(
-                    app_name, db_name, par, limit=200)
-                items = children_data.get('items',
-                            children_data.get('data', []))
-                for item in items:
-                    name = item.get('name', item.get('memberName', ''))
-                    if name and lvl > 1:
-                        sub = _get_tree(name, lvl - 1)
-                        if sub:
-                            item['children'] = sub
-                return items
-
-            tree = _get_tree(parent, depth)
+            tree = cache.tree(ess, app_name, db_name, parent, depth)
             return json.dumps({'parent': parent, 'members': tree},
                               indent=2, default=str)
         except Exception as exc:
@@ -235,19 +230,19 @@ def register_tools(mcp: FastMCP):
             hits = ess.dimensions.search_members(
                 app_name, db_name, pattern, limit=50)
             items = hits.get('items', hits.get('data', []))
+            names = [item.get('name', item.get('memberName', ''))
+                     for item in items]
+            lookups = get_outline_cache(ctx).ancestors(
+                ess, app_name, db_name, [n for n in names if n])
             errors = []
             enriched = []
-            for item in items:
-                name = item.get('name', item.get('memberName', ''))
+            for item, name in zip(items, names):
                 if name:
-                    ancestors, e = safe_call(
-                        f'ancestors/{name}',
-                        ess.dimensions.get_member_ancestors,
-                        app_name, db_name, name)
+                    ancestors, e = lookups[name]
                     if ancestors:
                         item['ancestors'] = ancestors
                     if e:
-                        errors.append(e)
+                        errors.append(safe_err(e, label=f'ancestors/{name}'))
                 enriched.append(item)
             return build_response(
                 {'matches': enriched, 'count': len(enriched)},
@@ -341,8 +336,14 @@ def register_tools(mcp: FastMCP):
                 payload['parameters']['file'] = data_file
 
             job = ess.jobs.execute(payload)
-            job_id = job.get('id', job.get('jobID'))
-            result = ess.jobs.wait_for_completion(job_id)
+            try:
+                job_id = job.get('id', job.get('jobID'))
+                result = ess.jobs.wait_for_completion(job_id)
+            finally:
+                # Rule-driven loads can build dimensions. Invalidate once
+                # the job is over so a browse during it cannot re-cache
+                # the old outline.
+                invalidate_outline(ctx, app_name, db_name)
             return json.dumps(result, indent=2, default=str)
         except Exception as exc:
             return err(str(exc))
@@ -372,8 +373,12 @@ def register_tools(mcp: FastMCP):
                 }
             }
             job = ess.jobs.execute(payload)
-            job_id = job.get('id', job.get('jobID'))
-            result = ess.jobs.wait_for_completion(job_id)
+            try:
+                job_id = job.get('id', job.get('jobID'))
+                result = ess.jobs.wait_for_completion(job_id)
+            finally:
+                # Invalidate once the import is over, as in essbase_load_data.
+                invalidate_outline(ctx, app_name)
 
             # If success, get the created app info
             if result.get('statusCode') in (200, 300):
@@ -623,13 +628,19 @@ def register_tools(mcp: FastMCP):
                              mdx: str = None,
                              report_name: str = None,
                              max_rows: int = 1000,
+                             export_format: str = None,
                              ctx: Context = None) -> str:
         """Export data from an Essbase database.
 
         Provide either an MDX query or a saved report name. Results
         are row-capped at `max_rows` (default 1000); when the cap
         fires, `truncated: true` and `original_row_count` are added
-        to the response.
+        to the response. For MDX the cap is pushed into the query
+        where possible (`source_capped: true`, see essbase_query).
+
+        Set `export_format` ('csv' or 'parquet') to write the full,
+        uncapped result to a local file instead; the response then
+        holds the file path, row count, columns and a short preview.
 
         Args:
             app_name: Application name.
@@ -637,21 +648,40 @@ def register_tools(mcp: FastMCP):
             mdx: MDX query string.
             report_name: Name of a saved MDX report.
             max_rows: Maximum row-axis tuples to return (default 1000).
+            export_format: 'csv' or 'parquet' to spill to a file.
         """
-        from ._helpers import bound_mdx_result
+        from ._helpers import (
+            _coerce_int_max_rows, bound_mdx_result, cap_mdx_rows)
+        from ._result_export import EXPORT_FORMATS, mdx_result_table, spill
         ess = get_essbase(ctx)
         if not ess:
             return err(_NO)
+        if export_format and export_format.lower() not in EXPORT_FORMATS:
+            return err('export_format must be one of: {}'.format(
+                ', '.join(EXPORT_FORMATS)))
         try:
+            cap = _coerce_int_max_rows(max_rows)
+            capped = None
             if mdx:
-                result = ess.grid.execute_mdx(app_name, db_name, mdx)
+                if not export_format:
+                    capped = cap_mdx_rows(mdx, cap + 1)
+                result = ess.grid.execute_mdx(app_name, db_name,
+                                              capped or mdx)
             elif report_name:
                 result = ess.grid.execute_mdx_report(
                     app_name, db_name, report_name)
             else:
                 # Default: get the default grid
                 result = ess.grid.get_default_grid(app_name, db_name)
-            result = bound_mdx_result(result, max_rows=max_rows)
+            if export_format:
+                columns, rows = mdx_result_table(result)
+                stem = '{}_{}_{}'.format(app_name, db_name,
+                                         report_name or 'mdx')
+                return json.dumps(
+                    spill(columns, rows, export_format=export_format,
+                          stem=stem), indent=2, default=str)
+            result = bound_mdx_result(result, max_rows=cap,
+                                      source_capped=capped is not None)
             return json.dumps(result, indent=2, default=str)
         except Exception as exc:
             return err(str(exc))
@@ -699,6 +729,7 @@ def register_tools(mcp: FastMCP):
                 if msg:
                     return err(msg)
                 a.delete_application(app_name)
+                invalidate_outline(ctx, app_name)
                 return json.dumps({'status': 'deleted',
                                    'application': app_name})
             elif action == 'copy':
@@ -716,6 +747,7 @@ def register_tools(mcp: FastMCP):
                     return err(msg)
                 result = a.rename_application({
                     'oldAppName': app_name, 'newAppName': new_name})
+                invalidate_outline(ctx, app_name)
                 return fmt(result)
             elif action == 'start':
                 a.update_application(app_name, {'status': 1})
@@ -1440,8 +1472,12 @@ def register_tools(mcp: FastMCP):
                            f'set_formula/set_alias/set_uda.')
 
             payload = {'editActions': edit_actions}
-            result = ess.dimensions.batch_outline_edit(
-                app_name, db_name, payload)
+            try:
+                result = ess.dimensions.batch_outline_edit(
+                    app_name, db_name, payload)
+            finally:
+                # A failed batch may still have applied some edits.
+                invalidate_outline(ctx, app_name, db_name)
             data = {'action': action, 'member': member_name,
                     'result': result}
             return json.dumps(data, indent=2, default=str)
@@ -1669,6 +1705,7 @@ def register_tools(mcp: FastMCP):
                 if msg:
                     return err(msg)
                 a.delete_database(app_name, db_name)
+                invalidate_outline(ctx, app_name, db_name)
                 return json.dumps({'status': 'deleted',
                                    'application': app_name,
                                    'database': db_name})
@@ -1689,6 +1726,7 @@ def register_tools(mcp: FastMCP):
                 result = a.rename_database(app_name,
                                            {'oldDbName': db_name,
                                             'newDbName': new_name})
+                invalidate_outline(ctx, app_name, db_name)
                 return fmt(result) if result else json.dumps(
                     {'status': 'renamed', 'old_name': db_name,
                      'new_name': new_name})
@@ -2130,14 +2168,24 @@ def register_tools(mcp: FastMCP):
     @mcp.tool()
     def essbase_get_logs(app_name: str,
                           latest_only: bool = True,
+                          mode: str = 'full',
+                          lines: int = None,
+                          grep: str = None,
                           ctx: Context = None) -> str:
         """Retrieve application logs from Essbase.
 
         Returns the latest log entry by default, or all available logs.
+        For monitoring loops use mode='new' to get only the lines written
+        since the previous call, or mode='tail' for the last lines.
 
         Args:
             app_name: Application name.
             latest_only: If True (default), return only the latest log. If False, return all logs.
+            mode: full (default) = whole log, tail = last `lines` lines,
+                new = lines added since the previous call for this application
+                on this connection.
+            lines: Max lines returned in tail/new mode (default 200).
+            grep: Optional regular expression; only matching lines are returned.
         """
         ess = get_essbase(ctx)
         if not ess:
@@ -2147,6 +2195,13 @@ def register_tools(mcp: FastMCP):
                 result = ess.applications.get_latest_log(app_name)
             else:
                 result = ess.applications.get_logs(app_name)
+            if mode != 'full' or grep:
+                # Cursors are per connection, keyed by (app, latest_only).
+                selection = get_log_tail(ctx, 'essbase').read(
+                    (app_name, latest_only), log_lines(result), mode=mode,
+                    limit=lines, grep=grep)
+                return json.dumps({'application': app_name, **selection},
+                                  default=str)
             if isinstance(result, bytes):
                 result = result.decode('utf-8', errors='replace')
             if isinstance(result, str):
@@ -137,6 +137,10 @@ def get_replicat_report(replicat_name: str) -> str:
     return f"/services/v2/replicats/{_enc(replicat_name)}/info/reports/{_enc(replicat_name)}.rpt"
 
 
+def get_distribution_path(process_name: str) -> str:
+    return f"/services/distsrvr/v2/sources/{_enc(process_name)}"
+
+
 def get_data_stream_info(data_stream_name: str) -> str:
     return f"/services/distsrvr/v2/stream/{_enc(data_stream_name)}/info"
 
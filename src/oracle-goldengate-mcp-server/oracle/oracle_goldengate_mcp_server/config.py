@@ -14,6 +14,7 @@ import os
 from codecs import BOM_UTF8, BOM_UTF16_BE, BOM_UTF16_LE
 from urllib.parse import quote
 
+from .consts import DEFAULT_HEALTH_CACHE_TTL_SECONDS, DEFAULT_MAX_WORKERS, DEFAULT_SAMPLER_CAPACITY
 from .http_client import sign_oci_request
 
 
@@ -34,6 +35,14 @@ def _must_env(name: str) -> str:
     return value
 
 
+def _int_env(name: str, default: int, minimum: int = 0) -> int:
+    """Return an integer environment variable, falling back to the default when unset or invalid."""
+    try:
+        return max(int(os.getenv(name, default)), minimum)
+    except ValueError:
+        return default
+
+
 def _read_password_from_file(path: str) -> str:
     """Read password from file with BOM-aware decoding, trimming surrounding whitespace."""
     try:
@@ -99,6 +108,9 @@ def read_config() -> dict:
         "passwordSecretOcid": os.getenv("OGG_PASSWORD_SECRET_OCID"),
         "passwordFile": os.getenv("OGG_PASSWORD_FILE"),
         "password": None,
+        "maxWorkers": _int_env("OGG_MCP_MAX_WORKERS", DEFAULT_MAX_WORKERS, minimum=1),
+        "healthCacheTtlSeconds": _int_env("OGG_MCP_HEALTH_CACHE_TTL_SECONDS", DEFAULT_HEALTH_CACHE_TTL_SECONDS),
+        "samplerCapacity": _int_env("OGG_MCP_SAMPLER_CAPACITY", DEFAULT_SAMPLER_CAPACITY, minimum=2),
     }
 
     private_key_file = os.getenv("OCI_PRIVATE_KEY_FILE")
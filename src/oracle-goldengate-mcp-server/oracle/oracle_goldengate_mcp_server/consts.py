@@ -8,3 +8,8 @@ SERVER_NAME = "oracle-goldengate-mcp-server"
 SERVER_VERSION = "1.0.0"
 DEFAULT_DOMAIN = "OracleGoldenGate"
 DEFAULT_TIMEOUT_SECONDS = 60
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_HEALTH_CACHE_TTL_SECONDS = 15
+DEFAULT_SAMPLER_CAPACITY = 720
+DEFAULT_SAMPLER_INTERVAL_SECONDS = 30
+MIN_SAMPLER_INTERVAL_SECONDS = 5
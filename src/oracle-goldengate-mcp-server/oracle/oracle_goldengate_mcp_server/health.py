@@ -0,0 +1,230 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Fleet-wide health snapshot for GoldenGate processes.
+
+Lists Extracts, Replicats and Distribution Paths, then issues the per-process
+STATUS, GETLAG and STATS calls concurrently over the shared HTTP client and
+condenses the replies into one compact table.
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any
+
+from . import api
+
+PROCESS_COLUMNS = ["type", "name", "status", "lag", "operations", "error"]
+
+_ERROR_MAX_CHARS = 200
+_STATUS_PATTERN = re.compile(r"\b(RUNNING|STOPPED|ABENDED|STARTING|STOPPING|KILLED)\b", re.IGNORECASE)
+_LAG_PATTERN = re.compile(r"lag\D*?(\d+(?:\.\d+)?)\s*sec", re.IGNORECASE)
+_OPERATION_KEYS = ("inserts", "updates", "deletes", "upserts", "truncates")
+_TOTAL_OPERATION_KEYS = ("totalOperations", "totalOps")
+
+
+class TtlCache:
+    """Thread-safe key/value cache whose entries expire after a fixed number of seconds."""
+
+    def __init__(self, ttl_seconds: float, clock=time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: dict[Any, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> tuple[Any, float] | None:
+        """Return ``(value, age_seconds)`` for a fresh entry, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            age = self._clock() - entry[0]
+            if age >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            return entry[1], age
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _unwrap(payload: Any) -> Any:
+    """Return the ``response`` body of a GoldenGate REST reply when present."""
+    if isinstance(payload, dict) and "response" in payload:
+        return payload["response"]
+    return payload
+
+
+def item_names(payload: Any) -> list[str]:
+    """Extract process names from a GoldenGate collection reply."""
+    body = _unwrap(payload)
+    items = body.get("items", []) if isinstance(body, dict) else body
+    if not isinstance(items, list):
+        return []
+    names = [item.get("name") if isinstance(item, dict) else item for item in items]
+    return [name for name in names if isinstance(name, str) and name]
+
+
+def find_value(payload: Any, keys: tuple[str, ...]) -> Any:
+    """Depth-first search for the first value stored under any of ``keys`` (case-insensitive)."""
+    wanted = {key.lower() for key in keys}
+    stack = [payload]
+    while stack:
+        node = stack.pop(0)
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key.lower() in wanted and not isinstance(value, (dict, list)):
+                    return value
+            stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(node)
+    return None
+
+
+def _reply_text(payload: Any) -> str:
+    body = _unwrap(payload)
+    reply = body.get("reply") if isinstance(body, dict) else body
+    if isinstance(reply, list):
+        reply = "\n".join(str(line) for line in reply)
+    return reply if isinstance(reply, str) else ""
+
+
+def parse_status(payload: Any) -> str | None:
+    status = find_value(_unwrap(payload), ("status",))
+    if isinstance(status, str):
+        return status.lower()
+    match = _STATUS_PATTERN.search(_reply_text(payload))
+    return match.group(1).lower() if match else None
+
+
+def parse_lag_seconds(payload: Any) -> float | None:
+    """Return the reported lag in seconds from a GETLAG or distribution path reply."""
+    lag = find_value(_unwrap(payload), ("lagSeconds", "lag"))
+    if isinstance(lag, (int, float)) and not isinstance(lag, bool):
+        return float(lag)
+    text = lag if isinstance(lag, str) else _reply_text(payload)
+    match = _LAG_PATTERN.search(text)
+    if match:
+        return float(match.group(1))
+    try:
+        return float(lag) if isinstance(lag, str) else None
+    except ValueError:
+        return None
+
+
+def parse_operations(payload: Any) -> int | None:
+    """Return the total DML operation count from the first statistics block of a STATS reply."""
+    body = _unwrap(payload)
+    total = find_value(body, _TOTAL_OPERATION_KEYS)
+    if isinstance(total, (int, float)) and not isinstance(total, bool):
+        return int(total)
+    stack = [body]
+    while stack:
+        node = stack.pop(0)
+        if isinstance(node, dict):
+            counts = [value for key, value in node.items() if key.lower() in _OPERATION_KEYS]
+            numeric = [value for value in counts if isinstance(value, (int, float)) and not isinstance(value, bool)]
+            if numeric:
+                return int(sum(numeric))
+            stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(node)
+    return None
+
+
+def _process_requests(kind: str, name: str, include_stats: bool) -> list[tuple[str, str, str, dict | None]]:
+    """Return ``(column, method, path, body)`` tuples needed to fill one table row."""
+    if kind == "distributionPath":
+        return [("status", "GET", api.get_distribution_path(name), None)]
+    status_path = api.get_extract_status(name) if kind == "extract" else api.get_replicat_status(name)
+    lag_path = api.get_extract_lag(name) if kind == "extract" else api.get_replicat_lag(name)
+    stats_path = api.get_extract_stats(name) if kind == "extract" else api.get_replicat_stats(name)
+    calls: list[tuple[str, str, str, dict | None]] = [
+        ("status", "POST", status_path, {"command": "STATUS"}),
+        ("lag", "POST", lag_path, {"command": "GETLAG", "isReported": True}),
+    ]
+    if include_stats:
+        calls.append(("operations", "POST", stats_path, {"command": "STATS", "isReported": True}))
+    return calls
+
+
+def _call(client: Any, method: str, path: str, body: dict | None) -> Any:
+    return client.get(path) if method == "GET" else client.post(path, body)
+
+
+def _error_text(exc: Exception) -> str:
+    message = str(exc) or type(exc).__name__
+    return message if len(message) <= _ERROR_MAX_CHARS else message[: _ERROR_MAX_CHARS - 3] + "..."
+
+
+def fleet_health_snapshot(client: Any, *, include_stats: bool = True, max_workers: int | None = None) -> dict[str, Any]:
+    """Collect status, lag and operation counts for every process in one concurrent sweep."""
+    started = time.perf_counter()
+    workers = max(int(max_workers or getattr(client, "max_workers", 1)), 1)
+    listings = {
+        "extract": api.list_extracts(),
+        "replicat": api.list_replicats(),
+        "distributionPath": api.list_distribution_paths(),
+    }
+    errors: list[dict[str, str]] = []
+    rows: list[list[Any]] = []
+    calls = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ogg-health") as pool:
+        list_futures = {kind: pool.submit(client.get, path) for kind, path in listings.items()}
+        processes: list[tuple[str, str]] = []
+        for kind, future in list_futures.items():
+            calls += 1
+            try:
+                processes.extend((kind, name) for name in item_names(future.result()))
+            except Exception as exc:
+                errors.append({"type": kind, "error": _error_text(exc)})
+
+        row_futures = []
+        for kind, name in processes:
+            futures = {
+                column: pool.submit(_call, client, method, path, body)
+                for column, method, path, body in _process_requests(kind, name, include_stats)
+            }
+            row_futures.append((kind, name, futures))
+
+        for kind, name, futures in row_futures:
+            row: dict[str, Any] = {"type": kind, "name": name, "status": None, "lag": None, "operations": None}
+            problems = []
+            for column, future in futures.items():
+                calls += 1
+                try:
+                    payload = future.result()
+                except Exception as exc:
+                    problems.append(f"{column}: {_error_text(exc)}")
+                    continue
+                if column == "status":
+                    row["status"] = parse_status(payload)
+                    if kind == "distributionPath":
+                        row["lag"] = parse_lag_seconds(payload)
+                elif column == "lag":
+                    row["lag"] = parse_lag_seconds(payload)
+                else:
+                    row["operations"] = parse_operations(payload)
+            row["error"] = "; ".join(problems) or None
+            rows.append([row[column] for column in PROCESS_COLUMNS])
+
+    return {
+        "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "columns": PROCESS_COLUMNS,
+        "rows": rows,
+        "errors": errors,
+        "calls": calls,
+        "elapsedSeconds": round(time.perf_counter() - started, 3),
+    }
@@ -18,8 +18,9 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
 from cryptography.hazmat.primitives.serialization import load_pem_private_key
+from requests.adapters import HTTPAdapter
 
-from .consts import DEFAULT_TIMEOUT_SECONDS
+from .consts import DEFAULT_MAX_WORKERS, DEFAULT_TIMEOUT_SECONDS
 
 
 def _classify_request_error(exc: requests.exceptions.RequestException) -> str:
@@ -93,7 +94,12 @@ class HttpClient:
         self.cfg = cfg
         self.base_url = cfg["baseUrl"].rstrip("/")
         self.timeout = DEFAULT_TIMEOUT_SECONDS
+        self.max_workers = int(cfg.get("maxWorkers") or DEFAULT_MAX_WORKERS)
         self.session = requests.Session()
+        # Size the connection pool for concurrent fan-out so parallel calls reuse connections.
+        adapter = HTTPAdapter(pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def _headers(self, method: str, url: str, body: dict | None = None, custom_headers: dict | None = None) -> tuple[dict, str | None]:
         """Build request headers and serialized body."""
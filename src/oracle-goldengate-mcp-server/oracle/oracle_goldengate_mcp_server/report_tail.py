@@ -0,0 +1,108 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Incremental tailing of GoldenGate process reports.
+
+Remembers how many lines of each report were already returned, plus a
+checksum of the lines just before that offset, so a follow-up read only
+returns lines appended since. If the checksum no longer matches (the report
+rolled over or was rewritten) the reader starts again from the tail.
+
+``ReportTail`` follows the same cursor rules as ``LogTail`` in
+oracle-data-studio-mcp-server (``tools/_helpers.py``). It is a copy rather
+than a shared import: the servers ship separately, and the only shared
+library (oracle-mcp-common) would pull fastmcp and the OCI SDK into this
+server and conflict with the fastmcp version data studio pins. A change to
+the cursor rules in one copy should be made in the other.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any
+
+TAIL_MODES = ("full", "new", "tail")
+DEFAULT_TAIL_LINES = 200
+_ANCHOR_LINES = 3
+_MAX_TRACKED_REPORTS = 256
+
+
+def report_lines(payload: Any) -> list[str]:
+    """Return report content as a list of lines from a JSON or plain-text reply."""
+    body = payload.get("response", payload) if isinstance(payload, dict) else payload
+    if isinstance(body, dict):
+        for key in ("lines", "content", "report"):
+            if key in body:
+                body = body[key]
+                break
+    if isinstance(body, list):
+        return [str(line) for line in body]
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    return str(body).splitlines() if body is not None else []
+
+
+def _anchor(lines: list[str], offset: int) -> str:
+    window = "\n".join(lines[max(offset - _ANCHOR_LINES, 0) : offset])
+    return hashlib.sha256(window.encode("utf-8")).hexdigest()
+
+
+class ReportTail:
+    """Per-report read cursors (line offset plus boundary checksum), bounded LRU."""
+
+    def __init__(self, max_reports: int = _MAX_TRACKED_REPORTS):
+        self.max_reports = max_reports
+        self._cursors: OrderedDict[Any, tuple[int, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _resume_offset(self, key: Any, lines: list[str]) -> int | None:
+        cursor = self._cursors.get(key)
+        if cursor is None:
+            return None
+        offset, checksum = cursor
+        if offset > len(lines) or _anchor(lines, offset) != checksum:
+            return None
+        return offset
+
+    def read(
+        self, key: Any, lines: list[str], *, mode: str, limit: int | None = None, grep: str | None = None
+    ) -> dict[str, Any]:
+        """Select lines for ``mode``, optionally filtered by a regex, and advance the report cursor.
+
+        ``full`` returns every (matching) line, ``tail`` the last ``limit`` lines and
+        ``new`` the lines appended since the previous read of the same report. A missing
+        or non-positive ``limit`` means ``DEFAULT_TAIL_LINES``.
+        """
+        if mode not in TAIL_MODES:
+            raise ValueError(f"mode must be one of {', '.join(TAIL_MODES)}")
+        try:
+            pattern = re.compile(grep) if grep else None
+        except re.error as exc:
+            raise ValueError(f"Invalid grep pattern: {exc}") from None
+        cap = limit if limit is not None and limit > 0 else DEFAULT_TAIL_LINES
+
+        with self._lock:
+            offset = self._resume_offset(key, lines) if mode == "new" else None
+            reset = mode == "new" and offset is None
+            window = lines[offset:] if offset is not None else lines
+            if pattern is not None:
+                window = [line for line in window if pattern.search(line)]
+            selected = window if mode == "full" else window[-cap:]
+            self._cursors[key] = (len(lines), _anchor(lines, len(lines)))
+            self._cursors.move_to_end(key)
+            while len(self._cursors) > self.max_reports:
+                self._cursors.popitem(last=False)
+
+        return {
+            "mode": mode,
+            "lines": selected,
+            "returnedLines": len(selected),
+            "matchedLines": len(window),
+            "omittedLines": len(window) - len(selected),
+            "totalLines": len(lines),
+            "newLines": len(lines) - offset if offset is not None else None,
+            "reset": reset,
+        }
@@ -0,0 +1,203 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Background lag and throughput sampler for GoldenGate processes.
+
+Sampling is opt-in per process: each sampled Extract or Replicat gets a daemon
+thread that issues GETLAG and STATS at a fixed interval and stores the parsed
+values in a bounded ring buffer. Trend queries are answered from the buffer
+without further REST round trips.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from . import api
+from .health import parse_lag_seconds, parse_operations
+
+PROCESS_TYPES = ("extract", "replicat")
+SAMPLE_COLUMNS = ["timestamp", "lagSeconds", "operations"]
+
+
+@dataclass
+class _Series:
+    """Ring buffer and sampling thread state for one process."""
+
+    kind: str
+    name: str
+    interval_seconds: float
+    samples: deque
+    stop_event: threading.Event = field(default_factory=threading.Event)
+    thread: threading.Thread | None = None
+    failures: int = 0
+    last_error: str | None = None
+
+
+def _mean(values: list[float]) -> float:
+    return sum(values) / len(values)
+
+
+def _slope(points: list[tuple[float, float]]) -> float | None:
+    """Least-squares slope of ``(x, y)`` points, or None when undefined."""
+    if len(points) < 2:
+        return None
+    mean_x = _mean([x for x, _ in points])
+    mean_y = _mean([y for _, y in points])
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    if denominator == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator
+
+
+def _operations_rate(samples: list[tuple[float, float | None, int | None]]) -> float | None:
+    """Operations per second across the window, tolerating counter resets after a restart."""
+    counted = [(ts, ops) for ts, _, ops in samples if ops is not None]
+    if len(counted) < 2 or counted[-1][0] <= counted[0][0]:
+        return None
+    total = 0
+    for (_, previous), (_, current) in zip(counted, counted[1:], strict=False):
+        total += current - previous if current >= previous else current
+    return total / (counted[-1][0] - counted[0][0])
+
+
+def downsample(samples: list[tuple[float, float | None, int | None]], points: int) -> list[list[Any]]:
+    """Reduce samples to at most ``points`` buckets keeping the peak lag and last operation count."""
+    if points <= 0 or len(samples) <= points:
+        return [list(sample) for sample in samples]
+    rows = []
+    size = len(samples) / points
+    for index in range(points):
+        bucket = samples[int(index * size) : int((index + 1) * size)]
+        lags = [lag for _, lag, _ in bucket if lag is not None]
+        operations = [ops for _, _, ops in bucket if ops is not None]
+        rows.append([bucket[-1][0], max(lags) if lags else None, operations[-1] if operations else None])
+    return rows
+
+
+class ProcessSampler:
+    """Registry of per-process background samplers sharing one HTTP client."""
+
+    def __init__(self, client: Any, capacity: int, clock=time.time):
+        self.client = client
+        self.capacity = max(int(capacity), 2)
+        self._clock = clock
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def _paths(self, kind: str, name: str) -> tuple[str, str]:
+        if kind == "extract":
+            return api.get_extract_lag(name), api.get_extract_stats(name)
+        return api.get_replicat_lag(name), api.get_replicat_stats(name)
+
+    def sample_once(self, kind: str, name: str) -> None:
+        """Take one GETLAG/STATS sample and append it to the process ring buffer."""
+        with self._lock:
+            series = self._series.get((kind, name))
+        if series is not None:
+            self._sample(series)
+
+    def _sample(self, series: _Series) -> None:
+        lag_path, stats_path = self._paths(series.kind, series.name)
+        try:
+            lag = parse_lag_seconds(self.client.post(lag_path, {"command": "GETLAG", "isReported": True}))
+            operations = parse_operations(self.client.post(stats_path, {"command": "STATS", "isReported": True}))
+        except Exception as exc:
+            with self._lock:
+                series.failures += 1
+                series.last_error = str(exc) or type(exc).__name__
+            return
+        with self._lock:
+            # A sampler stopped mid-request must not write into a buffer it no longer owns.
+            if not series.stop_event.is_set():
+                series.samples.append((self._clock(), lag, operations))
+
+    def _run(self, series: _Series) -> None:
+        while not series.stop_event.is_set():
+            self._sample(series)
+            series.stop_event.wait(series.interval_seconds)
+
+    def start(self, kind: str, name: str, interval_seconds: float) -> dict[str, Any]:
+        """Start (or retime) sampling for a process; existing samples are kept.
+
+        On a retime the previous thread is stopped and joined before the new series takes
+        over its buffer, so only one thread ever samples a process.
+        """
+        if kind not in PROCESS_TYPES:
+            raise ValueError(f"processType must be one of {', '.join(PROCESS_TYPES)}")
+        with self._lock:
+            existing = self._series.get((kind, name))
+            if existing:
+                existing.stop_event.set()
+        if existing and existing.thread is not None:
+            existing.thread.join()
+        samples = existing.samples if existing else deque(maxlen=self.capacity)
+        series = _Series(kind=kind, name=name, interval_seconds=interval_seconds, samples=samples)
+        series.thread = threading.Thread(target=self._run, args=(series,), name=f"ogg-sampler-{name}", daemon=True)
+        with self._lock:
+            self._series[(kind, name)] = series
+        series.thread.start()
+        return self.describe(kind, name)
+
+    def stop(self, kind: str, name: str) -> bool:
+        """Stop sampling a process and drop its buffer."""
+        with self._lock:
+            series = self._series.pop((kind, name), None)
+            if series is None:
+                return False
+            series.stop_event.set()
+        return True
+
+    def _describe(self, series: _Series) -> dict[str, Any]:
+        return {
+            "processType": series.kind,
+            "processName": series.name,
+            "intervalSeconds": series.interval_seconds,
+            "samples": len(series.samples),
+            "capacity": self.capacity,
+            "failures": series.failures,
+            "lastError": series.last_error,
+        }
+
+    def describe(self, kind: str, name: str) -> dict[str, Any]:
+        with self._lock:
+            return self._describe(self._series[(kind, name)])
+
+    def active(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [self._describe(self._series[key]) for key in sorted(self._series)]
+
+    def trend(self, kind: str, name: str, points: int) -> dict[str, Any]:
+        """Return a downsampled series with lag trend and throughput for a sampled process."""
+        with self._lock:
+            series = self._series.get((kind, name))
+            if series is None:
+                raise KeyError(f"{kind} {name} is not being sampled; call start_lag_sampler first")
+            described = self._describe(series)
+            samples = list(series.samples)
+        lags = [(ts, lag) for ts, lag, _ in samples if lag is not None]
+        slope = _slope(lags)
+        window = samples[-1][0] - samples[0][0] if len(samples) > 1 else 0.0
+        trend = None
+        if slope is not None:
+            # Call a trend only when the fitted change over the window exceeds 1s or 10% of the mean lag.
+            change = slope * window
+            threshold = max(1.0, 0.1 * _mean([lag for _, lag in lags]))
+            trend = "stable" if abs(change) < threshold else ("growing" if change > 0 else "shrinking")
+        rate = _operations_rate(samples)
+        return {
+            **described,
+            "windowSeconds": round(window, 3),
+            "lagLatestSeconds": lags[-1][1] if lags else None,
+            "lagMinSeconds": min(lag for _, lag in lags) if lags else None,
+            "lagMaxSeconds": max(lag for _, lag in lags) if lags else None,
+            "lagSlopeSecondsPerMinute": None if slope is None else round(slope * 60, 4),
+            "lagTrend": trend,
+            "operationsPerSecond": None if rate is None else round(rate, 4),
+            "columns": SAMPLE_COLUMNS,
+            "rows": downsample(samples, points),
+        }
@@ -21,8 +21,16 @@ from pydantic.fields import FieldInfo
 
 from . import api
 from .config import read_config
-from .consts import DEFAULT_DOMAIN, SERVER_NAME
+from .consts import (
+    DEFAULT_DOMAIN,
+    DEFAULT_HEALTH_CACHE_TTL_SECONDS,
+    DEFAULT_SAMPLER_CAPACITY,
+    DEFAULT_SAMPLER_INTERVAL_SECONDS,
+    MIN_SAMPLER_INTERVAL_SECONDS,
+    SERVER_NAME,
+)
 from .extract_config import build_advanced_extract_parameters
+from .health import TtlCache, fleet_health_snapshot
 from .http_client import HttpClient
 from .map_statement import build_map_statement, normalize_map_statement
 from .models import (
@@ -36,11 +44,16 @@ from .models import (
     ReplicatAdvancedParameters,
 )
 from .replicat_config import build_advanced_replicat_parameters
+from .report_tail import DEFAULT_TAIL_LINES, ReportTail, report_lines
+from .sampler import PROCESS_TYPES, ProcessSampler
 from .table_statement import build_table_statement, normalize_table_statement
 
 cfg = read_config()
 client = HttpClient(cfg)
 mcp = FastMCP(SERVER_NAME)
+fleet_health_cache = TtlCache(cfg.get("healthCacheTtlSeconds", DEFAULT_HEALTH_CACHE_TTL_SECONDS))
+lag_sampler = ProcessSampler(client, cfg.get("samplerCapacity", DEFAULT_SAMPLER_CAPACITY))
+report_tail = ReportTail()
 
 DEFAULT_MANAGED_PROCESS_SETTINGS = "ogg:managedProcessSettings:Default"
 
@@ -107,6 +120,17 @@ def _resolve_begin_value(begin: Any, default: Any = "now") -> Any:
     return begin
 
 
+def _report_result(kind: str, name: str, payload: Any, mode: Any, lines: Any, grep: Any) -> str:
+    """Return a process report whole, or the tail/new/grep-filtered lines selected by ``report_tail``."""
+    mode = _none_if_fieldinfo(mode) or "full"
+    lines = _none_if_fieldinfo(lines)
+    grep = _none_if_fieldinfo(grep)
+    if mode == "full" and not grep:
+        return _ok(payload)
+    selection = report_tail.read((kind, name), report_lines(payload), mode=mode, limit=lines or DEFAULT_TAIL_LINES, grep=grep)
+    return _ok({"processType": kind, "processName": name, **selection})
+
+
 def _resolve_replicat_checkpoint(
     checkpoint_table: Any,
     advanced_checkpoint_table: Any,
@@ -616,16 +640,31 @@ def get_replicat_lag(replicatName: str = Field(..., description="Replicat proces
     return _ok(client.post(api.get_replicat_lag(replicatName), {"command": "GETLAG", "isReported": True}))
 
 
-@mcp.tool(description="Retrieve a report from the Extract process to monitor or troubleshoot it. A report contains all the information about a GoldenGate process")
-def get_extract_report(extractName: str = Field(..., description="Extract process name", min_length=1, max_length=8)) -> str:
+_REPORT_MODE_DESCRIPTION = "full (default) returns the whole report, tail returns the last `lines` lines, new returns only lines added since the previous call for this process (the first call behaves like tail)"
+_REPORT_LINES_DESCRIPTION = f"Maximum lines returned in tail/new mode (default {DEFAULT_TAIL_LINES})"
+_REPORT_GREP_DESCRIPTION = "Optional regular expression; only matching lines are returned"
+
+
+@mcp.tool(description="Retrieve a report from the Extract process to monitor or troubleshoot it. A report contains all the information about a GoldenGate process. Use mode=new to follow the report incrementally, mode=tail for the last lines, and grep to filter lines.")
+def get_extract_report(
+    extractName: str = Field(..., description="Extract process name", min_length=1, max_length=8),
+    mode: str | None = Field(None, description=_REPORT_MODE_DESCRIPTION, pattern="^(full|tail|new)$"),
+    lines: int | None = Field(None, description=_REPORT_LINES_DESCRIPTION, ge=1),
+    grep: str | None = Field(None, description=_REPORT_GREP_DESCRIPTION),
+) -> str:
     """Retrieve a report from the Extract process to monitor or troubleshoot it. A report contains all the information about a GoldenGate process."""
-    return _ok(client.get(api.get_extract_report(extractName)))
+    return _report_result("extract", extractName, client.get(api.get_extract_report(extractName)), mode, lines, grep)
 
 
-@mcp.tool(description="Retrieve a report from the Replicat process to monitor or troubleshoot it. A report contains all the information about a GoldenGate process")
-def get_replicat_report(replicatName: str = Field(..., description="Replicat process name", min_length=1, max_length=8)) -> str:
+@mcp.tool(description="Retrieve a report from the Replicat process to monitor or troubleshoot it. A report contains all the information about a GoldenGate process. Use mode=new to follow the report incrementally, mode=tail for the last lines, and grep to filter lines.")
+def get_replicat_report(
+    replicatName: str = Field(..., description="Replicat process name", min_length=1, max_length=8),
+    mode: str | None = Field(None, description=_REPORT_MODE_DESCRIPTION, pattern="^(full|tail|new)$"),
+    lines: int | None = Field(None, description=_REPORT_LINES_DESCRIPTION, ge=1),
+    grep: str | None = Field(None, description=_REPORT_GREP_DESCRIPTION),
+) -> str:
     """Retrieve a report from the Replicat process to monitor or troubleshoot it. A report contains all the information about a GoldenGate process."""
-    return _ok(client.get(api.get_replicat_report(replicatName)))
+    return _report_result("replicat", replicatName, client.get(api.get_replicat_report(replicatName)), mode, lines, grep)
 
 
 @mcp.tool(description="Retrieve information about an existing GoldenGate Data Stream")
@@ -664,6 +703,71 @@ def get_replicat_details(replicatName: str = Field(..., description="Replicat pr
     return _ok(client.get(api.get_replicat_details(replicatName)))
 
 
+@mcp.tool(description="Return a compact health table (status, lag in seconds, DML operation count) for every Extract, Replicat and Distribution Path in OCI GoldenGate deployment. Per-process calls run concurrently and the snapshot is cached briefly, so repeated polling is cheap.")
+def get_fleet_health(
+    includeStats: bool = Field(True, description="Also issue STATS per Extract/Replicat to fill the operations column"),
+    refresh: bool = Field(False, description="Bypass the snapshot cache and query the deployment again"),
+) -> str:
+    """Return a compact health table for every Extract, Replicat and Distribution Path in OCI GoldenGate deployment."""
+    includeStats = _none_if_fieldinfo(includeStats)
+    refresh = _none_if_fieldinfo(refresh)
+    include_stats = True if includeStats is None else bool(includeStats)
+
+    cache_key = ("fleet", include_stats)
+    cached = None if refresh else fleet_health_cache.get(cache_key)
+    if cached is not None:
+        snapshot, age = cached
+        return _ok({**snapshot, "cached": True, "ageSeconds": round(age, 3)})
+    snapshot = fleet_health_snapshot(client, include_stats=include_stats)
+    fleet_health_cache.set(cache_key, snapshot)
+    return _ok({**snapshot, "cached": False, "ageSeconds": 0})
+
+
+@mcp.tool(description="Start recording GETLAG and STATS samples for an Extract or Replicat in the background at a fixed interval, so lag and throughput trends can be read later with get_lag_trend without repeated polling. Calling it again for the same process changes the interval and keeps collected samples.")
+def start_lag_sampler(
+    processName: str = Field(..., description="Extract or Replicat process name", min_length=1, max_length=8),
+    processType: str = Field(..., description="Process type", pattern="^(extract|replicat)$"),
+    intervalSeconds: int | None = Field(
+        None,
+        description=f"Seconds between samples; defaults to {DEFAULT_SAMPLER_INTERVAL_SECONDS}, minimum {MIN_SAMPLER_INTERVAL_SECONDS}",
+        ge=MIN_SAMPLER_INTERVAL_SECONDS,
+    ),
+) -> str:
+    """Start recording GETLAG and STATS samples for an Extract or Replicat in the background."""
+    intervalSeconds = _none_if_fieldinfo(intervalSeconds)
+    interval = max(intervalSeconds or DEFAULT_SAMPLER_INTERVAL_SECONDS, MIN_SAMPLER_INTERVAL_SECONDS)
+    return _ok(lag_sampler.start(processType, processName, interval))
+
+
+@mcp.tool(description="Stop background lag sampling for an Extract or Replicat and discard its samples")
+def stop_lag_sampler(
+    processName: str = Field(..., description="Extract or Replicat process name", min_length=1, max_length=8),
+    processType: str = Field(..., description="Process type", pattern="^(extract|replicat)$"),
+) -> str:
+    """Stop background lag sampling for an Extract or Replicat and discard its samples."""
+    return _ok({"processType": processType, "processName": processName, "stopped": lag_sampler.stop(processType, processName)})
+
+
+@mcp.tool(description="Return the downsampled lag/operations series recorded by start_lag_sampler for a process, with min/max/latest lag, the lag slope and trend (growing, shrinking, stable) and the operations-per-second rate. Without a process name, lists the processes currently sampled.")
+def get_lag_trend(
+    processName: str | None = Field(None, description="Extract or Replicat process name", min_length=1, max_length=8),
+    processType: str | None = Field(None, description="Process type", pattern="^(extract|replicat)$"),
+    points: int | None = Field(60, description="Maximum number of points in the returned series", ge=1, le=1000),
+) -> str:
+    """Return the downsampled lag/operations series recorded by start_lag_sampler for a process."""
+    processName = _none_if_fieldinfo(processName)
+    processType = _none_if_fieldinfo(processType)
+    points = _none_if_fieldinfo(points)
+    if not processName:
+        return _ok({"samplers": lag_sampler.active()})
+    if processType not in PROCESS_TYPES:
+        raise ValueError("processType must be 'extract' or 'replicat' when processName is given.")
+    try:
+        return _ok(lag_sampler.trend(processType, processName, points or 60))
+    except KeyError as exc:
+        raise ValueError(exc.args[0]) from None
+
+
 def main() -> None:
     """Start the FastMCP server using stdio transport."""
     try:
@@ -0,0 +1,160 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+
+import pytest
+
+os.environ.setdefault("OGG_BASE_URL", "https://example.com")
+os.environ.setdefault("OGG_USERNAME", "user")
+os.environ.setdefault("OGG_PASSWORD", "pass")
+
+from oracle.oracle_goldengate_mcp_server import api, health, server  # noqa: E402
+
+
+def _items(*names: str) -> dict:
+    return {"response": {"items": [{"name": name} for name in names]}}
+
+
+class _FleetClient:
+    """Fake HttpClient answering list/command calls and recording peak concurrency."""
+
+    max_workers = 4
+
+    def __init__(self, failures: dict[str, Exception] | None = None, delay_barrier: int = 0):
+        self.failures = failures or {}
+        self.calls: list[tuple[str, dict | None]] = []
+        self._lock = threading.Lock()
+        self._active = 0
+        self.peak = 0
+        self._barrier = threading.Barrier(delay_barrier) if delay_barrier else None
+
+    def _answer(self, path: str, body: dict | None):
+        with self._lock:
+            self.calls.append((path, body))
+            self._active += 1
+            self.peak = max(self.peak, self._active)
+        try:
+            if self._barrier is not None and body is not None:
+                self._barrier.wait(timeout=5)
+            key = f"{path}:{(body or {}).get('command', 'GET')}"
+            if key in self.failures:
+                raise self.failures[key]
+            if path == api.list_extracts():
+                return _items("E1", "E2")
+            if path == api.list_replicats():
+                return _items("R1")
+            if path == api.list_distribution_paths():
+                return _items("P1")
+            if path == api.get_distribution_path("P1"):
+                return {"response": {"name": "P1", "status": "running", "lagSeconds": 4}}
+            command = body["command"]
+            if command == "STATUS":
+                return {"response": {"reply": "EXTRACT E1: RUNNING"}}
+            if command == "GETLAG":
+                return {"response": {"reply": "Last record lag 12 seconds."}}
+            return {"response": {"replyData": {"totals": {"inserts": 5, "updates": 2, "deletes": 1}}}}
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def get(self, path: str):
+        return self._answer(path, None)
+
+    def post(self, path: str, body: dict | None = None):
+        return self._answer(path, body)
+
+
+def test_ttl_cache_expires_entries_and_honors_disabled_ttl() -> None:
+    now = [100.0]
+    cache = health.TtlCache(10, clock=lambda: now[0])
+    cache.set("key", "value")
+    now[0] = 104.0
+    assert cache.get("key") == ("value", 4.0)
+    now[0] = 110.0
+    assert cache.get("key") is None
+
+    disabled = health.TtlCache(0)
+    disabled.set("key", "value")
+    assert disabled.get("key") is None
+
+
+def test_reply_parsers_handle_structured_and_text_replies() -> None:
+    assert health.item_names({"response": {"items": [{"name": "E1"}, {"links": []}]}}) == ["E1"]
+    assert health.item_names("unexpected") == []
+    assert health.parse_status({"response": {"status": "RUNNING"}}) == "running"
+    assert health.parse_status({"response": {"reply": ["REPLICAT R1: ABENDED"]}}) == "abended"
+    assert health.parse_status({"response": {}}) is None
+    assert health.parse_lag_seconds({"response": {"replyData": {"lag": 7}}}) == 7.0
+    assert health.parse_lag_seconds({"response": {"lag": "3"}}) == 3.0
+    assert health.parse_lag_seconds({"response": {"reply": "At EOF, no more records to process"}}) is None
+    assert health.parse_operations({"response": {"totalOperations": 42}}) == 42
+    assert health.parse_operations({"response": {"tables": [{"Inserts": 1, "Updates": 2}, {"inserts": 9}]}}) == 3
+    assert health.parse_operations({"response": {"reply": "none"}}) is None
+
+
+def test_fleet_health_snapshot_fans_out_concurrently_into_one_table() -> None:
+    # 3 Extract/Replicat processes x 3 commands; the barrier only releases when 3 POSTs overlap.
+    client = _FleetClient(delay_barrier=3)
+
+    snapshot = health.fleet_health_snapshot(client)
+
+    assert snapshot["columns"] == health.PROCESS_COLUMNS
+    assert snapshot["rows"] == [
+        ["extract", "E1", "running", 12.0, 8, None],
+        ["extract", "E2", "running", 12.0, 8, None],
+        ["replicat", "R1", "running", 12.0, 8, None],
+        ["distributionPath", "P1", "running", 4.0, None, None],
+    ]
+    assert snapshot["errors"] == []
+    assert snapshot["calls"] == 3 + 9 + 1
+    assert 3 <= client.peak <= client.max_workers
+
+
+def test_fleet_health_snapshot_reports_per_call_and_listing_errors() -> None:
+    client = _FleetClient(
+        failures={
+            f"{api.get_extract_lag('E1')}:GETLAG": RuntimeError("POST lag failed: 500 " + "x" * 300),
+            f"{api.list_replicats()}:GET": RuntimeError("GET /services/v2/replicats failed: 401"),
+        }
+    )
+
+    snapshot = health.fleet_health_snapshot(client, include_stats=False, max_workers=2)
+
+    rows = {row[1]: row for row in snapshot["rows"]}
+    assert set(rows) == {"E1", "E2", "P1"}
+    assert rows["E1"][3] is None
+    assert rows["E1"][5].startswith("lag: POST lag failed: 500")
+    assert len(rows["E1"][5]) <= len("lag: ") + 200
+    assert rows["E2"][4] is None
+    assert snapshot["errors"] == [{"type": "replicat", "error": "GET /services/v2/replicats failed: 401"}]
+    assert all(body is None or body["command"] != "STATS" for _, body in client.calls)
+
+
+def test_get_fleet_health_tool_caches_snapshot_until_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
+    snapshots = []
+
+    def fake_snapshot(client, *, include_stats):
+        snapshots.append(include_stats)
+        return {"columns": health.PROCESS_COLUMNS, "rows": [], "errors": [], "calls": 3}
+
+    monkeypatch.setattr(server, "fleet_health_snapshot", fake_snapshot)
+    monkeypatch.setattr(server, "fleet_health_cache", health.TtlCache(60))
+
+    first = json.loads(server.get_fleet_health())
+    second = json.loads(server.get_fleet_health())
+    refreshed = json.loads(server.get_fleet_health(refresh=True))
+    without_stats = json.loads(server.get_fleet_health(includeStats=False))
+
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert refreshed["cached"] is False
+    assert without_stats["cached"] is False
+    assert snapshots == [True, True, False]
@@ -0,0 +1,103 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("OGG_BASE_URL", "https://example.com")
+os.environ.setdefault("OGG_USERNAME", "user")
+os.environ.setdefault("OGG_PASSWORD", "pass")
+
+from oracle.oracle_goldengate_mcp_server import report_tail, server  # noqa: E402
+
+
+def _report(*lines: str) -> dict:
+    return {"response": {"$schema": "ogg:report", "lines": list(lines)}}
+
+
+def test_report_lines_accepts_json_and_text_payloads() -> None:
+    assert report_tail.report_lines(_report("a", "b")) == ["a", "b"]
+    assert report_tail.report_lines({"response": {"content": "x\ny\n"}}) == ["x", "y"]
+    assert report_tail.report_lines("plain\ntext") == ["plain", "text"]
+    assert report_tail.report_lines(b"bytes\n") == ["bytes"]
+    assert report_tail.report_lines(None) == []
+
+
+def test_report_tail_returns_only_appended_lines_and_resets_on_rewrite() -> None:
+    tail = report_tail.ReportTail()
+    first = ["line 1", "line 2", "line 3"]
+
+    initial = tail.read("E1", first, mode="new", limit=2)
+    assert initial["lines"] == ["line 2", "line 3"]
+    assert initial["reset"] is True
+    assert initial["omittedLines"] == 1
+
+    appended = tail.read("E1", [*first, "line 4", "ERROR OGG-01", "line 6"], mode="new", limit=10)
+    assert appended["lines"] == ["line 4", "ERROR OGG-01", "line 6"]
+    assert appended["newLines"] == 3
+    assert appended["reset"] is False
+
+    unchanged = tail.read("E1", [*first, "line 4", "ERROR OGG-01", "line 6"], mode="new", limit=10)
+    assert unchanged["lines"] == []
+    assert unchanged["newLines"] == 0
+
+    rewritten = tail.read("E1", ["rolled 1", "rolled 2"], mode="new", limit=10)
+    assert rewritten["lines"] == ["rolled 1", "rolled 2"]
+    assert rewritten["reset"] is True
+
+
+def test_report_tail_grep_filters_before_limit_and_evicts_old_cursors() -> None:
+    tail = report_tail.ReportTail(max_reports=1)
+    lines = ["INFO a", "ERROR b", "INFO c", "ERROR d", "WARNING e"]
+
+    result = tail.read("E1", lines, mode="tail", limit=1, grep="ERROR|WARN")
+    assert result["lines"] == ["WARNING e"]
+    assert result["matchedLines"] == 3
+
+    assert tail.read("E1", lines, mode="full", limit=1, grep="ERROR")["lines"] == ["ERROR b", "ERROR d"]
+    tail.read("R1", lines, mode="tail", limit=1)
+    assert tail.read("E1", lines, mode="new", limit=10)["reset"] is True
+
+    with pytest.raises(ValueError, match="Invalid grep pattern"):
+        tail.read("E1", lines, mode="tail", limit=1, grep="(")
+    with pytest.raises(ValueError, match="mode must be one of"):
+        tail.read("E1", lines, mode="head", limit=1)
+
+
+def test_report_tail_uses_default_limit_when_not_positive() -> None:
+    lines = [f"line {n}" for n in range(report_tail.DEFAULT_TAIL_LINES + 5)]
+
+    for limit in (None, 0, -1):
+        result = report_tail.ReportTail().read("E1", lines, mode="tail", limit=limit)
+        assert result["returnedLines"] == report_tail.DEFAULT_TAIL_LINES
+        assert result["lines"][-1] == lines[-1]
+
+
+def test_report_tools_support_tail_modes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(server, "report_tail", report_tail.ReportTail())
+    payloads = [_report("a", "b", "c"), _report("a", "b", "c", "ERROR d", "e")]
+
+    with patch.object(server.client, "get", side_effect=payloads) as get:
+        first = json.loads(server.get_extract_report("E1", mode="new", lines=1))
+        second = json.loads(server.get_extract_report("E1", mode="new", grep="ERROR"))
+
+    assert get.call_args.args[0] == server.api.get_extract_report("E1")
+    assert first["processName"] == "E1"
+    assert first["lines"] == ["c"]
+    assert second["lines"] == ["ERROR d"]
+    assert second["newLines"] == 2
+
+    with patch.object(server.client, "get", return_value=_report("x", "y", "z")):
+        tail = json.loads(server.get_replicat_report("R1", mode="tail", lines=2))
+        full = json.loads(server.get_replicat_report("R1"))
+    assert tail["processType"] == "replicat"
+    assert tail["lines"] == ["y", "z"]
+    assert full == _report("x", "y", "z")
@@ -0,0 +1,180 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+
+import pytest
+
+os.environ.setdefault("OGG_BASE_URL", "https://example.com")
+os.environ.setdefault("OGG_USERNAME", "user")
+os.environ.setdefault("OGG_PASSWORD", "pass")
+
+from oracle.oracle_goldengate_mcp_server import api, sampler, server  # noqa: E402
+
+
+class _ScriptedClient:
+    """Fake HttpClient replaying (lag, operations) pairs for GETLAG/STATS commands."""
+
+    def __init__(self, values: list[tuple[float, int]]):
+        self.values = list(values)
+        self.current: tuple[float, int] | None = None
+        self.calls: list[tuple[str, str]] = []
+        self.sampled = threading.Event()
+
+    def post(self, path: str, body: dict):
+        self.calls.append((path, body["command"]))
+        if body["command"] == "GETLAG":
+            if not self.values:
+                raise RuntimeError("POST lag failed: 503")
+            self.current = self.values.pop(0)
+            return {"response": {"replyData": {"lag": self.current[0]}}}
+        self.sampled.set()
+        return {"response": {"totalOperations": self.current[1]}}
+
+
+def _sampler_with(values: list[tuple[float, int]], capacity: int = 100):
+    now = [1000.0]
+    client = _ScriptedClient(values)
+    registry = sampler.ProcessSampler(client, capacity, clock=lambda: now[0])
+    # Register without starting a thread so samples are taken deterministically.
+    registry._series[("extract", "E1")] = sampler._Series(
+        kind="extract", name="E1", interval_seconds=10, samples=sampler.deque(maxlen=registry.capacity)
+    )
+    return registry, client, now
+
+
+def test_sampler_ring_buffer_keeps_latest_samples_and_counts_failures() -> None:
+    registry, client, now = _sampler_with([(1, 10), (2, 20), (3, 30)], capacity=2)
+
+    for _ in range(4):
+        registry.sample_once("extract", "E1")
+        now[0] += 10
+
+    described = registry.describe("extract", "E1")
+    assert described["samples"] == 2
+    assert described["failures"] == 1
+    assert described["lastError"] == "POST lag failed: 503"
+    assert list(registry._series[("extract", "E1")].samples) == [(1010.0, 2.0, 20), (1020.0, 3.0, 30)]
+    assert client.calls[0] == (api.get_extract_lag("E1"), "GETLAG")
+    assert client.calls[1] == (api.get_extract_stats("E1"), "STATS")
+
+
+def test_sampler_trend_reports_growth_rate_and_downsampled_series() -> None:
+    # Lag grows 2s per sample; the STATS counter resets once (restart) between samples 3 and 4.
+    values = [(2 * i, ops) for i, ops in enumerate([0, 100, 200, 50, 150, 250])]
+    registry, _, now = _sampler_with(values)
+    for _ in values:
+        registry.sample_once("extract", "E1")
+        now[0] += 10
+
+    trend = registry.trend("extract", "E1", points=3)
+
+    assert trend["lagTrend"] == "growing"
+    assert trend["lagSlopeSecondsPerMinute"] == 12.0
+    assert trend["lagLatestSeconds"] == 10.0
+    assert (trend["lagMinSeconds"], trend["lagMaxSeconds"]) == (0.0, 10.0)
+    assert trend["windowSeconds"] == 50.0
+    assert trend["operationsPerSecond"] == 9.0
+    assert trend["columns"] == sampler.SAMPLE_COLUMNS
+    assert trend["rows"] == [[1010.0, 2.0, 100], [1030.0, 6.0, 50], [1050.0, 10.0, 250]]
+
+    flat, _, flat_now = _sampler_with([(5, 0), (5, 0), (5.2, 0)])
+    for _ in range(3):
+        flat.sample_once("extract", "E1")
+        flat_now[0] += 10
+    assert flat.trend("extract", "E1", points=60)["lagTrend"] == "stable"
+
+
+def test_sampler_start_runs_in_background_and_stop_discards_buffer() -> None:
+    client = _ScriptedClient([(1, 1)] * 50)
+    registry = sampler.ProcessSampler(client, 10)
+
+    started = registry.start("replicat", "R1", interval_seconds=60)
+    assert client.sampled.wait(timeout=5)
+
+    assert started["processType"] == "replicat"
+    assert registry.active()[0]["processName"] == "R1"
+    assert client.calls[0] == (api.get_replicat_lag("R1"), "GETLAG")
+    assert registry.stop("replicat", "R1") is True
+    assert registry.stop("replicat", "R1") is False
+    assert registry.active() == []
+    with pytest.raises(KeyError, match="not being sampled"):
+        registry.trend("replicat", "R1", points=10)
+    with pytest.raises(ValueError, match="processType"):
+        registry.start("path", "P1", interval_seconds=10)
+
+
+def test_sampler_retime_stops_old_thread_before_swapping_series() -> None:
+    in_flight = threading.Event()
+    release = threading.Event()
+
+    class _BlockingClient(_ScriptedClient):
+        def post(self, path: str, body: dict):
+            if not release.is_set():
+                in_flight.set()
+                release.wait(5)
+                return {"response": {"replyData": {"lag": 99}, "totalOperations": 99}}
+            return super().post(path, body)
+
+    client = _BlockingClient([(1, 1)] * 50)
+    registry = sampler.ProcessSampler(client, 10)
+    registry.start("extract", "E1", interval_seconds=60)
+    assert in_flight.wait(timeout=5)
+    old_thread = registry._series[("extract", "E1")].thread
+
+    retimed = threading.Thread(target=registry.start, args=("extract", "E1", 30))
+    retimed.start()
+    retimed.join(timeout=0.2)
+    # The retime waits for the old sampler's request instead of running beside it.
+    assert retimed.is_alive()
+    assert registry.describe("extract", "E1")["intervalSeconds"] == 60
+
+    release.set()
+    retimed.join(timeout=5)
+    assert not old_thread.is_alive()
+    assert client.sampled.wait(timeout=5)
+    series = registry._series[("extract", "E1")]
+    assert series.interval_seconds == 30
+    assert all(lag != 99 for _, lag, _ in registry.trend("extract", "E1", points=10)["rows"])
+    assert [entry["processName"] for entry in registry.active()] == ["E1"]
+    registry.stop("extract", "E1")
+
+
+def test_lag_sampler_tools(monkeypatch: pytest.MonkeyPatch) -> None:
+    starts = []
+
+    class _Registry:
+        def start(self, kind, name, interval):
+            starts.append((kind, name, interval))
+            return {"processType": kind, "processName": name, "intervalSeconds": interval}
+
+        def stop(self, kind, name):
+            return True
+
+        def active(self):
+            return [{"processName": "E1"}]
+
+        def trend(self, kind, name, points):
+            if name == "E2":
+                raise KeyError("extract E2 is not being sampled; call start_lag_sampler first")
+            return {"processName": name, "points": points}
+
+    monkeypatch.setattr(server, "lag_sampler", _Registry())
+
+    assert json.loads(server.start_lag_sampler("E1", "extract"))["intervalSeconds"] == 30
+    server.start_lag_sampler("E1", "extract", intervalSeconds=1)
+    assert starts[-1] == ("extract", "E1", 5)
+    assert json.loads(server.stop_lag_sampler("E1", "extract"))["stopped"] is True
+    assert json.loads(server.get_lag_trend()) == {"samplers": [{"processName": "E1"}]}
+    assert json.loads(server.get_lag_trend("E1", "extract")) == {"processName": "E1", "points": 60}
+    with pytest.raises(ValueError, match="not being sampled"):
+        server.get_lag_trend("E2", "extract")
+    with pytest.raises(ValueError, match="processType"):
+        server.get_lag_trend("E1")
@@ -310,9 +310,13 @@ def test_config_read_from_password_env_and_file(tmp_path: Path, monkeypatch: pyt
     monkeypatch.setenv("OGG_BASE_URL", "https://example.com")
     monkeypatch.setenv("OGG_USERNAME", "'user'")
     monkeypatch.setenv("OGG_PASSWORD", '"pass"')
+    monkeypatch.setenv("OGG_MCP_MAX_WORKERS", "many")
+    monkeypatch.setenv("OGG_MCP_HEALTH_CACHE_TTL_SECONDS", "-5")
     cfg = config.read_config()
     assert cfg["username"] == "user"
     assert cfg["password"] == "pass"
+    assert cfg["maxWorkers"] == 8
+    assert cfg["healthCacheTtlSeconds"] == 0
 
     pwd_file = tmp_path / "pwd.txt"
     pwd_file.write_text("filepass\n", encoding="utf-8")
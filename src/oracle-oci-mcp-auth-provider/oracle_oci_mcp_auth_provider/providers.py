@@ -8,6 +8,7 @@ import hashlib
 import hmac
 import io
 import json
+import logging
 import os
 import shutil
 import tempfile
@@ -15,7 +16,7 @@ import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Generic, Mapping, TypeVar
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote_plus, urlencode, urlparse, urlsplit
 from urllib.request import Request, urlopen
@@ -28,9 +29,13 @@ from cryptography.hazmat.primitives.asymmetric import padding, rsa
 _UPST_REQUIRED = ("OCI_UPST_DOMAIN_URL", "OCI_UPST_CLIENT_ID", "OCI_UPST_CLIENT_SECRET", "OCI_UPST_REGION")
 _UPST_PROFILE = "UPST"
 _EXPIRY_SKEW_SECONDS = 60
+_RENEWAL_LEAD_SECONDS = 300
+_RENEWAL_BACKOFF_SECONDS = (5, 300)
 IMDS_INSTANCE_ENDPOINT = "http://169.254.169.254/opc/v2/instance/"
 RPST_HTTP_TIMEOUT = (5, 30)
 _temporary_directory: Path | None = None
+_logger = logging.getLogger(__name__)
+_T = TypeVar("_T")
 
 
 class UpstAuthenticationError(RuntimeError):
@@ -55,25 +60,176 @@ class _UpstSession:
     config_file: Path
     expires_at: int | None
 
-    def is_usable(self, now: float) -> bool:
-        return self.expires_at is None or now < self.expires_at - _EXPIRY_SKEW_SECONDS
+
+class _RefreshScheduler(Generic[_T]):
+    """Keep a renewable credential fresh without making readers wait on renewal.
+
+    A credential is renewed in the background once it is within ``_RENEWAL_LEAD_SECONDS`` of
+    entering the ``_EXPIRY_SKEW_SECONDS`` window, while readers keep receiving the current one.
+    Readers only renew synchronously when no usable credential exists. Failed background
+    renewals are retried with exponential backoff.
+    """
+
+    def __init__(self, name: str, renew: Callable[[], tuple[_T, float | None]]):
+        self._name = name
+        self._renew = renew
+        self._value: _T | None = None
+        self._issued_at: float | None = None
+        self._expires_at: float | None = None
+        self._renew_at: float | None = None
+        self._retry_at = 0.0
+        self._in_flight = False
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._renewals = 0
+        self._failures = 0
+        self._consecutive_failures = 0
+        self._last_latency: float | None = None
+        self._max_latency: float | None = None
+        self._last_error: str | None = None
+
+    def get(self) -> _T:
+        value = self._value
+        now = time.time()
+        if value is not None and self._is_usable(now):
+            if self._renew_at is not None and now >= self._renew_at:
+                self._renew_in_background()
+            return value
+        with self._lock:
+            if self._value is not None and self._is_usable(time.time()):
+                return self._value
+            return self._renew_locked()
+
+    def metrics(self) -> dict[str, Any]:
+        """Return token age, time to expiry, and renewal latency and failure counters."""
+        now = time.time()
+        return {
+            "token_age_seconds": None if self._issued_at is None else now - self._issued_at,
+            "expires_in_seconds": None if self._expires_at is None else self._expires_at - now,
+            "renewals": self._renewals,
+            "renewal_failures": self._failures,
+            "consecutive_renewal_failures": self._consecutive_failures,
+            "last_renewal_latency_seconds": self._last_latency,
+            "max_renewal_latency_seconds": self._max_latency,
+            "last_renewal_error": self._last_error,
+            "renewal_in_flight": self._in_flight,
+        }
+
+    def close(self) -> None:
+        with self._state_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _is_usable(self, now: float) -> bool:
+        return self._expires_at is None or now < self._expires_at - _EXPIRY_SKEW_SECONDS
+
+    def _renew_locked(self) -> _T:
+        started = time.monotonic()
+        try:
+            value, expires_at = self._renew()
+        except Exception as error:
+            self._record_failure(error)
+            raise
+        latency = time.monotonic() - started
+        now = time.time()
+        self._value, self._issued_at, self._expires_at = value, now, expires_at
+        self._renewals += 1
+        self._consecutive_failures = 0
+        self._last_latency = latency
+        self._max_latency = latency if self._max_latency is None else max(self._max_latency, latency)
+        self._last_error = None
+        self._retry_at = 0.0
+        self._renew_at = None
+        if expires_at is not None:
+            usable_until = expires_at - _EXPIRY_SKEW_SECONDS
+            self._renew_at = usable_until - min(_RENEWAL_LEAD_SECONDS, max(usable_until - now, 0) / 2)
+            if self._renew_at > now:
+                self._schedule(self._renew_at - now)
+        return value
+
+    def _record_failure(self, error: Exception) -> None:
+        self._failures += 1
+        self._consecutive_failures += 1
+        self._last_error = f"{type(error).__name__}: {error}"
+        initial, maximum = _RENEWAL_BACKOFF_SECONDS
+        delay = min(initial * 2 ** (self._consecutive_failures - 1), maximum)
+        self._retry_at = time.time() + delay
+        if self._value is not None and self._is_usable(time.time()):
+            _logger.warning("%s renewal failed; retrying in %ss: %s", self._name, delay, self._last_error)
+            self._schedule(delay)
+
+    def _schedule(self, delay: float) -> None:
+        with self._state_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(delay, self._renew_in_background)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _renew_in_background(self) -> None:
+        with self._state_lock:
+            if self._in_flight or time.time() < self._retry_at:
+                return
+            self._in_flight = True
+        threading.Thread(target=self._background_renewal, name=f"{self._name} renewal", daemon=True).start()
+
+    def _background_renewal(self) -> None:
+        try:
+            with self._lock:
+                self._renew_locked()
+        except Exception:
+            pass
+        finally:
+            self._in_flight = False
+
+
+@dataclass(frozen=True)
+class _ProfileContext:
+    context: AuthContext
+    files: tuple[str, ...]
+    signature: tuple[float | None, ...]
+
+
+def _file_signature(paths: tuple[str, ...]) -> tuple[float | None, ...]:
+    signature = []
+    for path in paths:
+        try:
+            signature.append(os.stat(path).st_mtime)
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
 
 
 class SecurityTokenProfileProvider:
-    """Build an SDK signer from an OCI configuration profile security token."""
+    """Build an SDK signer from an OCI configuration profile security token.
+
+    The parsed profile, key, and token are reused until one of those files changes, for example
+    when ``oci session refresh`` rewrites the security token.
+    """
 
     def __init__(self, environment: Mapping[str, str] | None = None):
         self._environment = environment or os.environ
+        self._cached: _ProfileContext | None = None
 
     def get_context(self, *, region: str | None = None) -> AuthContext:
+        cached = self._cached
+        if cached is not None and _file_signature(cached.files) == cached.signature:
+            return cached.context
+        config_file = self._environment.get("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION)
         config = oci.config.from_file(
-            file_location=self._environment.get("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION),
+            file_location=config_file,
             profile_name=self._environment.get("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE),
         )
+        files = tuple(os.path.expanduser(path) for path in (config_file, config["key_file"], config["security_token_file"]))
+        signature = _file_signature(files)
         private_key = oci.signer.load_private_key_from_file(config["key_file"])
-        with open(os.path.expanduser(config["security_token_file"]), encoding="utf-8") as token_file:
+        with open(files[2], encoding="utf-8") as token_file:
             token = token_file.read()
-        return AuthContext(oci.auth.signers.SecurityTokenSigner(token, private_key), config=config)
+        context = AuthContext(oci.auth.signers.SecurityTokenSigner(token, private_key), config=config)
+        self._cached = _ProfileContext(context, files, signature)
+        return context
 
 
 class InstancePrincipalProvider:
@@ -88,8 +244,7 @@ class UserPrincipalSessionTokenProvider:
 
     def __init__(self, environment: Mapping[str, str] | None = None):
         self._environment = environment or os.environ
-        self._session: _UpstSession | None = None
-        self._lock = threading.Lock()
+        self._sessions = _RefreshScheduler("UPST", self._create_session)
 
     @classmethod
     def is_configured(cls, environment: Mapping[str, str] | None = None) -> bool:
@@ -104,26 +259,33 @@ class UserPrincipalSessionTokenProvider:
         session = self._get_session()
         return str(session.config_file), _UPST_PROFILE
 
+    def refresh_metrics(self) -> dict[str, Any]:
+        """Return UPST age and renewal latency metrics."""
+        return self._sessions.metrics()
+
+    def close(self) -> None:
+        """Cancel the scheduled background renewal."""
+        self._sessions.close()
+
     def _get_session(self) -> _UpstSession:
         _validate_upst_environment(self._environment)
-        with self._lock:
-            if self._session and self._session.is_usable(time.time()):
-                return self._session
-            directory = _credential_directory(self._environment)
-            key_path = _path_from_environment(self._environment, "OCI_UPST_PRIVATE_KEY_FILE", directory / "private_key.pem")
-            token_path = _path_from_environment(self._environment, "OCI_UPST_TOKEN_FILE", directory / "token")
-            config_path = _path_from_environment(self._environment, "OCI_UPST_CONFIG_FILE", directory / "config")
-            private_key = _load_or_create_private_key(key_path)
-            public_key = base64.b64encode(private_key.public_key().public_bytes(serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)).decode("ascii")
-            bearer = _get_service_bearer_token(self._environment)
-            token = _exchange_for_upst(self._environment, bearer, public_key)
-            expires_at = _jwt_expiration(token)
-            if expires_at is not None and expires_at <= time.time():
-                raise UpstAuthenticationError("UPST exchange returned an expired token.")
-            _write_private_file(token_path, token)
-            _write_cli_config(config_path, key_path, token_path, self._environment["OCI_UPST_REGION"])
-            self._session = _UpstSession(token, private_key, key_path, token_path, config_path, expires_at)
-            return self._session
+        return self._sessions.get()
+
+    def _create_session(self) -> tuple[_UpstSession, int | None]:
+        directory = _credential_directory(self._environment)
+        key_path = _path_from_environment(self._environment, "OCI_UPST_PRIVATE_KEY_FILE", directory / "private_key.pem")
+        token_path = _path_from_environment(self._environment, "OCI_UPST_TOKEN_FILE", directory / "token")
+        config_path = _path_from_environment(self._environment, "OCI_UPST_CONFIG_FILE", directory / "config")
+        private_key = _load_or_create_private_key(key_path)
+        public_key = base64.b64encode(private_key.public_key().public_bytes(serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)).decode("ascii")
+        bearer = _get_service_bearer_token(self._environment)
+        token = _exchange_for_upst(self._environment, bearer, public_key)
+        expires_at = _jwt_expiration(token)
+        if expires_at is not None and expires_at <= time.time():
+            raise UpstAuthenticationError("UPST exchange returned an expired token.")
+        _write_private_file(token_path, token)
+        _write_cli_config(config_path, key_path, token_path, self._environment["OCI_UPST_REGION"])
+        return _UpstSession(token, private_key, key_path, token_path, config_path, expires_at), expires_at
 
 
 class ResourcePrincipalSessionTokenProvider:
@@ -151,17 +313,29 @@ class ResourcePrincipalSessionTokenProvider:
         self.t0 = t0
         self.region = region
         self.timeout = timeout
-        self._context: AuthContext | None = None
+        self._private_key: Any = None
+        self._contexts = _RefreshScheduler("RPST", self._create_context)
 
     def get_context(self, *, region: str | None = None) -> AuthContext:
-        if self._context is None:
-            private_key = serialization.load_pem_private_key(Path(self.private_key_path).read_bytes(), password=None)
-            security_context = _security_context(self.rci, self.t0)
-            rpt, spst = _fetch_resource_tokens(self.resource_token_endpoint, self.resource_ocid, self.tenancy_ocid, private_key, security_context, self.timeout)
-            rpst, session_key = _exchange_rpst(self.auth_endpoint, self.tenancy_ocid, self.resource_ocid, private_key, rpt, spst, self.timeout)
-            config = {"region": self.region} if self.region else None
-            self._context = AuthContext(oci.auth.signers.SecurityTokenSigner(rpst, session_key), self.resource_token_endpoint, config)
-        return self._context
+        return self._contexts.get()
+
+    def refresh_metrics(self) -> dict[str, Any]:
+        """Return RPST age and renewal latency metrics."""
+        return self._contexts.metrics()
+
+    def close(self) -> None:
+        """Cancel the scheduled background renewal."""
+        self._contexts.close()
+
+    def _create_context(self) -> tuple[AuthContext, int | None]:
+        if self._private_key is None:
+            self._private_key = serialization.load_pem_private_key(Path(self.private_key_path).read_bytes(), password=None)
+        security_context = _security_context(self.rci, self.t0)
+        rpt, spst = _fetch_resource_tokens(self.resource_token_endpoint, self.resource_ocid, self.tenancy_ocid, self._private_key, security_context, self.timeout)
+        rpst, session_key = _exchange_rpst(self.auth_endpoint, self.tenancy_ocid, self.resource_ocid, self._private_key, rpt, spst, self.timeout)
+        config = {"region": self.region} if self.region else None
+        context = AuthContext(oci.auth.signers.SecurityTokenSigner(rpst, session_key), self.resource_token_endpoint, config)
+        return context, _jwt_expiration(rpst)
 
     @classmethod
     def from_database_environment(
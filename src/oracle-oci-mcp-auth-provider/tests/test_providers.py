@@ -1,4 +1,7 @@
 import json
+import os
+import threading
+import time
 from unittest.mock import MagicMock, mock_open
 
 import pytest
@@ -385,3 +388,140 @@ def test_database_rpst_environment_constructor_rejects_missing_values(monkeypatc
 def _jwt(expiration):
     payload = json.dumps({"exp": expiration}).encode()
     return "header." + __import__("base64").urlsafe_b64encode(payload).decode().rstrip("=") + ".signature"
+
+
+class _FakeTimer:
+    def __init__(self, delay, function):
+        self.delay = delay
+        self.function = function
+        self.cancelled = False
+
+    def start(self):
+        _FakeTimer.started.append(self)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def test_refresh_scheduler_serves_current_token_while_renewing_in_background(monkeypatch):
+    _FakeTimer.started = []
+    monkeypatch.setattr(providers.threading, "Timer", _FakeTimer)
+    now = [1000.0]
+    monkeypatch.setattr(providers.time, "time", lambda: now[0])
+    release = threading.Event()
+    renewals = iter(["first", "second"])
+
+    def renew():
+        value = next(renewals)
+        if value == "second":
+            assert release.wait(5)
+        return value, now[0] + 3600
+
+    scheduler = providers._RefreshScheduler("test", renew)
+
+    assert scheduler.get() == "first"
+    assert _FakeTimer.started[-1].delay == 3600 - providers._EXPIRY_SKEW_SECONDS - providers._RENEWAL_LEAD_SECONDS
+
+    now[0] += _FakeTimer.started[-1].delay
+    _FakeTimer.started[-1].function()
+    assert scheduler.get() == "first"
+    assert scheduler.metrics()["renewal_in_flight"] is True
+
+    release.set()
+    for _ in range(500):
+        if not scheduler.metrics()["renewal_in_flight"]:
+            break
+        time.sleep(0.01)
+    assert scheduler.get() == "second"
+    metrics = scheduler.metrics()
+    assert metrics["renewals"] == 2
+    assert metrics["token_age_seconds"] == 0
+    assert metrics["expires_in_seconds"] == 3600
+    assert metrics["last_renewal_latency_seconds"] is not None
+
+
+def test_refresh_scheduler_backs_off_after_background_failures(monkeypatch):
+    _FakeTimer.started = []
+    monkeypatch.setattr(providers.threading, "Timer", _FakeTimer)
+    monkeypatch.setattr(providers.time, "time", lambda: 1000.0)
+    attempts = []
+
+    def renew():
+        attempts.append(len(attempts))
+        if len(attempts) > 1:
+            raise RuntimeError("identity domain unavailable")
+        return "token", 1400
+
+    scheduler = providers._RefreshScheduler("test", renew)
+    scheduler.get()
+
+    scheduler._renew_in_background()
+    for _ in range(500):
+        if not scheduler.metrics()["renewal_in_flight"]:
+            break
+        time.sleep(0.01)
+    scheduler._background_renewal()
+
+    assert scheduler.get() == "token"
+    assert [timer.delay for timer in _FakeTimer.started[-2:]] == [5, 10]
+    metrics = scheduler.metrics()
+    assert metrics["renewal_failures"] == 2
+    assert metrics["consecutive_renewal_failures"] == 2
+    assert metrics["last_renewal_error"] == "RuntimeError: identity domain unavailable"
+    # Readers do not start another renewal until the backoff delay has passed.
+    scheduler._renew_in_background()
+    assert len(attempts) == 3
+    scheduler.close()
+    assert _FakeTimer.started[-1].cancelled
+
+
+def test_resource_principal_provider_renews_expiring_rpst(monkeypatch, tmp_path):
+    key_path = tmp_path / "key.pem"
+    key_path.write_text("key")
+    load_key = MagicMock(return_value=MagicMock())
+    monkeypatch.setattr(providers.serialization, "load_pem_private_key", load_key)
+    monkeypatch.setattr(providers, "_security_context", lambda *_: "context")
+    monkeypatch.setattr(providers, "_fetch_resource_tokens", lambda *_: ("rpt", "spst"))
+    tokens = iter([_jwt(1030), _jwt(5000)])
+    monkeypatch.setattr(providers, "_exchange_rpst", lambda *_: (next(tokens), "session-key"))
+    monkeypatch.setattr(providers.oci.auth.signers, "SecurityTokenSigner", lambda token, _key: token)
+    monkeypatch.setattr(providers.time, "time", lambda: 1000)
+
+    provider = providers.ResourcePrincipalSessionTokenProvider(
+        resource_token_endpoint="https://database.example.com",
+        auth_endpoint="https://auth.example.com",
+        tenancy_ocid="tenancy",
+        resource_ocid="resource",
+        private_key_path=str(key_path),
+        rci="YQ==",
+        t0="2026-01-01T00:00:00Z",
+    )
+
+    assert provider.get_context().signer == _jwt(1030)
+    assert provider.get_context().signer == _jwt(5000)
+    assert provider.refresh_metrics()["renewals"] == 2
+    load_key.assert_called_once()
+    provider.close()
+
+
+def test_security_token_profile_provider_reloads_only_when_files_change(monkeypatch, tmp_path):
+    config_file = tmp_path / "config"
+    key_file = tmp_path / "key.pem"
+    token_file = tmp_path / "token"
+    for path, content in ((config_file, "[TEST]"), (key_file, "key"), (token_file, "token-1")):
+        path.write_text(content)
+    config = {"key_file": str(key_file), "security_token_file": str(token_file)}
+    from_file = MagicMock(return_value=config)
+    monkeypatch.setattr(providers.oci.config, "from_file", from_file)
+    monkeypatch.setattr(providers.oci.signer, "load_private_key_from_file", MagicMock(return_value="private-key"))
+    monkeypatch.setattr(providers.oci.auth.signers, "SecurityTokenSigner", lambda token, _key: token)
+    provider = providers.SecurityTokenProfileProvider({"OCI_CONFIG_FILE": str(config_file), "OCI_CONFIG_PROFILE": "TEST"})
+
+    assert provider.get_context().signer == "token-1"
+    assert provider.get_context().signer == "token-1"
+    assert from_file.call_count == 1
+
+    token_file.write_text("token-2")
+    os.utime(token_file, (time.time() + 10, time.time() + 10))
+    assert provider.get_context().signer == "token-2"
+    assert from_file.call_count == 2